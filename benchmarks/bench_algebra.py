@@ -22,6 +22,7 @@ from __future__ import annotations
 import json
 import math
 import random
+import sys
 import time
 from dataclasses import dataclass, field
 from typing import Any
@@ -29,9 +30,11 @@ from typing import Any
 from jsonld_ex.confidence_algebra import (
     Opinion,
     cumulative_fuse,
+    cumulative_fuse_tree,
     averaging_fuse,
     trust_discount,
     deduce,
+    _cumulative_fuse_pair,
 )
 from jsonld_ex.confidence_bridge import (
     combine_opinions_from_scalars,
@@ -90,27 +93,75 @@ def _make_dogmatic_batch(n: int) -> list[Opinion]:
 # ═══════════════════════════════════════════════════════════════════
 
 
+def _cumulative_fold(opinions: list[Opinion]) -> Opinion:
+    """Reference pairwise left fold (the pre-closed-form cumulative_fuse)."""
+    result = opinions[0]
+    for o in opinions[1:]:
+        result = _cumulative_fuse_pair(result, o)
+    return result
+
+
 def bench_cumulative_fusion(
-    sizes: list[int] = [2, 3, 5, 10, 20, 50, 100],
+    sizes: list[int] = [2, 3, 5, 10, 20, 50, 100, 1_000, 10_000, 100_000],
     n_trials: int = DEFAULT_TRIALS,
     inner: int = 1000,
 ) -> dict[str, Any]:
-    """Measure cumulative_fuse throughput at varying opinion counts."""
+    """Measure cumulative_fuse throughput at varying opinion counts.
+
+    ``mean_us`` times :func:`cumulative_fuse` (closed n-ary form for
+    n ≥ 3).  The pairwise left fold and :func:`cumulative_fuse_tree`
+    are timed on the same inputs for comparison, together with the
+    largest component-wise deviation of each from the fold.
+    """
     results = {}
     for n in sizes:
         opinions = _make_opinion_batch(n)
+        # Keep total work per trial roughly constant for large n
+        n_inner = max(1, min(inner, 100_000 // n))
+        trials = n_trials if n < 10_000 else min(n_trials, 10)
 
         stats = timed_trials_us(
             lambda: cumulative_fuse(*opinions),
-            inner_iterations=inner,
-            n=n_trials,
+            inner_iterations=n_inner,
+            n=trials,
+        )
+        fold_stats = timed_trials_us(
+            lambda: _cumulative_fold(opinions),
+            inner_iterations=n_inner,
+            n=trials,
+        )
+        tree_stats = timed_trials_us(
+            lambda: cumulative_fuse_tree(*opinions),
+            inner_iterations=n_inner,
+            n=trials,
         )
 
+        fold = _cumulative_fold(opinions)
+        closed = cumulative_fuse(*opinions)
+        tree = cumulative_fuse_tree(*opinions)
+
+        def _max_diff(o: Opinion) -> float:
+            return max(
+                abs(o.belief - fold.belief),
+                abs(o.disbelief - fold.disbelief),
+                abs(o.uncertainty - fold.uncertainty),
+            )
+
         results[f"n={n}"] = {
             "n_opinions": n,
             "mean_us": round(stats.mean * 1e6, 3),
             "std_us": round(stats.std * 1e6, 3),
             "ops_per_sec": round(1.0 / stats.mean, 0) if stats.mean > 0 else 0,
+            "fold_mean_us": round(fold_stats.mean * 1e6, 3),
+            "tree_mean_us": round(tree_stats.mean * 1e6, 3),
+            "speedup_vs_fold": (
+                round(fold_stats.mean / stats.mean, 2) if stats.mean > 0 else 0
+            ),
+            "tree_speedup_vs_fold": (
+                round(fold_stats.mean / tree_stats.mean, 2) if tree_stats.mean > 0 else 0
+            ),
+            "closed_max_diff_vs_fold": _max_diff(closed),
+            "tree_max_diff_vs_fold": _max_diff(tree),
             **stats.to_dict(),
         }
     return results
@@ -397,9 +448,65 @@ def bench_opinion_formation(
         "std_us": round(stats.std * 1e6, 3),
     }
 
+    # Validating constructor vs the trusted fast path used by operators
+    b, d, u, a = opinion.belief, opinion.disbelief, opinion.uncertainty, opinion.base_rate
+    validating = timed_trials_us(
+        lambda: Opinion(belief=b, disbelief=d, uncertainty=u, base_rate=a),
+        inner_iterations=inner,
+        n=n_trials,
+    )
+    trusted = timed_trials_us(
+        lambda: Opinion._trusted_create(b, d, u, a),
+        inner_iterations=inner,
+        n=n_trials,
+    )
+    results["construct_validating"] = {
+        "mean_us": round(validating.mean * 1e6, 3),
+        "std_us": round(validating.std * 1e6, 3),
+    }
+    results["construct_trusted"] = {
+        "mean_us": round(trusted.mean * 1e6, 3),
+        "std_us": round(trusted.std * 1e6, 3),
+        "speedup": round(validating.mean / trusted.mean, 2) if trusted.mean > 0 else 0,
+        "instance_bytes": sys.getsizeof(opinion) + sys.getsizeof(getattr(opinion, "__dict__", {})),
+    }
+
+    # Hot loop: trust discount with and without re-validating its result
+    trust = _random_opinion(rng)
+    validating = timed_trials_us(
+        lambda: _trust_discount_validating(trust, opinion),
+        inner_iterations=inner,
+        n=n_trials,
+    )
+    trusted = timed_trials_us(
+        lambda: trust_discount(trust, opinion),
+        inner_iterations=inner,
+        n=n_trials,
+    )
+    results["trust_discount_validating"] = {
+        "mean_us": round(validating.mean * 1e6, 3),
+        "std_us": round(validating.std * 1e6, 3),
+    }
+    results["trust_discount_trusted"] = {
+        "mean_us": round(trusted.mean * 1e6, 3),
+        "std_us": round(trusted.std * 1e6, 3),
+        "speedup": round(validating.mean / trusted.mean, 2) if trusted.mean > 0 else 0,
+    }
+
     return results
 
 
+def _trust_discount_validating(trust: Opinion, opinion: Opinion) -> Opinion:
+    """trust_discount building its result through the full constructor."""
+    b_trust = trust.belief
+    return Opinion(
+        belief=b_trust * opinion.belief,
+        disbelief=b_trust * opinion.disbelief,
+        uncertainty=trust.disbelief + trust.uncertainty + b_trust * opinion.uncertainty,
+        base_rate=opinion.base_rate,
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════
 # A6: Scalar ↔ Algebra Information Comparison
 # ═══════════════════════════════════════════════════════════════════
@@ -615,7 +722,9 @@ if __name__ == "__main__":
     print("\n--- Cumulative Fusion (μs per fusion) ---")
     for k, v in r.cumulative_fusion.items():
         print(f"  {k}: {v['mean_us']:.2f} ± {v['std_us']:.2f} μs "
-              f"({v['ops_per_sec']:,.0f} ops/sec)")
+              f"({v['ops_per_sec']:,.0f} ops/sec) | fold {v['fold_mean_us']:.2f} μs "
+              f"({v['speedup_vs_fold']:.1f}x), tree {v['tree_mean_us']:.2f} μs "
+              f"({v['tree_speedup_vs_fold']:.1f}x)")
 
     print("\n--- Averaging Fusion (μs per fusion) ---")
     for k, v in r.averaging_fusion.items():
@@ -643,7 +752,8 @@ if __name__ == "__main__":
 
     print("\n--- Opinion Formation ---")
     for k, v in r.opinion_formation.items():
-        print(f"  {k}: {v['mean_us']:.2f} ± {v['std_us']:.2f} μs")
+        extra = f" ({v['speedup']:.1f}x)" if "speedup" in v else ""
+        print(f"  {k}: {v['mean_us']:.2f} ± {v['std_us']:.2f} μs{extra}")
 
     print("\n--- Information Richness ---")
     for k, v in r.information_richness.items():
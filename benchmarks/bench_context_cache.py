@@ -0,0 +1,104 @@
+"""
+Benchmark: Processed Context Cache
+
+Expands many small documents that share one inline ``@context`` and
+compares plain PyLD (context re-processed on every call) with
+``JsonLdEx.expand`` reusing its processed-context cache.
+
+Measures:
+  - Documents/sec for both paths, with stddev and 95% CI
+  - Cache hits and misses over the run
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pyld import jsonld
+
+from jsonld_ex import JsonLdEx
+
+from bench_utils import timed_trials
+
+
+SHARED_CONTEXT: dict[str, Any] = {
+    "@vocab": "http://schema.org/",
+    "jsonld-ex": "http://www.w3.org/ns/jsonld-ex/",
+    "name": "http://schema.org/name",
+    "knows": {"@id": "http://schema.org/knows", "@type": "@id"},
+    "age": {
+        "@id": "http://schema.org/age",
+        "@type": "http://www.w3.org/2001/XMLSchema#integer",
+    },
+    "confidence": "jsonld-ex:confidence",
+}
+
+
+def make_documents(n: int) -> list[dict[str, Any]]:
+    """*n* small person documents sharing :data:`SHARED_CONTEXT`."""
+    return [
+        {
+            "@context": SHARED_CONTEXT,
+            "@id": f"http://example.org/person/{i}",
+            "@type": "Person",
+            "name": f"Person {i}",
+            "age": 20 + i % 60,
+            "knows": f"http://example.org/person/{(i + 1) % n}",
+            "confidence": 0.5 + (i % 50) / 100,
+        }
+        for i in range(n)
+    ]
+
+
+def bench_expand_shared_context(
+    sizes: list[int] = [100_000],
+    n_trials: int = 3,
+) -> dict[str, Any]:
+    """Expand *n* documents sharing one context, with and without the cache."""
+    results = {}
+    for n in sizes:
+        docs = make_documents(n)
+        processor = JsonLdEx()
+        loader = processor.document_loader
+
+        def do_pyld():
+            for d in docs:
+                jsonld.expand(d, {"documentLoader": loader})
+
+        def do_cached():
+            for d in docs:
+                processor.expand(d)
+
+        stats_pyld = timed_trials(do_pyld, n=n_trials, warmup=1)
+        stats_cached = timed_trials(do_cached, n=n_trials, warmup=1)
+        cache = processor.context_cache
+
+        results[f"n={n}"] = {
+            "pyld": {
+                **stats_pyld.to_dict(),
+                "docs_per_sec": round(n / stats_pyld.mean, 1) if stats_pyld.mean > 0 else 0,
+            },
+            "cached": {
+                **stats_cached.to_dict(),
+                "docs_per_sec": round(n / stats_cached.mean, 1) if stats_cached.mean > 0 else 0,
+            },
+            "speedup": round(stats_pyld.mean / stats_cached.mean, 2) if stats_cached.mean > 0 else 0,
+            "cache_hits": cache.hits,
+            "cache_misses": cache.misses,
+        }
+    return results
+
+
+def run_all() -> dict[str, Any]:
+    print("=== Processed Context Cache ===\n")
+    print("Expanding documents with a shared @context...")
+    return {"expand_shared_context": bench_expand_shared_context()}
+
+
+if __name__ == "__main__":
+    r = run_all()
+    print("\n--- Expansion Throughput ---")
+    for k, v in r["expand_shared_context"].items():
+        print(f"  {k}: PyLD {v['pyld']['docs_per_sec']:.0f} docs/s, "
+              f"cached {v['cached']['docs_per_sec']:.0f} docs/s "
+              f"({v['speedup']}x; {v['cache_hits']} hits, {v['cache_misses']} misses)")
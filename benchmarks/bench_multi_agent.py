@@ -3,14 +3,17 @@ Benchmark Domain 2: Multi-Agent Knowledge Graph Construction
 
 Measures:
   - merge_graphs throughput at varying scale and conflict rates
+  - Partitioned (multi-process) merge scaling by worker count
   - Confidence propagation overhead per chain length
   - combine_sources comparison across methods
   - diff_graphs throughput
+  - Hashed snapshot diff (diff_graphs_hashed) vs diff_graphs
   All with stddev, 95% CI, and n=30 trials.
 """
 
 from __future__ import annotations
 
+import os
 import time
 import json
 import random
@@ -20,6 +23,8 @@ from typing import Any
 from jsonld_ex import (
     merge_graphs,
     diff_graphs,
+    diff_graphs_hashed,
+    summarize_graph,
     propagate_confidence,
     combine_sources,
     resolve_conflict,
@@ -33,9 +38,11 @@ from bench_utils import timed_trials, timed_trials_us, DEFAULT_TRIALS
 class MultiAgentResults:
     merge_throughput: dict[str, Any] = field(default_factory=dict)
     merge_by_conflict_rate: dict[str, Any] = field(default_factory=dict)
+    merge_scaling: dict[str, Any] = field(default_factory=dict)
     propagation_overhead: dict[str, Any] = field(default_factory=dict)
     combination_comparison: dict[str, Any] = field(default_factory=dict)
     diff_throughput: dict[str, Any] = field(default_factory=dict)
+    diff_hashed: dict[str, Any] = field(default_factory=dict)
 
 
 def bench_merge_throughput(
@@ -60,6 +67,33 @@ def bench_merge_throughput(
     return results
 
 
+def bench_merge_scaling(
+    n_nodes: int = 100_000,
+    n_sources: int = 3,
+    worker_counts: list[int] | None = None,
+    n_trials: int = 3,
+) -> dict[str, Any]:
+    """Partitioned merge: wall time by ``max_workers`` on one large merge."""
+    if worker_counts is None:
+        cpus = os.cpu_count() or 1
+        worker_counts = sorted({1, 2, 4, 8, 16, 32, cpus} & set(range(1, cpus + 1)))
+    graphs = make_conflicting_graphs(n_nodes, n_sources, conflict_rate=0.3)
+    results = {}
+    baseline = None
+    for workers in worker_counts:
+        stats = timed_trials(
+            lambda: merge_graphs(graphs, max_workers=workers), n=n_trials, warmup=0,
+        )
+        if baseline is None:
+            baseline = stats.mean
+        results[f"workers={workers}"] = {
+            **stats.to_dict(),
+            "nodes_per_sec": round(n_nodes / stats.mean, 1) if stats.mean > 0 else 0,
+            "speedup": round(baseline / stats.mean, 2) if stats.mean > 0 else 0,
+        }
+    return results
+
+
 def bench_merge_by_conflict_rate(
     n_nodes: int = 100,
     n_sources: int = 3,
@@ -161,6 +195,42 @@ def bench_diff_throughput(
     return results
 
 
+def bench_diff_hashed(
+    n_nodes: int = 100_000,
+    change_rate: float = 0.01,
+    n_trials: int = 3,
+) -> dict[str, Any]:
+    """Nightly-snapshot diff: diff_graphs vs diff_graphs_hashed.
+
+    The new snapshot modifies a *change_rate* fraction of the nodes.  The
+    hashed diff is timed from scratch and with a persisted summary of
+    the old snapshot, where only the new snapshot is hashed.
+    """
+    old = make_conflicting_graphs(n_nodes, 1, conflict_rate=0.0)[0]
+    new_nodes = [dict(node) for node in old["@graph"]]
+    step = max(1, round(1 / change_rate)) if change_rate > 0 else len(new_nodes) + 1
+    for node in new_nodes[::step]:
+        node["changed"] = True
+    new = {**old, "@graph": new_nodes}
+    summary_old = summarize_graph(old)
+
+    stats_full = timed_trials(lambda: diff_graphs(old, new), n=n_trials, warmup=0)
+    stats_hashed = timed_trials(lambda: diff_graphs_hashed(old, new), n=n_trials, warmup=0)
+    stats_summary = timed_trials(
+        lambda: diff_graphs_hashed(old, new, summary_a=summary_old), n=n_trials, warmup=0,
+    )
+    return {
+        "n_nodes": n_nodes,
+        "changed_nodes": len(new_nodes[::step]) if change_rate > 0 else 0,
+        "diff_graphs": stats_full.to_dict(),
+        "hashed": stats_hashed.to_dict(),
+        "hashed_with_summary": stats_summary.to_dict(),
+        "speedup_with_summary": (
+            round(stats_full.mean / stats_summary.mean, 2) if stats_summary.mean > 0 else 0
+        ),
+    }
+
+
 def run_all() -> MultiAgentResults:
     results = MultiAgentResults()
     print("=== Domain 2: Multi-Agent KG Construction ===\n")
@@ -168,6 +238,9 @@ def run_all() -> MultiAgentResults:
     print("2.1  Merge throughput by scale...")
     results.merge_throughput = bench_merge_throughput()
 
+    print("2.1b Partitioned merge scaling...")
+    results.merge_scaling = bench_merge_scaling()
+
     print("2.2  Merge by conflict rate...")
     results.merge_by_conflict_rate = bench_merge_by_conflict_rate()
 
@@ -180,6 +253,9 @@ def run_all() -> MultiAgentResults:
     print("2.5  Diff throughput...")
     results.diff_throughput = bench_diff_throughput()
 
+    print("2.6  Hashed snapshot diff...")
+    results.diff_hashed = bench_diff_hashed()
+
     return results
 
 
@@ -191,7 +267,20 @@ if __name__ == "__main__":
         print(f"  {k}: {v['nodes_per_sec']:.0f} nodes/s "
               f"(mean {v['mean_sec']*1000:.1f}ms ± {v['std_sec']*1000:.2f}ms, n={v['n_trials']})")
 
+    print("\n--- Partitioned Merge Scaling ---")
+    for k, v in r.merge_scaling.items():
+        print(f"  {k}: {v['nodes_per_sec']:.0f} nodes/s "
+              f"(mean {v['mean_sec']*1000:.1f}ms, {v['speedup']}x)")
+
     print("\n--- Merge by Conflict Rate ---")
     for k, v in r.merge_by_conflict_rate.items():
         print(f"  {k}: {v['mean_sec']*1000:.1f}ms ± {v['std_sec']*1000:.2f}ms, "
               f"agreed={v['properties_agreed']}, conflicted={v['properties_conflicted']}")
+
+    print("\n--- Hashed Snapshot Diff ---")
+    v = r.diff_hashed
+    print(f"  n={v['n_nodes']} ({v['changed_nodes']} changed): "
+          f"diff_graphs {v['diff_graphs']['mean_sec']*1000:.0f}ms, "
+          f"hashed {v['hashed']['mean_sec']*1000:.0f}ms, "
+          f"with summary {v['hashed_with_summary']['mean_sec']*1000:.0f}ms "
+          f"({v['speedup_with_summary']}x)")
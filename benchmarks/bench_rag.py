@@ -4,6 +4,7 @@ Benchmark Domain 4: RAG Pipeline & Temporal Queries
 Measures:
   - Confidence-filtered retrieval throughput
   - Temporal query (query_at_time) performance
+  - TemporalIndex point-in-time and range queries vs the query_at_time scan
   - temporal_diff overhead at scale
   - End-to-end RAG-style pipeline: merge → filter
   All with stddev, 95% CI, and n=30 trials.
@@ -21,6 +22,7 @@ from jsonld_ex import (
     query_at_time,
     temporal_diff,
     add_temporal,
+    TemporalIndex,
 )
 
 from data_generators import (
@@ -36,6 +38,7 @@ class RAGResults:
     confidence_filter: dict[str, Any] = field(default_factory=dict)
     temporal_query: dict[str, Any] = field(default_factory=dict)
     temporal_diff_bench: dict[str, Any] = field(default_factory=dict)
+    temporal_index: dict[str, Any] = field(default_factory=dict)
     rag_pipeline: dict[str, Any] = field(default_factory=dict)
 
 
@@ -125,6 +128,38 @@ def bench_temporal_query(
     return results
 
 
+def bench_temporal_index(
+    node_counts: list[int] = [1000, 5000, 100_000],
+    versions_per_node: int = 4,
+    n_trials: int = 5,
+) -> dict[str, Any]:
+    """Repeated as-of queries: query_at_time scan vs a prebuilt TemporalIndex."""
+    results = {}
+    for n in node_counts:
+        graph = make_temporal_graph(n, versions_per_node)
+        build = timed_trials(lambda: TemporalIndex(graph), n=1, warmup=0)
+        index = TemporalIndex(graph)
+
+        stats_scan = timed_trials(
+            lambda: query_at_time(graph, "2022-06-15T00:00:00Z"), n=n_trials, warmup=1,
+        )
+        stats_index = timed_trials(
+            lambda: index.query_at_time("2022-06-15T00:00:00Z"), n=n_trials, warmup=1,
+        )
+        stats_range = timed_trials(
+            lambda: index.query_range("2022-06-15T00:00:00Z", "2022-06-22T00:00:00Z"),
+            n=n_trials, warmup=1,
+        )
+        results[f"n={n}"] = {
+            "build_ms": build.mean_ms(),
+            "scan_ms": stats_scan.mean_ms(),
+            "index_ms": stats_index.mean_ms(),
+            "range_ms": stats_range.mean_ms(),
+            "speedup": round(stats_scan.mean / stats_index.mean, 2) if stats_index.mean > 0 else 0,
+        }
+    return results
+
+
 def bench_temporal_diff(
     node_counts: list[int] = [100, 500, 1000],
     n_trials: int = DEFAULT_TRIALS,
@@ -204,6 +239,9 @@ def run_all() -> RAGResults:
     print("4.2  Temporal query performance...")
     results.temporal_query = bench_temporal_query()
 
+    print("4.2b Temporal index...")
+    results.temporal_index = bench_temporal_index()
+
     print("4.3  Temporal diff...")
     results.temporal_diff_bench = bench_temporal_diff()
 
@@ -225,3 +263,8 @@ if __name__ == "__main__":
     for k, v in r.temporal_query.items():
         print(f"  {k}: {v['avg_ms']:.1f} ± {v['std_ms']:.2f}ms "
               f"({v['nodes_per_sec']:.0f} nodes/s, n={v['n_trials']})")
+
+    print("\n--- Temporal Index ---")
+    for k, v in r.temporal_index.items():
+        print(f"  {k}: scan {v['scan_ms']:.1f}ms, index {v['index_ms']:.1f}ms "
+              f"({v['speedup']}x), range {v['range_ms']:.1f}ms, build {v['build_ms']:.0f}ms")
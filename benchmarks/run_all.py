@@ -80,10 +80,12 @@ def main() -> None:
         },
         "domain_2_multi_agent": {
             "merge_throughput": d2.merge_throughput,
+            "merge_scaling": d2.merge_scaling,
             "merge_by_conflict_rate": d2.merge_by_conflict_rate,
             "propagation_overhead": d2.propagation_overhead,
             "combination_comparison": d2.combination_comparison,
             "diff_throughput": d2.diff_throughput,
+            "diff_hashed": d2.diff_hashed,
         },
         "domain_3_iot": {
             "payload_sizes": d3.payload_sizes,
@@ -94,6 +96,7 @@ def main() -> None:
         "domain_4_rag": {
             "confidence_filter": d4.confidence_filter,
             "temporal_query": d4.temporal_query,
+            "temporal_index": d4.temporal_index,
             "temporal_diff": d4.temporal_diff_bench,
             "rag_pipeline": d4.rag_pipeline,
         },
@@ -211,19 +214,21 @@ def _generate_markdown(results, d1, d2, d3, d4, db, d5, d6) -> str:
         f"### Round-trip Fidelity: {rt['fidelity']:.1%} "
         f"({rt['confidence_preserved']}/{rt['total_annotated_properties']} properties)",
         "",
-        "### Conversion Throughput (n=30 trials)",
+        "### Conversion Throughput (n=30 trials; 3 above 1K nodes)",
         "",
-        "| Scale | to_prov_o (nodes/s) | to_prov_o ± σ (ms) | from_prov_o (nodes/s) | from_prov_o ± σ (ms) |",
-        "|-------|---------------------|--------------------|-----------------------|----------------------|",
+        "| Scale | to_prov_o (nodes/s) | to_prov_o ± σ (ms) | from_prov_o (nodes/s) | from_prov_o ± σ (ms) | iter_prov_o (nodes/s) |",
+        "|-------|---------------------|--------------------|-----------------------|----------------------|-----------------------|",
     ]
     for k, v in d1.conversion_throughput.items():
         tp = v['to_prov_o']
         fp = v['from_prov_o']
+        ip = v['iter_prov_o']
         lines.append(
             f"| {k} | {tp['nodes_per_sec']:,.0f} | "
             f"{tp['mean_sec']*1000:.2f} ± {tp['std_sec']*1000:.2f} | "
             f"{fp['nodes_per_sec']:,.0f} | "
-            f"{fp['mean_sec']*1000:.2f} ± {fp['std_sec']*1000:.2f} |"
+            f"{fp['mean_sec']*1000:.2f} ± {fp['std_sec']*1000:.2f} | "
+            f"{ip['nodes_per_sec']:,.0f} |"
         )
 
     # ── Domain 1 Analysis ──
@@ -277,6 +282,19 @@ def _generate_markdown(results, d1, d2, d3, d4, db, d5, d6) -> str:
             f"{v['nodes_per_sec']:,.0f} | [{ci[0]:,.0f}, {ci[1]:,.0f}] |"
         )
 
+    lines += [
+        "",
+        "### Partitioned Merge Scaling",
+        "",
+        "| Workers | Mean ± σ (ms) | Nodes/sec | Speedup |",
+        "|---------|---------------|-----------|---------|",
+    ]
+    for k, v in d2.merge_scaling.items():
+        lines.append(
+            f"| {k} | {v['mean_sec']*1000:.2f} ± {v['std_sec']*1000:.2f} | "
+            f"{v['nodes_per_sec']:,.0f} | {v['speedup']}x |"
+        )
+
     lines += [
         "",
         "### Merge by Conflict Rate (n=30 trials)",
@@ -7,7 +7,8 @@ Wraps PyLD for core JSON-LD processing and adds extension layers.
 
 __version__ = "0.7.1"
 
-from jsonld_ex.processor import JsonLdEx
+from jsonld_ex.processor import JsonLdEx, DocumentResult
+from jsonld_ex.document_loader import CachingDocumentLoader, BUNDLED_CONTEXTS
 from jsonld_ex.ai_ml import annotate, get_confidence, get_provenance, filter_by_confidence
 from jsonld_ex.vector import validate_vector, cosine_similarity, vector_term_definition
 from jsonld_ex.similarity import (
@@ -34,20 +35,34 @@ from jsonld_ex.similarity import (
     get_all_metric_properties,
 )
 from jsonld_ex.security import compute_integrity, verify_integrity, is_context_allowed
-from jsonld_ex.validation import validate_node, validate_document
+from jsonld_ex.validation import (
+    validate_node,
+    validate_document,
+    compile_shape,
+    CompiledShape,
+    ShapeIndex,
+)
 from jsonld_ex.owl_interop import (
     ConversionReport,
     VerbosityComparison,
     to_prov_o,
     to_prov_o_graph,
+    iter_prov_o,
     from_prov_o,
     shape_to_shacl,
     shacl_to_shape,
     shape_to_owl_restrictions,
     owl_to_shape,
+    ShapeTranslator,
+    ShapeRegistryTranslation,
     to_rdf_star_ntriples,
     from_rdf_star_ntriples,
+    from_rdf_star_ntriples_stream,
     to_rdf_star_turtle,
+    iter_rdf_star_ntriples,
+    iter_rdf_star_turtle,
+    write_rdf_star_ntriples,
+    write_rdf_star_turtle,
     to_ssn,
     from_ssn,
     compare_with_prov_o,
@@ -64,13 +79,16 @@ from jsonld_ex.inference import (
 from jsonld_ex.confidence_algebra import (
     Opinion,
     cumulative_fuse,
+    cumulative_fuse_tree,
     averaging_fuse,
     trust_discount,
     deduce,
     pairwise_conflict,
     conflict_metric,
     robust_fuse,
+    intern_opinion,
 )
+from jsonld_ex.confidence_array import OpinionArray
 from jsonld_ex.confidence_bridge import (
     combine_opinions_from_scalars,
     propagate_opinions_from_scalars,
@@ -80,6 +98,7 @@ from jsonld_ex.confidence_decay import (
     exponential_decay,
     linear_decay,
     step_decay,
+    decay_opinions_batch,
 )
 from jsonld_ex.confidence_byzantine import (
     ByzantineStrategy,
@@ -95,6 +114,9 @@ from jsonld_ex.confidence_byzantine import (
     byzantine_fuse,
     build_conflict_matrix,
     cohesion_score,
+    conflict_matrix_array,
+    distance_matrix_array,
+    StreamingByzantineFuser,
 )
 from jsonld_ex.confidence_temporal_fusion import (
     TimestampedOpinion,
@@ -103,10 +125,16 @@ from jsonld_ex.confidence_temporal_fusion import (
     temporal_fuse,
     temporal_fuse_weighted,
     temporal_byzantine_fuse,
+    TemporalFusionWindow,
 )
 from jsonld_ex.merge import (
     merge_graphs,
+    merge_graph_streams,
     diff_graphs,
+    diff_graphs_hashed,
+    summarize_graph,
+    node_hash,
+    GraphSummary,
     MergeReport,
     MergeConflict,
 )
@@ -115,8 +143,14 @@ from jsonld_ex.temporal import (
     query_at_time,
     temporal_diff,
     TemporalDiffResult,
+    TemporalIndex,
+)
+from jsonld_ex.batch import (
+    annotate_batch,
+    validate_batch,
+    iter_validate_batch,
+    filter_by_confidence_batch,
 )
-from jsonld_ex.batch import annotate_batch, validate_batch, filter_by_confidence_batch
 from jsonld_ex.dataset import (
     create_dataset_metadata,
     validate_dataset_metadata,
@@ -224,6 +258,7 @@ try:
         TrustChainReport,
         # Temporal & escalation
         fhir_temporal_decay,
+        fhir_temporal_decay_batch,
         fhir_escalation_policy,
         # Bundle processing
         fhir_bundle_annotate,
@@ -258,6 +293,9 @@ except ImportError:
 
 __all__ = [
     "JsonLdEx",
+    "DocumentResult",
+    "CachingDocumentLoader",
+    "BUNDLED_CONTEXTS",
     # AI/ML annotations
     "annotate",
     "get_confidence",
@@ -297,17 +335,28 @@ __all__ = [
     # Validation
     "validate_node",
     "validate_document",
+    "compile_shape",
+    "CompiledShape",
+    "ShapeIndex",
     # OWL/RDF interoperability
     "to_prov_o",
     "to_prov_o_graph",
+    "iter_prov_o",
     "from_prov_o",
     "shape_to_shacl",
     "shacl_to_shape",
     "shape_to_owl_restrictions",
     "owl_to_shape",
+    "ShapeTranslator",
+    "ShapeRegistryTranslation",
     "to_rdf_star_ntriples",
     "from_rdf_star_ntriples",
+    "from_rdf_star_ntriples_stream",
     "to_rdf_star_turtle",
+    "iter_rdf_star_ntriples",
+    "iter_rdf_star_turtle",
+    "write_rdf_star_ntriples",
+    "write_rdf_star_turtle",
     "to_ssn",
     "from_ssn",
     "ConversionReport",
@@ -324,12 +373,15 @@ __all__ = [
     # Formal confidence algebra (Subjective Logic)
     "Opinion",
     "cumulative_fuse",
+    "cumulative_fuse_tree",
     "averaging_fuse",
     "trust_discount",
     "deduce",
     "pairwise_conflict",
     "conflict_metric",
     "robust_fuse",
+    "intern_opinion",
+    "OpinionArray",
     "combine_opinions_from_scalars",
     "propagate_opinions_from_scalars",
     # Temporal decay
@@ -337,9 +389,15 @@ __all__ = [
     "exponential_decay",
     "linear_decay",
     "step_decay",
+    "decay_opinions_batch",
     # Graph merging
     "merge_graphs",
+    "merge_graph_streams",
     "diff_graphs",
+    "diff_graphs_hashed",
+    "summarize_graph",
+    "node_hash",
+    "GraphSummary",
     "MergeReport",
     "MergeConflict",
     # Temporal extensions
@@ -347,6 +405,7 @@ __all__ = [
     "query_at_time",
     "temporal_diff",
     "TemporalDiffResult",
+    "TemporalIndex",
     # Dataset metadata (Croissant interop)
     "create_dataset_metadata",
     "validate_dataset_metadata",
@@ -362,6 +421,7 @@ __all__ = [
     # Batch API
     "annotate_batch",
     "validate_batch",
+    "iter_validate_batch",
     "filter_by_confidence_batch",
     # CBOR-LD serialization (requires cbor2)
     "to_cbor",
@@ -445,6 +505,7 @@ __all__ = [
     "TrustChainReport",
     # FHIR R4 — temporal & escalation
     "fhir_temporal_decay",
+    "fhir_temporal_decay_batch",
     "fhir_escalation_policy",
     # FHIR R4 — bundle processing
     "fhir_bundle_annotate",
@@ -487,6 +548,9 @@ __all__ = [
     "byzantine_fuse",
     "build_conflict_matrix",
     "cohesion_score",
+    "conflict_matrix_array",
+    "distance_matrix_array",
+    "StreamingByzantineFuser",
     # Temporal fusion
     "TimestampedOpinion",
     "TemporalFusionConfig",
@@ -494,4 +558,5 @@ __all__ = [
     "temporal_fuse",
     "temporal_fuse_weighted",
     "temporal_byzantine_fuse",
+    "TemporalFusionWindow",
 ]
@@ -5,10 +5,12 @@ targeting 100K+ nodes for ML pipeline scalability.
 """
 
 from __future__ import annotations
-from typing import Any, Optional, Sequence, Union
+from collections import deque
+from itertools import islice
+from typing import Any, Iterable, Iterator, Optional, Sequence, Union
 
 from jsonld_ex.ai_ml import annotate, get_confidence
-from jsonld_ex.validation import ValidationResult, validate_node
+from jsonld_ex.validation import CompiledShape, ValidationResult, compile_shape
 
 
 def annotate_batch(
@@ -77,13 +79,87 @@ def annotate_batch(
 
 def validate_batch(
     nodes: Sequence[dict[str, Any]],
-    shape: dict[str, Any],
+    shape: Union[dict[str, Any], CompiledShape],
+    *,
+    shape_registry: Optional[dict[str, dict[str, Any]]] = None,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 4096,
 ) -> list[ValidationResult]:
     """Validate a list of nodes against a single shape.
 
+    The shape is compiled once (see
+    :func:`~jsonld_ex.validation.compile_shape`) and reused for every node;
+    pass a :class:`~jsonld_ex.validation.CompiledShape` to share one plan
+    across calls.  *shape_registry* resolves named ``@extends`` references
+    and is ignored for compiled shapes.
+
+    With ``max_workers`` greater than 1 the nodes are split into chunks of
+    *chunk_size* and validated in a
+    :class:`concurrent.futures.ProcessPoolExecutor`; the shape is sent to
+    each worker once, not once per chunk.  Nodes and results must be
+    picklable.
+
     Returns one :class:`ValidationResult` per node, in order.
     """
-    return [validate_node(node, shape) for node in nodes]
+    if max_workers is None or max_workers <= 1:
+        if not isinstance(shape, CompiledShape):
+            shape = compile_shape(shape, shape_registry)
+        validate = shape.validate
+        return [validate(node) for node in nodes]
+    return list(iter_validate_batch(
+        nodes, shape, shape_registry=shape_registry,
+        max_workers=max_workers, chunk_size=chunk_size,
+    ))
+
+
+def iter_validate_batch(
+    nodes: Iterable[dict[str, Any]],
+    shape: Union[dict[str, Any], CompiledShape],
+    *,
+    shape_registry: Optional[dict[str, dict[str, Any]]] = None,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 4096,
+) -> Iterator[ValidationResult]:
+    """Streaming :func:`validate_batch`: yield results as chunks finish.
+
+    *nodes* may be any iterable (e.g. a generator over a file) and is
+    consumed lazily.  Results are yielded in input order; in parallel mode
+    at most ``2 * max_workers`` chunks are in flight at once, which bounds
+    memory independently of the input size.  Closing the generator early
+    cancels chunks that have not started.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    if not isinstance(shape, CompiledShape):
+        shape = compile_shape(shape, shape_registry)
+
+    if max_workers is None or max_workers <= 1:
+        validate = shape.validate
+        for node in nodes:
+            yield validate(node)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunks = _chunked(nodes, chunk_size)
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_validate_worker,
+        initargs=(shape,),
+    ) as pool:
+        pending = deque(
+            pool.submit(_validate_chunk, chunk)
+            for chunk in islice(chunks, 2 * max_workers)
+        )
+        try:
+            while pending:
+                results = pending.popleft().result()
+                for chunk in islice(chunks, 1):
+                    pending.append(pool.submit(_validate_chunk, chunk))
+                yield from results
+        finally:
+            for future in pending:
+                future.cancel()
 
 
 def filter_by_confidence_batch(
@@ -118,6 +194,27 @@ def filter_by_confidence_batch(
 
 # -- Internal -----------------------------------------------------------------
 
+# Shape compiled by _init_validate_worker, once per pool worker process.
+_WORKER_SHAPE: Optional[CompiledShape] = None
+
+
+def _init_validate_worker(shape: CompiledShape) -> None:
+    global _WORKER_SHAPE
+    _WORKER_SHAPE = shape
+
+
+def _validate_chunk(nodes: list[dict[str, Any]]) -> list[ValidationResult]:
+    assert _WORKER_SHAPE is not None, "worker not initialised"
+    validate = _WORKER_SHAPE.validate
+    return [validate(node) for node in nodes]
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Yield consecutive lists of up to *size* items from *items*."""
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
 
 def _passes_all(
     node: dict[str, Any],
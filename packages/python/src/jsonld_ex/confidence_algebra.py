@@ -38,8 +38,9 @@ References:
 from __future__ import annotations
 
 import math
+import sys
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Callable, Optional, Sequence
 
 # Tolerance for floating-point comparison in the b + d + u = 1 constraint
 _ADDITIVITY_TOL = 1e-9
@@ -72,7 +73,19 @@ def _validate_component(value: Any, name: str) -> float:
     return fval
 
 
-@dataclass(frozen=True, eq=True)
+# Upper bound on interned opinions (see :func:`intern_opinion`).
+_INTERN_MAX = 1024
+_INTERNED: dict[tuple[float, float, float, float], "Opinion"] = {}
+
+# Bypass the frozen-dataclass __setattr__ in _trusted_create.
+_new_object = object.__new__
+_set_attr = object.__setattr__
+
+# ``slots=True`` needs Python 3.10; on 3.9 Opinion keeps a __dict__.
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, eq=True, **_SLOTS)
 class Opinion:
     """A subjective opinion ω = (b, d, u, a) per Subjective Logic.
 
@@ -116,6 +129,53 @@ class Opinion:
                 f"got {b} + {d} + {u} = {total}"
             )
 
+    @classmethod
+    def _trusted_create(
+        cls,
+        belief: float,
+        disbelief: float,
+        uncertainty: float,
+        base_rate: float = 0.5,
+    ) -> Opinion:
+        """Construct from operator output, skipping re-validation.
+
+        For internal use by operators whose results are valid by
+        construction (floats, finite, b + d + u = 1 analytically).
+        Only the IEEE 754 boundary clamp of :func:`_validate_component`
+        is applied, so results are bitwise identical to ``Opinion(...)``
+        for such inputs.  Vacuous and absolute (b = 1 or d = 1)
+        results are interned.
+        """
+        b, d, u, a = belief, disbelief, uncertainty, base_rate
+        # Common case: strictly non-extreme u, nothing to clamp or intern.
+        extreme = not (
+            0.0 < u < 1.0 and 0.0 <= b <= 1.0 and 0.0 <= d <= 1.0 and 0.0 <= a <= 1.0
+        )
+        if extreme:
+            b = 0.0 if b < 0.0 else 1.0 if b > 1.0 else b
+            d = 0.0 if d < 0.0 else 1.0 if d > 1.0 else d
+            u = 0.0 if u < 0.0 else 1.0 if u > 1.0 else u
+            a = 0.0 if a < 0.0 else 1.0 if a > 1.0 else a
+            extreme = u == 1.0 or (u == 0.0 and (b == 1.0 or d == 1.0))
+            if extreme:
+                cached = _INTERNED.get((b, d, u, a))
+                if cached is not None:
+                    return cached
+        self = _new_object(cls)
+        _set_attr(self, "belief", b)
+        _set_attr(self, "disbelief", d)
+        _set_attr(self, "uncertainty", u)
+        _set_attr(self, "base_rate", a)
+        return intern_opinion(self) if extreme else self
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Frozen slotted dataclasses cannot be unpickled via setattr
+        # on Python 3.10; rebuild through the constructor instead.
+        return (
+            self.__class__,
+            (self.belief, self.disbelief, self.uncertainty, self.base_rate),
+        )
+
     # ── Projections ────────────────────────────────────────────────
 
     def projected_probability(self) -> float:
@@ -262,6 +322,31 @@ class Opinion:
 # ═══════════════════════════════════════════════════════════════════
 
 
+def intern_opinion(opinion: Opinion) -> Opinion:
+    """Return a shared instance equal to *opinion*.
+
+    Opinions are immutable and compare by value, so repeated values
+    (the vacuous opinion, absolute belief/disbelief, common priors)
+    can share one object.  Operators intern vacuous and absolute
+    results automatically.  The cache is bounded; once full, new
+    values are returned unchanged.
+
+    Args:
+        opinion: Any Opinion.
+
+    Returns:
+        The cached instance equal to *opinion*, or *opinion* itself.
+    """
+    _require_opinion(opinion, "opinion")
+    key = (opinion.belief, opinion.disbelief, opinion.uncertainty, opinion.base_rate)
+    cached = _INTERNED.get(key)
+    if cached is not None:
+        return cached
+    if len(_INTERNED) < _INTERN_MAX:
+        _INTERNED[key] = opinion
+    return opinion
+
+
 def _require_opinion(value: object, name: str) -> None:
     """Raise TypeError if *value* is not an Opinion."""
     if not isinstance(value, Opinion):
@@ -305,6 +390,13 @@ def cumulative_fuse(*opinions: Opinion) -> Opinion:
         - Identity:       A ⊕ vacuous = A
         - Uncertainty reduction: u_{A⊕B} ≤ min(u_A, u_B)
 
+    For three or more opinions with at most one dogmatic input, the
+    result is computed in a single pass with the closed n-ary form
+    (see :func:`_cumulative_fuse_closed_form`) instead of folding
+    pairwise, so no intermediate Opinions are built.  With two or more
+    dogmatic inputs the pairwise left fold is used, since the dogmatic
+    limit weights depend on fusion order.
+
     Args:
         *opinions: Two or more opinions to fuse.  A single opinion
                    is returned unchanged.
@@ -319,6 +411,18 @@ def cumulative_fuse(*opinions: Opinion) -> Opinion:
         raise ValueError("cumulative_fuse requires at least one opinion")
     if len(opinions) == 1:
         return opinions[0]
+    if len(opinions) == 2:
+        return _cumulative_fuse_pair(opinions[0], opinions[1])
+
+    closed = _cumulative_fuse_closed_form(
+        [o.belief for o in opinions],
+        [o.disbelief for o in opinions],
+        [o.uncertainty for o in opinions],
+        [o.base_rate for o in opinions],
+    )
+    if closed is not None:
+        b, d, u, a = closed
+        return Opinion._trusted_create(belief=b, disbelief=d, uncertainty=u, base_rate=a)
 
     result = opinions[0]
     for i in range(1, len(opinions)):
@@ -326,6 +430,134 @@ def cumulative_fuse(*opinions: Opinion) -> Opinion:
     return result
 
 
+def _fold_base_rate(base_rates: list[float]) -> float:
+    """Base rate of a left fold of pairwise fusions.
+
+    Each pairwise fusion averages the two base rates, so folding
+    a_1 … a_n from the left yields ((a_1 + a_2)/2 + a_3)/2 … .  The
+    n-ary paths reproduce this so they agree with the fold exactly.
+    """
+    fused_a = base_rates[0]
+    for a in base_rates[1:]:
+        fused_a = (fused_a + a) / 2.0
+    return fused_a
+
+
+def _cumulative_fuse_closed_form(
+    beliefs: list[float],
+    disbeliefs: list[float],
+    uncertainties: list[float],
+    base_rates: list[float],
+) -> Optional[tuple[float, float, float, float]]:
+    """Closed-form n-ary cumulative fusion (Jøsang 2016, §12.3).
+
+    For n sources with at least one non-dogmatic opinion:
+
+        κ = Σ_i ∏_{j≠i} u_j − (n − 1) · ∏_i u_i
+        b = Σ_i b_i · ∏_{j≠i} u_j / κ
+        d = Σ_i d_i · ∏_{j≠i} u_j / κ
+        u = ∏_i u_i / κ
+
+    When every u_i > 0, dividing numerator and denominator by ∏ u_i
+    gives the equivalent evidence-sum form
+
+        B = Σ b_i / u_i,   D = Σ d_i / u_i
+        b = B / (1 + B + D),  d = D / (1 + B + D),  u = 1 / (1 + B + D)
+
+    which never forms the product, so it cannot underflow for long
+    inputs.  Sums use :func:`math.fsum` (exactly rounded), so there is
+    no accumulated drift.  With exactly one dogmatic opinion the
+    products of all other terms vanish and that opinion dominates.
+
+    Operates on raw component lists so batch callers
+    (:class:`~jsonld_ex.confidence_array.OpinionArray`) can share it.
+
+    Returns:
+        ``(b, d, u, a)`` clamped to [0, 1], or ``None`` when two or more
+        opinions are dogmatic (or the evidence sums overflow) and the
+        caller must fall back to the pairwise fold.
+    """
+    fused_a = _fold_base_rate(base_rates)
+
+    dogmatic = -1
+    for i, u in enumerate(uncertainties):
+        if u == 0.0:
+            if dogmatic >= 0:
+                return None
+            dogmatic = i
+    if dogmatic >= 0:
+        return (beliefs[dogmatic], disbeliefs[dogmatic], 0.0, fused_a)
+
+    evidence_b = math.fsum([b / u for b, u in zip(beliefs, uncertainties)])
+    evidence_d = math.fsum([d / u for d, u in zip(disbeliefs, uncertainties)])
+    denom = 1.0 + evidence_b + evidence_d
+    if math.isinf(denom):
+        return None
+
+    fused_b = min(1.0, evidence_b / denom)
+    fused_d = min(1.0, evidence_d / denom)
+    fused_u = min(1.0, 1.0 / denom)
+    return (fused_b, fused_d, fused_u, fused_a)
+
+
+def cumulative_fuse_tree(*opinions: Opinion) -> Opinion:
+    """Cumulative fusion by balanced pairwise (tree) reduction.
+
+    Fuses neighbours pairwise, level by level, so every opinion passes
+    through O(log n) fusion steps instead of up to n − 1 as in a left
+    fold.  Rounding error therefore grows logarithmically rather than
+    linearly, which matters for 10^5+ sources.  Intermediate results
+    are plain floats; only the final Opinion is constructed.
+
+    The result equals :func:`cumulative_fuse` (within floating-point
+    tolerance) whenever at most one input is dogmatic.  With several
+    dogmatic inputs the equal-weight dogmatic limit is applied per
+    pair, so — as for any regrouping — their relative weights follow
+    the tree shape rather than the fold order.  The base rate follows
+    the same recurrence as the left fold.
+
+    Args:
+        *opinions: One or more opinions to fuse.
+
+    Returns:
+        Fused Opinion.
+
+    Raises:
+        ValueError: If no opinions are provided.
+    """
+    if len(opinions) == 0:
+        raise ValueError("cumulative_fuse_tree requires at least one opinion")
+    if len(opinions) == 1:
+        return opinions[0]
+
+    level = [(o.belief, o.disbelief, o.uncertainty) for o in opinions]
+    while len(level) > 1:
+        paired = []
+        for i in range(0, len(level) - 1, 2):
+            b_a, d_a, u_a = level[i]
+            b_b, d_b, u_b = level[i + 1]
+            if u_a == 0.0 and u_b == 0.0:
+                paired.append((0.5 * b_a + 0.5 * b_b, 0.5 * d_a + 0.5 * d_b, 0.0))
+            else:
+                kappa = u_a + u_b - u_a * u_b
+                paired.append((
+                    min(1.0, (b_a * u_b + b_b * u_a) / kappa),
+                    min(1.0, (d_a * u_b + d_b * u_a) / kappa),
+                    min(1.0, (u_a * u_b) / kappa),
+                ))
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+
+    fused_b, fused_d, fused_u = level[0]
+    return Opinion._trusted_create(
+        belief=fused_b,
+        disbelief=fused_d,
+        uncertainty=fused_u,
+        base_rate=_fold_base_rate([o.base_rate for o in opinions]),
+    )
+
+
 def _cumulative_fuse_pair(a: Opinion, b: Opinion) -> Opinion:
     """Cumulative fusion of exactly two opinions."""
     u_a, u_b = a.uncertainty, b.uncertainty
@@ -348,7 +580,7 @@ def _cumulative_fuse_pair(a: Opinion, b: Opinion) -> Opinion:
     # Use average base rate for fused opinions
     fused_a = (a.base_rate + b.base_rate) / 2.0
 
-    return Opinion(
+    return Opinion._trusted_create(
         belief=fused_b,
         disbelief=fused_d,
         uncertainty=fused_u,
@@ -432,7 +664,7 @@ def _averaging_fuse_pair(a: Opinion, b: Opinion) -> Opinion:
 
     fused_a = (a.base_rate + b.base_rate) / 2.0
 
-    return Opinion(
+    return Opinion._trusted_create(
         belief=fused_b,
         disbelief=fused_d,
         uncertainty=fused_u,
@@ -506,7 +738,7 @@ def _averaging_fuse_nary(opinions: tuple[Opinion, ...] | list[Opinion]) -> Opini
 
     fused_a = sum(o.base_rate for o in opinions) / n
 
-    return Opinion(
+    return Opinion._trusted_create(
         belief=fused_b,
         disbelief=fused_d,
         uncertainty=fused_u,
@@ -543,7 +775,7 @@ def trust_discount(trust: Opinion, opinion: Opinion) -> Opinion:
     fused_d = b_trust * opinion.disbelief
     fused_u = trust.disbelief + trust.uncertainty + b_trust * opinion.uncertainty
 
-    return Opinion(
+    return Opinion._trusted_create(
         belief=fused_b,
         disbelief=fused_d,
         uncertainty=fused_u,
@@ -630,7 +862,7 @@ def deduce(
     p_y_given_not_x = ynx.projected_probability()
     a_y = a_x * p_y_given_x + a_x_bar * p_y_given_not_x
 
-    return Opinion(
+    return Opinion._trusted_create(
         belief=b_y,
         disbelief=d_y,
         uncertainty=u_y,
@@ -733,6 +965,10 @@ def robust_fuse(
            agents have been removed.
         5. Fuse the remaining opinions via cumulative fusion.
 
+    Pairwise conflicts are summed once; each removal then updates the
+    per-agent sums in O(n) (see :class:`_DiscordTracker`), so the whole
+    filter is O(n²) rather than O(n²) per removal.
+
     Args:
         opinions:     List of opinions from independent agents.
         threshold:    Discord score above which an agent is removed.
@@ -765,40 +1001,122 @@ def robust_fuse(
     if max_removals is None:
         max_removals = len(opinions) // 2
 
-    # Track original indices alongside opinions
-    indexed: list[tuple[int, Opinion]] = list(enumerate(opinions))
+    tracker = _DiscordTracker(opinions)
     removed: list[int] = []
 
     for _ in range(max_removals):
-        n = len(indexed)
-        if n <= 2:
+        if tracker.size <= 2:
             break  # Can't go below 2 agents
 
-        # Compute discord score for each remaining agent
-        discord = [0.0] * n
-        for i in range(n):
-            for j in range(i + 1, n):
-                c = pairwise_conflict(indexed[i][1], indexed[j][1])
-                discord[i] += c
-                discord[j] += c
-
-        # Normalize to mean conflict per peer
-        for i in range(n):
-            discord[i] /= (n - 1)
-
-        # Find worst agent
-        worst_idx = max(range(n), key=lambda k: discord[k])
-        worst_score = discord[worst_idx]
+        # Find worst agent (first in original order on exact ties)
+        candidates = tracker.candidates(lambda _idx, disc: (disc,))
+        scores = [tracker.exact_discord(idx) for idx in candidates]
+        worst = max(range(len(candidates)), key=lambda k: scores[k])
 
-        if worst_score < threshold:
+        if scores[worst] < threshold:
             break  # Group is cohesive enough
 
         # Remove worst agent, record its original index
-        original_idx, _ = indexed.pop(worst_idx)
-        removed.append(original_idx)
+        tracker.remove(candidates[worst])
+        removed.append(candidates[worst])
 
     # Fuse remaining opinions
-    remaining_opinions = [op for _, op in indexed]
+    remaining_opinions = [opinions[idx] for idx in tracker.alive]
     fused = cumulative_fuse(*remaining_opinions)
 
     return (fused, removed)
+
+
+class _DiscordTracker:
+    """Incremental per-agent discord over a shrinking group of agents.
+
+    Iterative Byzantine filtering (:func:`robust_fuse`,
+    :func:`~jsonld_ex.confidence_byzantine.byzantine_fuse`) needs each
+    surviving agent's mean pairwise conflict after every removal.
+    Recomputing all pairs each round costs O(n²) per removal.  The
+    tracker instead keeps the running conflict sum per agent and, when
+    an agent is removed, subtracts its conflict with every survivor —
+    O(n) per removal.
+
+    Subtraction drifts from a freshly accumulated sum by a few ulps.
+    To reproduce the batch computation bit for bit, the running sums
+    only shortlist candidates (:meth:`candidates`); the exact discord
+    of each shortlisted agent is re-accumulated in the original
+    summation order (:meth:`exact_discord`) before any decision.
+
+    Args:
+        opinions: The full agent population.
+        matrix:   Optional precomputed symmetric conflict matrix (as
+                  built by ``build_conflict_matrix``).  Without it,
+                  conflicts are evaluated on demand.
+    """
+
+    # Running sums drift by O(n² · 2⁻⁵³); anything within this band of
+    # the best shortlisted key is re-checked exactly.
+    _DRIFT_TOL = 1e-9
+
+    def __init__(
+        self,
+        opinions: Sequence[Opinion],
+        matrix: Optional[list[list[float]]] = None,
+    ) -> None:
+        self._opinions = opinions
+        self._matrix = matrix
+        self.alive: list[int] = list(range(len(opinions)))
+
+        n = len(opinions)
+        sums = [0.0] * n
+        for i in range(n):
+            for j in range(i + 1, n):
+                c = self._conflict(i, j)
+                sums[i] += c
+                sums[j] += c
+        self._sums = sums
+
+    @property
+    def size(self) -> int:
+        """Number of surviving agents."""
+        return len(self.alive)
+
+    def _conflict(self, i: int, j: int) -> float:
+        if self._matrix is not None:
+            return self._matrix[i][j]
+        return pairwise_conflict(self._opinions[i], self._opinions[j])
+
+    def exact_discord(self, idx: int) -> float:
+        """Mean conflict of agent *idx* against all other survivors.
+
+        Accumulated over survivors in original order, exactly as a
+        from-scratch pairwise pass would.
+        """
+        total = 0.0
+        for j in self.alive:
+            if j != idx:
+                total += self._conflict(idx, j)
+        n = len(self.alive)
+        return total / ((n - 1) if n > 1 else 1.0)
+
+    def candidates(self, key: Callable[[int, float], tuple[float, ...]]) -> list[int]:
+        """Survivors whose removal key may be the maximum.
+
+        *key* maps ``(original_index, discord)`` to a tuple compared
+        lexicographically; only the last element may depend on
+        discord.  Returns every survivor whose approximate key is
+        within drift tolerance of the best, in original order.
+        """
+        n = len(self.alive)
+        denom = (n - 1) if n > 1 else 1.0
+        keys = [key(idx, self._sums[idx] / denom) for idx in self.alive]
+        best = max(keys)
+        floor = best[-1] - self._DRIFT_TOL
+        return [
+            idx for idx, k in zip(self.alive, keys)
+            if k[:-1] == best[:-1] and k[-1] >= floor
+        ]
+
+    def remove(self, idx: int) -> None:
+        """Remove agent *idx* and update every survivor's running sum."""
+        self.alive.remove(idx)
+        sums = self._sums
+        for j in self.alive:
+            sums[j] -= self._conflict(j, idx)
@@ -0,0 +1,725 @@
+"""
+Columnar Opinion Arrays for JSON-LD-Ex.
+
+Batch counterpart to :mod:`jsonld_ex.confidence_algebra`.  Every operator
+in the scalar algebra works on one frozen :class:`Opinion` at a time, and
+every result is re-validated in ``Opinion.__post_init__``.  When millions
+of opinions flow through a pipeline, that per-object cost dominates.
+
+:class:`OpinionArray` stores a batch of opinions as four contiguous
+float64 columns — belief, disbelief, uncertainty and base rate — and
+implements the Subjective Logic operators column-wise:
+
+    - **Element-wise** binary operators (``cumulative_fuse``,
+      ``averaging_fuse``, ``trust_discount``, ``deduce``,
+      ``pairwise_conflict``) combine position *i* of one array with
+      position *i* of another (or with a single broadcast Opinion).
+    - **Batch reductions** (``cumulative_reduce``, ``averaging_reduce``)
+      fuse every opinion in the array into a single :class:`Opinion`.
+
+Validation happens once per batch, when an array is built from untrusted
+input.  Operator outputs are valid by construction (Jøsang 2016) and only
+have IEEE 754 boundary overshoots clamped, exactly as the scalar
+constructor does.
+
+Backends:
+    Columns are ``numpy.ndarray`` (float64) when NumPy is installed and
+    ``array.array('d')`` otherwise.  NumPy is optional — the pure-Python
+    backend produces results bitwise-identical to the scalar operators.
+    The NumPy backend agrees within floating-point tolerance.
+
+Usage::
+
+    from jsonld_ex.confidence_array import OpinionArray
+
+    arr = OpinionArray.from_opinions(opinions)
+    discounted = OpinionArray.from_opinions(trusts).trust_discount(arr)
+    fused = arr.cumulative_reduce()          # -> Opinion
+    back = discounted.to_opinions()          # -> list[Opinion]
+
+References:
+    Jøsang, A. (2016). Subjective Logic: A Formalism for Reasoning Under
+    Uncertainty. Springer.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Any, Iterable, Iterator, Literal, Optional, Union, overload
+
+from jsonld_ex.confidence_algebra import (
+    Opinion,
+    _ADDITIVITY_TOL,
+    _BOUNDARY_TOL,
+    _cumulative_fuse_closed_form,
+    _fold_base_rate,
+    _require_opinion,
+    _validate_component,
+)
+
+try:
+    import numpy as np  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
+
+ArrayBackend = Literal["numpy", "array"]
+
+# A column is either a float64 ndarray or an array('d').
+Column = Any
+
+
+# ═══════════════════════════════════════════════════════════════════
+# BACKEND HELPERS
+# ═══════════════════════════════════════════════════════════════════
+
+
+def _resolve_backend(backend: Optional[str]) -> str:
+    """Pick the column backend, defaulting to NumPy when available."""
+    if backend is None:
+        return "numpy" if np is not None else "array"
+    if backend == "numpy":
+        if np is None:
+            raise ImportError(
+                "The numpy OpinionArray backend requires numpy. "
+                "Install with: pip install numpy"
+            )
+        return backend
+    if backend == "array":
+        return backend
+    raise ValueError(f"backend must be 'numpy' or 'array', got: {backend!r}")
+
+
+def _to_backend(col: Column, backend: str) -> Column:
+    """Convert a validated column to *backend* without re-validation."""
+    if backend == "numpy":
+        if isinstance(col, np.ndarray):
+            return col
+        return np.frombuffer(col, dtype=np.float64).copy()
+    if isinstance(col, array):
+        return col
+    return array("d", col.tolist())
+
+
+def _validate_column_py(values: Iterable[Any], name: str) -> array:
+    """Validate and clamp a column element by element (pure Python).
+
+    Plain in-range floats take the fast path; everything else is
+    routed through :func:`_validate_component` so error messages match
+    the scalar constructor, with the offending index appended.
+    """
+    out = array("d")
+    append = out.append
+    for i, v in enumerate(values):
+        if type(v) is not float or not (0.0 <= v <= 1.0):
+            v = _validate_component(v, f"{name}[{i}]")
+        append(v)
+    return out
+
+
+def _validate_column_np(values: Any, name: str) -> Any:
+    """Validate and clamp a column with one vectorized pass (NumPy)."""
+    raw = np.asarray(values)
+    if raw.dtype.kind not in "iuf":
+        # bool, object, str, ... — defer to the scalar checks for the
+        # exact TypeError / ValueError the constructor would raise.
+        return np.frombuffer(_validate_column_py(raw.tolist(), name), dtype=np.float64).copy()
+    if raw.ndim != 1:
+        raise ValueError(f"{name} must be one-dimensional, got shape {raw.shape}")
+
+    col = raw.astype(np.float64, copy=True)
+    bad = ~np.isfinite(col) | (col < -_BOUNDARY_TOL) | (col > 1.0 + _BOUNDARY_TOL)
+    if bad.any():
+        i = int(np.argmax(bad))
+        _validate_component(float(col[i]), f"{name}[{i}]")
+    np.clip(col, 0.0, 1.0, out=col)
+    return col
+
+
+def _clamp_py(x: float) -> float:
+    """Clamp an operator output to [0, 1] (IEEE 754 overshoot only)."""
+    if x < 0.0:
+        return 0.0
+    if x > 1.0:
+        return 1.0
+    return x
+
+
+def _broadcast(value: float, n: int, backend: str) -> Column:
+    """Build a constant column of length *n*."""
+    if backend == "numpy":
+        return np.full(n, value, dtype=np.float64)
+    return array("d", [value]) * n
+
+
+# ═══════════════════════════════════════════════════════════════════
+# OPINION ARRAY
+# ═══════════════════════════════════════════════════════════════════
+
+
+class OpinionArray:
+    """A batch of opinions stored as four contiguous float64 columns.
+
+    Position *i* across the four columns is the opinion
+    ω_i = (b_i, d_i, u_i, a_i).  Arrays are immutable by convention:
+    every operator returns a new array and never writes into its inputs.
+
+    Args:
+        belief:      Belief column.
+        disbelief:   Disbelief column.
+        uncertainty: Uncertainty column.
+        base_rate:   Base-rate column, or a single float applied to every
+                     position.  Default 0.5.
+        backend:     ``"numpy"``, ``"array"`` or ``None`` (NumPy when
+                     installed, ``array('d')`` otherwise).
+
+    Raises:
+        TypeError:   If any component is not a number.
+        ValueError:  If any component is non-finite or outside [0, 1],
+                     if b + d + u ≠ 1 at any position, or if the columns
+                     have different lengths.
+        ImportError: If ``backend="numpy"`` and NumPy is not installed.
+    """
+
+    __slots__ = ("_b", "_d", "_u", "_a", "_backend")
+
+    def __init__(
+        self,
+        belief: Iterable[float],
+        disbelief: Iterable[float],
+        uncertainty: Iterable[float],
+        base_rate: Union[float, Iterable[float]] = 0.5,
+        *,
+        backend: Optional[ArrayBackend] = None,
+    ) -> None:
+        be = _resolve_backend(backend)
+        if not hasattr(belief, "__len__"):
+            belief = list(belief)
+        if not hasattr(disbelief, "__len__"):
+            disbelief = list(disbelief)
+        if not hasattr(uncertainty, "__len__"):
+            uncertainty = list(uncertainty)
+        if not isinstance(base_rate, (int, float)) and not hasattr(base_rate, "__len__"):
+            base_rate = list(base_rate)
+        validate = _validate_column_np if be == "numpy" else _validate_column_py
+
+        b = validate(belief, "belief")
+        d = validate(disbelief, "disbelief")
+        u = validate(uncertainty, "uncertainty")
+        n = len(b)
+        if len(d) != n or len(u) != n:
+            raise ValueError(
+                f"belief, disbelief and uncertainty must have the same length, "
+                f"got {n}, {len(d)}, {len(u)}"
+            )
+
+        if isinstance(base_rate, (int, float)) and not isinstance(base_rate, bool):
+            a = _broadcast(_validate_component(base_rate, "base_rate"), n, be)
+        else:
+            a = validate(base_rate, "base_rate")
+            if len(a) != n:
+                raise ValueError(
+                    f"base_rate must have the same length as belief, "
+                    f"got {len(a)} and {n}"
+                )
+
+        # Additivity constraint: b + d + u = 1 at every position
+        if be == "numpy":
+            total = b + d + u
+            bad = np.abs(total - 1.0) > _ADDITIVITY_TOL
+            if bad.any():
+                i = int(np.argmax(bad))
+                self._raise_additivity(i, b[i], d[i], u[i], total[i])
+        else:
+            for i in range(n):
+                total = b[i] + d[i] + u[i]
+                if abs(total - 1.0) > _ADDITIVITY_TOL:
+                    self._raise_additivity(i, b[i], d[i], u[i], total)
+
+        self._b, self._d, self._u, self._a = b, d, u, a
+        self._backend = be
+
+    @staticmethod
+    def _raise_additivity(i: int, b: float, d: float, u: float, total: float) -> None:
+        raise ValueError(
+            f"belief + disbelief + uncertainty must sum to 1 at index {i}, "
+            f"got {float(b)} + {float(d)} + {float(u)} = {float(total)}"
+        )
+
+    @classmethod
+    def _trusted(cls, b: Column, d: Column, u: Column, a: Column, backend: str) -> OpinionArray:
+        """Build an array from columns that are valid by construction.
+
+        Used for operator outputs and conversions from validated
+        sources.  Skips every check — callers are responsible for
+        having clamped the columns to [0, 1].
+        """
+        self = cls.__new__(cls)
+        self._b, self._d, self._u, self._a = b, d, u, a
+        self._backend = backend
+        return self
+
+    # ── Construction & conversion ──────────────────────────────────
+
+    @classmethod
+    def from_opinions(
+        cls,
+        opinions: Iterable[Opinion],
+        *,
+        backend: Optional[ArrayBackend] = None,
+    ) -> OpinionArray:
+        """Build an array from a sequence of :class:`Opinion` objects.
+
+        Opinions are already validated, so no further checks run.  The
+        conversion is lossless: ``from_opinions(ops).to_opinions() == ops``.
+
+        Raises:
+            TypeError: If any element is not an Opinion.
+        """
+        be = _resolve_backend(backend)
+        b, d, u, a = array("d"), array("d"), array("d"), array("d")
+        for i, op in enumerate(opinions):
+            _require_opinion(op, f"opinions[{i}]")
+            b.append(op.belief)
+            d.append(op.disbelief)
+            u.append(op.uncertainty)
+            a.append(op.base_rate)
+        return cls._trusted(
+            _to_backend(b, be), _to_backend(d, be), _to_backend(u, be), _to_backend(a, be), be,
+        )
+
+    def to_opinions(self) -> list[Opinion]:
+        """Convert back to a list of :class:`Opinion` objects (lossless)."""
+        return [
+            Opinion._trusted_create(belief=b, disbelief=d, uncertainty=u, base_rate=a)
+            for b, d, u, a in zip(*self._columns_as_lists())
+        ]
+
+    def to_backend(self, backend: ArrayBackend) -> OpinionArray:
+        """Return this array on another column backend (no re-validation)."""
+        be = _resolve_backend(backend)
+        if be == self._backend:
+            return self
+        return OpinionArray._trusted(
+            _to_backend(self._b, be), _to_backend(self._d, be),
+            _to_backend(self._u, be), _to_backend(self._a, be), be,
+        )
+
+    def _columns_as_lists(self) -> tuple[list[float], list[float], list[float], list[float]]:
+        return (self._b.tolist(), self._d.tolist(), self._u.tolist(), self._a.tolist())
+
+    # ── Column access ──────────────────────────────────────────────
+
+    @property
+    def backend(self) -> str:
+        """The column backend in use: ``"numpy"`` or ``"array"``."""
+        return self._backend
+
+    @property
+    def belief(self) -> Column:
+        """Belief column (do not mutate)."""
+        return self._b
+
+    @property
+    def disbelief(self) -> Column:
+        """Disbelief column (do not mutate)."""
+        return self._d
+
+    @property
+    def uncertainty(self) -> Column:
+        """Uncertainty column (do not mutate)."""
+        return self._u
+
+    @property
+    def base_rate(self) -> Column:
+        """Base-rate column (do not mutate)."""
+        return self._a
+
+    # ── Sequence protocol ──────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self._b)
+
+    @overload
+    def __getitem__(self, index: int) -> Opinion: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> OpinionArray: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Opinion, OpinionArray]:
+        if isinstance(index, slice):
+            return OpinionArray._trusted(
+                self._b[index], self._d[index], self._u[index], self._a[index], self._backend,
+            )
+        return Opinion._trusted_create(
+            belief=float(self._b[index]),
+            disbelief=float(self._d[index]),
+            uncertainty=float(self._u[index]),
+            base_rate=float(self._a[index]),
+        )
+
+    def __iter__(self) -> Iterator[Opinion]:
+        return iter(self.to_opinions())
+
+    def __repr__(self) -> str:
+        return f"OpinionArray(n={len(self)}, backend={self._backend!r})"
+
+    # ── Projections ────────────────────────────────────────────────
+
+    def projected_probability(self) -> Column:
+        """Column of P(ω_i) = b_i + a_i·u_i."""
+        if self._backend == "numpy":
+            return self._b + self._a * self._u
+        return array("d", [b + a * u for b, a, u in zip(self._b, self._a, self._u)])
+
+    def conflict_metric(self) -> Column:
+        """Column of internal conflict max(0, 1 − |b − d| − u).
+
+        Element-wise counterpart to
+        :func:`~jsonld_ex.confidence_algebra.conflict_metric`.
+        """
+        if self._backend == "numpy":
+            return np.maximum(0.0, 1.0 - np.abs(self._b - self._d) - self._u)
+        return array(
+            "d",
+            [max(0.0, 1.0 - abs(b - d) - u) for b, d, u in zip(self._b, self._d, self._u)],
+        )
+
+    # ── Operand handling ───────────────────────────────────────────
+
+    def _operand(self, other: Union[Opinion, OpinionArray], name: str) -> tuple[Any, Any, Any, Any]:
+        """Return the four columns of *other*, broadcast to ``len(self)``.
+
+        A single :class:`Opinion` is broadcast against every position.
+        On the NumPy backend plain floats broadcast natively; on the
+        ``array`` backend constant columns are materialised.
+        """
+        n = len(self)
+        if isinstance(other, Opinion):
+            vals = (other.belief, other.disbelief, other.uncertainty, other.base_rate)
+            if self._backend == "numpy":
+                return vals
+            return tuple(_broadcast(v, n, "array") for v in vals)  # type: ignore[return-value]
+        if not isinstance(other, OpinionArray):
+            raise TypeError(
+                f"{name} must be an Opinion or OpinionArray, got: {type(other).__name__}"
+            )
+        if len(other) != n:
+            raise ValueError(
+                f"{name} length ({len(other)}) must match array length ({n})"
+            )
+        o = other.to_backend(self._backend)  # type: ignore[arg-type]
+        return (o._b, o._d, o._u, o._a)
+
+    def _finish_np(self, b: Any, d: Any, u: Any, a: Any) -> OpinionArray:
+        for col in (b, d, u, a):
+            np.clip(col, 0.0, 1.0, out=col)
+        return OpinionArray._trusted(b, d, u, a, "numpy")
+
+    # ── Element-wise operators ─────────────────────────────────────
+
+    def cumulative_fuse(self, other: Union[Opinion, OpinionArray]) -> OpinionArray:
+        """Element-wise cumulative fusion (⊕), ``self[i] ⊕ other[i]``.
+
+        Same formula and dogmatic limit as
+        :func:`~jsonld_ex.confidence_algebra.cumulative_fuse` for two
+        opinions.
+        """
+        ob, od, ou, oa = self._operand(other, "other")
+        if self._backend == "numpy":
+            sb, sd, su, sa = self._b, self._d, self._u, self._a
+            dogmatic = (su == 0.0) & (ou == 0.0)
+            kappa = np.where(dogmatic, 1.0, su + ou - su * ou)
+            b = np.where(dogmatic, 0.5 * sb + 0.5 * ob, (sb * ou + ob * su) / kappa)
+            d = np.where(dogmatic, 0.5 * sd + 0.5 * od, (sd * ou + od * su) / kappa)
+            u = np.where(dogmatic, 0.0, (su * ou) / kappa)
+            a = np.broadcast_to((sa + oa) / 2.0, b.shape).copy()
+            return self._finish_np(b, d, u, a)
+
+        rb, rd, ru, ra = array("d"), array("d"), array("d"), array("d")
+        for sb, sd, su, sa, xb, xd, xu, xa in zip(
+            self._b, self._d, self._u, self._a, ob, od, ou, oa,
+        ):
+            if su == 0.0 and xu == 0.0:
+                fb = 0.5 * sb + 0.5 * xb
+                fd = 0.5 * sd + 0.5 * xd
+                fu = 0.0
+            else:
+                kappa = su + xu - su * xu
+                fb = (sb * xu + xb * su) / kappa
+                fd = (sd * xu + xd * su) / kappa
+                fu = (su * xu) / kappa
+            rb.append(_clamp_py(fb))
+            rd.append(_clamp_py(fd))
+            ru.append(_clamp_py(fu))
+            ra.append(_clamp_py((sa + xa) / 2.0))
+        return OpinionArray._trusted(rb, rd, ru, ra, "array")
+
+    def averaging_fuse(self, other: Union[Opinion, OpinionArray]) -> OpinionArray:
+        """Element-wise averaging fusion (⊘), ``self[i] ⊘ other[i]``.
+
+        Same formula and dogmatic limit as
+        :func:`~jsonld_ex.confidence_algebra.averaging_fuse` for two
+        opinions.
+        """
+        ob, od, ou, oa = self._operand(other, "other")
+        if self._backend == "numpy":
+            sb, sd, su, sa = self._b, self._d, self._u, self._a
+            kappa = su + ou
+            degenerate = kappa == 0.0
+            safe = np.where(degenerate, 1.0, kappa)
+            b = np.where(degenerate, (sb + ob) / 2.0, (sb * ou + ob * su) / safe)
+            d = np.where(degenerate, (sd + od) / 2.0, (sd * ou + od * su) / safe)
+            u = np.where(degenerate, 0.0, 2.0 * su * ou / safe)
+            a = np.broadcast_to((sa + oa) / 2.0, b.shape).copy()
+            return self._finish_np(b, d, u, a)
+
+        rb, rd, ru, ra = array("d"), array("d"), array("d"), array("d")
+        for sb, sd, su, sa, xb, xd, xu, xa in zip(
+            self._b, self._d, self._u, self._a, ob, od, ou, oa,
+        ):
+            kappa = su + xu
+            if kappa == 0.0:
+                fb = (sb + xb) / 2.0
+                fd = (sd + xd) / 2.0
+                fu = 0.0
+            else:
+                fb = (sb * xu + xb * su) / kappa
+                fd = (sd * xu + xd * su) / kappa
+                fu = 2.0 * su * xu / kappa
+            rb.append(_clamp_py(fb))
+            rd.append(_clamp_py(fd))
+            ru.append(_clamp_py(fu))
+            ra.append(_clamp_py((sa + xa) / 2.0))
+        return OpinionArray._trusted(rb, rd, ru, ra, "array")
+
+    def trust_discount(self, opinions: Union[Opinion, OpinionArray]) -> OpinionArray:
+        """Element-wise trust discount (⊗), treating ``self`` as the trust.
+
+        ``result[i] = trust_discount(self[i], opinions[i])`` per
+        :func:`~jsonld_ex.confidence_algebra.trust_discount`.
+        """
+        ob, od, ou, oa = self._operand(opinions, "opinions")
+        if self._backend == "numpy":
+            tb = self._b
+            b = tb * ob
+            d = tb * od
+            u = self._d + self._u + tb * ou
+            a = np.broadcast_to(oa, b.shape).astype(np.float64, copy=True)
+            return self._finish_np(b, d, u, a)
+
+        rb, rd, ru = array("d"), array("d"), array("d")
+        for tb, td, tu, xb, xd, xu in zip(self._b, self._d, self._u, ob, od, ou):
+            rb.append(_clamp_py(tb * xb))
+            rd.append(_clamp_py(tb * xd))
+            ru.append(_clamp_py(td + tu + tb * xu))
+        return OpinionArray._trusted(rb, rd, ru, array("d", oa), "array")
+
+    def deduce(
+        self,
+        y_given_x: Union[Opinion, OpinionArray],
+        y_given_not_x: Union[Opinion, OpinionArray],
+    ) -> OpinionArray:
+        """Element-wise deduction, treating ``self`` as the antecedent ω_x.
+
+        ``result[i] = deduce(self[i], y_given_x[i], y_given_not_x[i])``
+        per :func:`~jsonld_ex.confidence_algebra.deduce` (Jøsang 2016,
+        Def. 12.6).
+        """
+        yb, yd, yu, ya = self._operand(y_given_x, "y_given_x")
+        nb, nd, nu, na = self._operand(y_given_not_x, "y_given_not_x")
+        if self._backend == "numpy":
+            bx, dx, ux, ax = self._b, self._d, self._u, self._a
+            ax_bar = 1.0 - ax
+            b = bx * yb + dx * nb + ux * (ax * yb + ax_bar * nb)
+            d = bx * yd + dx * nd + ux * (ax * yd + ax_bar * nd)
+            u = bx * yu + dx * nu + ux * (ax * yu + ax_bar * nu)
+            a = ax * (yb + ya * yu) + ax_bar * (nb + na * nu)
+            return self._finish_np(b, d, u, a)
+
+        rb, rd, ru, ra = array("d"), array("d"), array("d"), array("d")
+        for i in range(len(self)):
+            bx, dx, ux, ax = self._b[i], self._d[i], self._u[i], self._a[i]
+            ax_bar = 1.0 - ax
+            rb.append(_clamp_py(
+                bx * yb[i] + dx * nb[i] + ux * (ax * yb[i] + ax_bar * nb[i])
+            ))
+            rd.append(_clamp_py(
+                bx * yd[i] + dx * nd[i] + ux * (ax * yd[i] + ax_bar * nd[i])
+            ))
+            ru.append(_clamp_py(
+                bx * yu[i] + dx * nu[i] + ux * (ax * yu[i] + ax_bar * nu[i])
+            ))
+            p_yx = yb[i] + ya[i] * yu[i]
+            p_ynx = nb[i] + na[i] * nu[i]
+            ra.append(_clamp_py(ax * p_yx + ax_bar * p_ynx))
+        return OpinionArray._trusted(rb, rd, ru, ra, "array")
+
+    def pairwise_conflict(self, other: Union[Opinion, OpinionArray]) -> Column:
+        """Column of con(self[i], other[i]) = b_i·d'_i + d_i·b'_i."""
+        ob, od, _, _ = self._operand(other, "other")
+        if self._backend == "numpy":
+            return self._b * od + self._d * ob
+        return array(
+            "d",
+            [sb * xd + sd * xb for sb, sd, xb, xd in zip(self._b, self._d, ob, od)],
+        )
+
+    # ── Batch reductions ───────────────────────────────────────────
+
+    def cumulative_reduce(self) -> Opinion:
+        """Fuse every opinion in the array with cumulative fusion.
+
+        Equivalent to ``cumulative_fuse(*self.to_opinions())`` but
+        without building or validating any intermediate
+        :class:`Opinion`.  Uses the closed n-ary form when at most one
+        opinion is dogmatic (vectorized on the NumPy backend) and the
+        pairwise left fold otherwise.
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        n = len(self)
+        if n == 0:
+            raise ValueError("cumulative_reduce requires at least one opinion")
+        if n == 1:
+            return self[0]
+        if n == 2:
+            return self[0:1].cumulative_fuse(self[1:2])[0]
+
+        bs, ds, us, as_ = self._columns_as_lists()
+        if self._backend == "numpy":
+            closed = self._cumulative_closed_form_np(as_)
+        else:
+            closed = _cumulative_fuse_closed_form(bs, ds, us, as_)
+        if closed is not None:
+            b, d, u, a = closed
+            return Opinion._trusted_create(belief=b, disbelief=d, uncertainty=u, base_rate=a)
+
+        rb, rd, ru, ra = bs[0], ds[0], us[0], as_[0]
+        for i in range(1, n):
+            xb, xd, xu = bs[i], ds[i], us[i]
+            if ru == 0.0 and xu == 0.0:
+                fb = 0.5 * rb + 0.5 * xb
+                fd = 0.5 * rd + 0.5 * xd
+                fu = 0.0
+            else:
+                kappa = ru + xu - ru * xu
+                fb = (rb * xu + xb * ru) / kappa
+                fd = (rd * xu + xd * ru) / kappa
+                fu = (ru * xu) / kappa
+            rb, rd, ru = _clamp_py(fb), _clamp_py(fd), _clamp_py(fu)
+            ra = _clamp_py((ra + as_[i]) / 2.0)
+        return Opinion._trusted_create(belief=rb, disbelief=rd, uncertainty=ru, base_rate=ra)
+
+    def _cumulative_closed_form_np(
+        self, base_rates: list[float],
+    ) -> Optional[tuple[float, float, float, float]]:
+        """Vectorized :func:`_cumulative_fuse_closed_form` (NumPy backend)."""
+        zero = self._u == 0.0
+        n_zero = int(zero.sum())
+        if n_zero >= 2:
+            return None
+        fused_a = _fold_base_rate(base_rates)
+        if n_zero == 1:
+            z = int(np.argmax(zero))
+            return (float(self._b[z]), float(self._d[z]), 0.0, fused_a)
+
+        evidence_b = float(np.sum(self._b / self._u))
+        evidence_d = float(np.sum(self._d / self._u))
+        denom = 1.0 + evidence_b + evidence_d
+        if math.isinf(denom):
+            return None
+        return (
+            min(1.0, evidence_b / denom),
+            min(1.0, evidence_d / denom),
+            min(1.0, 1.0 / denom),
+            fused_a,
+        )
+
+    def averaging_reduce(self) -> Opinion:
+        """Fuse every opinion in the array with simultaneous averaging fusion.
+
+        Equivalent to ``averaging_fuse(*self.to_opinions())`` (Jøsang
+        2016, §12.5).  Each U_i = ∏_{j≠i} u_j is derived from the full
+        product and the count of dogmatic opinions, so the reduction is
+        O(n) even when some uncertainties are zero.
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        n = len(self)
+        if n == 0:
+            raise ValueError("averaging_reduce requires at least one opinion")
+        if n == 1:
+            return self[0]
+        if n == 2:
+            return self[0:1].averaging_fuse(self[1:2])[0]
+
+        if self._backend == "numpy":
+            return self._averaging_reduce_np()
+
+        bs, ds, us, as_ = self._columns_as_lists()
+        full_product = math.prod(us)
+        zeros = [i for i, u in enumerate(us) if u == 0.0]
+        if not zeros:
+            capital_u = [full_product / u for u in us]
+        elif len(zeros) == 1:
+            z = zeros[0]
+            capital_u = [0.0] * n
+            capital_u[z] = math.prod(us[:z] + us[z + 1:])
+        else:
+            capital_u = [0.0] * n
+
+        kappa = sum(capital_u)
+        if kappa == 0.0:
+            pool = zeros if zeros else range(n)
+            z_count = len(pool)
+            fb = sum(bs[i] for i in pool) / z_count
+            fd = sum(ds[i] for i in pool) / z_count
+            fu = 0.0
+        else:
+            fb = sum(b * w for b, w in zip(bs, capital_u)) / kappa
+            fd = sum(d * w for d, w in zip(ds, capital_u)) / kappa
+            fu = n * full_product / kappa
+        fa = sum(as_) / n
+        return Opinion._trusted_create(
+            belief=_clamp_py(fb),
+            disbelief=_clamp_py(fd),
+            uncertainty=_clamp_py(fu),
+            base_rate=_clamp_py(fa),
+        )
+
+    def _averaging_reduce_np(self) -> Opinion:
+        n = len(self)
+        us = self._u
+        zero = us == 0.0
+        n_zero = int(zero.sum())
+        full_product = float(np.prod(us))
+        if n_zero == 0:
+            capital_u = full_product / us
+        elif n_zero == 1:
+            capital_u = np.zeros(n)
+            z = int(np.argmax(zero))
+            capital_u[z] = float(np.prod(us[~zero]))
+        else:
+            capital_u = np.zeros(n)
+
+        kappa = float(capital_u.sum())
+        if kappa == 0.0:
+            mask = zero if n_zero else np.ones(n, dtype=bool)
+            fb = float(self._b[mask].mean())
+            fd = float(self._d[mask].mean())
+            fu = 0.0
+        else:
+            fb = float(self._b @ capital_u) / kappa
+            fd = float(self._d @ capital_u) / kappa
+            fu = n * full_product / kappa
+        fa = float(self._a.mean())
+        return Opinion._trusted_create(
+            belief=_clamp_py(fb),
+            disbelief=_clamp_py(fd),
+            uncertainty=_clamp_py(fu),
+            base_rate=_clamp_py(fa),
+        )
@@ -10,6 +10,9 @@ Extends the basic ``robust_fuse`` in ``confidence_algebra`` with:
   - **Group cohesion metric**: a scalar summary of overall agreement.
   - **Full conflict matrix**: the nxn pairwise conflict matrix for
     downstream analysis or visualization.
+  - **Streaming fusion**: :class:`StreamingByzantineFuser` fuses an
+    unbounded opinion stream over a sliding window with O(1) discord,
+    fused-opinion and cohesion queries.
   - **Pluggable distance metrics**: Euclidean (default), Manhattan,
     Jensen-Shannon divergence, and Hellinger distance on the opinion
     simplex, with support for user-defined metrics.
@@ -44,15 +47,24 @@ References:
 
 from __future__ import annotations
 
+import heapq
 import math
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Callable, Literal, Optional, Sequence
+from typing import Any, Callable, Literal, Optional, Sequence, Union
 
 from jsonld_ex.confidence_algebra import (
     Opinion,
+    _DiscordTracker,
     cumulative_fuse,
     pairwise_conflict,
 )
+from jsonld_ex.confidence_array import OpinionArray
+
+try:
+    import numpy as np  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover
+    np = None
 
 
 # -------------------------------------------------------------------
@@ -247,6 +259,265 @@ def hellinger_opinion_distance(a: Opinion, b: Opinion) -> float:
     return raw / _MAX_SIMPLEX_DISTANCE
 
 
+# -------------------------------------------------------------------
+# Batch kernels: tiled, vectorized, optionally process-parallel
+# -------------------------------------------------------------------
+
+# Below this many agents the per-call NumPy overhead outweighs the
+# vectorization gain, so the scalar double loops are used.
+_VECTORIZE_MIN_AGENTS = 32
+
+# Default tile edge.  A 512x512 float64 tile is 2 MiB, which keeps
+# each kernel's temporaries cache-friendly.
+_DEFAULT_BLOCK_SIZE = 512
+
+
+def _conflict_kernel(rows: tuple, cols: tuple) -> "np.ndarray":
+    """Tile of pairwise_conflict: b_i * d_j + d_i * b_j."""
+    rb, rd, _ = rows
+    cb, cd, _ = cols
+    return np.multiply.outer(rb, cd) + np.multiply.outer(rd, cb)
+
+
+def _euclidean_kernel(rows: tuple, cols: tuple) -> "np.ndarray":
+    """Tile of euclidean_opinion_distance."""
+    sq = sum((r[:, None] - c[None, :]) ** 2 for r, c in zip(rows, cols))
+    return np.sqrt(sq) / _MAX_SIMPLEX_DISTANCE
+
+
+def _manhattan_kernel(rows: tuple, cols: tuple) -> "np.ndarray":
+    """Tile of manhattan_opinion_distance."""
+    raw = sum(np.abs(r[:, None] - c[None, :]) for r, c in zip(rows, cols))
+    return raw / 2.0
+
+
+def _hellinger_kernel(rows: tuple, cols: tuple) -> "np.ndarray":
+    """Tile of hellinger_opinion_distance (square roots taken per column)."""
+    return _euclidean_kernel(
+        tuple(np.sqrt(r) for r in rows), tuple(np.sqrt(c) for c in cols),
+    )
+
+
+def _jsd_kernel(rows: tuple, cols: tuple) -> "np.ndarray":
+    """Tile of jsd_opinion_distance (0 * log 0 = 0 convention)."""
+    jsd = 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for r, c in zip(rows, cols):
+            p = np.broadcast_to(r[:, None], (len(r), len(c)))
+            q = np.broadcast_to(c[None, :], (len(r), len(c)))
+            m = (p + q) / 2.0
+            jsd = jsd + 0.5 * np.where(p > 0.0, p * np.log2(p / m), 0.0)
+            jsd = jsd + 0.5 * np.where(q > 0.0, q * np.log2(q / m), 0.0)
+    return np.sqrt(np.maximum(jsd, 0.0))
+
+
+# Vectorized counterparts of the built-in scalar distances.
+_DISTANCE_KERNELS: dict[Callable[..., float], Callable[..., Any]] = {
+    euclidean_opinion_distance: _euclidean_kernel,
+    manhattan_opinion_distance: _manhattan_kernel,
+    jsd_opinion_distance: _jsd_kernel,
+    hellinger_opinion_distance: _hellinger_kernel,
+}
+
+
+def _tile_bounds(n: int, block_size: int) -> list[tuple[int, int]]:
+    if block_size < 1:
+        raise ValueError(f"block_size must be >= 1, got: {block_size}")
+    return [(start, min(start + block_size, n)) for start in range(0, n, block_size)]
+
+
+def _vector_tile(
+    kernel: Callable[..., Any],
+    rows: tuple,
+    cols: tuple,
+    diagonal: bool,
+    reduce_sum: bool,
+) -> Any:
+    """Evaluate one tile; module-level so it can run in a worker process.
+
+    With *reduce_sum*, returns the sum over pairs i < j (the strict
+    upper triangle on diagonal tiles) instead of the tile itself.
+    """
+    tile = kernel(rows, cols)
+    if not reduce_sum:
+        return tile
+    if diagonal:
+        return float(np.triu(tile, 1).sum())
+    return float(tile.sum())
+
+
+def _scalar_tile(
+    fn: Callable[[Opinion, Opinion], float],
+    rows: Sequence[Opinion],
+    cols: Sequence[Opinion],
+    diagonal: bool,
+    reduce_sum: bool,
+) -> Any:
+    """Scalar fallback tile for custom metrics or when NumPy is absent."""
+    if reduce_sum:
+        total = 0.0
+        for i, a in enumerate(rows):
+            for b in cols[i + 1:] if diagonal else cols:
+                total += fn(a, b)
+        return total
+    return [[fn(a, b) for b in cols] for a in rows]
+
+
+def _run_tiles(
+    tile_fn: Callable[..., Any],
+    fn: Any,
+    data: Any,
+    bounds: list[tuple[int, int]],
+    reduce_sum: bool,
+    max_workers: Optional[int],
+) -> list[tuple[tuple[int, int], tuple[int, int], Any]]:
+    """Evaluate every upper-triangular tile, serially or in a process pool.
+
+    *data* is either a tuple of NumPy columns (sliced per tile) or a
+    list of Opinions.  Returns ``(row_bounds, col_bounds, result)``
+    triples in deterministic tile order.
+    """
+    def _slice(lo: int, hi: int) -> Any:
+        if isinstance(data, tuple):
+            return tuple(col[lo:hi] for col in data)
+        return data[lo:hi]
+
+    jobs = [
+        (bounds[i], bounds[j], i == j)
+        for i in range(len(bounds))
+        for j in range(i, len(bounds))
+    ]
+    if max_workers is None or max_workers <= 1 or len(jobs) == 1:
+        return [
+            (r, c, tile_fn(fn, _slice(*r), _slice(*c), diag, reduce_sum))
+            for r, c, diag in jobs
+        ]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(tile_fn, fn, _slice(*r), _slice(*c), diag, reduce_sum)
+            for r, c, diag in jobs
+        ]
+        return [(r, c, fut.result()) for (r, c, _), fut in zip(jobs, futures)]
+
+
+def _opinion_columns(opinions: Union[Sequence[Opinion], OpinionArray]) -> tuple:
+    """(b, d, u) float64 columns for *opinions*."""
+    if isinstance(opinions, OpinionArray):
+        arr = opinions.to_backend("numpy")
+        return (arr.belief, arr.disbelief, arr.uncertainty)
+    n = len(opinions)
+    return (
+        np.fromiter((o.belief for o in opinions), dtype=np.float64, count=n),
+        np.fromiter((o.disbelief for o in opinions), dtype=np.float64, count=n),
+        np.fromiter((o.uncertainty for o in opinions), dtype=np.float64, count=n),
+    )
+
+
+def _require_numpy(what: str) -> None:
+    if np is None:
+        raise ImportError(f"{what} requires numpy. Install with: pip install numpy")
+
+
+def _matrix_from_tiles(
+    n: int,
+    tiles: list[tuple[tuple[int, int], tuple[int, int], Any]],
+) -> "np.ndarray":
+    out = np.zeros((n, n), dtype=np.float64)
+    for (r0, r1), (c0, c1), tile in tiles:
+        tile = np.asarray(tile, dtype=np.float64)
+        out[r0:r1, c0:c1] = tile
+        out[c0:c1, r0:r1] = tile.T
+    np.fill_diagonal(out, 0.0)
+    return out
+
+
+def conflict_matrix_array(
+    opinions: Union[Sequence[Opinion], OpinionArray],
+    *,
+    block_size: int = _DEFAULT_BLOCK_SIZE,
+    max_workers: Optional[int] = None,
+) -> "np.ndarray":
+    """Pairwise conflict matrix as a NumPy array, computed in tiles.
+
+    Vectorized equivalent of :func:`build_conflict_matrix`: each entry
+    is ``b_i * d_j + d_i * b_j`` evaluated with the same floating-point
+    operations, so values are bitwise identical.  The matrix is split
+    into ``block_size`` x ``block_size`` tiles; only the upper triangle
+    of tiles is computed and mirrored.
+
+    Args:
+        opinions:    Opinions, or an :class:`OpinionArray`.
+        block_size:  Tile edge length.
+        max_workers: If greater than 1, tiles run in a
+                     :class:`concurrent.futures.ProcessPoolExecutor`
+                     with this many workers.  Worth it only for
+                     thousands of agents.
+
+    Returns:
+        nxn float64 array with zero diagonal.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        ValueError:  If opinions is empty.
+    """
+    _require_numpy("conflict_matrix_array")
+    n = len(opinions)
+    if n == 0:
+        raise ValueError("conflict_matrix_array requires at least one opinion")
+    tiles = _run_tiles(
+        _vector_tile, _conflict_kernel, _opinion_columns(opinions),
+        _tile_bounds(n, block_size), False, max_workers,
+    )
+    return _matrix_from_tiles(n, tiles)
+
+
+def distance_matrix_array(
+    opinions: Union[Sequence[Opinion], OpinionArray],
+    distance_fn: Optional[DistanceMetric] = None,
+    *,
+    block_size: int = _DEFAULT_BLOCK_SIZE,
+    max_workers: Optional[int] = None,
+) -> "np.ndarray":
+    """Pairwise opinion-distance matrix as a NumPy array, computed in tiles.
+
+    The four built-in metrics use vectorized kernels (agreeing with the
+    scalar functions within floating-point tolerance).  Any other
+    ``distance_fn`` is evaluated pairwise per tile; with
+    ``max_workers`` it must be picklable (a module-level function).
+
+    Args:
+        opinions:    Opinions, or an :class:`OpinionArray`.
+        distance_fn: Distance metric.  ``None`` = Euclidean.
+        block_size:  Tile edge length.
+        max_workers: Process-pool size; ``None`` or 1 runs serially.
+
+    Returns:
+        nxn float64 array with zero diagonal.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        ValueError:  If opinions is empty.
+    """
+    _require_numpy("distance_matrix_array")
+    n = len(opinions)
+    if n == 0:
+        raise ValueError("distance_matrix_array requires at least one opinion")
+    fn = distance_fn if distance_fn is not None else euclidean_opinion_distance
+    bounds = _tile_bounds(n, block_size)
+    kernel = _DISTANCE_KERNELS.get(fn)
+    if kernel is not None:
+        tiles = _run_tiles(
+            _vector_tile, kernel, _opinion_columns(opinions), bounds, False, max_workers,
+        )
+    else:
+        ops = opinions.to_opinions() if isinstance(opinions, OpinionArray) else list(opinions)
+        tiles = _run_tiles(_scalar_tile, fn, ops, bounds, False, max_workers)
+    return _matrix_from_tiles(n, tiles)
+
+
 # -------------------------------------------------------------------
 # Types
 # -------------------------------------------------------------------
@@ -355,7 +626,12 @@ def opinion_distance(
     return fn(a, b)
 
 
-def build_conflict_matrix(opinions: Sequence[Opinion]) -> list[list[float]]:
+def build_conflict_matrix(
+    opinions: Sequence[Opinion],
+    *,
+    block_size: int = _DEFAULT_BLOCK_SIZE,
+    max_workers: Optional[int] = None,
+) -> list[list[float]]:
     """Build the symmetric nxn pairwise conflict matrix.
 
     ``matrix[i][j]`` = :func:`pairwise_conflict(opinions[i], opinions[j])`.
@@ -367,8 +643,15 @@ def build_conflict_matrix(opinions: Sequence[Opinion]) -> list[list[float]]:
     correct metric for Byzantine agent detection (identifying agents
     whose evidence opposes the group).
 
+    When NumPy is installed and the group is not tiny, the matrix is
+    computed by :func:`conflict_matrix_array` (tiled, optionally
+    parallel) with bitwise-identical values.
+
     Args:
-        opinions: One or more opinions.
+        opinions:    One or more opinions.
+        block_size:  Tile edge length for the vectorized path.
+        max_workers: Process-pool size for the vectorized path.
+                     ``None`` or 1 runs serially.
 
     Returns:
         nxn list-of-lists with float values in [0, 1].
@@ -380,6 +663,11 @@ def build_conflict_matrix(opinions: Sequence[Opinion]) -> list[list[float]]:
     if n == 0:
         raise ValueError("build_conflict_matrix requires at least one opinion")
 
+    if np is not None and n >= _VECTORIZE_MIN_AGENTS:
+        return conflict_matrix_array(
+            opinions, block_size=block_size, max_workers=max_workers,
+        ).tolist()
+
     mat: list[list[float]] = [[0.0] * n for _ in range(n)]
     for i in range(n):
         for j in range(i + 1, n):
@@ -392,6 +680,9 @@ def build_conflict_matrix(opinions: Sequence[Opinion]) -> list[list[float]]:
 def cohesion_score(
     opinions: Sequence[Opinion],
     distance_fn: Optional[DistanceMetric] = None,
+    *,
+    block_size: int = _DEFAULT_BLOCK_SIZE,
+    max_workers: Optional[int] = None,
 ) -> float:
     """Group cohesion based on opinion distance in the simplex.
 
@@ -423,9 +714,18 @@ def cohesion_score(
         for identical opinions when both b > 0 and d > 0, making it
         unsuitable for cohesion measurement.
 
+    Large groups are summed tile by tile without materializing the
+    distance matrix.  Built-in metrics use vectorized kernels when
+    NumPy is installed (results agree with the pairwise loop within
+    floating-point tolerance); ``max_workers`` spreads tiles over a
+    process pool, in which case a custom ``distance_fn`` must be
+    picklable.
+
     Args:
         opinions:    One or more opinions.
         distance_fn: Distance metric.  ``None`` = Euclidean.
+        block_size:  Tile edge length.
+        max_workers: Process-pool size.  ``None`` or 1 runs serially.
 
     Returns:
         Cohesion score in [0, 1].  1.0 = perfect agreement.
@@ -440,15 +740,29 @@ def cohesion_score(
         return 1.0
 
     fn = distance_fn if distance_fn is not None else euclidean_opinion_distance
+    pairs = n * (n - 1) // 2
+
+    kernel = _DISTANCE_KERNELS.get(fn) if np is not None else None
+    if kernel is not None and n >= _VECTORIZE_MIN_AGENTS:
+        tiles = _run_tiles(
+            _vector_tile, kernel, _opinion_columns(opinions),
+            _tile_bounds(n, block_size), True, max_workers,
+        )
+        return 1.0 - math.fsum(t for _, _, t in tiles) / pairs
+
+    if max_workers is not None and max_workers > 1:
+        tiles = _run_tiles(
+            _scalar_tile, fn, list(opinions),
+            _tile_bounds(n, block_size), True, max_workers,
+        )
+        return 1.0 - math.fsum(t for _, _, t in tiles) / pairs
 
     total = 0.0
-    pairs = 0
     for i in range(n):
         for j in range(i + 1, n):
             total += fn(opinions[i], opinions[j])
-            pairs += 1
 
-    mean_distance = total / pairs if pairs > 0 else 0.0
+    mean_distance = total / pairs
     return 1.0 - mean_distance
 
 
@@ -465,6 +779,9 @@ def _compute_discord_scores(
     Uses Josang's pairwise_conflict (evidential tension), which is the
     correct metric for identifying adversarial agents: an agent whose
     belief strongly overlaps with the group's disbelief has high discord.
+
+    From-scratch O(n^2) reference.  :func:`byzantine_fuse` maintains
+    the same scores incrementally and must agree with this bit for bit.
     """
     n = len(indexed)
     discord = [0.0] * n
@@ -545,6 +862,27 @@ _STRATEGY_PICKERS = {
 }
 
 
+def _strategy_key(
+    strategy: str,
+    trust_weights: Optional[Sequence[float]],
+) -> Callable[[int, float], tuple[float, ...]]:
+    """Removal-priority key ``(original_index, discord) -> tuple``.
+
+    Orders agents exactly as the matching ``_pick_*`` function does, so
+    :class:`_DiscordTracker` can shortlist the picker's candidates from
+    running discord sums.
+    """
+    if strategy == "least_trusted":
+        assert trust_weights is not None
+        tw = trust_weights
+        return lambda idx, disc: (-tw[idx], disc)
+    if strategy == "combined":
+        assert trust_weights is not None
+        tw = trust_weights
+        return lambda idx, disc: (disc * (1.0 - tw[idx]),)
+    return lambda _idx, disc: (disc,)
+
+
 def byzantine_fuse(
     opinions: Sequence[Opinion],
     config: Optional[ByzantineConfig] = None,
@@ -554,7 +892,9 @@ def byzantine_fuse(
     Algorithm:
         1. Build the full pairwise conflict matrix (preserved in report).
         2. Iteratively remove agents according to the chosen strategy
-           until the group is cohesive or limits are reached.
+           until the group is cohesive or limits are reached.  Discord
+           sums come from the matrix once and are updated in O(n) per
+           removal rather than recomputed over all pairs.
         3. Fuse surviving agents via :func:`cumulative_fuse`.
         4. Compute cohesion of the surviving group.
 
@@ -619,17 +959,22 @@ def byzantine_fuse(
         max_removals = len(opinions) // 2
 
     picker = _STRATEGY_PICKERS[cfg.strategy]
+    key = _strategy_key(cfg.strategy, cfg.trust_weights)
 
-    # Track: (original_index, opinion)
-    indexed: list[tuple[int, Opinion]] = list(enumerate(opinions))
+    # Conflicts are summed once from the report's matrix; each removal
+    # then updates the survivors' sums in O(n).
+    tracker = _DiscordTracker(opinions, matrix=original_matrix)
     removed: list[AgentRemoval] = []
 
     for _ in range(max_removals):
-        n = len(indexed)
-        if n <= cfg.min_agents:
+        if tracker.size <= cfg.min_agents:
             break
 
-        discord = _compute_discord_scores(indexed)
+        # Shortlist by running sums, then decide on exact discord so the
+        # choice matches a from-scratch _compute_discord_scores pass.
+        candidates = tracker.candidates(key)
+        indexed = [(idx, opinions[idx]) for idx in candidates]
+        discord = [tracker.exact_discord(idx) for idx in candidates]
 
         # Pick victim
         local_idx, score, reason = picker(indexed, discord, cfg.trust_weights)
@@ -637,7 +982,8 @@ def byzantine_fuse(
         if discord[local_idx] < cfg.threshold:
             break  # Group is cohesive enough
 
-        orig_idx, orig_opinion = indexed.pop(local_idx)
+        orig_idx, orig_opinion = indexed[local_idx]
+        tracker.remove(orig_idx)
         removed.append(AgentRemoval(
             index=orig_idx,
             opinion=orig_opinion,
@@ -646,10 +992,10 @@ def byzantine_fuse(
         ))
 
     # Fuse survivors
-    surviving = [op for _, op in indexed]
+    surviving_indices = list(tracker.alive)
+    surviving = [opinions[idx] for idx in surviving_indices]
     fused = cumulative_fuse(*surviving)
 
-    surviving_indices = [idx for idx, _ in indexed]
     final_cohesion = cohesion_score(surviving) if len(surviving) > 1 else 1.0
 
     return ByzantineFusionReport(
@@ -659,3 +1005,382 @@ def byzantine_fuse(
         cohesion_score=final_cohesion,
         surviving_indices=surviving_indices,
     )
+
+
+# -------------------------------------------------------------------
+# Streaming: online Byzantine fusion over a bounded window
+# -------------------------------------------------------------------
+
+# Slack added to every discord bound after a resynchronization, which
+# may shift the running sums by a few ulps.
+_BOUND_SLACK = 1e-9
+
+
+class _StreamAgent:
+    """Per-agent record with the terms each running sum needs."""
+
+    __slots__ = ("opinion", "trust", "evidence_b", "evidence_d", "square")
+
+    def __init__(self, opinion: Opinion, trust: Optional[float]) -> None:
+        self.opinion = opinion
+        self.trust = trust
+        u = opinion.uncertainty
+        # Dogmatic agents (u = 0) carry no finite evidence; they are
+        # counted separately and dominate the fused opinion.
+        self.evidence_b = opinion.belief / u if u > 0.0 else 0.0
+        self.evidence_d = opinion.disbelief / u if u > 0.0 else 0.0
+        self.square = opinion.belief ** 2 + opinion.disbelief ** 2 + u ** 2
+
+
+class StreamingByzantineFuser:
+    """Online Byzantine-resistant fusion over a sliding window of agents.
+
+    Opinions arrive one at a time (:meth:`add`) or in micro-batches
+    (:meth:`extend`).  At most ``window`` agents are held; when the
+    window is full the oldest agent expires.  After every update,
+    agents are evicted while the removal candidate's discord is at
+    least ``config.threshold`` -- the same rule :func:`byzantine_fuse`
+    applies to a fixed population.
+
+    Running sums make every query cheap:
+
+    - Discord is mean :func:`pairwise_conflict` against the rest of
+      the window.  Conflict is bilinear, so for agent i with running
+      totals B = sum(b), D = sum(d)::
+
+          discord_i = (b_i * (D - d_i) + d_i * (B - b_i)) / (n - 1)
+
+      is O(1).  A lazily refreshed max-heap of discord upper bounds
+      finds the most discordant agent; refreshes are amortized
+      O(log n) while honest agents sit below the threshold.
+    - :attr:`fused` is closed-form cumulative fusion from the summed
+      evidence b/u and d/u (O(1)).
+    - :attr:`cohesion` is 1 - RMS pairwise Euclidean distance,
+      computed from sums of components and squares (O(1)).
+
+    Memory is O(window).  Sums are recomputed exactly every ``window``
+    updates to stop floating-point drift.
+
+    Differences from :func:`byzantine_fuse`:
+
+    - ``AgentRemoval.index`` is the agent's arrival sequence number.
+    - ``max_removals`` caps evictions *per update*
+      (``None`` = half the current window).
+    - Trust for ``"least_trusted"`` / ``"combined"`` is given per
+      agent to :meth:`add`; ``config.trust_weights`` must be ``None``.
+    - With two or more dogmatic agents the fused opinion is their
+      equal-weight average, and the fused base rate is the window mean.
+
+    Args:
+        config: Fusion configuration.  ``None`` uses defaults.
+        window: Maximum number of agents held.
+
+    Raises:
+        ValueError: If ``window`` < 2 or ``config.trust_weights`` is set.
+    """
+
+    def __init__(
+        self,
+        config: Optional[ByzantineConfig] = None,
+        *,
+        window: int = 1000,
+    ) -> None:
+        cfg = config or ByzantineConfig()
+        if window < 2:
+            raise ValueError(f"window must be >= 2, got: {window}")
+        if cfg.trust_weights is not None:
+            raise ValueError(
+                "StreamingByzantineFuser takes per-agent trust in add(); "
+                "config.trust_weights must be None"
+            )
+        self._config = cfg
+        self._window = window
+        self._agents: OrderedDict[int, _StreamAgent] = OrderedDict()
+        self._next_seq = 0
+        self._expired = 0
+        self._evicted = 0
+        self._reset_sums()
+        # Discord bound heap: entries (-(raw - drift_at_push), seq, version).
+        # An entry's raw discord can have grown by at most the increase
+        # in self._drift since it was pushed.
+        self._heap: list[tuple[float, int, int]] = []
+        self._drift = 0.0
+        self._version = 0
+        self._since_resync = 0
+
+    # -- running sums ------------------------------------------------
+
+    def _reset_sums(self) -> None:
+        self._sum_b = 0.0
+        self._sum_d = 0.0
+        self._sum_u = 0.0
+        self._sum_a = 0.0
+        self._sum_sq = 0.0
+        self._sum_eb = 0.0
+        self._sum_ed = 0.0
+        self._dogmatic = 0
+        self._dogmatic_b = 0.0
+        self._dogmatic_d = 0.0
+
+    def _apply(self, agent: _StreamAgent, sign: float) -> None:
+        o = agent.opinion
+        old_b, old_d = self._sum_b, self._sum_d
+        self._sum_b += sign * o.belief
+        self._sum_d += sign * o.disbelief
+        self._sum_u += sign * o.uncertainty
+        self._sum_a += sign * o.base_rate
+        self._sum_sq += sign * agent.square
+        if o.uncertainty == 0.0:
+            self._dogmatic += int(sign)
+            self._dogmatic_b += sign * o.belief
+            self._dogmatic_d += sign * o.disbelief
+        else:
+            self._sum_eb += sign * agent.evidence_b
+            self._sum_ed += sign * agent.evidence_d
+        # b_i*dD + d_i*dB <= max(dB, dD) because b_i + d_i <= 1.
+        self._drift += max(self._sum_b - old_b, self._sum_d - old_d, 0.0)
+        self._version += 1
+        self._since_resync += 1
+
+    def _resync(self) -> None:
+        """Recompute every running sum exactly from the window."""
+        agents = list(self._agents.values())
+        ops = [ag.opinion for ag in agents]
+        self._sum_b = math.fsum(o.belief for o in ops)
+        self._sum_d = math.fsum(o.disbelief for o in ops)
+        self._sum_u = math.fsum(o.uncertainty for o in ops)
+        self._sum_a = math.fsum(o.base_rate for o in ops)
+        self._sum_sq = math.fsum(ag.square for ag in agents)
+        self._sum_eb = math.fsum(ag.evidence_b for ag in agents)
+        self._sum_ed = math.fsum(ag.evidence_d for ag in agents)
+        dogmatic = [o for o in ops if o.uncertainty == 0.0]
+        self._dogmatic = len(dogmatic)
+        self._dogmatic_b = math.fsum(o.belief for o in dogmatic)
+        self._dogmatic_d = math.fsum(o.disbelief for o in dogmatic)
+        self._drift += _BOUND_SLACK
+        self._version += 1
+        self._since_resync = 0
+        if len(self._heap) > 2 * len(self._agents) + 16:
+            self._heap = [e for e in self._heap if e[1] in self._agents]
+            heapq.heapify(self._heap)
+
+    def _remove(self, seq: int) -> Opinion:
+        agent = self._agents.pop(seq)
+        self._apply(agent, -1.0)
+        # Subtracting a dominant evidence term cancels catastrophically.
+        if agent.evidence_b + agent.evidence_d > self._sum_eb + self._sum_ed:
+            self._resync()
+        return agent.opinion
+
+    # -- discord -----------------------------------------------------
+
+    def _raw_discord(self, agent: _StreamAgent) -> float:
+        o = agent.opinion
+        return max(
+            o.belief * (self._sum_d - o.disbelief)
+            + o.disbelief * (self._sum_b - o.belief),
+            0.0,
+        )
+
+    def _push(self, seq: int) -> None:
+        raw = self._raw_discord(self._agents[seq])
+        heapq.heappush(self._heap, (-(raw - self._drift), seq, self._version))
+
+    def _max_bound(self) -> float:
+        """Upper bound on the largest raw discord in the window."""
+        heap = self._heap
+        while heap and heap[0][1] not in self._agents:
+            heapq.heappop(heap)
+        return -heap[0][0] + self._drift if heap else 0.0
+
+    def _most_discordant(self) -> tuple[int, float]:
+        """(seq, raw discord) of the most discordant agent, refreshing bounds."""
+        heap = self._heap
+        while True:
+            _, seq, version = heap[0]
+            if seq not in self._agents:
+                heapq.heappop(heap)
+            elif version == self._version:
+                return seq, self._raw_discord(self._agents[seq])
+            else:
+                heapq.heappop(heap)
+                self._push(seq)
+
+    def discord(self, seq: int) -> float:
+        """Current mean conflict of agent *seq* with the rest of the window.
+
+        Raises:
+            KeyError: If *seq* is not in the window.
+        """
+        n = len(self._agents)
+        raw = self._raw_discord(self._agents[seq])
+        return raw / (n - 1) if n > 1 else 0.0
+
+    # -- updates -----------------------------------------------------
+
+    def _admit(self, opinion: Opinion, trust: Optional[float]) -> None:
+        if not isinstance(opinion, Opinion):
+            raise TypeError(f"Expected Opinion, got: {type(opinion).__name__}")
+        if self._config.strategy in ("least_trusted", "combined"):
+            if trust is None:
+                raise ValueError(
+                    f"trust is required for strategy '{self._config.strategy}'"
+                )
+        if len(self._agents) >= self._window:
+            self._remove(next(iter(self._agents)))
+            self._expired += 1
+        agent = _StreamAgent(opinion, trust)
+        seq = self._next_seq
+        self._next_seq += 1
+        self._agents[seq] = agent
+        self._apply(agent, 1.0)
+        if self._since_resync >= self._window:
+            self._resync()
+        self._push(seq)
+
+    def add(self, opinion: Opinion, trust: Optional[float] = None) -> list[AgentRemoval]:
+        """Add one agent's opinion and evict Byzantine agents.
+
+        Args:
+            opinion: The new opinion.
+            trust:   Agent trust in [0, 1]; required for the
+                     ``"least_trusted"`` and ``"combined"`` strategies.
+
+        Returns:
+            Agents evicted by this update (possibly including the new one).
+        """
+        self._admit(opinion, trust)
+        return self._evict()
+
+    def extend(
+        self,
+        opinions: Sequence[Opinion],
+        trusts: Optional[Sequence[float]] = None,
+    ) -> list[AgentRemoval]:
+        """Add a micro-batch of opinions, then evict once for the batch.
+
+        Raises:
+            ValueError: If ``trusts`` has a different length, or is
+                        missing when the strategy needs trust.
+        """
+        if trusts is not None and len(trusts) != len(opinions):
+            raise ValueError(
+                f"trusts length ({len(trusts)}) must match "
+                f"opinions length ({len(opinions)})"
+            )
+        if trusts is None and self._config.strategy in ("least_trusted", "combined"):
+            raise ValueError(
+                f"trusts are required for strategy '{self._config.strategy}'"
+            )
+        for k, opinion in enumerate(opinions):
+            self._admit(opinion, trusts[k] if trusts is not None else None)
+        return self._evict()
+
+    def _evict(self) -> list[AgentRemoval]:
+        cfg = self._config
+        limit = cfg.max_removals
+        if limit is None:
+            limit = len(self._agents) // 2
+        removed: list[AgentRemoval] = []
+
+        while len(removed) < limit and len(self._agents) > max(cfg.min_agents, 1):
+            scale = len(self._agents) - 1
+            # Cheap exit: nobody's discord can reach the threshold.
+            if self._max_bound() < cfg.threshold * scale:
+                break
+
+            if cfg.strategy == "most_conflicting":
+                seq, raw = self._most_discordant()
+                score = raw / scale
+                if score < cfg.threshold:
+                    break
+                reason = "highest discord in window"
+            else:
+                seqs = list(self._agents)
+                indexed = [(s, self._agents[s].opinion) for s in seqs]
+                discord = [self._raw_discord(self._agents[s]) / scale for s in seqs]
+                trust = {s: self._agents[s].trust for s in seqs}
+                local, score, reason = _STRATEGY_PICKERS[cfg.strategy](
+                    indexed, discord, trust,  # type: ignore[arg-type]
+                )
+                if score < cfg.threshold:
+                    break
+                seq = seqs[local]
+
+            opinion = self._remove(seq)
+            self._evicted += 1
+            removed.append(AgentRemoval(
+                index=seq,
+                opinion=opinion,
+                discord_score=score,
+                reason=reason,
+            ))
+        return removed
+
+    # -- state -------------------------------------------------------
+
+    @property
+    def size(self) -> int:
+        """Number of agents currently in the window."""
+        return len(self._agents)
+
+    @property
+    def agents(self) -> list[tuple[int, Opinion]]:
+        """``(sequence number, opinion)`` pairs, oldest first."""
+        return [(seq, ag.opinion) for seq, ag in self._agents.items()]
+
+    @property
+    def expired_count(self) -> int:
+        """Agents dropped because the window was full."""
+        return self._expired
+
+    @property
+    def evicted_count(self) -> int:
+        """Agents evicted as Byzantine since construction."""
+        return self._evicted
+
+    @property
+    def fused(self) -> Optional[Opinion]:
+        """Cumulative fusion of the window, or ``None`` when empty."""
+        n = len(self._agents)
+        if n == 0:
+            return None
+        a = min(max(self._sum_a / n, 0.0), 1.0)
+        if self._dogmatic > 0:
+            return Opinion(
+                belief=min(max(self._dogmatic_b / self._dogmatic, 0.0), 1.0),
+                disbelief=min(max(self._dogmatic_d / self._dogmatic, 0.0), 1.0),
+                uncertainty=0.0,
+                base_rate=a,
+            )
+        eb = max(self._sum_eb, 0.0)
+        ed = max(self._sum_ed, 0.0)
+        total = 1.0 + eb + ed
+        return Opinion(
+            belief=eb / total, disbelief=ed / total, uncertainty=1.0 / total, base_rate=a,
+        )
+
+    @property
+    def cohesion(self) -> float:
+        """1 - RMS pairwise Euclidean distance (normalized), in [0, 1].
+
+        The quadratic mean is at least the arithmetic mean, so this is
+        a lower bound on :func:`cohesion_score` with the default metric;
+        use :meth:`exact_cohesion` for that value.
+        """
+        n = len(self._agents)
+        if n < 2:
+            return 1.0
+        s1 = self._sum_b ** 2 + self._sum_d ** 2 + self._sum_u ** 2
+        mean_sq = max(n * self._sum_sq - s1, 0.0) / (n * (n - 1) / 2)
+        return max(1.0 - math.sqrt(mean_sq) / _MAX_SIMPLEX_DISTANCE, 0.0)
+
+    def exact_cohesion(self, distance_fn: Optional[DistanceMetric] = None) -> float:
+        """:func:`cohesion_score` of the current window (O(n^2)).
+
+        Raises:
+            ValueError: If the window is empty.
+        """
+        return cohesion_score(
+            [ag.opinion for ag in self._agents.values()], distance_fn=distance_fn,
+        )
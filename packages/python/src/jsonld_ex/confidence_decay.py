@@ -40,6 +40,9 @@ Usage::
     stale = decay_opinion(opinion, elapsed=3600, half_life=86400,
                           decay_fn=linear_decay)
 
+    # Batch (one factor per opinion, vectorized with NumPy):
+    decayed = decay_opinions_batch(opinions, ages, half_life=86400)
+
 References:
     Jøsang, A. (2016). Subjective Logic, §10.4 (Opinion Aging).
     The decay model here generalizes Jøsang's aging operator by
@@ -50,9 +53,17 @@ References:
 from __future__ import annotations
 
 import math
-from typing import Callable, Protocol
+import time
+from array import array
+from typing import Any, Callable, Protocol, Sequence
 
 from jsonld_ex.confidence_algebra import Opinion
+from jsonld_ex.confidence_array import OpinionArray
+
+try:
+    import numpy as np  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover
+    np = None
 
 
 # Type alias for decay functions.
@@ -192,9 +203,156 @@ def decay_opinion(
     if new_u < 0.0:
         new_u = 0.0
 
-    return Opinion(
+    return Opinion._trusted_create(
         belief=new_b,
         disbelief=new_d,
         uncertainty=new_u,
         base_rate=opinion.base_rate,
     )
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Batch decay
+# ═══════════════════════════════════════════════════════════════════
+
+
+def _exponential_decay_np(elapsed: Any, half_life: float) -> Any:
+    return np.exp2(-elapsed / half_life)
+
+
+def _linear_decay_np(elapsed: Any, half_life: float) -> Any:
+    return np.maximum(0.0, 1.0 - elapsed / (2.0 * half_life))
+
+
+def _step_decay_np(elapsed: Any, half_life: float) -> Any:
+    return np.where(elapsed < half_life, 1.0, 0.0)
+
+
+# Vectorized equivalents of the built-in decay functions.
+_VECTOR_DECAY: dict[DecayFunction, Callable[[Any, float], Any]] = {
+    exponential_decay: _exponential_decay_np,
+    linear_decay: _linear_decay_np,
+    step_decay: _step_decay_np,
+}
+
+
+def _elapsed_column(
+    n: int,
+    elapsed: float | Sequence[float] | None,
+    timestamps: Sequence[float] | None,
+    reference_time: float | None,
+) -> list[float]:
+    """Resolve per-opinion elapsed times as a Python list."""
+    if (elapsed is None) == (timestamps is None):
+        raise ValueError("Provide exactly one of elapsed or timestamps")
+    if timestamps is not None:
+        ref = reference_time if reference_time is not None else time.time()
+        values = [ref - t for t in _as_list(timestamps)]
+    elif not hasattr(elapsed, "__len__"):
+        values = [float(elapsed)] * n  # type: ignore[arg-type]
+    else:
+        values = _as_list(elapsed)
+    if len(values) != n:
+        raise ValueError(
+            f"Expected {n} elapsed times or timestamps, got {len(values)}"
+        )
+    return values
+
+
+def _as_list(values: Any) -> list[float]:
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+def decay_opinions_batch(
+    opinions: Sequence[Opinion] | OpinionArray,
+    elapsed: float | Sequence[float] | None = None,
+    *,
+    half_life: float,
+    decay_fn: DecayFunction | None = None,
+    timestamps: Sequence[float] | None = None,
+    reference_time: float | None = None,
+    backend: str | None = None,
+) -> OpinionArray:
+    """Decay many opinions at once, one decay factor per opinion.
+
+    Element-wise :func:`decay_opinion` over parallel arrays.  Decay
+    factors are computed in a single pass: with the NumPy backend the
+    built-in decay functions run vectorized; any other ``decay_fn`` is
+    called once per element.  The ``"array"`` backend is bitwise
+    identical to :func:`decay_opinion`.
+
+    Args:
+        opinions:       Opinions, or an :class:`OpinionArray`.
+        elapsed:        Elapsed time per opinion, or one value for all.
+        half_life:      Time for belief and disbelief to halve.
+        decay_fn:       Decay function.  Default: :func:`exponential_decay`.
+        timestamps:     Instead of *elapsed*: formation times as epoch
+                        seconds (then *half_life* is in seconds too).
+        reference_time: "Now" in epoch seconds for *timestamps*.
+                        Default: ``time.time()``.
+        backend:        Result backend (see :class:`OpinionArray`).
+                        Default: the input array's backend, else NumPy
+                        when installed.
+
+    Returns:
+        :class:`OpinionArray` of decayed opinions, in input order.
+
+    Raises:
+        ValueError: If both or neither of elapsed/timestamps are given,
+                    lengths differ, any elapsed time is negative,
+                    half_life ≤ 0, or a decay factor is outside [0, 1].
+    """
+    if half_life <= 0:
+        raise ValueError(
+            f"half_life must be positive, got: {half_life}"
+        )
+    if isinstance(opinions, OpinionArray):
+        arr = opinions if backend is None else opinions.to_backend(backend)
+    else:
+        arr = OpinionArray.from_opinions(opinions, backend=backend)
+    n = len(arr)
+    times = _elapsed_column(n, elapsed, timestamps, reference_time)
+    fn = decay_fn if decay_fn is not None else exponential_decay
+    kernel = _VECTOR_DECAY.get(fn)
+
+    if arr.backend == "numpy":
+        e = np.asarray(times, dtype=np.float64)
+        negative = e < 0
+        if negative.any():
+            i = int(np.argmax(negative))
+            raise ValueError(f"elapsed must be non-negative, got: {times[i]} at index {i}")
+        if kernel is not None:
+            factors = kernel(e, half_life)
+        else:
+            factors = np.fromiter((fn(t, half_life) for t in times), dtype=np.float64, count=n)
+        bad = ~((factors >= 0.0) & (factors <= 1.0))
+        if bad.any():
+            i = int(np.argmax(bad))
+            raise ValueError(
+                f"decay factor must be in [0, 1], got: {factors[i]} "
+                f"from decay_fn({times[i]}, {half_life}) at index {i}"
+            )
+        new_b = factors * arr.belief
+        new_d = factors * arr.disbelief
+        new_u = np.maximum(1.0 - new_b - new_d, 0.0)
+        return OpinionArray._trusted(new_b, new_d, new_u, arr.base_rate, "numpy")
+
+    out_b = array("d")
+    out_d = array("d")
+    out_u = array("d")
+    for i, (t, b, d) in enumerate(zip(times, arr.belief, arr.disbelief)):
+        if t < 0:
+            raise ValueError(f"elapsed must be non-negative, got: {t} at index {i}")
+        factor = fn(t, half_life)
+        if not (0.0 <= factor <= 1.0):
+            raise ValueError(
+                f"decay factor must be in [0, 1], got: {factor} "
+                f"from decay_fn({t}, {half_life}) at index {i}"
+            )
+        new_b = factor * b
+        new_d = factor * d
+        new_u = 1.0 - new_b - new_d
+        out_b.append(new_b)
+        out_d.append(new_d)
+        out_u.append(new_u if new_u > 0.0 else 0.0)
+    return OpinionArray._trusted(out_b, out_d, out_u, arr.base_rate, "array")
@@ -11,7 +11,7 @@ age relative to a reference time.  The decayed opinions are then
 fused (cumulative or averaging), and optionally filtered for
 adversarial agents.
 
-Three entry points, from simple to full-featured:
+Four entry points, from simple to full-featured:
 
     temporal_fuse()
         Decay → Fuse.  Uniform half-life for all sources.
@@ -23,7 +23,11 @@ Three entry points, from simple to full-featured:
     temporal_byzantine_fuse()
         Decay → Byzantine filter → Fuse.  The complete pipeline.
 
-All three are **additive** — they compose existing modules without
+    TemporalFusionWindow
+        Stateful rolling-window version of temporal_fuse() for
+        repeated "fused opinion now" queries.
+
+All four are **additive** — they compose existing modules without
 modifying them.
 
 Usage::
@@ -46,12 +50,15 @@ References:
 
 from __future__ import annotations
 
+import heapq
+import math
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Callable, Literal, Optional, Sequence
 
 from jsonld_ex.confidence_algebra import (
     Opinion,
+    _cumulative_fuse_closed_form,
     cumulative_fuse,
     averaging_fuse,
 )
@@ -303,3 +310,217 @@ def temporal_byzantine_fuse(
     ]
 
     return byzantine_fuse(decayed, config=byzantine_config)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Sliding window
+# ═══════════════════════════════════════════════════════════════════
+
+# Re-pivot the stored weights once the global factor has shrunk by
+# 2^-256, well before either it or the weights leave float range.
+_MAX_PIVOT_HALF_LIVES = 256.0
+
+
+class TemporalFusionWindow:
+    """Stateful exponential-decay fusion over a rolling time window.
+
+    Equivalent to calling :func:`temporal_fuse` on every opinion whose
+    age is at most ``window`` seconds, but without re-decaying each
+    entry from its timestamp on every query.
+
+    Exponential decay is multiplicative: the decay factor of an entry
+    formed at t_i, seen at time t, factors as::
+
+        2^(-(t - t_i)/h) = 2^(-(t - p)/h) * 2^((t_i - p)/h)
+
+    for any pivot p.  Each entry stores its belief and disbelief
+    pre-scaled by the second (per-entry, constant) factor, so
+    advancing time rescales the whole window with one global
+    multiplier.  A query is a single float pass into the closed-form
+    fusion; repeated queries at the same time are cached.  Expired
+    entries leave through a min-heap on timestamp.
+
+    Queries must move forward in time, since expired entries are
+    discarded.  Only exponential decay factors this way.
+
+    Args:
+        half_life:     Half-life in seconds.  Must be positive.
+        window:        Maximum age in seconds; older entries expire.
+        fusion_method: ``"cumulative"`` or ``"averaging"``.
+
+    Raises:
+        ValueError: If half_life or window is not positive.
+
+    Example::
+
+        win = TemporalFusionWindow(half_life=3600.0, window=86400.0)
+        win.add(TimestampedOpinion(op, datetime.now(timezone.utc)))
+        win.fused()  # "now"
+    """
+
+    def __init__(
+        self,
+        half_life: float,
+        window: float,
+        *,
+        fusion_method: Literal["cumulative", "averaging"] = "cumulative",
+    ) -> None:
+        if half_life <= 0:
+            raise ValueError(f"half_life must be positive, got: {half_life}")
+        if window <= 0:
+            raise ValueError(f"window must be positive, got: {window}")
+        self._half_life = half_life
+        self._window = window
+        self._fusion_method = fusion_method
+        # Seconds are measured from the first timestamp seen.
+        self._origin: Optional[datetime] = None
+        self._pivot = 0.0
+        # seq -> (entry, t, b * 2^((t - pivot)/h), d * 2^((t - pivot)/h))
+        self._entries: dict[int, tuple[TimestampedOpinion, float, float, float]] = {}
+        self._expiry: list[tuple[float, int]] = []
+        self._next_seq = 0
+        self._latest = -math.inf
+        self._last_query = -math.inf
+        self._cache: Optional[tuple[float, Opinion]] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _seconds(self, when: datetime) -> float:
+        if self._origin is None:
+            self._origin = when
+        return (when - self._origin).total_seconds()
+
+    def _weight(self, t: float) -> float:
+        return 2.0 ** ((t - self._pivot) / self._half_life)
+
+    def add(self, ts_opinion: TimestampedOpinion) -> None:
+        """Add one timestamped opinion.  Arrival order need not be time order."""
+        t = self._seconds(ts_opinion.timestamp)
+        if (t - self._pivot) / self._half_life > _MAX_PIVOT_HALF_LIVES:
+            self._repivot(t)
+        w = self._weight(t)
+        op = ts_opinion.opinion
+        seq = self._next_seq
+        self._next_seq += 1
+        self._entries[seq] = (ts_opinion, t, op.belief * w, op.disbelief * w)
+        heapq.heappush(self._expiry, (t, seq))
+        if t > self._latest:
+            self._latest = t
+        self._cache = None
+
+    def extend(self, ts_opinions: Sequence[TimestampedOpinion]) -> None:
+        """Add several timestamped opinions."""
+        for ts_op in ts_opinions:
+            self.add(ts_op)
+
+    def advance(self, now: datetime) -> int:
+        """Move the window to *now*, expiring old entries.
+
+        Returns:
+            Number of entries expired.
+
+        Raises:
+            ValueError: If *now* is earlier than a previous query.
+        """
+        return self._advance(self._seconds(now), now)
+
+    def _advance(self, t: float, now: datetime) -> int:
+        if t < self._last_query:
+            raise ValueError(
+                f"Query time {now.isoformat()} is earlier than a previous query"
+            )
+        self._last_query = t
+        horizon = t - self._window
+        expired = 0
+        while self._expiry and self._expiry[0][0] < horizon:
+            _, seq = heapq.heappop(self._expiry)
+            del self._entries[seq]
+            expired += 1
+        if expired:
+            self._cache = None
+        if (t - self._pivot) / self._half_life > _MAX_PIVOT_HALF_LIVES:
+            self._repivot(t)
+        return expired
+
+    def _repivot(self, pivot: float) -> None:
+        """Rebase the stored weights on a new pivot (amortized O(1))."""
+        self._pivot = pivot
+        for seq, (ts_op, t, _, _) in self._entries.items():
+            w = self._weight(t)
+            self._entries[seq] = (ts_op, t, ts_op.opinion.belief * w, ts_op.opinion.disbelief * w)
+
+    def _decayed_columns(
+        self, at: Optional[datetime],
+    ) -> tuple[datetime, float, list[float], list[float], list[float]]:
+        ref = at if at is not None else datetime.now(timezone.utc)
+        t = self._seconds(ref)
+        self._advance(t, ref)
+        if not self._entries:
+            raise ValueError("TemporalFusionWindow has no opinions in the window")
+        if self._latest > t:
+            latest = max(e[0].timestamp for e in self._entries.values())
+            if latest > ref:
+                raise ValueError(
+                    f"Opinion timestamp {latest.isoformat()} is in the "
+                    f"future relative to reference_time {ref.isoformat()}"
+                )
+        scale = 2.0 ** (-(t - self._pivot) / self._half_life)
+        bs: list[float] = []
+        ds: list[float] = []
+        us: list[float] = []
+        for _, _, pb, pd in self._entries.values():
+            b = scale * pb
+            d = scale * pd
+            u = 1.0 - b - d
+            bs.append(b)
+            ds.append(d)
+            us.append(u if u > 0.0 else 0.0)
+        return ref, t, bs, ds, us
+
+    def _decayed_opinions(self, bs: list[float], ds: list[float], us: list[float]) -> list[Opinion]:
+        return [
+            Opinion(belief=b, disbelief=d, uncertainty=u, base_rate=e[0].opinion.base_rate)
+            for b, d, u, e in zip(bs, ds, us, self._entries.values())
+        ]
+
+    def fused(self, at: Optional[datetime] = None) -> Opinion:
+        """Fused opinion of the window as seen at *at* (``None`` = UTC now).
+
+        Raises:
+            ValueError: If the window is empty, *at* precedes an earlier
+                        query, or an entry's timestamp is after *at*.
+        """
+        ref = at if at is not None else datetime.now(timezone.utc)
+        t = self._seconds(ref)
+        if self._cache is not None and self._cache[0] == t:
+            return self._cache[1]
+        _, t, bs, ds, us = self._decayed_columns(ref)
+        result: Optional[Opinion] = None
+        if self._fusion_method == "cumulative" and len(bs) >= 3:
+            closed = _cumulative_fuse_closed_form(
+                bs, ds, us, [e[0].opinion.base_rate for e in self._entries.values()],
+            )
+            if closed is not None:
+                b, d, u, a = closed
+                result = Opinion._trusted_create(belief=b, disbelief=d, uncertainty=u, base_rate=a)
+        if result is None:
+            result = _fuse_many(self._decayed_opinions(bs, ds, us), self._fusion_method)
+        self._cache = (t, result)
+        return result
+
+    def report(self, at: Optional[datetime] = None) -> TemporalFusionReport:
+        """:class:`TemporalFusionReport` for the window, as :func:`temporal_fuse` builds it."""
+        ref = at if at is not None else datetime.now(timezone.utc)
+        fused = self.fused(ref)
+        _, _, bs, ds, us = self._decayed_columns(ref)
+        return TemporalFusionReport(
+            fused=fused,
+            decayed_opinions=self._decayed_opinions(bs, ds, us),
+            reference_time=ref,
+            config=TemporalFusionConfig(
+                half_life=self._half_life,
+                fusion_method=self._fusion_method,
+                reference_time=ref,
+            ),
+        )
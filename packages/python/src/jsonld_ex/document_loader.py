@@ -0,0 +1,289 @@
+"""Caching Document Loader for JSON-LD processing.
+
+PyLD resolves every remote ``@context`` through a *document loader*
+callable.  Without one, each ``expand``/``compact``/``flatten`` call
+re-fetches the same contexts.  :class:`CachingDocumentLoader` keeps
+resolved documents in an LRU cache with a time-to-live and applies the
+jsonld-ex security policy when a document first enters the cache:
+
+- URLs are checked against a context allowlist (:func:`is_context_allowed`).
+- Documents with a declared hash are checked once with
+  :func:`verify_integrity`.
+
+The loader can be pre-seeded with the contexts bundled with jsonld-ex and
+can serve a mirror directory of contexts, so processing can run fully
+offline.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Union
+from urllib.parse import urlsplit
+
+from pyld.jsonld import JsonLdError, get_document_loader
+
+from jsonld_ex.security import is_context_allowed, verify_integrity
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Bundled contexts
+# ═══════════════════════════════════════════════════════════════════
+
+_CONTEXTS_DIR = Path(__file__).parent / "contexts"
+
+# Published context URL -> file name under ``contexts/``.  Empty until
+# the published context documents are committed to the package.
+_BUNDLED_FILES: dict[str, str] = {}
+
+
+def _load_bundled() -> dict[str, Any]:
+    return {
+        url: json.loads((_CONTEXTS_DIR / name).read_text(encoding="utf-8"))
+        for url, name in _BUNDLED_FILES.items()
+    }
+
+
+BUNDLED_CONTEXTS: dict[str, Any] = _load_bundled()
+"""Context documents shipped with jsonld-ex, keyed by their published URL."""
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Loader
+# ═══════════════════════════════════════════════════════════════════
+
+RemoteDocument = dict[str, Any]
+
+
+class CachingDocumentLoader:
+    """PyLD document loader with an LRU + TTL cache and a context policy.
+
+    Instances are callables with PyLD's loader signature and can be passed
+    as the ``documentLoader`` option or to :class:`~jsonld_ex.JsonLdEx`.
+
+    Resolution order on a cache miss: pinned documents (bundled contexts
+    and :meth:`preload`), then *local_dir*, then *fallback* (PyLD's
+    default network loader unless *offline*).  Documents obtained from
+    *local_dir* or *fallback* are policy-checked and cached; the checks
+    run once per cache entry, not once per use.  Bundled contexts are
+    checked against the allowlist on first use; preloaded documents are
+    trusted as given.
+
+    Args:
+        max_size: Maximum number of cached (non-pinned) documents.
+        ttl: Seconds a cached document stays fresh; ``None`` disables
+            expiry.  Pinned documents never expire.
+        allowlist: Context allowlist configuration as accepted by
+            :func:`~jsonld_ex.security.is_context_allowed`.  ``None``
+            allows every URL.
+        integrity: Mapping of URL to declared integrity string (e.g. from
+            :func:`~jsonld_ex.security.compute_integrity`).  Loaded
+            documents for these URLs must match.
+        local_dir: Directory mirroring remote contexts as
+            ``<local_dir>/<host>/<path>``; consulted before the network.
+        offline: Never use the network; unresolvable URLs raise.
+        fallback: Loader used for network fetches; defaults to PyLD's
+            current default document loader.
+        bundled: Pre-seed the cache with :data:`BUNDLED_CONTEXTS`.
+        clock: Monotonic time source (seconds), for testing.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 256,
+        ttl: Optional[float] = 3600.0,
+        allowlist: Optional[dict[str, Any]] = None,
+        integrity: Optional[dict[str, str]] = None,
+        local_dir: Union[str, Path, None] = None,
+        offline: bool = False,
+        fallback: Optional[Callable[..., RemoteDocument]] = None,
+        bundled: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be >= 1, got {max_size}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be positive or None, got {ttl}")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.allowlist = allowlist
+        self.integrity = dict(integrity or {})
+        self.local_dir = Path(local_dir).resolve() if local_dir is not None else None
+        self.offline = offline
+        self._fallback = fallback
+        self._clock = clock
+        self._pinned: dict[str, Any] = dict(BUNDLED_CONTEXTS) if bundled else {}
+        # Bundled URLs whose allowlist check is still pending.
+        self._unchecked: set[str] = set(self._pinned)
+        # url -> (document, expires_at or None), least recently used first
+        self._cache: OrderedDict[str, tuple[Any, Optional[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Bumped whenever documents are replaced or dropped on demand.
+        self.generation = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"CachingDocumentLoader(cached={len(self._cache)}, "
+            f"pinned={len(self._pinned)}, hits={self.hits}, misses={self.misses})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._cache) + len(self._pinned)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Pickled copies (e.g. for worker processes) keep configuration and
+        # pinned documents but start with an empty cache.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_cache"] = OrderedDict()
+        state["hits"] = state["misses"] = 0
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __contains__(self, url: object) -> bool:
+        return url in self._pinned or url in self._cache
+
+    def __call__(self, url: str, options: Optional[dict[str, Any]] = None) -> RemoteDocument:
+        """Return the PyLD remote document for *url*."""
+        document = self._pinned.get(url)
+        if document is not None:
+            if url in self._unchecked:
+                self._check_allowed(url)
+                self._unchecked.discard(url)
+            with self._lock:
+                self.hits += 1
+            return _remote_document(url, document)
+
+        with self._lock:
+            entry = self._cache.get(url)
+            if entry is not None:
+                document, expires = entry
+                if expires is None or self._clock() < expires:
+                    self._cache.move_to_end(url)
+                    self.hits += 1
+                    return _remote_document(url, document)
+                del self._cache[url]
+            self.misses += 1
+
+        document = self._load(url, options)
+        with self._lock:
+            expires = None if self.ttl is None else self._clock() + self.ttl
+            self._cache[url] = (document, expires)
+            self._cache.move_to_end(url)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return _remote_document(url, document)
+
+    def preload(self, url: str, document: Union[str, dict[str, Any], list[Any]]) -> None:
+        """Pin *document* for *url*; it is served without checks or expiry."""
+        if isinstance(document, str):
+            document = json.loads(document)
+        with self._lock:
+            self._pinned[url] = document
+            self._unchecked.discard(url)
+            self._cache.pop(url, None)
+            self.generation += 1
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """Drop *url* (or every non-pinned entry) from the cache."""
+        with self._lock:
+            if url is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(url, None)
+            self.generation += 1
+
+    def freshness(self, urls: Iterable[str]) -> tuple[int, Optional[float]]:
+        """Token describing how long the documents for *urls* stay current.
+
+        Returns the current :attr:`generation` and the earliest expiry
+        among *urls* (``None`` if none of them expires).  A URL that is no
+        longer cached counts as already expired.  Results derived from
+        these documents are valid while :meth:`is_fresh` holds.
+        """
+        with self._lock:
+            now = self._clock()
+            expires: Optional[float] = None
+            for url in urls:
+                if url in self._pinned:
+                    continue
+                entry = self._cache.get(url)
+                url_expires = now if entry is None else entry[1]
+                if url_expires is not None and (expires is None or url_expires < expires):
+                    expires = url_expires
+            return self.generation, expires
+
+    def is_fresh(self, token: tuple[int, Optional[float]]) -> bool:
+        """Whether a :meth:`freshness` token is still current."""
+        generation, expires = token
+        return generation == self.generation and (expires is None or self._clock() < expires)
+
+    # ── Internal ─────────────────────────────────────────────────
+
+    def _check_allowed(self, url: str) -> None:
+        if self.allowlist is not None and not is_context_allowed(url, self.allowlist):
+            raise _load_error(url, "URL is not permitted by the context allowlist")
+
+    def _load(self, url: str, options: Optional[dict[str, Any]]) -> Any:
+        self._check_allowed(url)
+
+        document = self._load_local(url)
+        if document is None:
+            if self.offline:
+                raise _load_error(url, "document not available offline")
+            fallback = self._fallback or get_document_loader()
+            document = fallback(url, options or {})["document"]
+            if isinstance(document, str):
+                document = _parse_json(url, document)
+
+        declared = self.integrity.get(url)
+        if declared is not None and not verify_integrity(document, declared):
+            raise _load_error(url, f"integrity check failed (expected {declared})")
+        return document
+
+    def _load_local(self, url: str) -> Any:
+        if self.local_dir is None:
+            return None
+        parts = urlsplit(url)
+        if not parts.netloc:
+            return None
+        path = (self.local_dir / parts.netloc / parts.path.lstrip("/")).resolve()
+        if self.local_dir not in path.parents or not path.is_file():
+            return None
+        return _parse_json(url, path.read_text(encoding="utf-8"))
+
+
+def _remote_document(url: str, document: Any) -> RemoteDocument:
+    # A fresh envelope per call: PyLD writes into it while processing.
+    return {
+        "contentType": "application/ld+json",
+        "contextUrl": None,
+        "documentUrl": url,
+        "document": document,
+    }
+
+
+def _parse_json(url: str, text: str) -> Any:
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as exc:
+        raise _load_error(url, f"document is not valid JSON: {exc}") from exc
+
+
+def _load_error(url: str, reason: str) -> JsonLdError:
+    return JsonLdError(
+        f"Could not load document {url}: {reason}",
+        "jsonld.LoadDocumentError",
+        {"url": url},
+        code="loading document failed",
+    )
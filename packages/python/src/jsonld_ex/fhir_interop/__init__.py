@@ -125,6 +125,7 @@ from jsonld_ex.fhir_interop._fusion import (
 )
 from jsonld_ex.fhir_interop._temporal import (
     fhir_temporal_decay,
+    fhir_temporal_decay_batch,
 )
 from jsonld_ex.fhir_interop._escalation import (
     fhir_escalation_policy,
@@ -195,6 +196,7 @@ __all__ = [
     "TrustChainReport",
     # Temporal & escalation
     "fhir_temporal_decay",
+    "fhir_temporal_decay_batch",
     "fhir_escalation_policy",
     # Compliance algebra bridge
     "fhir_consent_to_opinion",
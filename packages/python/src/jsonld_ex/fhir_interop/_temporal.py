@@ -11,7 +11,7 @@ import copy
 from datetime import datetime, timezone
 from typing import Any
 
-from jsonld_ex.confidence_decay import decay_opinion
+from jsonld_ex.confidence_decay import decay_opinion, decay_opinions_batch
 from jsonld_ex.owl_interop import ConversionReport
 
 
@@ -80,6 +80,18 @@ def _extract_timestamp(doc: dict[str, Any]) -> datetime | None:
     return None
 
 
+def _resolve_reference_time(reference_time: str | None) -> datetime:
+    """Parse *reference_time* (ISO-8601, UTC if naive) or return UTC now."""
+    if reference_time is not None:
+        ref_dt = datetime.fromisoformat(
+            reference_time.replace("Z", "+00:00")
+        )
+        if ref_dt.tzinfo is None:
+            ref_dt = ref_dt.replace(tzinfo=timezone.utc)
+        return ref_dt
+    return datetime.now(timezone.utc)
+
+
 def fhir_temporal_decay(
     doc: dict[str, Any],
     *,
@@ -116,14 +128,7 @@ def fhir_temporal_decay(
           unchanged with a warning.
         - The original document is never mutated.
     """
-    if reference_time is not None:
-        ref_dt = datetime.fromisoformat(
-            reference_time.replace("Z", "+00:00")
-        )
-        if ref_dt.tzinfo is None:
-            ref_dt = ref_dt.replace(tzinfo=timezone.utc)
-    else:
-        ref_dt = datetime.now(timezone.utc)
+    ref_dt = _resolve_reference_time(reference_time)
 
     result = copy.deepcopy(doc)
     warnings: list[str] = []
@@ -173,3 +178,88 @@ def fhir_temporal_decay(
         warnings=warnings,
     )
     return result, report
+
+
+def fhir_temporal_decay_batch(
+    docs: list[dict[str, Any]],
+    *,
+    reference_time: str | None = None,
+    half_life_days: float = 365.0,
+) -> tuple[list[dict[str, Any]], ConversionReport]:
+    """Apply temporal decay to the opinions of many FHIR-derived documents.
+
+    Batch form of :func:`fhir_temporal_decay`: timestamps are resolved
+    per document, then every opinion across all documents is decayed
+    in one :func:`decay_opinions_batch` pass.  Decayed opinions agree
+    with :func:`fhir_temporal_decay` within floating-point tolerance
+    (bitwise without NumPy).
+
+    Unlike :func:`fhir_temporal_decay`, documents are not deep-copied:
+    each result is a new top-level dict with a new ``opinions`` list
+    of new entries, but all other values are shared with the input.
+    Treat them as read-only, or deep-copy before mutating.
+
+    Args:
+        docs:            jsonld-ex documents (outputs of ``from_fhir()``).
+        reference_time:  ISO-8601 datetime string for "now".
+                         Defaults to ``datetime.now(timezone.utc)``.
+        half_life_days:  Time (in days) for belief/disbelief to halve.
+
+    Returns:
+        ``(decayed_docs, report)``, decayed_docs in input order.
+        ``report.nodes_converted`` counts decayed opinions; warnings
+        name the index of each document left unchanged.
+
+    Notes:
+        - Documents without a parseable timestamp, or with a
+          timestamp in the future, are returned unchanged with a
+          warning, as in :func:`fhir_temporal_decay`.
+        - The input documents are never mutated.
+    """
+    ref_dt = _resolve_reference_time(reference_time)
+    warnings: list[str] = []
+
+    results: list[dict[str, Any]] = []
+    entries: list[dict[str, Any]] = []
+    elapsed_days: list[float] = []
+
+    for i, doc in enumerate(docs):
+        result = dict(doc)
+        results.append(result)
+        doc_dt = _extract_timestamp(doc)
+        if doc_dt is None:
+            warnings.append(
+                f"Document {i}: no parseable timestamp found; "
+                "opinions returned unchanged."
+            )
+            continue
+        elapsed_seconds = (ref_dt - doc_dt).total_seconds()
+        if elapsed_seconds < 0:
+            warnings.append(
+                f"Document {i}: timestamp ({doc_dt.isoformat()}) is in the "
+                f"future relative to reference_time "
+                f"({ref_dt.isoformat()}); opinions returned unchanged."
+            )
+            continue
+        if "opinions" not in doc:
+            continue
+        new_entries = [dict(entry) for entry in doc["opinions"]]
+        result["opinions"] = new_entries
+        entries.extend(new_entries)
+        elapsed_days.extend([elapsed_seconds / 86400.0] * len(new_entries))
+
+    if entries:
+        decayed = decay_opinions_batch(
+            [entry["opinion"] for entry in entries],
+            elapsed_days,
+            half_life=half_life_days,
+        )
+        for entry, op in zip(entries, decayed.to_opinions()):
+            entry["opinion"] = op
+
+    report = ConversionReport(
+        success=True,
+        nodes_converted=len(entries),
+        warnings=warnings,
+    )
+    return results, report
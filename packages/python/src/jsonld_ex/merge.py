@@ -15,8 +15,17 @@ and picks winners where they disagree — with a full audit trail.
 from __future__ import annotations
 
 import copy
+import hashlib
+import heapq
+import json
+import multiprocessing as mp
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Literal, Optional, Sequence
+from itertools import groupby, repeat
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Literal, Optional, Sequence, Union
 
 from jsonld_ex.ai_ml import get_confidence
 from jsonld_ex.inference import combine_sources, resolve_conflict
@@ -70,6 +79,8 @@ def merge_graphs(
     confidence_combination: Literal[
         "noisy_or", "average", "max"
     ] = "noisy_or",
+    copy_output: bool = False,
+    max_workers: Optional[int] = None,
 ) -> tuple[dict[str, Any], MergeReport]:
     """Merge multiple JSON-LD graphs with confidence-aware conflict resolution.
 
@@ -84,6 +95,13 @@ def merge_graphs(
            - If *conflict_strategy* is ``"union"`` → keep all values.
         4. Produce a merged ``@graph`` document and an audit report.
 
+    The merge is copy-on-write: the output shares the context, anonymous
+    nodes and every value it does not change with the input graphs.
+    Only values whose annotations are rewritten (combined confidence on
+    agreement, a resolved conflict winner carrying a default or voted
+    confidence) are new objects.  Treat the result as read-only, or pass
+    ``copy_output=True``.
+
     Args:
         graphs: Two or more JSON-LD documents.  Each may contain a
             top-level node or a ``@graph`` array.
@@ -94,6 +112,18 @@ def merge_graphs(
         confidence_combination: Method for boosting confidence when
             sources agree.  Passed to
             :func:`~jsonld_ex.inference.combine_sources`.
+        copy_output: Deep-copy everything taken from the inputs, so the
+            result shares no mutable objects with them.
+        max_workers: With more than one worker, the ``@id`` groups are
+            hash-partitioned into *max_workers* shards merged in a process
+            pool.  Output and report are identical to a serial merge
+            (merged nodes then come back as copies, not shared values).
+            ``None`` or ``1`` merges serially.  Workers inherit the input
+            under the ``fork`` start method, but the parent still groups
+            nodes by ``@id`` and unpickles every merged node, about a
+            third of a serial merge, so the speedup stays below roughly
+            3x however many cores are used.  Below a few thousand ``@id``
+            groups, process start-up costs more than it saves.
 
     Returns:
         A tuple of (merged_document, MergeReport).
@@ -105,6 +135,7 @@ def merge_graphs(
         raise ValueError("merge_graphs requires at least 2 graphs")
 
     report = MergeReport(source_count=len(graphs))
+    clone = copy.deepcopy if copy_output else _shared
 
     # Step 1 — collect all nodes, indexed by @id
     id_buckets: dict[str, list[dict[str, Any]]] = {}
@@ -114,28 +145,34 @@ def merge_graphs(
     for graph in graphs:
         # Capture the first non-None context we see
         if merged_context is None and "@context" in graph:
-            merged_context = copy.deepcopy(graph["@context"])
+            merged_context = clone(graph["@context"])
 
         for node in _extract_nodes(graph):
             node_id = node.get("@id")
             if node_id is None:
-                anonymous_nodes.append(copy.deepcopy(node))
+                anonymous_nodes.append(clone(node))
             else:
                 id_buckets.setdefault(node_id, []).append(node)
 
     # Step 2 — merge each bucket
     merged_nodes: list[dict[str, Any]] = []
 
-    for node_id, nodes in id_buckets.items():
-        merged = _merge_node_group(
-            node_id,
-            nodes,
-            conflict_strategy=conflict_strategy,
-            confidence_combination=confidence_combination,
-            report=report,
+    if max_workers is not None and max_workers > 1 and len(id_buckets) > 1:
+        merged_nodes = _merge_partitioned(
+            id_buckets, conflict_strategy, confidence_combination, report, max_workers,
         )
-        merged_nodes.append(merged)
-        report.nodes_merged += 1
+    else:
+        for node_id, nodes in id_buckets.items():
+            merged = _merge_node_group(
+                node_id,
+                nodes,
+                conflict_strategy=conflict_strategy,
+                confidence_combination=confidence_combination,
+                report=report,
+                copy_output=copy_output,
+            )
+            merged_nodes.append(merged)
+            report.nodes_merged += 1
 
     # Pass through anonymous nodes
     merged_nodes.extend(anonymous_nodes)
@@ -149,6 +186,238 @@ def merge_graphs(
     return result, report
 
 
+# Buckets of the merge a forked worker serves; set in the worker only,
+# by _init_merge_worker.
+_worker_buckets: list[tuple[str, list[dict[str, Any]]]] = []
+
+_ShardConflict = tuple[str, str, Any]
+_ShardEntry = tuple[int, dict[str, Any], list[_ShardConflict]]
+
+
+def _merge_partitioned(
+    id_buckets: dict[str, list[dict[str, Any]]],
+    conflict_strategy: str,
+    confidence_combination: str,
+    report: MergeReport,
+    n_shards: int,
+) -> list[dict[str, Any]]:
+    """Merge *id_buckets* in a process pool, one hash partition per worker.
+
+    Where the ``fork`` start method exists the workers inherit the
+    buckets and receive only bucket positions; otherwise each shard's
+    buckets are pickled to its worker.  Workers send back merged nodes
+    and conflicts as ``(property, resolution, winner)``; the conflicting
+    input values are looked up here instead of round-tripping through
+    pickle.  Nodes and conflicts are put back in bucket order, so the
+    result does not depend on how the work was split or scheduled.
+    """
+    buckets = list(id_buckets.items())
+    shards: list[list[int]] = [[] for _ in range(n_shards)]
+    for position, (node_id, _) in enumerate(buckets):
+        shards[_id_bucket(node_id, n_shards)].append(position)
+    shards = [shard for shard in shards if shard]
+
+    if "fork" in mp.get_all_start_methods():
+        # Forked children inherit initargs without pickling them.
+        pool = ProcessPoolExecutor(
+            max_workers=len(shards),
+            mp_context=mp.get_context("fork"),
+            initializer=_init_merge_worker,
+            initargs=(buckets,),
+        )
+        tasks: list[Any] = shards
+    else:
+        pool = ProcessPoolExecutor(max_workers=len(shards))
+        tasks = [[(position, *buckets[position]) for position in shard] for shard in shards]
+
+    entries: list[_ShardEntry] = []
+    with pool:
+        for shard_entries, shard_report in pool.map(
+            _merge_shard,
+            tasks,
+            repeat(conflict_strategy),
+            repeat(confidence_combination),
+        ):
+            entries.extend(shard_entries)
+            report.nodes_merged += shard_report.nodes_merged
+            report.properties_agreed += shard_report.properties_agreed
+            report.properties_conflicted += shard_report.properties_conflicted
+            report.properties_union += shard_report.properties_union
+
+    entries.sort(key=lambda entry: entry[0])
+    merged_nodes = []
+    for position, merged, conflicts in entries:
+        merged_nodes.append(merged)
+        node_id, nodes = buckets[position]
+        for prop, resolution, winner_value in conflicts:
+            report.conflicts.append(MergeConflict(
+                node_id=node_id,
+                property_name=prop,
+                values=[node[prop] for node in nodes if prop in node],
+                resolution=resolution,
+                winner_value=winner_value,
+            ))
+    return merged_nodes
+
+
+def _init_merge_worker(buckets: list[tuple[str, list[dict[str, Any]]]]) -> None:
+    global _worker_buckets
+    _worker_buckets = buckets
+
+
+def _merge_shard(
+    shard: list[Any],
+    conflict_strategy: str,
+    confidence_combination: str,
+) -> tuple[list[_ShardEntry], MergeReport]:
+    """Worker: merge one partition, returning (position, node, conflicts) entries.
+
+    *shard* holds positions into ``_worker_buckets``, or
+    ``(position, node_id, nodes)`` triples when the buckets were not
+    inherited.
+    """
+    report = MergeReport()
+    entries: list[_ShardEntry] = []
+    for item in shard:
+        if isinstance(item, int):
+            position = item
+            node_id, nodes = _worker_buckets[position]
+        else:
+            position, node_id, nodes = item
+        recorded = len(report.conflicts)
+        merged = _merge_node_group(
+            node_id,
+            nodes,
+            conflict_strategy=conflict_strategy,
+            confidence_combination=confidence_combination,
+            report=report,
+            copy_output=False,
+        )
+        report.nodes_merged += 1
+        conflicts = [
+            (c.property_name, c.resolution, c.winner_value)
+            for c in report.conflicts[recorded:]
+        ]
+        entries.append((position, merged, conflicts))
+    report.conflicts = []
+    return entries, report
+
+
+def merge_graph_streams(
+    streams: Sequence[Iterable[Union[dict[str, Any], str, bytes]]],
+    conflict_strategy: Literal[
+        "highest", "weighted_vote", "union", "recency"
+    ] = "highest",
+    confidence_combination: Literal[
+        "noisy_or", "average", "max"
+    ] = "noisy_or",
+    report: Optional[MergeReport] = None,
+    copy_output: bool = False,
+    record_conflicts: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Merge node streams that are sorted by ``@id``, one id group at a time.
+
+    Streaming counterpart of :func:`merge_graphs` for graphs too large to
+    hold in memory, such as per-agent shards written as JSON Lines.  Each
+    stream yields nodes (or JSON text lines, which are parsed; blank
+    lines are skipped) in non-decreasing ``@id`` order.  A heap-based
+    k-way merge gathers the nodes of the smallest ``@id`` across all
+    streams, merges them exactly as :func:`merge_graphs` does and yields
+    the result, so memory is bounded by one id group per stream.
+
+    Merged nodes come out in ``@id`` order; nodes without ``@id`` are
+    passed through when they are read.  *report* (created if not given)
+    is updated as nodes are yielded; its counters always are, but
+    :class:`MergeConflict` records, which hold on to the conflicting
+    values, are only kept with *record_conflicts*.  Output shares values
+    with the input nodes unless *copy_output*, as for :func:`merge_graphs`.
+
+    Raises:
+        ValueError: If fewer than 2 streams are given, or a stream is
+            not sorted by ``@id`` (raised when the offending node is
+            reached).
+    """
+    if len(streams) < 2:
+        raise ValueError("merge_graph_streams requires at least 2 streams")
+    if report is None:
+        report = MergeReport()
+    report.source_count = len(streams)
+    return _merge_streams(
+        streams, conflict_strategy, confidence_combination,
+        report, copy_output, record_conflicts,
+    )
+
+
+def _merge_streams(
+    streams: Sequence[Iterable[Union[dict[str, Any], str, bytes]]],
+    conflict_strategy: str,
+    confidence_combination: str,
+    report: MergeReport,
+    copy_output: bool,
+    record_conflicts: bool,
+) -> Iterator[dict[str, Any]]:
+    anonymous: list[dict[str, Any]] = []
+    merged_stream = heapq.merge(
+        *(_sorted_nodes(stream, index, anonymous) for index, stream in enumerate(streams)),
+        key=_node_id,
+    )
+    for node_id, group in groupby(merged_stream, key=_node_id):
+        nodes = list(group)
+        if anonymous:
+            yield from _take_all(anonymous, copy_output)
+        recorded = len(report.conflicts)
+        merged = _merge_node_group(
+            node_id,
+            nodes,
+            conflict_strategy=conflict_strategy,
+            confidence_combination=confidence_combination,
+            report=report,
+            copy_output=copy_output,
+        )
+        if not record_conflicts:
+            del report.conflicts[recorded:]
+        report.nodes_merged += 1
+        yield merged
+    yield from _take_all(anonymous, copy_output)
+
+
+def _node_id(node: dict[str, Any]) -> str:
+    return node["@id"]
+
+
+def _sorted_nodes(
+    stream: Iterable[Union[dict[str, Any], str, bytes]],
+    index: int,
+    anonymous: list[dict[str, Any]],
+) -> Iterator[dict[str, Any]]:
+    """Yield the identified nodes of *stream*, checking their order.
+
+    Nodes without ``@id`` are diverted to *anonymous*.
+    """
+    previous: Optional[str] = None
+    for item in stream:
+        if isinstance(item, (str, bytes)):
+            if not item.strip():
+                continue
+            item = json.loads(item)
+        node_id = item.get("@id")
+        if node_id is None:
+            anonymous.append(item)
+            continue
+        if previous is not None and node_id < previous:
+            raise ValueError(
+                f"Stream {index} is not sorted by @id: {node_id!r} after {previous!r}"
+            )
+        previous = node_id
+        yield item
+
+
+def _take_all(nodes: list[dict[str, Any]], copy_output: bool) -> list[dict[str, Any]]:
+    taken = [copy.deepcopy(n) for n in nodes] if copy_output else list(nodes)
+    nodes.clear()
+    return taken
+
+
 # ═══════════════════════════════════════════════════════════════════
 # GRAPH DIFF
 # ═══════════════════════════════════════════════════════════════════
@@ -191,42 +460,9 @@ def diff_graphs(
 
     # Nodes in both — compare properties
     for nid in ids_a & ids_b:
-        node_a = nodes_a[nid]
-        node_b = nodes_b[nid]
-
-        props_a = _data_properties(node_a)
-        props_b = _data_properties(node_b)
-
-        all_props = set(props_a.keys()) | set(props_b.keys())
-
-        for prop in all_props:
-            val_a = props_a.get(prop)
-            val_b = props_b.get(prop)
-
-            if val_a is None:
-                added.append({"@id": nid, "property": prop, "value": val_b})
-            elif val_b is None:
-                removed.append({"@id": nid, "property": prop, "value": val_a})
-            elif _bare_value(val_a) == _bare_value(val_b):
-                # Same value, possibly different annotations
-                conf_a = get_confidence(val_a) if isinstance(val_a, dict) else None
-                conf_b = get_confidence(val_b) if isinstance(val_b, dict) else None
-                entry: dict[str, Any] = {
-                    "@id": nid,
-                    "property": prop,
-                    "value": _bare_value(val_a),
-                }
-                if conf_a is not None or conf_b is not None:
-                    entry["confidence_a"] = conf_a
-                    entry["confidence_b"] = conf_b
-                unchanged.append(entry)
-            else:
-                modified.append({
-                    "@id": nid,
-                    "property": prop,
-                    "value_a": val_a,
-                    "value_b": val_b,
-                })
+        _diff_node_properties(
+            nid, nodes_a[nid], nodes_b[nid], added, removed, modified, unchanged,
+        )
 
     return {
         "added": added,
@@ -236,6 +472,281 @@ def diff_graphs(
     }
 
 
+def _diff_node_properties(
+    nid: str,
+    node_a: dict[str, Any],
+    node_b: dict[str, Any],
+    added: list[dict[str, Any]],
+    removed: list[dict[str, Any]],
+    modified: list[dict[str, Any]],
+    unchanged: list[dict[str, Any]],
+) -> None:
+    """Property-level diff of one node present in both graphs."""
+    props_a = _data_properties(node_a)
+    props_b = _data_properties(node_b)
+
+    all_props = set(props_a.keys()) | set(props_b.keys())
+
+    for prop in all_props:
+        val_a = props_a.get(prop)
+        val_b = props_b.get(prop)
+
+        if val_a is None:
+            added.append({"@id": nid, "property": prop, "value": val_b})
+        elif val_b is None:
+            removed.append({"@id": nid, "property": prop, "value": val_a})
+        elif _bare_value(val_a) == _bare_value(val_b):
+            # Same value, possibly different annotations
+            conf_a = get_confidence(val_a) if isinstance(val_a, dict) else None
+            conf_b = get_confidence(val_b) if isinstance(val_b, dict) else None
+            entry: dict[str, Any] = {
+                "@id": nid,
+                "property": prop,
+                "value": _bare_value(val_a),
+            }
+            if conf_a is not None or conf_b is not None:
+                entry["confidence_a"] = conf_a
+                entry["confidence_b"] = conf_b
+            unchanged.append(entry)
+        else:
+            modified.append({
+                "@id": nid,
+                "property": prop,
+                "value_a": val_a,
+                "value_b": val_b,
+            })
+
+
+# ── Hashed diff ────────────────────────────────────────────────────
+
+_SUMMARY_VERSION = 1
+_CANONICAL_JSON = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str,
+)
+
+
+@dataclass(frozen=True)
+class GraphSummary:
+    """Merkle-style content summary of a graph, for :func:`diff_graphs_hashed`.
+
+    Nodes are assigned to one of ``n_buckets`` buckets by a hash of their
+    ``@id``.  ``buckets[i]`` maps each ``@id`` in bucket *i* to the
+    node's :func:`node_hash` digest, ``bucket_hashes[i]`` covers the
+    sorted ``(@id, digest)`` pairs of that bucket and ``root`` covers all
+    bucket hashes.  Equal bucket hashes mean identical node content.
+
+    Summaries can be persisted with :meth:`save` and reloaded with
+    :meth:`load`, so a later diff only has to hash the new snapshot.
+    """
+
+    buckets: tuple[dict[str, bytes], ...]
+    bucket_hashes: tuple[bytes, ...]
+    root: bytes
+
+    @property
+    def n_buckets(self) -> int:
+        return len(self.buckets)
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self.buckets)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict (digests as hex strings)."""
+        return {
+            "version": _SUMMARY_VERSION,
+            "root": self.root.hex(),
+            "bucket_hashes": [digest.hex() for digest in self.bucket_hashes],
+            "buckets": [
+                {nid: digest.hex() for nid, digest in bucket.items()}
+                for bucket in self.buckets
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> GraphSummary:
+        """Rebuild a summary from :meth:`to_dict` output.
+
+        Raises:
+            ValueError: If the format version or bucket count is wrong.
+        """
+        if data.get("version") != _SUMMARY_VERSION:
+            raise ValueError(
+                f"Unsupported graph summary version: {data.get('version')!r}"
+            )
+        buckets = tuple(
+            {nid: bytes.fromhex(digest) for nid, digest in bucket.items()}
+            for bucket in data["buckets"]
+        )
+        bucket_hashes = tuple(bytes.fromhex(digest) for digest in data["bucket_hashes"])
+        if not buckets or len(bucket_hashes) != len(buckets):
+            raise ValueError("Graph summary bucket count mismatch")
+        return cls(buckets, bucket_hashes, bytes.fromhex(data["root"]))
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the summary to *path* as JSON (atomically replaced)."""
+        path = Path(path)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self.to_dict(), separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> GraphSummary:
+        """Read a summary written by :meth:`save`."""
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+def node_hash(node: dict[str, Any]) -> bytes:
+    """Stable 16-byte content digest of *node*.
+
+    The node is hashed as canonical JSON with sorted keys, so the order
+    of properties and of annotation keys (``@confidence``, ``@source``,
+    ...) does not matter; array order does.
+    """
+    content = _CANONICAL_JSON.encode(node)
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+
+def summarize_graph(graph: dict[str, Any], n_buckets: int = 256) -> GraphSummary:
+    """Compute the :class:`GraphSummary` of a JSON-LD graph.
+
+    Nodes without ``@id`` are ignored and duplicate ``@id`` values are
+    last-write-wins, as in :func:`diff_graphs`.
+
+    Raises:
+        ValueError: If *n_buckets* is less than 1.
+    """
+    if n_buckets < 1:
+        raise ValueError(f"n_buckets must be >= 1, got {n_buckets}")
+    return _summarize(_index_by_id(_extract_nodes(graph)), n_buckets)
+
+
+def diff_graphs_hashed(
+    a: dict[str, Any],
+    b: dict[str, Any],
+    *,
+    summary_a: Optional[GraphSummary] = None,
+    summary_b: Optional[GraphSummary] = None,
+    n_buckets: int = 256,
+) -> tuple[dict[str, Any], GraphSummary]:
+    """Diff two graphs, property-diffing only the nodes whose content changed.
+
+    Both graphs are summarized with :func:`summarize_graph` (or the given
+    summaries are used).  Buckets with equal hashes are skipped without
+    looking at their nodes; in the others, nodes with equal
+    :func:`node_hash` digests are skipped and only added, removed and
+    changed nodes are compared as in :func:`diff_graphs`.
+
+    Pass the summary returned by the previous run as *summary_a* to avoid
+    re-hashing the old snapshot; persist it with :meth:`GraphSummary.save`.
+
+    Args:
+        a: The old graph.  With *summary_a*, it is only read for nodes
+            that changed.
+        b: The new graph.
+        summary_a: Precomputed summary of *a*.  Its bucket count is used
+            for *b* as well.
+        summary_b: Precomputed summary of *b*.
+        n_buckets: Bucket count when neither summary is given.
+
+    Returns:
+        A tuple of (diff, summary of *b*).  The diff has the keys of
+        :func:`diff_graphs`, with ``added``, ``removed`` and ``modified``
+        matching its entries (in ``@id`` order within each bucket);
+        ``unchanged`` lists only the unchanged properties of changed
+        nodes, and ``unchanged_nodes`` counts the nodes that were skipped.
+
+    Raises:
+        ValueError: If the two summaries have different bucket counts.
+    """
+    if summary_a is not None:
+        n_buckets = summary_a.n_buckets
+    elif summary_b is not None:
+        n_buckets = summary_b.n_buckets
+    elif n_buckets < 1:
+        raise ValueError(f"n_buckets must be >= 1, got {n_buckets}")
+
+    nodes_a: Optional[dict[str, dict[str, Any]]] = None
+    nodes_b: Optional[dict[str, dict[str, Any]]] = None
+    if summary_a is None:
+        nodes_a = _index_by_id(_extract_nodes(a))
+        summary_a = _summarize(nodes_a, n_buckets)
+    if summary_b is None:
+        nodes_b = _index_by_id(_extract_nodes(b))
+        summary_b = _summarize(nodes_b, n_buckets)
+    if summary_a.n_buckets != summary_b.n_buckets:
+        raise ValueError(
+            f"Summaries have different bucket counts: "
+            f"{summary_a.n_buckets} and {summary_b.n_buckets}"
+        )
+
+    added: list[dict[str, Any]] = []
+    removed: list[dict[str, Any]] = []
+    modified: list[dict[str, Any]] = []
+    unchanged: list[dict[str, Any]] = []
+    unchanged_nodes = len(summary_b)
+
+    if summary_a.root != summary_b.root:
+        unchanged_nodes = 0
+        for index, digest in enumerate(summary_a.bucket_hashes):
+            bucket_b = summary_b.buckets[index]
+            if digest == summary_b.bucket_hashes[index]:
+                unchanged_nodes += len(bucket_b)
+                continue
+            if nodes_a is None:
+                nodes_a = _index_by_id(_extract_nodes(a))
+            if nodes_b is None:
+                nodes_b = _index_by_id(_extract_nodes(b))
+            bucket_a = summary_a.buckets[index]
+            for nid in sorted(bucket_a.keys() | bucket_b.keys()):
+                digest_a = bucket_a.get(nid)
+                digest_b = bucket_b.get(nid)
+                if digest_a == digest_b:
+                    unchanged_nodes += 1
+                elif digest_a is None:
+                    added.append({"@id": nid, "node": _summarized_node(nodes_b, nid)})
+                elif digest_b is None:
+                    removed.append({"@id": nid, "node": _summarized_node(nodes_a, nid)})
+                else:
+                    _diff_node_properties(
+                        nid, _summarized_node(nodes_a, nid), _summarized_node(nodes_b, nid),
+                        added, removed, modified, unchanged,
+                    )
+
+    diff = {
+        "added": added,
+        "removed": removed,
+        "modified": modified,
+        "unchanged": unchanged,
+        "unchanged_nodes": unchanged_nodes,
+    }
+    return diff, summary_b
+
+
+def _summarize(nodes: dict[str, dict[str, Any]], n_buckets: int) -> GraphSummary:
+    buckets: list[dict[str, bytes]] = [{} for _ in range(n_buckets)]
+    for nid, node in nodes.items():
+        buckets[_id_bucket(nid, n_buckets)][nid] = node_hash(node)
+
+    bucket_hashes = []
+    root = hashlib.blake2b(digest_size=16)
+    for bucket in buckets:
+        h = hashlib.blake2b(digest_size=16)
+        for nid in sorted(bucket):
+            h.update(nid.encode("utf-8"))
+            h.update(b"\0")
+            h.update(bucket[nid])
+        bucket_hashes.append(h.digest())
+        root.update(bucket_hashes[-1])
+    return GraphSummary(tuple(buckets), tuple(bucket_hashes), root.digest())
+
+
+def _summarized_node(nodes: dict[str, dict[str, Any]], nid: str) -> dict[str, Any]:
+    node = nodes.get(nid)
+    if node is None:
+        raise ValueError(f"Node {nid!r} is in the summary but not in the graph")
+    return node
+
+
 # ═══════════════════════════════════════════════════════════════════
 # INTERNAL HELPERS
 # ═══════════════════════════════════════════════════════════════════
@@ -258,6 +769,11 @@ def _extract_nodes(doc: dict[str, Any]) -> list[dict[str, Any]]:
     return []
 
 
+def _id_bucket(node_id: Any, n_buckets: int) -> int:
+    """Stable bucket of *node_id* among *n_buckets* (independent of PYTHONHASHSEED)."""
+    return zlib.crc32(str(node_id).encode("utf-8")) % n_buckets
+
+
 def _index_by_id(nodes: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
     """Index a node list by @id.  Last-write-wins for duplicates."""
     index: dict[str, dict[str, Any]] = {}
@@ -287,14 +803,24 @@ def _bare_value(val: Any) -> Any:
     return val
 
 
+def _shared(value: Any) -> Any:
+    """Copy-on-write stand-in for ``copy.deepcopy``: share *value* as is."""
+    return value
+
+
 def _merge_node_group(
     node_id: str,
     nodes: list[dict[str, Any]],
     conflict_strategy: str,
     confidence_combination: str,
     report: MergeReport,
+    copy_output: bool = True,
 ) -> dict[str, Any]:
-    """Merge a group of nodes that share the same @id."""
+    """Merge a group of nodes that share the same @id.
+
+    Unless *copy_output*, values taken unchanged from *nodes* are shared.
+    """
+    clone = copy.deepcopy if copy_output else _shared
     merged: dict[str, Any] = {"@id": node_id}
 
     # Collect @type (union of all types)
@@ -326,7 +852,7 @@ def _merge_node_group(
         if len(values) == 0:
             continue
         elif len(values) == 1:
-            merged[prop] = copy.deepcopy(values[0])
+            merged[prop] = clone(values[0])
             report.properties_agreed += 1
         else:
             # Multiple sources provided this property — agree or conflict?
@@ -334,13 +860,13 @@ def _merge_node_group(
             if _all_equal(bare_vals):
                 # Agreement — combine confidence
                 merged[prop] = _combine_agreed(
-                    values, confidence_combination
+                    values, confidence_combination, clone
                 )
                 report.properties_agreed += 1
             else:
                 # Conflict
                 if conflict_strategy == "union":
-                    merged[prop] = [copy.deepcopy(v) for v in values]
+                    merged[prop] = [clone(v) for v in values]
                     report.properties_union += 1
                     report.conflicts.append(MergeConflict(
                         node_id=node_id,
@@ -353,7 +879,7 @@ def _merge_node_group(
                     winner = _resolve_property_conflict(
                         values, conflict_strategy
                     )
-                    merged[prop] = copy.deepcopy(winner)
+                    merged[prop] = clone(winner)
                     report.conflicts.append(MergeConflict(
                         node_id=node_id,
                         property_name=prop,
@@ -377,6 +903,7 @@ def _all_equal(values: list[Any]) -> bool:
 def _combine_agreed(
     values: list[Any],
     method: str,
+    clone: Callable[[Any], Any] = copy.deepcopy,
 ) -> Any:
     """Combine agreed-upon values by boosting confidence."""
     # Extract confidence scores from all sources
@@ -394,11 +921,13 @@ def _combine_agreed(
 
     if len(conf_scores) < 2:
         # Not enough confidence data to combine — return richest value
-        return copy.deepcopy(best_value)
+        return clone(best_value)
 
     combined = combine_sources(conf_scores, method=method)  # type: ignore[arg-type]
-    result = copy.deepcopy(best_value)
+    result = clone(best_value)
     if isinstance(result, dict):
+        if result is best_value:
+            result = dict(result)  # materialize only the rewritten value
         result["@confidence"] = round(combined.score, 10)
     return result
 
@@ -412,11 +941,11 @@ def _resolve_property_conflict(
     assertions = []
     for v in values:
         if isinstance(v, dict) and "@value" in v:
-            a = copy.deepcopy(v)
-            # Ensure @confidence exists for resolution
-            if "@confidence" not in a:
-                a["@confidence"] = 0.5  # default uncertainty
-            assertions.append(a)
+            # resolve_conflict does not mutate its input, so the value is
+            # only copied when @confidence has to be filled in.
+            if "@confidence" not in v:
+                v = {**v, "@confidence": 0.5}  # default uncertainty
+            assertions.append(v)
         else:
             # Wrap plain values
             c = get_confidence(v) if isinstance(v, dict) else None
@@ -14,12 +14,22 @@ proves that jsonld-ex integrates with the existing ecosystem.
 
 from __future__ import annotations
 import copy
+import hashlib
+import itertools
+import json
+import mmap
+import os
+import re
+import threading
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Optional, Sequence
+from pathlib import Path
+from typing import IO, Any, Callable, Iterable, Iterator, NamedTuple, Optional, Sequence, Union
 
 from jsonld_ex.ai_ml import (
     JSONLD_EX_NAMESPACE,
+    _extract_field,
     get_confidence,
     get_provenance,
     ProvenanceMetadata,
@@ -339,6 +349,230 @@ def to_prov_o_graph(doc: dict[str, Any]) -> tuple[dict[str, Any], ConversionRepo
     return {"@context": prov_context, "@graph": combined_graph}, report
 
 
+# ── Streaming PROV-O ───────────────────────────────────────────────
+
+# Interned IRIs used for every generated node.
+_PROV_ENTITY = f"{PROV}Entity"
+_PROV_VALUE = f"{PROV}value"
+_PROV_SOFTWARE_AGENT = f"{PROV}SoftwareAgent"
+_PROV_PERSON = f"{PROV}Person"
+_PROV_ACTIVITY = f"{PROV}Activity"
+_PROV_ATTRIBUTED_TO = f"{PROV}wasAttributedTo"
+_PROV_ON_BEHALF_OF = f"{PROV}actedOnBehalfOf"
+_PROV_GENERATED_AT = f"{PROV}generatedAtTime"
+_PROV_GENERATED_BY = f"{PROV}wasGeneratedBy"
+_PROV_ASSOCIATED_WITH = f"{PROV}wasAssociatedWith"
+_PROV_DERIVED_FROM = f"{PROV}wasDerivedFrom"
+_PROV_INVALIDATED_BY = f"{PROV}wasInvalidatedBy"
+_PROV_AT_TIME = f"{PROV}atTime"
+_RDFS_LABEL = f"{RDFS}label"
+_JEX_CONFIDENCE = f"{JSONLD_EX}confidence"
+_XSD_DATETIME = f"{XSD}dateTime"
+
+# (compact name, keyword) of the annotations to_prov_o maps.
+_PROV_O_FIELDS = (
+    ("confidence", "@confidence"),
+    ("source", "@source"),
+    ("extractedAt", "@extractedAt"),
+    ("method", "@method"),
+    ("humanVerified", "@humanVerified"),
+    ("derivedFrom", "@derivedFrom"),
+    ("delegatedBy", "@delegatedBy"),
+    ("invalidatedAt", "@invalidatedAt"),
+    ("invalidationReason", "@invalidationReason"),
+)
+
+
+def iter_prov_o(
+    nodes: Iterable[dict[str, Any]],
+    report: Optional[ConversionReport] = None,
+) -> Iterator[dict[str, Any]]:
+    """Convert a stream of annotated nodes to PROV-O, node by node.
+
+    Applies the :func:`to_prov_o` mapping to each node of *nodes* (any
+    iterable, consumed lazily) and yields the converted node followed by
+    the PROV-O nodes it produced, so memory stays bounded by one input
+    node.  Compared with calling :func:`to_prov_o` per node:
+
+    - Blank node identifiers come from one random run prefix and a
+      counter, so they never collide within a stream.
+    - Each ``prov:SoftwareAgent`` (per source and delegation) and the
+      ``prov:Person`` human verifier are emitted once and referenced
+      afterwards; triple counts cover emitted triples only.
+    - All counts accumulate into the single *report* (created if not
+      given).
+
+    ``@context`` entries are dropped; wrap the output as
+    ``{"@context": ..., "@graph": [...]}`` with the context of
+    :func:`to_prov_o_graph` to obtain an equivalent document.
+    """
+    if report is None:
+        report = ConversionReport(success=True)
+    converter = _ProvOConverter(report)
+    for node in nodes:
+        emitted: list[dict[str, Any]] = []
+        main = converter.convert(node, emitted)
+        yield main
+        yield from emitted
+
+
+def _agent_key(source: Any, delegated_by: Any) -> Optional[tuple[str, Any]]:
+    """Dedup key for a software agent; ``None`` unless both are plain IRIs."""
+    if not isinstance(source, str):
+        return None
+    if delegated_by is None or isinstance(delegated_by, str):
+        return source, delegated_by
+    if isinstance(delegated_by, list) and all(isinstance(d, str) for d in delegated_by):
+        return source, tuple(delegated_by)
+    return None
+
+
+class _ProvOConverter:
+    """Stateful node converter behind :func:`iter_prov_o`."""
+
+    def __init__(self, report: ConversionReport) -> None:
+        self.report = report
+        self._run = uuid.uuid4().hex[:8]
+        self._ids = itertools.count()
+        self._agents: set[tuple[str, Any]] = set()
+        self._verifier: Optional[str] = None
+
+    def _new_id(self, kind: str) -> str:
+        return f"_:{kind}-{self._run}-{next(self._ids)}"
+
+    def convert(self, node: dict[str, Any], emitted: list[dict[str, Any]]) -> dict[str, Any]:
+        processed: dict[str, Any] = {}
+        for key, value in node.items():
+            if key == "@context":
+                continue
+            if isinstance(value, dict):
+                if "@value" in value:
+                    entity_id = self._entity(value, emitted)
+                    processed[key] = value if entity_id is None else {"@id": entity_id}
+                elif key != "@graph":
+                    processed[key] = self.convert(value, emitted)
+                else:
+                    processed[key] = value
+            elif isinstance(value, list):
+                processed_list = []
+                for item in value:
+                    if isinstance(item, dict) and "@value" in item:
+                        entity_id = self._entity(item, emitted)
+                        processed_list.append(item if entity_id is None else {"@id": entity_id})
+                    else:
+                        processed_list.append(item)
+                processed[key] = processed_list
+            else:
+                processed[key] = value
+        return processed
+
+    def _entity(self, value: dict[str, Any], emitted: list[dict[str, Any]]) -> Optional[str]:
+        """Emit the PROV-O nodes for an annotated value; ``None`` if it has none."""
+        (confidence, source, extracted_at, method, human_verified,
+         derived_from, delegated_by, invalidated_at, invalidation_reason) = (
+            _extract_field(value, name, keyword) for name, keyword in _PROV_O_FIELDS
+        )
+        if (
+            confidence is None and source is None and extracted_at is None
+            and method is None and human_verified is None and derived_from is None
+            and delegated_by is None and invalidated_at is None
+            and invalidation_reason is None
+        ):
+            return None
+
+        report = self.report
+        report.triples_input += 1
+        entity_id = self._new_id("entity")
+        entity: dict[str, Any] = {
+            "@id": entity_id,
+            "@type": _PROV_ENTITY,
+            _PROV_VALUE: value["@value"],
+        }
+        triples = 3  # type + value + link from the subject
+
+        if confidence is not None:
+            entity[_JEX_CONFIDENCE] = confidence
+            triples += 1
+
+        if source is not None:
+            entity[_PROV_ATTRIBUTED_TO] = {"@id": source}
+            triples += 1
+            agent_key = _agent_key(source, delegated_by)
+            if agent_key is None or agent_key not in self._agents:
+                if agent_key is not None:
+                    self._agents.add(agent_key)
+                agent: dict[str, Any] = {"@id": source, "@type": _PROV_SOFTWARE_AGENT}
+                triples += 1
+                if isinstance(delegated_by, str):
+                    agent[_PROV_ON_BEHALF_OF] = {"@id": delegated_by}
+                    triples += 1
+                elif isinstance(delegated_by, list):
+                    agent[_PROV_ON_BEHALF_OF] = [{"@id": d} for d in delegated_by]
+                    triples += len(delegated_by)
+                emitted.append(agent)
+
+        if extracted_at is not None:
+            entity[_PROV_GENERATED_AT] = {"@value": extracted_at, "@type": _XSD_DATETIME}
+            triples += 1
+
+        if method is not None:
+            activity_id = self._new_id("activity")
+            activity: dict[str, Any] = {
+                "@id": activity_id,
+                "@type": _PROV_ACTIVITY,
+                _RDFS_LABEL: method,
+            }
+            entity[_PROV_GENERATED_BY] = {"@id": activity_id}
+            triples += 3  # activity type + label + wasGeneratedBy
+            if source is not None:
+                activity[_PROV_ASSOCIATED_WITH] = {"@id": source}
+                triples += 1
+            emitted.append(activity)
+
+        if isinstance(derived_from, str):
+            entity[_PROV_DERIVED_FROM] = {"@id": derived_from}
+            triples += 1
+        elif isinstance(derived_from, list):
+            entity[_PROV_DERIVED_FROM] = [{"@id": d} for d in derived_from]
+            triples += len(derived_from)
+
+        if human_verified is True:
+            if self._verifier is None:
+                self._verifier = self._new_id("human-verifier")
+                emitted.append({
+                    "@id": self._verifier,
+                    "@type": _PROV_PERSON,
+                    _RDFS_LABEL: "Human Verifier",
+                })
+                triples += 1
+            verifier_ref = {"@id": self._verifier}
+            if _PROV_ATTRIBUTED_TO in entity:
+                entity[_PROV_ATTRIBUTED_TO] = [entity[_PROV_ATTRIBUTED_TO], verifier_ref]
+            else:
+                entity[_PROV_ATTRIBUTED_TO] = verifier_ref
+            triples += 1
+
+        if invalidated_at is not None or invalidation_reason is not None:
+            inv_activity: dict[str, Any] = {
+                "@id": self._new_id("invalidation"),
+                "@type": _PROV_ACTIVITY,
+            }
+            if invalidated_at is not None:
+                inv_activity[_PROV_AT_TIME] = {"@value": invalidated_at, "@type": _XSD_DATETIME}
+                triples += 1
+            if invalidation_reason is not None:
+                inv_activity[_RDFS_LABEL] = invalidation_reason
+                triples += 1
+            entity[_PROV_INVALIDATED_BY] = {"@id": inv_activity["@id"]}
+            emitted.append(inv_activity)
+            triples += 2  # activity type + wasInvalidatedBy link
+
+        emitted.append(entity)
+        report.triples_output += triples
+        report.nodes_converted += 1
+        return entity_id
+
+
 def from_prov_o(prov_doc: dict[str, Any]) -> tuple[dict[str, Any], ConversionReport]:
     """Convert PROV-O provenance graph back to jsonld-ex inline annotations.
 
@@ -1494,6 +1728,303 @@ def _restore_jex_annotations(
             shape[key] = value
 
 
+# ═══════════════════════════════════════════════════════════════════
+# SHAPE TRANSLATION CACHE
+# ═══════════════════════════════════════════════════════════════════
+
+# Part of every cache key; bump when a translation's output changes so
+# on-disk entries written by older versions are not reused.
+_SHAPE_CACHE_VERSION = 2
+
+
+@dataclass(frozen=True)
+class ShapeRegistryTranslation:
+    """Result of :meth:`ShapeTranslator.translate_registry`.
+
+    Attributes:
+        shacl: One SHACL shapes graph holding every shape, or ``None``.
+        owl: One OWL graph holding every class, or ``None``.
+        shape_iris: Registry name → IRI of its SHACL ``NodeShape``.
+    """
+
+    shacl: Optional[dict[str, Any]]
+    owl: Optional[dict[str, Any]]
+    shape_iris: dict[str, str]
+
+
+class ShapeTranslator:
+    """Memoizing front end for the shape ↔ SHACL/OWL translations.
+
+    Each method returns what the module-level function of the same name
+    returns, but results are memoized under a SHA-256 hash of the
+    canonical JSON of the input and arguments, so a shape library
+    exported repeatedly is translated once.  Callers receive their own
+    copy of every result.
+
+    With *cache_dir*, results are also written there as
+    ``<hash>.json`` (atomically, via a temporary file) and read back on
+    a memory miss, so a restarted service skips translation altogether.
+    Unreadable cache files are ignored and recomputed.
+
+    Translations are deterministic only when an IRI is supplied:
+    ``shape_to_shacl`` without *shape_iri* memoizes its first randomly
+    generated blank node identifier.
+
+    Args:
+        max_size: Maximum number of results kept in memory (LRU).
+        cache_dir: Optional directory for the persistent cache; created
+            on first write.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        cache_dir: Union[str, Path, None] = None,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be >= 1, got {max_size}")
+        self.max_size = max_size
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._results: OrderedDict[str, str] = OrderedDict()  # key -> JSON text
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __repr__(self) -> str:
+        return (
+            f"ShapeTranslator(size={len(self._results)}, max_size={self.max_size}, "
+            f"hits={self.hits}, disk_hits={self.disk_hits}, misses={self.misses})"
+        )
+
+    def clear(self, disk: bool = False) -> None:
+        """Drop memoized results; with *disk*, also delete cache files."""
+        with self._lock:
+            self._results.clear()
+        if disk and self.cache_dir is not None and self.cache_dir.is_dir():
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    # ── Memoized translations ──────────────────────────────────────
+
+    def shape_to_shacl(
+        self,
+        shape: dict[str, Any],
+        target_class: Optional[str] = None,
+        shape_iri: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Memoized :func:`shape_to_shacl`."""
+        return self._memo(
+            ("shape_to_shacl", shape, target_class, shape_iri),
+            lambda: shape_to_shacl(shape, target_class, shape_iri),
+        )
+
+    def shacl_to_shape(self, shacl_doc: dict[str, Any]) -> tuple[dict[str, Any], list[str]]:
+        """Memoized :func:`shacl_to_shape`."""
+        shape, warnings = self._memo(
+            ("shacl_to_shape", shacl_doc),
+            lambda: list(shacl_to_shape(shacl_doc)),
+        )
+        return shape, warnings
+
+    def shape_to_owl_restrictions(
+        self,
+        shape: dict[str, Any],
+        class_iri: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Memoized :func:`shape_to_owl_restrictions`."""
+        return self._memo(
+            ("shape_to_owl_restrictions", shape, class_iri),
+            lambda: shape_to_owl_restrictions(shape, class_iri),
+        )
+
+    def owl_to_shape(self, owl_doc: dict[str, Any]) -> dict[str, Any]:
+        """Memoized :func:`owl_to_shape`."""
+        return self._memo(("owl_to_shape", owl_doc), lambda: owl_to_shape(owl_doc))
+
+    # ── Bulk translation ───────────────────────────────────────────
+
+    def translate_registry(
+        self,
+        registry: dict[str, dict[str, Any]],
+        *,
+        shacl: bool = True,
+        owl: bool = True,
+        shape_iri_base: str = "_:shape-",
+    ) -> ShapeRegistryTranslation:
+        """Translate a whole shape registry into one SHACL and one OWL graph.
+
+        *registry* maps names to shapes, as for
+        :func:`~jsonld_ex.validation.validate_node`.  Each shape becomes
+        the ``NodeShape`` ``<shape_iri_base><name>`` and the OWL class of
+        its ``@type``.  ``@extends`` is resolved once per registry:
+
+        - A name in *registry* links to that shape's ``NodeShape``
+          (``sh:node``) and OWL class (``rdfs:subClassOf``) instead of
+          re-translating the parent for every child.
+        - An inline parent is translated once per distinct content, as
+          the ``NodeShape`` ``<shape_iri_base>inline-<hash>``, and shared
+          by every child extending it.
+        - Unknown names are ignored for SHACL and kept as IRIs for OWL,
+          as by the single-shape functions.
+
+        The whole result is memoized under the hash of the registry, and
+        every shape and parent through the per-shape memo, so re-exporting
+        an unchanged library is a single cache lookup and a changed one
+        only translates the shapes that changed.
+
+        Raises:
+            ValueError: If a translated shape has no ``@type``, or
+                ``@extends`` is circular.
+        """
+        result = self._memo(
+            ("translate_registry", registry, shacl, owl, shape_iri_base),
+            lambda: self._translate_registry(registry, shacl, owl, shape_iri_base),
+        )
+        return ShapeRegistryTranslation(**result)
+
+    def _translate_registry(
+        self,
+        registry: dict[str, dict[str, Any]],
+        shacl: bool,
+        owl: bool,
+        shape_iri_base: str,
+    ) -> dict[str, Any]:
+        shape_iris = {name: f"{shape_iri_base}{name}" for name in registry}
+        shacl_nodes: dict[str, dict[str, Any]] = {}
+        owl_nodes: dict[str, dict[str, Any]] = {}
+        resolving: set[int] = set()
+
+        def class_of(ref: Any) -> Any:
+            if isinstance(ref, str):
+                parent = registry.get(ref)
+                return parent.get("@type", ref) if isinstance(parent, dict) else ref
+            return ref
+
+        def add_shape(shape: dict[str, Any], iri: str, label: str) -> None:
+            if iri in shacl_nodes or iri in owl_nodes:
+                return
+            if id(shape) in resolving:
+                raise ValueError(f"Circular @extends involving shape {label}")
+            if shape.get("@type") is None:
+                raise ValueError(f"Shape {label} has no @type")
+            resolving.add(id(shape))
+
+            extends_raw = shape.get("@extends")
+            parents = [] if extends_raw is None else (
+                extends_raw if isinstance(extends_raw, list) else [extends_raw]
+            )
+            parent_iris: list[str] = []
+            for parent in parents:
+                if isinstance(parent, str):
+                    if parent in registry:
+                        add_shape(registry[parent], shape_iris[parent], repr(parent))
+                        parent_iris.append(shape_iris[parent])
+                elif isinstance(parent, dict):
+                    parent_iri = f"{shape_iri_base}inline-{_shape_digest(parent)[:16]}"
+                    add_shape(parent, parent_iri, "(inline parent)")
+                    parent_iris.append(parent_iri)
+
+            if shacl:
+                own = {k: v for k, v in shape.items() if k != "@extends"}
+                node = self.shape_to_shacl(own, shape_iri=iri)["@graph"][0]
+                if len(parent_iris) == 1:
+                    node[f"{SHACL}node"] = {"@id": parent_iris[0]}
+                    node[f"{JSONLD_EX}extends"] = {"@id": parent_iris[0]}
+                elif parent_iris:
+                    node[f"{SHACL}node"] = [{"@id": pid} for pid in parent_iris]
+                    node[f"{JSONLD_EX}extends"] = [{"@id": pid} for pid in parent_iris]
+                shacl_nodes[iri] = node
+            if owl:
+                linked = dict(shape)
+                if extends_raw is not None:
+                    linked["@extends"] = (
+                        [class_of(p) for p in extends_raw]
+                        if isinstance(extends_raw, list) else class_of(extends_raw)
+                    )
+                owl_nodes[iri] = self.shape_to_owl_restrictions(linked)["@graph"][0]
+            resolving.discard(id(shape))
+
+        for name, shape in registry.items():
+            add_shape(shape, shape_iris[name], repr(name))
+
+        shacl_doc = owl_doc = None
+        if shacl:
+            shacl_doc = {
+                "@context": {"sh": SHACL, "xsd": XSD, "rdfs": RDFS},
+                "@graph": list(shacl_nodes.values()),
+            }
+        if owl:
+            owl_doc = {
+                "@context": {"owl": OWL, "xsd": XSD, "rdfs": RDFS, "rdf": RDF},
+                "@graph": list(owl_nodes.values()),
+            }
+        return {"shacl": shacl_doc, "owl": owl_doc, "shape_iris": shape_iris}
+
+    # ── Internal ───────────────────────────────────────────────────
+
+    def _memo(self, key_parts: tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+        # Results are kept as JSON text: parsing it back is both the copy
+        # handed to the caller and the format of the on-disk cache.
+        key = _shape_digest([_SHAPE_CACHE_VERSION, *key_parts])
+        with self._lock:
+            text = self._results.get(key)
+            if text is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return json.loads(text)
+
+        result = None
+        text = self._load(key)
+        if text is not None:
+            try:
+                result = json.loads(text)
+            except ValueError:
+                text = None
+        from_disk = text is not None
+        if not from_disk:
+            result = compute()
+            text = json.dumps(result, separators=(",", ":"))
+            self._store(key, text)
+
+        with self._lock:
+            if from_disk:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+            self._results[key] = text
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+        return result
+
+    def _load(self, key: str) -> Optional[str]:
+        if self.cache_dir is None:
+            return None
+        try:
+            return (self.cache_dir / f"{key}.json").read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def _store(self, key: str, text: str) -> None:
+        if self.cache_dir is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{key}.json"
+        tmp = path.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+
+
+def _shape_digest(value: Any) -> str:
+    """SHA-256 hex digest of the canonical JSON of *value*."""
+    content = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
 # ═══════════════════════════════════════════════════════════════════
 # RDF-STAR MAPPING
 # ═══════════════════════════════════════════════════════════════════
@@ -1509,6 +2040,9 @@ def to_rdf_star_ntriples(
         <<subject predicate "value">> jsonld-ex:source <uri> .
         etc.
 
+    For large exports see :func:`iter_rdf_star_ntriples` and
+    :func:`write_rdf_star_ntriples`.
+
     Args:
         doc: A JSON-LD document with jsonld-ex annotations.
         base_subject: IRI for the document subject.
@@ -1517,8 +2051,51 @@ def to_rdf_star_ntriples(
         Tuple of (N-Triples string, ConversionReport).
     """
     report = ConversionReport(success=True)
-    lines: list[str] = []
+    lines = list(_rdf_star_ntriples_lines(doc, base_subject, report))
+    return "\n".join(lines), report
+
+
+def iter_rdf_star_ntriples(
+    docs: Union[dict[str, Any], Iterable[dict[str, Any]]],
+    base_subject: Optional[str] = None,
+    report: Optional[ConversionReport] = None,
+) -> Iterator[str]:
+    """Yield the RDF-star N-Triples lines of one or many documents.
+
+    *docs* is a single document or any iterable of documents, consumed
+    lazily; for a single document the lines are exactly those of
+    :func:`to_rdf_star_ntriples` (without line terminators).  *report*,
+    if given, is updated as lines are produced.
+    """
+    if report is None:
+        report = ConversionReport(success=True)
+    for doc in _iter_docs(docs):
+        yield from _rdf_star_ntriples_lines(doc, base_subject, report)
 
+
+def write_rdf_star_ntriples(
+    docs: Union[dict[str, Any], Iterable[dict[str, Any]]],
+    fp: IO[str],
+    base_subject: Optional[str] = None,
+    *,
+    buffer_size: int = 1 << 16,
+) -> ConversionReport:
+    """Write the RDF-star N-Triples of *docs* to the text stream *fp*.
+
+    Lines from :func:`iter_rdf_star_ntriples` are written newline
+    terminated, in writes of about *buffer_size* characters.
+    """
+    report = ConversionReport(success=True)
+    _write_buffered(iter_rdf_star_ntriples(docs, base_subject, report), fp, buffer_size)
+    return report
+
+
+def _rdf_star_ntriples_lines(
+    doc: dict[str, Any],
+    base_subject: Optional[str],
+    report: ConversionReport,
+) -> Iterator[str]:
+    """Yield the N-Triples lines of one document, updating *report*."""
     subject = base_subject or doc.get("@id", "_:subject")
     if not subject.startswith("_:") and not subject.startswith("<"):
         subject = f"<{subject}>"
@@ -1534,7 +2111,7 @@ def to_rdf_star_ntriples(
             if not ann_tuples:
                 # Plain value — emit standard triple
                 literal = _format_literal(value["@value"])
-                lines.append(f"{subject} <{key}> {literal} .")
+                yield f"{subject} <{key}> {literal} ."
                 report.triples_output += 1
                 continue
 
@@ -1544,15 +2121,13 @@ def to_rdf_star_ntriples(
             report.triples_input += 1
 
             # Base triple
-            lines.append(f"{subject} <{key}> {literal} .")
+            yield f"{subject} <{key}> {literal} ."
             report.triples_output += 1
 
             # Annotation triples
             for local_name, val, vkind in ann_tuples:
                 formatted = _format_annotation_value_ntriples(val, vkind)
-                lines.append(
-                    f"{embedded} <{JSONLD_EX}{local_name}> {formatted} ."
-                )
+                yield f"{embedded} <{JSONLD_EX}{local_name}> {formatted} ."
                 report.triples_output += 1
 
             report.nodes_converted += 1
@@ -1560,18 +2135,39 @@ def to_rdf_star_ntriples(
             # Non-annotated value — pass through
             if isinstance(value, str):
                 if value.startswith("http://") or value.startswith("https://"):
-                    lines.append(f"{subject} <{key}> <{value}> .")
+                    yield f"{subject} <{key}> <{value}> ."
                 else:
-                    lines.append(f'{subject} <{key}> "{_escape_ntriples(value)}" .')
+                    yield f'{subject} <{key}> "{_escape_ntriples(value)}" .'
             elif isinstance(value, (int, float)) and not isinstance(value, bool):
                 xsd_t = f"{XSD}integer" if isinstance(value, int) else f"{XSD}double"
-                lines.append(f'{subject} <{key}> "{value}"^^<{xsd_t}> .')
+                yield f'{subject} <{key}> "{value}"^^<{xsd_t}> .'
             elif isinstance(value, bool):
                 val = "true" if value else "false"
-                lines.append(f'{subject} <{key}> "{val}"^^<{XSD}boolean> .')
+                yield f'{subject} <{key}> "{val}"^^<{XSD}boolean> .'
             report.triples_output += 1
 
-    return "\n".join(lines), report
+
+def _iter_docs(
+    docs: Union[dict[str, Any], Iterable[dict[str, Any]]],
+) -> Iterable[dict[str, Any]]:
+    return (docs,) if isinstance(docs, dict) else docs
+
+
+def _write_buffered(chunks: Iterable[str], fp: IO[str], buffer_size: int) -> None:
+    """Write each chunk of *chunks* plus a newline, batching small writes."""
+    buffer: list[str] = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk) + 1
+        if size >= buffer_size:
+            buffer.append("")
+            fp.write("\n".join(buffer))
+            buffer.clear()
+            size = 0
+    if buffer:
+        buffer.append("")
+        fp.write("\n".join(buffer))
 
 
 # ── RDF-Star Reverse Mapping Constants ─────────────────────────────
@@ -1608,35 +2204,21 @@ _RDF_STAR_MULTI_VALUE_KEYWORDS: frozenset[str] = frozenset(
 )
 
 
+_NT_ESCAPES = {"\\": "\\", '"': '"', "n": "\n", "r": "\r", "t": "\t"}
+_NT_ESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+
+
 def _unescape_ntriples(s: str) -> str:
     """Reverse of :func:`_escape_ntriples`.
 
-    Processes escape sequences character-by-character so that
-    sequences like ``\\\\`` → ``\\`` are handled correctly.
+    Unknown escape sequences are kept verbatim, and ``\\\\`` → ``\\`` is
+    handled before any following character is looked at.
     """
-    result: list[str] = []
-    i = 0
-    while i < len(s):
-        if s[i] == "\\" and i + 1 < len(s):
-            c = s[i + 1]
-            if c == "\\":
-                result.append("\\")
-            elif c == '"':
-                result.append('"')
-            elif c == "n":
-                result.append("\n")
-            elif c == "r":
-                result.append("\r")
-            elif c == "t":
-                result.append("\t")
-            else:
-                result.append("\\")
-                result.append(c)
-            i += 2
-        else:
-            result.append(s[i])
-            i += 1
-    return "".join(result)
+    if "\\" not in s:
+        return s
+    return _NT_ESCAPE_RE.sub(
+        lambda m: _NT_ESCAPES.get(m.group(1), m.group(0)), s
+    )
 
 
 def _cast_typed_literal(value_str: str, datatype_iri: str) -> Any:
@@ -1656,174 +2238,199 @@ def _cast_typed_literal(value_str: str, datatype_iri: str) -> Any:
     return value_str
 
 
-def _parse_ntriples_term(text: str, pos: int) -> tuple[Any, str, int]:
-    """Parse one N-Triples term starting at *pos*.
+# ── RDF-Star N-Triples Tokenizer ───────────────────────────────────
 
-    Returns ``(python_value, raw_form, next_position)``.
+# Named sub-groups of each term group: IRI, literal text, literal
+# datatype and blank node.
+_NT_SUBGROUPS = {
+    name: (f"{name}_iri", f"{name}_literal", f"{name}_datatype", f"{name}_bnode")
+    for name in ("s", "p", "o", "ap", "av")
+}
 
-    *raw_form* is the verbatim text slice (e.g. ``'"Alice"'`` or
-    ``'"22.5"^^<…double>'``) used as a grouping key so that base
-    triples and their embedded-triple annotations can be matched.
-    """
-    # Skip leading whitespace
-    while pos < len(text) and text[pos] == " ":
-        pos += 1
-
-    if pos >= len(text):
-        raise ValueError("Unexpected end of input while parsing N-Triples term")
-
-    # ── IRI ──────────────────────────────────────────────────────
-    if text[pos] == "<":
-        end = text.index(">", pos + 1)
-        iri = text[pos + 1 : end]
-        raw = text[pos : end + 1]
-        return iri, raw, end + 1
-
-    # ── Literal ──────────────────────────────────────────────────
-    if text[pos] == '"':
-        # Scan for closing quote, respecting escape sequences.
-        i = pos + 1
-        while i < len(text):
-            if text[i] == "\\":
-                i += 2  # skip escaped character
-            elif text[i] == '"':
-                break
-            else:
-                i += 1
 
-        literal_str = _unescape_ntriples(text[pos + 1 : i])
-        next_pos = i + 1  # past closing quote
+def _nt_term(name: str) -> str:
+    """Regex for one N-Triples term, captured as group *name*.
 
-        # Typed literal?  "value"^^<type>
-        if (
-            next_pos + 1 < len(text)
-            and text[next_pos : next_pos + 2] == "^^"
-        ):
-            type_start = next_pos + 3  # skip ^^ and opening <
-            type_end = text.index(">", type_start)
-            datatype = text[type_start:type_end]
-            raw = text[pos : type_end + 1]
-            value = _cast_typed_literal(literal_str, datatype)
-            return value, raw, type_end + 1
-
-        # Language-tagged literal?  "value"@lang  (pass through as string)
-        if next_pos < len(text) and text[next_pos] == "@":
-            lang_end = next_pos + 1
-            while lang_end < len(text) and text[lang_end] not in (" ", ".", "\n"):
-                lang_end += 1
-            raw = text[pos:lang_end]
-            return literal_str, raw, lang_end
-
-        # Plain literal
-        raw = text[pos:next_pos]
-        return literal_str, raw, next_pos
-
-    # ── Blank node ───────────────────────────────────────────────
-    if text[pos : pos + 2] == "_:":
-        end = pos + 2
-        while end < len(text) and text[end] not in (" ", ".", "\n", ">"):
-            end += 1
-        bnode = text[pos:end]
-        return bnode, bnode, end
-
-    raise ValueError(
-        f"Unexpected character at position {pos}: {text[pos : pos + 20]!r}"
+    The group contains four named sub-groups (see :data:`_NT_SUBGROUPS`):
+    IRI, literal text, literal datatype and blank node.  The whole group
+    is the verbatim *raw form* used to match base triples with their
+    annotations.
+    """
+    iri, literal, datatype, bnode = _NT_SUBGROUPS[name]
+    return (
+        rf"(?P<{name}>"
+        rf"<(?P<{iri}>[^>]*)>"
+        rf'|"(?P<{literal}>(?:[^"\\]|\\.)*)"(?:\^\^<(?P<{datatype}>[^>]*)>|@[^ \t.\n]*)?'
+        rf"|(?P<{bnode}>_:[^ \t.\n>]*))"
     )
 
 
-def from_rdf_star_ntriples(
-    ntriples_str: str,
-) -> tuple[dict[str, Any], ConversionReport]:
-    """Parse RDF-Star N-Triples and reconstruct a jsonld-ex annotated document.
+_NT_WS = r"[ \t]*"
+_NT_BASE_LINE = re.compile(
+    _NT_WS + _nt_term("s") + _NT_WS + _nt_term("p") + _NT_WS + _nt_term("o")
+)
+_NT_ANNOTATION_LINE = re.compile(
+    r"<<" + _NT_WS + _nt_term("s") + _NT_WS + _nt_term("p") + _NT_WS
+    + _nt_term("o") + _NT_WS + r">>" + _NT_WS + _nt_term("ap") + _NT_WS
+    + _nt_term("av")
+)
 
-    Inverse of :func:`to_rdf_star_ntriples`.  Handles:
 
-    - Base triples: ``<s> <p> object .``
-    - Annotation triples: ``<< <s> <p> object >> <jex:pred> value .``
-    - Typed literals (``xsd:double``, ``xsd:integer``, ``xsd:boolean``,
-      ``xsd:dateTime``), IRI objects, and plain string literals.
-    - Multi-value annotation fields (``@derivedFrom``, ``@delegatedBy``)
-      are collected into lists.
+def _nt_value(m: re.Match[str], name: str) -> Any:
+    """Python value of term *name* in match *m* (see :func:`_nt_term`)."""
+    iri, literal, datatype, bnode = _NT_SUBGROUPS[name]
+    if m.group(iri) is not None:
+        return m.group(iri)
+    literal, datatype, bnode = m.group(literal, datatype, bnode)
+    if literal is not None:
+        literal = _unescape_ntriples(literal)
+        return literal if datatype is None else _cast_typed_literal(literal, datatype)
+    return bnode
 
-    Args:
-        ntriples_str: N-Triples-star text (as produced by
-            :func:`to_rdf_star_ntriples`).
 
-    Returns:
-        Tuple of ``(reconstructed_document, ConversionReport)``.
+class _RdfStarLine(NamedTuple):
+    """One tokenized RDF-star N-Triples line.
+
+    *keyword* is ``None`` for a base triple, whose *value* is the object;
+    for an annotation it is the jsonld-ex keyword of the annotation
+    predicate, and *value* is the annotation value.  *raw_object* is the
+    verbatim object term either way.
     """
-    report = ConversionReport(success=True)
 
-    # Phase 1 — parse every line into base triples and annotations.
-    #   base_triples: [(subject_iri, predicate_iri, python_value, raw_object)]
-    #   annotations:  { (subj, pred, raw_obj) -> [(keyword, python_value)] }
-    base_triples: list[tuple[str, str, Any, str]] = []
-    annotations: dict[tuple[str, str, str], list[tuple[str, Any]]] = {}
+    subject: Any
+    predicate: Any
+    raw_object: str
+    value: Any
+    keyword: Optional[str] = None
+
+
+def _tokenize_rdf_star(
+    lines: Iterable[Union[str, bytes]],
+    report: ConversionReport,
+) -> Iterator[_RdfStarLine]:
+    """Tokenize RDF-star N-Triples *lines* one at a time.
 
-    for line in ntriples_str.split("\n"):
+    Counts accepted triples in ``report.triples_input`` and records
+    unknown annotation predicates as warnings.
+    """
+    base_line = _NT_BASE_LINE.match
+    annotation_line = _NT_ANNOTATION_LINE.match
+    keywords = _RDF_STAR_PREDICATE_TO_KEYWORD
+    for line_number, line in enumerate(lines, 1):
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
         line = line.strip()
-        if not line or line.startswith("#"):
+        if not line or line[0] == "#":
             continue
 
         if line.startswith("<<"):
-            # ── Annotation triple ────────────────────────────────
-            close_idx = line.index(">>")
-            inner = line[2:close_idx].strip()
-            outer = line[close_idx + 2 :].strip().rstrip(" .")
-
-            # Parse the three terms of the embedded triple.
-            pos = 0
-            e_subj, _, pos = _parse_ntriples_term(inner, pos)
-            e_pred, _, pos = _parse_ntriples_term(inner, pos)
-            _, e_obj_raw, pos = _parse_ntriples_term(inner, pos)
-
-            # Parse annotation predicate + value.
-            pos = 0
-            ann_pred, _, pos = _parse_ntriples_term(outer, pos)
-            ann_value, _, pos = _parse_ntriples_term(outer, pos)
-
-            keyword = _RDF_STAR_PREDICATE_TO_KEYWORD.get(ann_pred)
-            if keyword is None:
-                report.warnings.append(
-                    f"Unknown annotation predicate: {ann_pred}"
+            m = annotation_line(line)
+            if m is None:
+                raise ValueError(
+                    f"Invalid RDF-star annotation at line {line_number}: {line[:80]!r}"
                 )
+            ann_pred = _nt_value(m, "ap")
+            keyword = keywords.get(ann_pred)
+            if keyword is None:
+                report.warnings.append(f"Unknown annotation predicate: {ann_pred}")
                 continue
-
-            key = (e_subj, e_pred, e_obj_raw)
-            annotations.setdefault(key, []).append((keyword, ann_value))
             report.triples_input += 1
+            yield _RdfStarLine(
+                _nt_value(m, "s"), _nt_value(m, "p"), m.group("o"),
+                _nt_value(m, "av"), keyword,
+            )
         else:
-            # ── Regular base triple ──────────────────────────────
-            content = line.rstrip(" .")
-            pos = 0
-            subj, _, pos = _parse_ntriples_term(content, pos)
-            pred, _, pos = _parse_ntriples_term(content, pos)
-            obj_value, obj_raw, pos = _parse_ntriples_term(content, pos)
-
-            base_triples.append((subj, pred, obj_value, obj_raw))
+            m = base_line(line)
+            if m is None:
+                raise ValueError(
+                    f"Invalid N-Triples line {line_number}: {line[:80]!r}"
+                )
             report.triples_input += 1
+            yield _RdfStarLine(
+                _nt_value(m, "s"), _nt_value(m, "p"), m.group("o"), _nt_value(m, "o"),
+            )
+
 
-    # Phase 2 — reconstruct the document from parsed data.
-    subjects: dict[str, dict[str, Any]] = {}
-    for subj, pred, obj_value, obj_raw in base_triples:
-        if subj not in subjects:
-            subjects[subj] = {}
+def _iter_text_lines(source: Union[str, IO[Any], Iterable[Any]]) -> Iterable[Any]:
+    """Lines of *source*: a string, a file object, an mmap or any iterable."""
+    if isinstance(source, str):
+        return source.split("\n")
+    if isinstance(source, mmap.mmap):
+        return iter(source.readline, b"")
+    return source
 
-        key = (subj, pred, obj_raw)
-        if key in annotations:
-            # Build an annotated value dict.
+
+def _rdf_star_properties(
+    base_triples: list[tuple[str, Any, str]],
+    annotations: dict[tuple[str, str], list[tuple[str, Any]]],
+    report: ConversionReport,
+) -> dict[str, Any]:
+    """Rebuild one subject's properties from its base triples and annotations.
+
+    *base_triples* holds ``(predicate, value, raw_object)``; *annotations*
+    maps ``(predicate, raw_object)`` to ``(keyword, value)`` pairs.
+    """
+    props: dict[str, Any] = {}
+    for pred, obj_value, obj_raw in base_triples:
+        ann = annotations.get((pred, obj_raw))
+        if ann is not None:
             annotated: dict[str, Any] = {"@value": obj_value}
-            for keyword, ann_value in annotations[key]:
+            for keyword, ann_value in ann:
                 if keyword in _RDF_STAR_MULTI_VALUE_KEYWORDS:
                     annotated.setdefault(keyword, []).append(ann_value)
                 else:
                     annotated[keyword] = ann_value
-            subjects[subj][pred] = annotated
+            props[pred] = annotated
             report.nodes_converted += 1
         else:
-            subjects[subj][pred] = obj_value
-
+            props[pred] = obj_value
         report.triples_output += 1
+    return props
+
+
+def from_rdf_star_ntriples(
+    ntriples_str: str,
+) -> tuple[dict[str, Any], ConversionReport]:
+    """Parse RDF-Star N-Triples and reconstruct a jsonld-ex annotated document.
+
+    Inverse of :func:`to_rdf_star_ntriples`.  Handles:
+
+    - Base triples: ``<s> <p> object .``
+    - Annotation triples: ``<< <s> <p> object >> <jex:pred> value .``
+    - Typed literals (``xsd:double``, ``xsd:integer``, ``xsd:boolean``,
+      ``xsd:dateTime``), IRI objects, and plain string literals.
+    - Multi-value annotation fields (``@derivedFrom``, ``@delegatedBy``)
+      are collected into lists.
+
+    For large inputs see :func:`from_rdf_star_ntriples_stream`.
+
+    Args:
+        ntriples_str: N-Triples-star text (as produced by
+            :func:`to_rdf_star_ntriples`).
+
+    Returns:
+        Tuple of ``(reconstructed_document, ConversionReport)``.
+    """
+    report = ConversionReport(success=True)
+
+    # Phase 1 — tokenize every line, grouping by subject.  Annotations may
+    # appear anywhere in the input relative to their base triple.
+    base_triples: dict[str, list[tuple[str, Any, str]]] = {}
+    annotations: dict[str, dict[tuple[str, str], list[tuple[str, Any]]]] = {}
+    for token in _tokenize_rdf_star(_iter_text_lines(ntriples_str), report):
+        subj, pred, obj_raw, value, keyword = token
+        if keyword is not None:
+            annotations.setdefault(subj, {}).setdefault((pred, obj_raw), []).append(
+                (keyword, value)
+            )
+        else:
+            base_triples.setdefault(subj, []).append((pred, value, obj_raw))
+
+    # Phase 2 — reconstruct each subject, in order of first base triple.
+    subjects = {
+        subj: _rdf_star_properties(triples, annotations.get(subj, {}), report)
+        for subj, triples in base_triples.items()
+    }
 
     # Phase 3 — assemble the output document.
     if len(subjects) == 0:
@@ -1844,6 +2451,54 @@ def from_rdf_star_ntriples(
     return {"@graph": graph}, report
 
 
+def from_rdf_star_ntriples_stream(
+    source: Union[str, IO[Any], Iterable[Union[str, bytes]]],
+    report: Optional[ConversionReport] = None,
+) -> Iterator[dict[str, Any]]:
+    """Incrementally parse RDF-star N-Triples, yielding one node per subject block.
+
+    Streaming counterpart of :func:`from_rdf_star_ntriples` for inputs too
+    large to hold in memory.  *source* may be a string, a text or binary
+    file object, an :class:`mmap.mmap`, or any iterable of lines.  Lines
+    are tokenized with precompiled regexes as they are read; consecutive
+    lines about the same subject (base triples, and annotations on that
+    subject's triples) form a block, and the block's node
+    (``{"@id": subject, ...}``) is yielded as soon as the next subject
+    starts.  Memory is therefore bounded by the largest block.
+
+    Input written by :func:`to_rdf_star_ntriples` is grouped this way.
+    A subject whose lines are not contiguous yields one node per block,
+    and an annotation is only matched to base triples in its own block.
+
+    Args:
+        source: RDF-star N-Triples input.
+        report: Optional :class:`ConversionReport` updated as the stream
+            is consumed (counts and warnings as for
+            :func:`from_rdf_star_ntriples`).
+
+    Raises:
+        ValueError: On a line that is not a valid triple or annotation.
+    """
+    if report is None:
+        report = ConversionReport(success=True)
+
+    subject: Any = None
+    base_triples: list[tuple[str, Any, str]] = []
+    annotations: dict[tuple[str, str], list[tuple[str, Any]]] = {}
+    for token in _tokenize_rdf_star(_iter_text_lines(source), report):
+        subj, pred, obj_raw, value, keyword = token
+        if subj != subject:
+            if base_triples:
+                yield {"@id": subject, **_rdf_star_properties(base_triples, annotations, report)}
+            subject, base_triples, annotations = subj, [], {}
+        if keyword is not None:
+            annotations.setdefault((pred, obj_raw), []).append((keyword, value))
+        else:
+            base_triples.append((pred, value, obj_raw))
+    if base_triples:
+        yield {"@id": subject, **_rdf_star_properties(base_triples, annotations, report)}
+
+
 # ── RDF-Star Turtle Output ─────────────────────────────────────────
 
 # Shared annotation field descriptors.
@@ -1975,6 +2630,9 @@ def to_rdf_star_turtle(
     continuation syntax.  Only prefixes that are actually referenced
     are emitted.
 
+    For large exports see :func:`iter_rdf_star_turtle` and
+    :func:`write_rdf_star_turtle`.
+
     Args:
         doc: A JSON-LD document with jsonld-ex annotations.
         base_subject: IRI for the document subject.
@@ -1984,8 +2642,127 @@ def to_rdf_star_turtle(
     """
     report = ConversionReport(success=True)
     used_prefixes: set[str] = set()
-    body_lines: list[str] = []
+    body = list(_rdf_star_turtle_statements(doc, base_subject, report, used_prefixes))
+
+    # Assemble output: prefix declarations, then body.
+    output_lines = list(_turtle_prefix_lines(used_prefixes))
+    output_lines.extend(body)
 
+    return "\n".join(output_lines), report
+
+
+def iter_rdf_star_turtle(
+    docs: Union[dict[str, Any], Iterable[dict[str, Any]]],
+    base_subject: Optional[str] = None,
+    report: Optional[ConversionReport] = None,
+    *,
+    prefixes: Optional[Iterable[str]] = None,
+) -> Iterator[str]:
+    """Yield RDF-star Turtle for one or many documents, statement by statement.
+
+    The ``@prefix`` header must precede the body, so the prefixes are
+    settled first:
+
+    - *prefixes* given (a subset of ``{"jex", "xsd"}``): declared as is.
+    - *docs* is a document or a re-iterable collection: a cheap first
+      pass finds the prefixes actually used, without formatting.
+    - *docs* is a one-shot iterator: both prefixes are declared.
+
+    The body is then streamed.  For a single document the output equals
+    :func:`to_rdf_star_turtle`; items may span several lines (grouped
+    annotation blocks) and carry no trailing newline.
+    """
+    if report is None:
+        report = ConversionReport(success=True)
+    if prefixes is not None:
+        declared = set(prefixes)
+        unknown = declared - set(_TURTLE_PREFIXES)
+        if unknown:
+            raise ValueError(f"Unknown Turtle prefixes: {sorted(unknown)}")
+    elif isinstance(docs, dict) or iter(docs) is not docs:
+        declared = set()
+        for doc in _iter_docs(docs):
+            _collect_turtle_prefixes(doc, declared)
+            if len(declared) == len(_TURTLE_PREFIXES):
+                break
+    else:
+        declared = set(_TURTLE_PREFIXES)
+
+    yield from _turtle_prefix_lines(declared)
+    used: set[str] = set()
+    for doc in _iter_docs(docs):
+        for statement in _rdf_star_turtle_statements(doc, base_subject, report, used):
+            if not used <= declared:
+                raise ValueError(
+                    f"Turtle prefixes used but not declared: {sorted(used - declared)}"
+                )
+            yield statement
+
+
+def write_rdf_star_turtle(
+    docs: Union[dict[str, Any], Iterable[dict[str, Any]]],
+    fp: IO[str],
+    base_subject: Optional[str] = None,
+    *,
+    prefixes: Optional[Iterable[str]] = None,
+    buffer_size: int = 1 << 16,
+) -> ConversionReport:
+    """Write the RDF-star Turtle of *docs* to the text stream *fp*.
+
+    Statements from :func:`iter_rdf_star_turtle` are written newline
+    terminated, in writes of about *buffer_size* characters.
+    """
+    report = ConversionReport(success=True)
+    _write_buffered(
+        iter_rdf_star_turtle(docs, base_subject, report, prefixes=prefixes),
+        fp,
+        buffer_size,
+    )
+    return report
+
+
+_TURTLE_PREFIXES: dict[str, str] = {"jex": JSONLD_EX, "xsd": XSD}
+_XSD_ANNOTATION_KINDS = frozenset({"double", "integer", "boolean", "dateTime"})
+
+
+def _turtle_prefix_lines(used_prefixes: set[str]) -> Iterator[str]:
+    """``@prefix`` declarations for *used_prefixes*, then a blank line."""
+    declared = False
+    for name, iri in _TURTLE_PREFIXES.items():
+        if name in used_prefixes:
+            declared = True
+            yield f"@prefix {name}: <{iri}> ."
+    if declared:
+        yield ""  # blank line after prefixes
+
+
+def _collect_turtle_prefixes(doc: dict[str, Any], used_prefixes: set[str]) -> None:
+    """Add the prefixes :func:`_rdf_star_turtle_statements` would use for *doc*."""
+    for key, value in doc.items():
+        if key.startswith("@"):
+            continue
+        if isinstance(value, dict) and "@value" in value:
+            if isinstance(value["@value"], (bool, int, float)):
+                used_prefixes.add("xsd")
+            ann_tuples = _iter_prov_annotations(get_provenance(value))
+            if ann_tuples:
+                used_prefixes.add("jex")
+                if any(vkind in _XSD_ANNOTATION_KINDS for _, _, vkind in ann_tuples):
+                    used_prefixes.add("xsd")
+        elif isinstance(value, (bool, int, float)):
+            used_prefixes.add("xsd")
+
+
+def _rdf_star_turtle_statements(
+    doc: dict[str, Any],
+    base_subject: Optional[str],
+    report: ConversionReport,
+    used_prefixes: set[str],
+) -> Iterator[str]:
+    """Yield the Turtle body statements of one document.
+
+    Updates *report* and records referenced prefixes in *used_prefixes*.
+    """
     subject = base_subject or doc.get("@id", "_:subject")
     if not subject.startswith("_:") and not subject.startswith("<"):
         subject = f"<{subject}>"
@@ -2001,14 +2778,13 @@ def to_rdf_star_turtle(
             if not ann_tuples:
                 # Plain value — no annotations.
                 literal = _format_literal_turtle(value["@value"], used_prefixes)
-                body_lines.append(f"{subject} <{key}> {literal} .")
+                yield f"{subject} <{key}> {literal} ."
                 report.triples_output += 1
                 continue
 
             # Build the base triple.
             literal = _format_literal_turtle(value["@value"], used_prefixes)
             embedded = f"<< {subject} <{key}> {literal} >>"
-            body_lines.append(f"{subject} <{key}> {literal} .")
             report.triples_output += 1
             report.triples_input += 1
 
@@ -2022,42 +2798,24 @@ def to_rdf_star_turtle(
                 ann_parts.append(f"    jex:{local_name} {obj}")
                 report.triples_output += 1
 
-            annotation_block = f"{embedded}\n"
-            annotation_block += " ;\n".join(ann_parts)
-            annotation_block += " ."
-            body_lines.append(annotation_block)
-
             report.nodes_converted += 1
+            yield f"{subject} <{key}> {literal} ."
+            yield f"{embedded}\n" + " ;\n".join(ann_parts) + " ."
         else:
             # Non-annotated value.
             if isinstance(value, str):
                 if value.startswith("http://") or value.startswith("https://"):
-                    body_lines.append(f"{subject} <{key}> <{value}> .")
+                    yield f"{subject} <{key}> <{value}> ."
                 else:
-                    body_lines.append(
-                        f'{subject} <{key}> "{_escape_ntriples(value)}" .'
-                    )
+                    yield f'{subject} <{key}> "{_escape_ntriples(value)}" .'
             elif isinstance(value, bool):
                 literal = _format_literal_turtle(value, used_prefixes)
-                body_lines.append(f"{subject} <{key}> {literal} .")
+                yield f"{subject} <{key}> {literal} ."
             elif isinstance(value, (int, float)):
                 literal = _format_literal_turtle(value, used_prefixes)
-                body_lines.append(f"{subject} <{key}> {literal} .")
+                yield f"{subject} <{key}> {literal} ."
             report.triples_output += 1
 
-    # Assemble output: prefix declarations, then body.
-    output_lines: list[str] = []
-    if "jex" in used_prefixes:
-        output_lines.append(f"@prefix jex: <{JSONLD_EX}> .")
-    if "xsd" in used_prefixes:
-        output_lines.append(f"@prefix xsd: <{XSD}> .")
-    if output_lines:
-        output_lines.append("")  # blank line after prefixes
-
-    output_lines.extend(body_lines)
-
-    return "\n".join(output_lines), report
-
 
 # ═══════════════════════════════════════════════════════════════════
 # SSN/SOSA MAPPING
@@ -6,7 +6,19 @@ security, and validation.
 """
 
 from __future__ import annotations
-from typing import Any, Optional
+
+import copy
+import copyreg
+import pickle
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait,
+)
+from dataclasses import dataclass
+from functools import partial
+from itertools import islice
+from typing import IO, Any, Callable, Iterable, Iterator, Literal, Optional, Union
 
 from pyld import jsonld
 
@@ -23,45 +35,535 @@ from jsonld_ex.security import (
     is_context_allowed, enforce_resource_limits, DEFAULT_RESOURCE_LIMITS,
 )
 from jsonld_ex.validation import validate_node, validate_document, ValidationResult
+from jsonld_ex.document_loader import CachingDocumentLoader
+from jsonld_ex.batch import _chunked
+
+
+# ── Processed context cache ──────────────────────────────────────
+
+class ProcessedContextCache:
+    """Bounded LRU cache of processed active contexts.
+
+    Keys combine the :func:`~jsonld_ex.security.compute_integrity` hash of
+    a top-level ``@context`` value with the processing mode and base IRI
+    it was processed under, so equal contexts share one entry however
+    their dicts were built.  Processed contexts are treated as immutable
+    and shared between calls, as PyLD does with its own caches.
+
+    An entry may carry a *valid* callable, checked on every lookup; once
+    it returns false the entry is dropped and the lookup is a miss.
+    """
+
+    def __init__(self, max_size: int = 128) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be >= 1, got {max_size}")
+        self.max_size = max_size
+        self._entries: OrderedDict[
+            tuple[str, str, str], tuple[dict[str, Any], Optional[Callable[[], bool]]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"ProcessedContextCache(size={len(self._entries)}, "
+            f"max_size={self.max_size}, hits={self.hits}, misses={self.misses})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Processed contexts are not carried across processes.
+        return {"max_size": self.max_size}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state["max_size"])
+
+    def get(self, key: tuple[str, str, str]) -> Optional[dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is not None and not entry[1]():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(
+        self,
+        key: tuple[str, str, str],
+        active_ctx: dict[str, Any],
+        valid: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        with self._lock:
+            self._entries[key] = (active_ctx, valid)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry; the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+
+class _CachingProcessor(jsonld.JsonLdProcessor):
+    """PyLD processor that expands through a :class:`ProcessedContextCache`.
+
+    PyLD's ``compact``, ``flatten`` and ``to_rdf`` expand their input via
+    ``self.expand``, so they reuse cached contexts too.  Documents without
+    a top-level ``@context`` have nothing to cache, and inputs the cache
+    cannot serve exactly (an ``expandContext`` option, a different
+    document loader, contexts with ``@propagate: false``) take PyLD's
+    own path.
+
+    It also provides the per-subject RDF conversions behind
+    :meth:`JsonLdEx.iter_rdf` and :meth:`JsonLdEx.from_rdf_stream`.
+    """
+
+    def __init__(
+        self,
+        contexts: ProcessedContextCache,
+        document_loader: Callable[..., dict[str, Any]],
+    ) -> None:
+        super().__init__()
+        self._contexts = contexts
+        self._document_loader = document_loader
+
+    def expand(self, input_: Any, options: Optional[dict[str, Any]]) -> list[Any]:
+        options = options or {}
+        if (
+            not isinstance(input_, dict)
+            or input_.get("@context") is None
+            or "expandContext" in options
+            or options.get("documentLoader") is not self._document_loader
+        ):
+            return super().expand(input_, options)
+        local_ctx = input_["@context"]
+        if isinstance(local_ctx, dict) and len(local_ctx) == 1 and "@context" in local_ctx:
+            # PyLD rejects this shape only when it appears inside a document.
+            return super().expand(input_, options)
+
+        options = options.copy()
+        options.setdefault("isFrame", False)
+        options.setdefault("keepFreeFloatingNodes", False)
+        options.setdefault("processingMode", "json-ld-1.1")
+        options.setdefault("base", "")
+        options.setdefault(
+            "contextResolver",
+            jsonld.ContextResolver(jsonld._resolved_context_cache, self._document_loader),
+        )
+
+        key = (compute_integrity(local_ctx), options["processingMode"], options["base"])
+        active_ctx = self._contexts.get(key)
+        if active_ctx is None:
+            # Process with a private resolver: PyLD's shared cache ignores
+            # the base IRI, which is part of our key.  The resolver's
+            # loader records the remote contexts the result depends on.
+            urls: list[str] = []
+
+            def load(url: str, load_options: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+                urls.append(url)
+                return self._document_loader(url, load_options)
+
+            active_ctx = self.process_context(
+                self._get_initial_context(options),
+                local_ctx,
+                {**options, "contextResolver": jsonld.ContextResolver({}, load)},
+            )
+            if active_ctx.get("previousContext"):
+                # Non-propagated contexts are reverted by the expansion
+                # algorithm itself and must stay in the document.
+                return super().expand(input_, options)
+            self._contexts.put(key, active_ctx, self._validity(urls))
+
+        document = copy.deepcopy({k: v for k, v in input_.items() if k != "@context"})
+        expanded = self._expand(active_ctx, None, document, options, inside_list=False)
+        if isinstance(expanded, dict) and "@graph" in expanded and len(expanded) == 1:
+            expanded = expanded["@graph"]
+        elif expanded is None:
+            expanded = []
+        return jsonld.JsonLdProcessor.arrayify(expanded)
+
+    def _validity(self, urls: list[str]) -> Optional[Callable[[], bool]]:
+        """Expiry check for a context built from the remote documents *urls*.
+
+        Contexts built from a :class:`CachingDocumentLoader`'s documents
+        expire with them and on ``invalidate()``; other loaders give no
+        expiry information.
+        """
+        loader = self._document_loader
+        if not urls or not isinstance(loader, CachingDocumentLoader):
+            return None
+        return partial(loader.is_fresh, loader.freshness(urls))
+
+    def iter_nquads(self, input_: Any, options: dict[str, Any]) -> Iterator[str]:
+        """Yield the N-Quads lines of ``to_rdf`` one subject at a time.
+
+        Uses the same expansion, node map and blank node labelling as
+        PyLD's ``to_rdf``, so the lines are exactly those of its output;
+        only the global sort is replaced by a per-subject one.  Subjects
+        are dropped from the node map once written.
+        """
+        options = options.copy()
+        options.setdefault("base", "")
+        options.setdefault("produceGeneralizedRdf", False)
+        options.setdefault("processingMode", "json-ld-1.1")
+        options.setdefault("identifierIssuer", jsonld.IdentifierIssuer("_:b"))
+        try:
+            expanded = self.expand(input_, options)
+        except jsonld.JsonLdError as cause:
+            raise jsonld.JsonLdError(
+                "Could not expand input before serialization to RDF.",
+                "jsonld.RdfError",
+            ) from cause
+
+        issuer = options["identifierIssuer"]
+        node_map: dict[str, dict[str, Any]] = {"@default": {}}
+        self._create_node_map(expanded, node_map, "@default", issuer)
+        del expanded
+
+        for graph_name in sorted(node_map):
+            graph = node_map.pop(graph_name)
+            if graph_name != "@default" and not jsonld._is_absolute_iri(graph_name):
+                continue
+            name = None if graph_name == "@default" else graph_name
+            for subject in sorted(graph):
+                triples = self._graph_to_rdf({subject: graph.pop(subject)}, issuer, options)
+                yield from sorted(jsonld.JsonLdProcessor.to_nquad(t, name) for t in triples)
+
+    def iter_from_nquads(
+        self, lines: Iterable[Union[str, bytes]], options: dict[str, Any],
+    ) -> Iterator[dict[str, Any]]:
+        """Parse N-Quads *lines* and yield one node object per subject run.
+
+        Consecutive quads with the same graph and subject are converted
+        together with PyLD's ``from_rdf`` algorithm.  Named-graph subjects
+        come wrapped as ``{"@id": graph, "@graph": [node]}``.
+        """
+        options = options.copy()
+        options.setdefault("useRdfType", False)
+        options.setdefault("useNativeTypes", False)
+        options.setdefault("rdfDirection", None)
+
+        key: Optional[tuple[str, str]] = None
+        triples: list[dict[str, Any]] = []
+        for line_number, line in enumerate(lines, 1):
+            if isinstance(line, bytes):
+                line = line.decode("utf-8")
+            if line.lstrip().startswith("#"):
+                continue
+            try:
+                dataset = jsonld.JsonLdProcessor.parse_nquads(line)
+            except jsonld.JsonLdError:
+                raise jsonld.JsonLdError(
+                    f"Error while parsing N-Quads invalid quad {line.rstrip()} "
+                    f"at line {line_number}.",
+                    "jsonld.ParseError",
+                    {"line": line_number},
+                ) from None
+            for graph_name, parsed in dataset.items():
+                triple = parsed[0]
+                quad_key = (graph_name, triple["subject"]["value"])
+                if quad_key != key:
+                    if triples:
+                        yield from self._from_rdf({key[0]: triples}, options)
+                    key, triples = quad_key, []
+                triples.append(triple)
+        if triples:
+            yield from self._from_rdf({key[0]: triples}, options)
+
+
+# ── Batch results ────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class DocumentResult:
+    """Outcome of one document in a ``*_many`` batch operation.
+
+    Attributes:
+        index: Position of the document in the input iterable.
+        result: The operation's return value, or ``None`` on failure.
+        error: The exception raised for this document, or ``None``.
+    """
+
+    index: int
+    result: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+Executor = Literal["thread", "process"]
 
 
 class JsonLdEx:
-    """Extended JSON-LD processor wrapping PyLD."""
+    """Extended JSON-LD processor wrapping PyLD.
+
+    Remote contexts are resolved through *document_loader*, by default a
+    :class:`~jsonld_ex.document_loader.CachingDocumentLoader` that caches
+    documents and enforces *context_allowlist*.  A ``documentLoader`` keyword passed to an
+    individual call takes precedence.
+
+    Processed top-level contexts are kept in :attr:`context_cache` (at
+    most *max_contexts* entries) and reused by ``expand``, ``compact``,
+    ``flatten`` and ``to_rdf``, so documents sharing a ``@context`` pay
+    for context processing once.  With the default loader, an entry that
+    references remote contexts expires with them (the loader's TTL) and on
+    ``document_loader.invalidate()``; with another loader, call
+    ``context_cache.clear()`` when a remote context changes.
+    """
 
     def __init__(
         self,
         resource_limits: Optional[dict[str, int]] = None,
         context_allowlist: Optional[dict[str, Any]] = None,
+        document_loader: Optional[Callable[..., dict[str, Any]]] = None,
+        max_contexts: int = 128,
     ):
         self._limits = {**DEFAULT_RESOURCE_LIMITS, **(resource_limits or {})}
         self._allowlist = context_allowlist
+        self.document_loader = (
+            document_loader
+            if document_loader is not None
+            else CachingDocumentLoader(allowlist=context_allowlist)
+        )
+        self.context_cache = ProcessedContextCache(max_contexts)
+        self._processor = _CachingProcessor(self.context_cache, self.document_loader)
+
+    def _options(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        return {"documentLoader": self.document_loader, **kwargs}
 
     # ── Core Operations ──────────────────────────────────────────
 
     def expand(self, doc: dict[str, Any], **kwargs: Any) -> list[dict[str, Any]]:
         """Expand a JSON-LD document with resource limit enforcement."""
         enforce_resource_limits(doc, self._limits)
-        return jsonld.expand(doc, kwargs)
+        return self._processor.expand(doc, self._options(kwargs))
 
     def compact(self, doc: dict[str, Any], ctx: Any, **kwargs: Any) -> dict[str, Any]:
         """Compact a JSON-LD document."""
         enforce_resource_limits(doc, self._limits)
-        return jsonld.compact(doc, ctx, kwargs)
+        return self._processor.compact(doc, ctx, self._options(kwargs))
 
     def flatten(self, doc: dict[str, Any], ctx: Any = None, **kwargs: Any) -> dict[str, Any]:
         """Flatten a JSON-LD document."""
         enforce_resource_limits(doc, self._limits)
-        return jsonld.flatten(doc, ctx, kwargs)
+        return self._processor.flatten(doc, ctx, self._options(kwargs))
 
     def to_rdf(self, doc: dict[str, Any], **kwargs: Any) -> str:
         """Convert to N-Quads."""
         enforce_resource_limits(doc, self._limits)
-        return jsonld.to_rdf(doc, {**kwargs, "format": "application/n-quads"})
+        return self._processor.to_rdf(doc, {**self._options(kwargs), "format": "application/n-quads"})
 
     def from_rdf(self, nquads: str, **kwargs: Any) -> list[dict[str, Any]]:
         """Convert N-Quads to JSON-LD."""
         return jsonld.from_rdf(nquads, kwargs)
 
+    # ── Streaming RDF ────────────────────────────────────────────
+
+    def iter_rdf(self, doc: dict[str, Any], **kwargs: Any) -> Iterator[str]:
+        """Yield the N-Quads of *doc* line by line (each ending in ``\\n``).
+
+        The lines are those of :meth:`to_rdf`, grouped by graph and
+        subject instead of sorted globally, and the full output string is
+        never built.  Resource limits are enforced before the first line.
+        """
+        enforce_resource_limits(doc, self._limits)
+        return self._processor.iter_nquads(doc, self._options(kwargs))
+
+    def write_rdf(
+        self,
+        doc: dict[str, Any],
+        fp: IO[str],
+        *,
+        buffer_size: int = 1 << 16,
+        **kwargs: Any,
+    ) -> int:
+        """Write the N-Quads of *doc* to the text stream *fp*.
+
+        Lines from :meth:`iter_rdf` are joined into writes of about
+        *buffer_size* characters.  Returns the number of quads written.
+        """
+        count = 0
+        size = 0
+        buffer: list[str] = []
+        for line in self.iter_rdf(doc, **kwargs):
+            buffer.append(line)
+            count += 1
+            size += len(line)
+            if size >= buffer_size:
+                fp.write("".join(buffer))
+                buffer.clear()
+                size = 0
+        if buffer:
+            fp.write("".join(buffer))
+        return count
+
+    def from_rdf_stream(
+        self,
+        fp: Iterable[Union[str, bytes]],
+        **kwargs: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """Parse N-Quads from *fp* line by line, yielding expanded nodes.
+
+        *fp* is any iterable of lines, such as a text or binary file.  Each
+        run of consecutive quads sharing a graph and subject becomes one
+        node, so memory is bounded by the largest run rather than the
+        input.  A subject split across runs yields several nodes with the
+        same ``@id``, and RDF lists stay as ``rdf:first`` / ``rdf:rest``
+        nodes; flattening the yielded nodes merges them.  Input grouped by
+        subject, as written by :meth:`iter_rdf`, yields one node per subject.
+        Keyword arguments are PyLD ``from_rdf`` options such as
+        ``useNativeTypes``.
+        """
+        return self._processor.iter_from_nquads(fp, kwargs)
+
+    # ── Batch Operations ─────────────────────────────────────────
+
+    def expand_many(
+        self,
+        docs: Iterable[dict[str, Any]],
+        *,
+        max_workers: Optional[int] = None,
+        executor: Executor = "thread",
+        ordered: bool = True,
+        chunk_size: int = 64,
+        **kwargs: Any,
+    ) -> Iterator[DocumentResult]:
+        """Expand every document in *docs*, yielding a :class:`DocumentResult` each.
+
+        Each document goes through :meth:`expand`, including resource-limit
+        enforcement.  A failing document yields a result carrying its
+        exception and the batch continues.
+
+        *docs* is consumed lazily.  With ``max_workers`` greater than 1 the
+        documents are split into chunks of *chunk_size* and run on a
+        ``"thread"`` pool, which shares this processor's context cache and
+        document loader, or a ``"process"`` pool, where each worker gets a
+        pickled copy of the processor (same configuration, empty caches);
+        documents and results must then be picklable.  At most
+        ``2 * max_workers`` chunks are in flight.  Results come in input
+        order when *ordered*, otherwise as chunks complete; every result
+        carries its input ``index`` either way.  Remaining keyword
+        arguments are PyLD options, as for :meth:`expand`.
+        """
+        return self._run_many(
+            "expand", (), docs, kwargs, max_workers, executor, ordered, chunk_size,
+        )
+
+    def compact_many(
+        self,
+        docs: Iterable[dict[str, Any]],
+        ctx: Any,
+        *,
+        max_workers: Optional[int] = None,
+        executor: Executor = "thread",
+        ordered: bool = True,
+        chunk_size: int = 64,
+        **kwargs: Any,
+    ) -> Iterator[DocumentResult]:
+        """Compact every document in *docs* against *ctx*.
+
+        Batch options and error handling are as for :meth:`expand_many`.
+        """
+        return self._run_many(
+            "compact", (ctx,), docs, kwargs, max_workers, executor, ordered, chunk_size,
+        )
+
+    def to_rdf_many(
+        self,
+        docs: Iterable[dict[str, Any]],
+        *,
+        max_workers: Optional[int] = None,
+        executor: Executor = "thread",
+        ordered: bool = True,
+        chunk_size: int = 64,
+        **kwargs: Any,
+    ) -> Iterator[DocumentResult]:
+        """Convert every document in *docs* to N-Quads.
+
+        Batch options and error handling are as for :meth:`expand_many`.
+        """
+        return self._run_many(
+            "to_rdf", (), docs, kwargs, max_workers, executor, ordered, chunk_size,
+        )
+
+    def _run_many(
+        self,
+        method: str,
+        args: tuple[Any, ...],
+        docs: Iterable[dict[str, Any]],
+        kwargs: dict[str, Any],
+        max_workers: Optional[int],
+        executor: Executor,
+        ordered: bool,
+        chunk_size: int,
+    ) -> Iterator[DocumentResult]:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        if executor not in ("thread", "process"):
+            raise ValueError(f"executor must be 'thread' or 'process', got {executor!r}")
+        items = enumerate(docs)
+        if max_workers is None or max_workers <= 1:
+            return (_apply(self, method, args, kwargs, i, doc) for i, doc in items)
+        return self._run_pool(
+            method, args, kwargs, items, max_workers, executor, ordered, chunk_size,
+        )
+
+    def _run_pool(
+        self,
+        method: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        items: Iterator[tuple[int, dict[str, Any]]],
+        max_workers: int,
+        executor: Executor,
+        ordered: bool,
+        chunk_size: int,
+    ) -> Iterator[DocumentResult]:
+        if executor == "process":
+            pool: Any = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(self,),
+            )
+
+            def submit(chunk: list[tuple[int, Any]]) -> Future:
+                return pool.submit(_run_worker_chunk, method, args, kwargs, chunk)
+        else:
+            pool = ThreadPoolExecutor(max_workers=max_workers)
+
+            def submit(chunk: list[tuple[int, Any]]) -> Future:
+                return pool.submit(_run_chunk, self, method, args, kwargs, chunk)
+
+        chunks = _chunked(items, chunk_size)
+        with pool:
+            pending = deque(submit(chunk) for chunk in islice(chunks, 2 * max_workers))
+            try:
+                while pending:
+                    if ordered:
+                        done = [pending.popleft()]
+                    else:
+                        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        done = [f for f in pending if f in finished]
+                        for future in done:
+                            pending.remove(future)
+                    for future in done:
+                        results = future.result()
+                        for chunk in islice(chunks, 1):
+                            pending.append(submit(chunk))
+                        yield from results
+            finally:
+                for future in pending:
+                    future.cancel()
+
     # ── AI/ML Extensions ─────────────────────────────────────────
 
     annotate = staticmethod(annotate)
@@ -89,3 +591,69 @@ class JsonLdEx:
 
     validate_node = staticmethod(validate_node)
     validate_document = staticmethod(validate_document)
+
+
+# ── Batch workers ────────────────────────────────────────────────
+
+# Processor unpickled by _init_worker, once per pool worker process.
+_WORKER_PROCESSOR: Optional[JsonLdEx] = None
+
+
+def _apply(
+    processor: JsonLdEx,
+    method: str,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    index: int,
+    doc: Any,
+) -> DocumentResult:
+    try:
+        return DocumentResult(index, getattr(processor, method)(doc, *args, **kwargs))
+    except Exception as exc:
+        return DocumentResult(index, error=exc)
+
+
+def _run_chunk(
+    processor: JsonLdEx,
+    method: str,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    chunk: list[tuple[int, Any]],
+) -> list[DocumentResult]:
+    return [_apply(processor, method, args, kwargs, i, doc) for i, doc in chunk]
+
+
+def _init_worker(processor: JsonLdEx) -> None:
+    global _WORKER_PROCESSOR
+    _WORKER_PROCESSOR = processor
+    copyreg.pickle(jsonld.JsonLdError, _reduce_jsonld_error)
+
+
+def _run_worker_chunk(
+    method: str,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    chunk: list[tuple[int, Any]],
+) -> list[DocumentResult]:
+    assert _WORKER_PROCESSOR is not None, "worker not initialised"
+    results = _run_chunk(_WORKER_PROCESSOR, method, args, kwargs, chunk)
+    return [
+        r if r.error is None else DocumentResult(r.index, error=_picklable_error(r.error))
+        for r in results
+    ]
+
+
+def _reduce_jsonld_error(exc: jsonld.JsonLdError) -> tuple[Any, ...]:
+    # JsonLdError requires a ``type_`` argument that default exception
+    # pickling does not pass.
+    message = exc.args[0] if exc.args else ""
+    return (jsonld.JsonLdError, (message, exc.type, exc.details, exc.code))
+
+
+def _picklable_error(exc: BaseException) -> BaseException:
+    """Return *exc*, or a ``RuntimeError`` describing it if it cannot be pickled."""
+    try:
+        pickle.dumps(exc)
+    except Exception:
+        return RuntimeError(f"{type(exc).__name__}: {exc}")
+    return exc
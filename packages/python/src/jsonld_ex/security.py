@@ -4,8 +4,11 @@ from __future__ import annotations
 import hashlib
 import base64
 import json
+import math
 import re
-from typing import Any, Optional
+from dataclasses import dataclass
+from json.encoder import encode_basestring_ascii as _encode_str
+from typing import Any, Iterator, NoReturn, Optional
 
 
 DEFAULT_RESOURCE_LIMITS = {
@@ -68,53 +71,357 @@ def is_context_allowed(url: str, config: dict[str, Any]) -> bool:
     return True
 
 
-_MAX_RECURSION_DEPTH = 500  # Safety cap for _measure_depth
+@dataclass(frozen=True)
+class ResourceUsage:
+    """Resource figures gathered by :func:`measure_resources`.
+
+    Attributes:
+        size: Serialized size in characters.  For parsed documents this is
+            ``len(json.dumps(document))``, computed without building the
+            string; for JSON text it is ``len(text)``.
+        depth: Nesting depth as counted by the ``max_graph_depth`` limit
+            (levels of non-empty objects and arrays).
+        node_count: Number of JSON objects.
+        string_length: Total characters in string keys and values, or
+            ``None`` for JSON text (the scanner does not measure it).
+        exceeded: Name of the first limit found exceeded (``"size"``,
+            ``"depth"``, ``"node count"`` or ``"string length"``), or
+            ``None``.  When set the scan stopped early and the other
+            figures are lower bounds.
+    """
+
+    size: int
+    depth: int
+    node_count: int
+    string_length: Optional[int]
+    exceeded: Optional[str] = None
 
 
 def enforce_resource_limits(
     document: str | dict | Any,
     limits: Optional[dict[str, int]] = None,
 ) -> None:
-    """Validate document against resource limits before processing."""
+    """Validate document against resource limits before processing.
+
+    Besides the keys of :data:`DEFAULT_RESOURCE_LIMITS`, *limits* may set
+    ``max_node_count`` and ``max_string_length`` (total characters in
+    string keys and values of parsed documents).  The document is checked
+    in a single pass that stops at the first exceeded limit; see
+    :func:`measure_resources`.
+    """
+    usage = measure_resources(document, limits)
+    if usage.exceeded is not None:
+        resolved = {**DEFAULT_RESOURCE_LIMITS, **(limits or {})}
+        key = _LIMIT_KEYS[usage.exceeded]
+        measured = {
+            "size": usage.size,
+            "depth": usage.depth,
+            "node count": usage.node_count,
+            "string length": usage.string_length,
+        }[usage.exceeded]
+        # Only oversized text is rejected on its exact length; any other
+        # figure is where the scan stopped, a lower bound.
+        if not (usage.exceeded == "size" and isinstance(document, str)):
+            measured = f"of at least {measured}"
+        raise ValueError(
+            f"Document {usage.exceeded} {measured} exceeds limit {resolved[key]}"
+        )
+
+
+def measure_resources(
+    document: str | dict | Any,
+    limits: Optional[dict[str, int]] = None,
+) -> ResourceUsage:
+    """Measure size, depth, node count and string totals in one pass.
+
+    Parsed documents (``dict``/``list``) are walked iteratively with an
+    exact running count of their ``json.dumps`` size, so the JSON string
+    is never built.  JSON text is checked by an incremental scanner that
+    validates syntax and tracks depth without building a parse tree.
+    Either way the walk stops as soon as a limit in *limits* (merged over
+    :data:`DEFAULT_RESOURCE_LIMITS`) is exceeded and reports it in
+    :attr:`ResourceUsage.exceeded`.
+
+    Raises:
+        TypeError: If *document* is ``None``, of an unsupported type, or
+            not JSON-serializable.
+        ValueError: If *document* is a string that is not valid JSON.
+    """
     if document is None:
         raise TypeError("Document must not be None")
     resolved = {**DEFAULT_RESOURCE_LIMITS, **(limits or {})}
     if isinstance(document, str):
-        content = document
-        if len(content) > resolved["max_document_size"]:
-            raise ValueError(
-                f"Document size {len(content)} exceeds limit {resolved['max_document_size']}"
-            )
-        try:
-            parsed = json.loads(content)
-        except json.JSONDecodeError as exc:
-            raise ValueError(f"Document is not valid JSON: {exc}") from exc
-    elif isinstance(document, (dict, list)):
-        try:
-            content = json.dumps(document)
-        except (TypeError, ValueError) as exc:
-            raise TypeError(f"Document is not JSON-serializable: {exc}") from exc
-        if len(content) > resolved["max_document_size"]:
-            raise ValueError(
-                f"Document size {len(content)} exceeds limit {resolved['max_document_size']}"
-            )
-        parsed = document
-    else:
-        raise TypeError(f"Document must be a str, dict, or list, got: {type(document).__name__}")
-    depth = _measure_depth(parsed)
-    if depth > resolved["max_graph_depth"]:
-        raise ValueError(
-            f"Document depth {depth} exceeds limit {resolved['max_graph_depth']}"
-        )
+        if len(document) > resolved["max_document_size"]:
+            return ResourceUsage(len(document), 0, 0, None, "size")
+        return _scan_text(document, resolved)
+    if isinstance(document, (dict, list)):
+        return _scan_object(document, resolved)
+    raise TypeError(f"Document must be a str, dict, or list, got: {type(document).__name__}")
+
+
+# -- Resource scanning --------------------------------------------------------
+
+_LIMIT_KEYS = {
+    "size": "max_document_size",
+    "depth": "max_graph_depth",
+    "node count": "max_node_count",
+    "string length": "max_string_length",
+}
+
+
+def _optional_limit(limits: dict[str, Any], key: str) -> float:
+    value = limits.get(key)
+    return math.inf if value is None else value
+
+
+def _float_size(value: float) -> int:
+    """Length of *value* as written by ``json.dumps``."""
+    if value != value:
+        return 3  # NaN
+    if value == math.inf:
+        return 8  # Infinity
+    if value == -math.inf:
+        return 9  # -Infinity
+    return len(float.__repr__(value))
+
 
+def _key_size(key: Any) -> int:
+    """Length of an object key as written by ``json.dumps``, with quotes."""
+    if isinstance(key, str):
+        return len(_encode_str(key))
+    if key is True or key is None:
+        return 6
+    if key is False:
+        return 7
+    if isinstance(key, int):
+        return len(int.__repr__(key)) + 2
+    if isinstance(key, float):
+        return _float_size(key) + 2
+    raise TypeError(
+        "Document is not JSON-serializable: keys must be str, int, float, "
+        f"bool or None, not {type(key).__name__}"
+    )
 
-def _measure_depth(obj: Any, current: int = 0) -> int:
-    if current > _MAX_RECURSION_DEPTH:
-        return current  # Safety cap to prevent stack overflow
-    if obj is None or not isinstance(obj, (dict, list)):
-        return current
-    max_depth = current
-    items = obj if isinstance(obj, list) else obj.values()
-    for item in items:
-        max_depth = max(max_depth, _measure_depth(item, current + 1))
-    return max_depth
+
+def _scalar_size(value: Any) -> int:
+    """Length of a non-container JSON value as written by ``json.dumps``.
+
+    Returns ``-1`` for containers (including tuples and subclasses of
+    ``dict``/``list``), which the caller descends into instead.
+    """
+    if value is None or value is True:
+        return 4
+    if value is False:
+        return 5
+    if isinstance(value, str):
+        return len(_encode_str(value))
+    if isinstance(value, int):
+        return len(int.__repr__(value))
+    if isinstance(value, float):
+        return _float_size(value)
+    if isinstance(value, (dict, list, tuple)):
+        return -1
+    raise TypeError(
+        "Document is not JSON-serializable: "
+        f"Object of type {type(value).__name__} is not JSON serializable"
+    )
+
+
+def _scan_object(document: Any, limits: dict[str, Any]) -> ResourceUsage:
+    """Walk a parsed document once, without recursion or serialization.
+
+    Each container is scanned in a tight loop over its scalar members and
+    only suspended (pushed on an explicit stack) when a nested container
+    is found.
+    """
+    max_size = limits["max_document_size"]
+    max_depth = limits["max_graph_depth"]
+    max_nodes = _optional_limit(limits, "max_node_count")
+    max_strings = _optional_limit(limits, "max_string_length")
+
+    encode = _encode_str
+    size = depth = nodes = strings = 0
+    on_path: set[int] = set()  # ids of open containers, for cycle detection
+    stack: list[tuple[Iterator[Any], bool, int]] = []
+    pending: Any = document
+
+    while True:
+        if pending is not None:
+            cid = id(pending)
+            if cid in on_path:
+                raise TypeError(
+                    "Document is not JSON-serializable: Circular reference detected"
+                )
+            is_dict = isinstance(pending, dict)
+            if is_dict:
+                nodes += 1
+                if nodes > max_nodes:
+                    return ResourceUsage(size, depth, nodes, strings, "node count")
+            count = len(pending)
+            if count:
+                size += 2 * count  # brackets plus ", " separators
+                level = len(stack)
+                if level >= max_depth:
+                    return ResourceUsage(size, level + 1, nodes, strings, "depth")
+                if level + 1 > depth:
+                    depth = level + 1
+                on_path.add(cid)
+                stack.append(
+                    (iter(pending.items()) if is_dict else iter(pending), is_dict, cid)
+                )
+            else:
+                size += 2
+            pending = None
+        if size > max_size:
+            return ResourceUsage(size, depth, nodes, strings, "size")
+        if not stack:
+            return ResourceUsage(size, depth, nodes, strings)
+
+        it, is_dict, cid = stack[-1]
+        for item in it:
+            if is_dict:
+                key, value = item
+                if type(key) is str:
+                    strings += len(key)
+                    size += len(encode(key)) + 2  # key plus ": "
+                else:
+                    size += _key_size(key) + 2
+                    if isinstance(key, str):
+                        strings += len(key)
+            else:
+                value = item
+            kind = type(value)
+            if kind is str:
+                strings += len(value)
+                size += len(encode(value))
+                if strings > max_strings:
+                    return ResourceUsage(size, depth, nodes, strings, "string length")
+            elif kind is int:
+                size += len(int.__repr__(value))
+            elif kind is dict or kind is list:
+                pending = value
+                break
+            else:
+                n = _scalar_size(value)
+                if n < 0:
+                    pending = value
+                    break
+                size += n
+                if isinstance(value, str):
+                    strings += len(value)
+                    if strings > max_strings:
+                        return ResourceUsage(size, depth, nodes, strings, "string length")
+            if size > max_size:
+                return ResourceUsage(size, depth, nodes, strings, "size")
+        else:
+            stack.pop()
+            on_path.discard(cid)
+
+
+# JSON text scanner.  Each match consumes a whole run of scalar members,
+# so the Python loop iterates per container rather than per value.
+_WS = r"[ \t\n\r]*"
+_STRING = r'"[^"\\\x00-\x1f]*(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\\x00-\x1f]*)*"'
+_SCALAR = (
+    rf"(?:{_STRING}|-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?"
+    r"|true|false|null|NaN|-?Infinity)"
+)
+_OBJECT_MEMBERS = (
+    rf"((?:{_WS}{_STRING}{_WS}:{_WS}{_SCALAR}{_WS},)*){_WS}"
+    rf"{_STRING}{_WS}:{_WS}(?:{_SCALAR}{_WS}(\}})|([\[{{]))"
+)
+_ARRAY_MEMBERS = (
+    rf"((?:{_WS}{_SCALAR}{_WS},)*){_WS}"
+    rf"(?:{_SCALAR}{_WS}(\])|([\[{{]))"
+)
+# Groups of every pattern below: (run of scalar members followed by ",",
+# close after the last member, nested opener, immediate close).  The
+# *_OPEN patterns apply right after an opening bracket, the *_NEXT ones
+# after a nested container closed (a separator must follow).
+_SCANNER = {
+    "{": (
+        re.compile(rf"{_OBJECT_MEMBERS}|{_WS}(\}})"),
+        re.compile(rf"{_WS}(?:,{_OBJECT_MEMBERS}|(\}}))"),
+    ),
+    "[": (
+        re.compile(rf"{_ARRAY_MEMBERS}|{_WS}(\])"),
+        re.compile(rf"{_WS}(?:,{_ARRAY_MEMBERS}|(\]))"),
+    ),
+}
+_TOP_VALUE = re.compile(rf"{_WS}(?:{_SCALAR}|([\[{{]))")
+_TRAILING = re.compile(rf"{_WS}\Z")
+
+
+def _scan_text(text: str, limits: dict[str, Any]) -> ResourceUsage:
+    """Validate JSON *text* and measure depth and node count without parsing.
+
+    Only the stack of open brackets is kept, so memory is bounded by the
+    nesting depth rather than the document size.
+    """
+    max_depth = limits["max_graph_depth"]
+    max_nodes = _optional_limit(limits, "max_node_count")
+    size = len(text)
+    depth = nodes = 0
+    stack: list[str] = []
+
+    m = _TOP_VALUE.match(text)
+    if m is None:
+        _raise_invalid_json(text, 0)
+    opener = m.group(1)
+    pos = m.end()
+    if opener is not None:
+        if opener == "{":
+            nodes = 1
+        stack.append(opener)
+        m = _SCANNER[opener][0].match(text, pos)
+
+    while stack:
+        if m is None:
+            _raise_invalid_json(text, pos)
+        pos = m.end()
+        _, _, nested, empty = m.groups()
+        if empty is None:
+            level = len(stack)
+            if level > max_depth:
+                return ResourceUsage(size, level, nodes, None, "depth")
+            if level > depth:
+                depth = level
+        if nested is not None:
+            if nested == "{":
+                nodes += 1
+                if nodes > max_nodes:
+                    return ResourceUsage(size, depth, nodes, None, "node count")
+            stack.append(nested)
+            m = _SCANNER[nested][0].match(text, pos)
+            continue
+
+        # The innermost container closed; resume its parent, closing
+        # further levels while they end immediately.
+        stack.pop()
+        while stack:
+            m = _SCANNER[stack[-1]][1].match(text, pos)
+            if m is None or m.group(4) is None:
+                break
+            pos = m.end()
+            stack.pop()
+
+    if _TRAILING.match(text, pos) is None:
+        _raise_invalid_json(text, pos)
+    return ResourceUsage(size, depth, nodes, None)
+
+
+def _raise_invalid_json(text: str, pos: int) -> NoReturn:
+    """Raise for invalid JSON *text* with the decoder's line and column.
+
+    The scanner only knows where the unmatched run of members starts
+    (*pos*), so the decoder is re-run on this error path to locate the
+    exact fault; *pos* is the fallback if it cannot.
+    """
+    try:
+        json.loads(text)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"Document is not valid JSON: {exc}") from exc
+    except RecursionError:
+        pass
+    detail = json.JSONDecodeError("Unexpected content", text, pos)
+    raise ValueError(f"Document is not valid JSON: {detail}")
@@ -11,13 +11,20 @@ Extension keywords:
 
 These compose naturally with existing jsonld-ex annotations
 (``@confidence``, ``@source``, etc.) on the same value object.
+
+For repeated point-in-time queries against the same graph,
+:class:`TemporalIndex` parses every bound once and answers
+``query_at_time`` and range queries from an interval tree.
 """
 
 from __future__ import annotations
 
+import math
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Literal, Optional, Sequence
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Iterable, Literal, Optional, Sequence
 
 from jsonld_ex.ai_ml import get_confidence
 
@@ -58,6 +65,18 @@ def _parse_timestamp(ts: str) -> datetime:
     raise ValueError(f"Cannot parse timestamp: {ts!r}")
 
 
+@lru_cache(maxsize=4096)
+def _parse_timestamp_cached(ts: str) -> datetime:
+    return _parse_timestamp(ts)
+
+
+def _timestamp(ts: Any) -> datetime:
+    """:func:`_parse_timestamp` memoized for the strings seen repeatedly in a graph."""
+    if isinstance(ts, str):
+        return _parse_timestamp_cached(ts)
+    return _parse_timestamp(ts)
+
+
 # ── Annotation helpers ─────────────────────────────────────────────
 
 
@@ -201,17 +220,290 @@ def _is_valid_at(value: Any, ts: datetime) -> bool:
         return True
 
     if vf is not None:
-        from_dt = _parse_timestamp(vf)
+        from_dt = _timestamp(vf)
         if ts < from_dt:
             return False
     if vu is not None:
-        until_dt = _parse_timestamp(vu)
+        until_dt = _timestamp(vu)
         if ts > until_dt:
             return False
 
     return True
 
 
+# ── Temporal index ─────────────────────────────────────────────────
+
+_IDENTITY_KEYS = frozenset({"@id", "@type", "@context"})
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _epoch_us(ts: str) -> int:
+    """Microseconds since the Unix epoch; naive timestamps are taken as UTC."""
+    dt = _timestamp(ts)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def _value_interval(value: Any) -> tuple[float, float]:
+    """Closed validity interval of *value* in epoch microseconds."""
+    if not isinstance(value, dict):
+        return -math.inf, math.inf
+    vf = value.get("@validFrom")
+    vu = value.get("@validUntil")
+    return (
+        -math.inf if vf is None else _epoch_us(vf),
+        math.inf if vu is None else _epoch_us(vu),
+    )
+
+
+class TemporalIndex:
+    """Interval index over a graph's ``@validFrom`` / ``@validUntil`` bounds.
+
+    Every property value (each item of a multi-valued property) becomes a
+    closed interval of epoch microseconds, parsed once when the node is
+    added; values without bounds are valid over the whole time line.
+    The intervals are kept in a centered interval tree, so
+    :meth:`query_at_time` and :meth:`query_range` cost O(log n + k) for
+    *k* matching values instead of a scan over the whole graph.
+
+    Results are identical to :func:`query_at_time` on the same nodes,
+    except that naive timestamps are taken as UTC (where the scan raises
+    ``TypeError`` when mixing naive and aware timestamps) and malformed
+    timestamps are rejected by :meth:`add` rather than at query time.
+
+    Nodes added later with :meth:`add` / :meth:`extend` are scanned
+    linearly until there are more than about √n of them, and then folded
+    into the tree on the next query.  Nodes are indexed as they were when
+    added; mutate a node and the index goes stale.
+
+    Args:
+        graph: Initial JSON-LD nodes (typically ``doc["@graph"]``).
+    """
+
+    __slots__ = ("nodes", "_plans", "_entry_node", "_starts", "_ends", "_tree", "_indexed")
+
+    def __init__(self, graph: Iterable[dict[str, Any]] = ()) -> None:
+        self.nodes: list[dict[str, Any]] = []
+        # Per node, its items in order as (key, value, first entry, item
+        # count); the first entry is None for identity keys and the count
+        # is -1 for single values.  Entry ids are consecutive per node.
+        self._plans: list[list[tuple[str, Any, Optional[int], int]]] = []
+        self._entry_node: list[int] = []
+        self._starts: list[float] = []
+        self._ends: list[float] = []
+        self._tree: Optional[_IntervalNode] = None
+        self._indexed = 0  # entries covered by _tree; later ones are scanned
+        self.extend(graph)
+        self._rebuild()
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __repr__(self) -> str:
+        return (
+            f"TemporalIndex(nodes={len(self.nodes)}, values={len(self._starts)}, "
+            f"pending={len(self._starts) - self._indexed})"
+        )
+
+    def add(self, node: dict[str, Any]) -> None:
+        """Append *node*, as if appended to the indexed graph.
+
+        Raises:
+            TypeError:  If a temporal bound is not a string.
+            ValueError: If a temporal bound cannot be parsed.
+        """
+        plan: list[tuple[str, Any, Optional[int], int]] = []
+        intervals: list[tuple[float, float]] = []
+        first = len(self._starts)
+        for key, value in node.items():
+            if key in _IDENTITY_KEYS:
+                plan.append((key, value, None, -1))
+            elif isinstance(value, list):
+                plan.append((key, value, first + len(intervals), len(value)))
+                intervals.extend(_value_interval(item) for item in value)
+            else:
+                plan.append((key, value, first + len(intervals), -1))
+                intervals.append(_value_interval(value))
+
+        pos = len(self.nodes)
+        self.nodes.append(node)
+        self._plans.append(plan)
+        for start, end in intervals:
+            if start > end:
+                # @validFrom after @validUntil: never valid, never matched
+                start, end = math.inf, -math.inf
+            self._entry_node.append(pos)
+            self._starts.append(start)
+            self._ends.append(end)
+
+    def extend(self, nodes: Iterable[dict[str, Any]]) -> None:
+        """Append each of *nodes* with :meth:`add`."""
+        for node in nodes:
+            self.add(node)
+
+    def query_at_time(
+        self,
+        timestamp: str,
+        property_name: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """Return the graph state as of *timestamp*; see :func:`query_at_time`."""
+        at = _epoch_us(timestamp)
+        return self._select(at, at, property_name)
+
+    def query_range(
+        self,
+        start: str,
+        end: str,
+        property_name: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """Return the values valid at any time in [*start*, *end*].
+
+        Nodes are filtered as by :meth:`query_at_time`, keeping each value
+        whose validity interval overlaps the range.
+
+        Raises:
+            ValueError: If *start* is after *end*.
+        """
+        lo = _epoch_us(start)
+        hi = _epoch_us(end)
+        if lo > hi:
+            raise ValueError(f"Range start ({start}) must not be after end ({end})")
+        return self._select(lo, hi, property_name)
+
+    # ── Internal ─────────────────────────────────────────────────
+
+    def _rebuild(self) -> None:
+        starts, ends = self._starts, self._ends
+        ids = sorted(
+            (entry for entry in range(len(starts)) if starts[entry] <= ends[entry]),
+            key=starts.__getitem__,
+        )
+        self._tree = _build_interval_tree(ids, starts, ends)
+        self._indexed = len(starts)
+
+    def _select(
+        self,
+        lo: float,
+        hi: float,
+        property_name: Optional[str],
+    ) -> list[dict[str, Any]]:
+        total = len(self._starts)
+        if total - self._indexed > max(64, math.isqrt(total)):
+            self._rebuild()
+
+        hits: list[int] = []
+        if self._tree is not None:
+            _overlapping(self._tree, lo, hi, hits)
+        starts, ends = self._starts, self._ends
+        hits.extend(
+            entry for entry in range(self._indexed, total)
+            if starts[entry] <= hi and ends[entry] >= lo
+        )
+        hit = set(hits)
+
+        # Filtering one property passes every other property through, so
+        # every node is visited; otherwise only nodes with matching values.
+        if property_name is None:
+            positions: Iterable[int] = sorted(set(map(self._entry_node.__getitem__, hits)))
+        else:
+            positions = range(len(self.nodes))
+
+        result: list[dict[str, Any]] = []
+        for pos in positions:
+            out: dict[str, Any] = {}
+            has_any_data = False
+            for key, value, first, count in self._plans[pos]:
+                if first is None:
+                    out[key] = value
+                elif property_name is not None and key != property_name:
+                    out[key] = value
+                    has_any_data = True
+                elif count < 0:
+                    if first in hit:
+                        out[key] = value
+                        has_any_data = True
+                else:
+                    kept = [value[i] for i in range(count) if first + i in hit]
+                    if kept:
+                        out[key] = kept if len(kept) > 1 else kept[0]
+                        has_any_data = True
+            if has_any_data:
+                result.append(out)
+        return result
+
+
+class _IntervalNode:
+    """Centered interval tree node.
+
+    Holds the intervals containing ``center``, sorted by start and by end;
+    intervals entirely before / after it live in ``left`` / ``right``.
+    """
+
+    __slots__ = ("center", "starts", "by_start", "ends", "by_end", "left", "right")
+
+    def __init__(self, center: float) -> None:
+        self.center = center
+        self.starts: list[float] = []
+        self.by_start: list[int] = []
+        self.ends: list[float] = []
+        self.by_end: list[int] = []
+        self.left: Optional[_IntervalNode] = None
+        self.right: Optional[_IntervalNode] = None
+
+
+def _build_interval_tree(
+    ids: list[int],
+    starts: list[float],
+    ends: list[float],
+) -> Optional[_IntervalNode]:
+    """Build a tree over *ids*, which must be sorted by start.
+
+    The center is the median start, so each side gets at most half the
+    intervals; partitions keep the start order, giving O(n log n) overall.
+    """
+    if not ids:
+        return None
+    node = _IntervalNode(starts[ids[len(ids) // 2]])
+    center = node.center
+    left: list[int] = []
+    right: list[int] = []
+    for entry in ids:
+        if ends[entry] < center:
+            left.append(entry)
+        elif starts[entry] > center:
+            right.append(entry)
+        else:
+            node.by_start.append(entry)
+    node.starts = [starts[entry] for entry in node.by_start]
+    node.by_end = sorted(node.by_start, key=ends.__getitem__)
+    node.ends = [ends[entry] for entry in node.by_end]
+    node.left = _build_interval_tree(left, starts, ends)
+    node.right = _build_interval_tree(right, starts, ends)
+    return node
+
+
+def _overlapping(
+    node: Optional[_IntervalNode],
+    lo: float,
+    hi: float,
+    out: list[int],
+) -> None:
+    """Append the ids of intervals overlapping [*lo*, *hi*] to *out*."""
+    while node is not None:
+        if hi < node.center:
+            out.extend(node.by_start[:bisect_right(node.starts, hi)])
+            node = node.left
+        elif lo > node.center:
+            out.extend(node.by_end[bisect_left(node.ends, lo):])
+            node = node.right
+        else:
+            out.extend(node.by_start)
+            _overlapping(node.left, lo, hi, out)
+            node = node.right
+
+
 # ── Temporal diff ──────────────────────────────────────────────────
 
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional, Sequence
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, Union
 
 
 @dataclass
@@ -34,11 +34,19 @@ XSD = "http://www.w3.org/2001/XMLSchema#"
 
 def validate_node(
     node: dict[str, Any],
-    shape: dict[str, Any],
+    shape: Union[dict[str, Any], CompiledShape],
     *,
     shape_registry: dict[str, dict[str, Any]] | None = None,
 ) -> ValidationResult:
-    """Validate a JSON-LD node against a shape definition."""
+    """Validate a JSON-LD node against a shape definition.
+
+    *shape* may also be a :class:`CompiledShape` from :func:`compile_shape`,
+    in which case *shape_registry* is ignored (inheritance was already
+    resolved at compile time).
+    """
+    if isinstance(shape, CompiledShape):
+        return shape.validate(node)
+
     errors: list[ValidationError] = []
     warnings: list[ValidationWarning] = []
 
@@ -145,25 +153,566 @@ def validate_node(
 
 
 def validate_document(
-    doc: dict[str, Any], shapes: Sequence[dict[str, Any]]
+    doc: dict[str, Any],
+    shapes: Union[Sequence[Union[dict[str, Any], CompiledShape]], ShapeIndex],
 ) -> ValidationResult:
-    """Validate all matching nodes in a document against shapes."""
+    """Validate all matching nodes in a document against shapes.
+
+    Shapes are compiled and indexed by ``@type`` once per call, so each
+    node is only checked against the shapes targeting one of its types.
+    Pass a prebuilt :class:`ShapeIndex` to reuse that work across
+    documents.  Nodes are visited lazily; ``@graph`` arrays are never
+    copied.
+    """
     all_errors: list[ValidationError] = []
     all_warnings: list[ValidationWarning] = []
+    index = shapes if isinstance(shapes, ShapeIndex) else ShapeIndex(shapes)
 
-    for node in _extract_nodes(doc):
-        node_types = _get_types(node)
-        for shape in shapes:
-            if shape.get("@type") in node_types:
-                result = validate_node(node, shape)
+    for node in _iter_nodes(doc):
+        for shape in index.match(_get_types(node)):
+            result = shape.validate(node)
+            if result.errors:
+                node_id = node.get("@id", "anonymous")
                 for e in result.errors:
-                    e.path = f"{node.get('@id', 'anonymous')}/{e.path}"
+                    e.path = f"{node_id}/{e.path}"
                 all_errors.extend(result.errors)
-                all_warnings.extend(result.warnings)
+            all_warnings.extend(result.warnings)
 
     return ValidationResult(len(all_errors) == 0, all_errors, all_warnings)
 
 
+class ShapeIndex:
+    """Compiled shapes indexed by their target ``@type``.
+
+    :meth:`match` returns the shapes whose ``@type`` is one of a node's
+    types, in the order the shapes were given, at the cost of one dict
+    lookup per node type instead of a scan over every shape.
+    """
+
+    __slots__ = ("shapes", "_by_type", "_unindexed")
+
+    def __init__(self, shapes: Iterable[Union[dict[str, Any], CompiledShape]]) -> None:
+        self.shapes: list[CompiledShape] = [
+            s if isinstance(s, CompiledShape) else compile_shape(s) for s in shapes
+        ]
+        self._by_type: dict[Any, list[tuple[int, CompiledShape]]] = {}
+        # Shapes whose @type is unhashable fall back to a linear check.
+        self._unindexed: list[tuple[int, CompiledShape]] = []
+        for pos, shape in enumerate(self.shapes):
+            try:
+                self._by_type.setdefault(shape.target_type, []).append((pos, shape))
+            except TypeError:
+                self._unindexed.append((pos, shape))
+
+    def __len__(self) -> int:
+        return len(self.shapes)
+
+    def match(self, node_types: Sequence[Any]) -> list[CompiledShape]:
+        """Return the shapes targeting any of *node_types*, in input order."""
+        if len(node_types) == 1 and not self._unindexed:
+            try:
+                entries = self._by_type.get(node_types[0])
+            except TypeError:
+                return []
+            return [shape for _, shape in entries] if entries else []
+
+        hits: dict[int, CompiledShape] = {}
+        for node_type in node_types:
+            try:
+                entries = self._by_type.get(node_type)
+            except TypeError:
+                continue
+            if entries:
+                hits.update(entries)
+        for pos, shape in self._unindexed:
+            if shape.target_type in node_types:
+                hits[pos] = shape
+        if len(hits) > 1:
+            return [hits[pos] for pos in sorted(hits)]
+        return list(hits.values())
+
+
+# -- Compiled shapes ----------------------------------------------------------
+
+# A compiled value check appends findings for ``(raw, node)`` to ``errors``.
+_Check = Callable[[Any, Optional[dict], list], None]
+
+_UNSET = object()
+
+
+class CompiledShape:
+    """A shape pre-processed by :func:`compile_shape` for repeated validation.
+
+    Inheritance is flattened, ``@pattern`` regexes are compiled and each
+    property's constraints become a list of check closures evaluated in the
+    same order as :func:`validate_node`, so ``compiled.validate(node)``
+    returns exactly what ``validate_node(node, shape, shape_registry=...)``
+    would.  The plan is a snapshot: later edits to the source shape dict
+    are not seen.  Instances pickle by recompiling from the source shape.
+    """
+
+    __slots__ = (
+        "shape", "shape_registry", "target_type",
+        "_type", "_extend_warnings", "_properties",
+    )
+
+    def __init__(
+        self,
+        shape: dict[str, Any],
+        shape_registry: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        self.shape = shape
+        self.shape_registry = shape_registry
+        self.target_type = shape.get("@type")
+        self._type: Any = _UNSET
+        self._extend_warnings: list[ValidationWarning] = []
+        self._properties: list[tuple] = []
+
+    def __reduce__(self) -> tuple:
+        return (compile_shape, (self.shape, self.shape_registry))
+
+    def __repr__(self) -> str:
+        return (
+            f"CompiledShape(type={self.target_type!r}, "
+            f"properties={len(self._properties)})"
+        )
+
+    def validate(self, node: dict[str, Any]) -> ValidationResult:
+        """Validate *node*; equivalent to :func:`validate_node`."""
+        errors: list[ValidationError] = []
+        if not isinstance(node, dict):
+            errors.append(ValidationError(".", "type", "Node must be a dict"))
+            return ValidationResult(False, errors, [])
+
+        warnings = [
+            ValidationWarning(w.path, w.code, w.message)
+            for w in self._extend_warnings
+        ]
+
+        expected = self._type
+        if expected is not _UNSET:
+            node_types = _get_types(node)
+            if expected not in node_types:
+                errors.append(ValidationError(
+                    "@type", "type",
+                    f'Expected type "{expected}", found: {node_types}',
+                    node_types,
+                ))
+
+        for (prop, severity, min_count, max_count, required,
+             nested, checks) in self._properties:
+            value = node.get(prop)
+
+            if min_count is not _UNSET or max_count is not _UNSET:
+                count = _count_values(value)
+                if min_count is not _UNSET and count < min_count:
+                    _emit(
+                        errors, warnings, severity, prop, "minCount",
+                        f"Expected at least {min_count} value(s), found {count}",
+                        value,
+                    )
+                if max_count is not _UNSET and count > max_count:
+                    _emit(
+                        errors, warnings, severity, prop, "maxCount",
+                        f"Expected at most {max_count} value(s), found {count}",
+                        value,
+                    )
+
+            raw = _extract_raw(value)
+
+            if required and raw is None:
+                _emit(
+                    errors, warnings, severity, prop, "required",
+                    f'Property "{prop}" is required',
+                )
+                continue
+
+            if raw is None and value is None:
+                continue
+
+            if nested is not None:
+                nested(prop, severity, value, errors, warnings)
+                continue
+
+            if raw is None or not checks:
+                continue
+
+            found: list[ValidationError] = []
+            for check in checks:
+                check(raw, node, found)
+            for e in found:
+                _emit(errors, warnings, severity, e.path, e.constraint, e.message, e.value)
+
+        return ValidationResult(len(errors) == 0, errors, warnings)
+
+
+def compile_shape(
+    shape: dict[str, Any],
+    shape_registry: dict[str, dict[str, Any]] | None = None,
+) -> CompiledShape:
+    """Compile *shape* into a reusable validation plan.
+
+    ``@extends`` is resolved once against *shape_registry*, ``@pattern``
+    regexes are compiled up front, and nested ``@shape`` constraints are
+    compiled recursively.  Use the result with :meth:`CompiledShape.validate`,
+    :func:`validate_node`, :func:`validate_document` or
+    :func:`~jsonld_ex.batch.validate_batch` when validating many nodes
+    against the same shape.
+    """
+    return _compile_shape(shape, shape_registry, {})
+
+
+def _compile_shape(
+    shape: dict[str, Any],
+    registry: dict[str, dict[str, Any]] | None,
+    memo: dict[int, CompiledShape],
+) -> CompiledShape:
+    compiled = CompiledShape(shape, registry)
+    if not registry:
+        # Nested shapes are always compiled without a registry; sharing
+        # them by identity also terminates self-referencing shapes.
+        memo[id(shape)] = compiled
+
+    resolved = shape
+    if "@extends" in shape:
+        resolved, compiled._extend_warnings = _resolve_extends(shape, registry or {})
+
+    if "@type" in resolved:
+        compiled._type = resolved["@type"]
+
+    for prop, constraint in resolved.items():
+        if prop.startswith("@") or not isinstance(constraint, dict):
+            continue
+        nested = None
+        checks: list[_Check] = []
+        if "@shape" in constraint:
+            nested = _compile_nested(constraint["@shape"], memo)
+        else:
+            checks = _compile_constraints(prop, constraint)
+        compiled._properties.append((
+            prop,
+            constraint.get("@severity", "error"),
+            constraint.get("@minCount", _UNSET),
+            constraint.get("@maxCount", _UNSET),
+            bool(constraint.get("@required")),
+            nested,
+            checks,
+        ))
+    return compiled
+
+
+def _compile_nested(
+    inner_shape: Any,
+    memo: dict[int, CompiledShape],
+) -> Callable[..., None]:
+    """Build the ``@shape`` handler for one property (GAP-V5)."""
+    if isinstance(inner_shape, dict):
+        inner = memo.get(id(inner_shape)) or _compile_shape(inner_shape, None, memo)
+        validate: Callable[[Any], ValidationResult] = inner.validate
+    else:
+        def validate(target: Any) -> ValidationResult:
+            return validate_node(target, inner_shape)
+
+    def nested(prop, severity, value, errors, warnings) -> None:
+        target = value
+        if isinstance(target, list) and len(target) > 0:
+            target = target[0]
+        if not isinstance(target, dict):
+            _emit(
+                errors, warnings, severity, prop, "shape",
+                f"Expected a node (dict) for @shape validation, "
+                f"got {type(target).__name__}",
+                target,
+            )
+            return
+        inner_result = validate(target)
+        if not inner_result.valid:
+            _emit(
+                errors, warnings, severity, prop, "shape",
+                f"Nested shape validation failed: "
+                f"{inner_result.errors[0].message}",
+                target,
+            )
+
+    return nested
+
+
+def _run_checks(checks: list[_Check], raw: Any, node: Optional[dict]) -> list[ValidationError]:
+    errors: list[ValidationError] = []
+    for check in checks:
+        check(raw, node, errors)
+    return errors
+
+
+def _compile_constraints(prop: str, constraint: Any) -> list[_Check]:
+    """Compile a constraint dict into checks mirroring :func:`_check_constraints`.
+
+    The checks are emitted in the same order as ``_check_constraints``
+    evaluates them, so findings come out in the same order too.
+    """
+    if not isinstance(constraint, dict):
+        def check_raw(raw, node, errors, _c=constraint):
+            errors.extend(_check_constraints(prop, raw, _c, node))
+        return [check_raw]
+
+    checks: list[_Check] = []
+
+    # -- Logical combinators --------------------------------------------------
+    if "@or" in constraint:
+        or_branches = [_compile_constraints(prop, b) for b in constraint["@or"]]
+
+        def check_or(raw, node, errors):
+            for branch in or_branches:
+                if not _run_checks(branch, raw, node):
+                    return
+            errors.append(ValidationError(
+                prop, "or",
+                f"Value {raw!r} did not satisfy any @or branch",
+                raw,
+            ))
+        checks.append(check_or)
+
+    if "@and" in constraint:
+        and_branches = [_compile_constraints(prop, b) for b in constraint["@and"]]
+
+        def check_and(raw, node, errors):
+            for branch in and_branches:
+                branch_errors = _run_checks(branch, raw, node)
+                if branch_errors:
+                    errors.append(ValidationError(
+                        prop, "and",
+                        f"Value {raw!r} failed an @and branch: "
+                        f"{branch_errors[0].message}",
+                        raw,
+                    ))
+                    return
+        checks.append(check_and)
+
+    if "@not" in constraint:
+        not_source = constraint["@not"]
+        not_checks = _compile_constraints(prop, not_source)
+
+        def check_not(raw, node, errors):
+            if not _run_checks(not_checks, raw, node):
+                errors.append(ValidationError(
+                    prop, "not",
+                    f"Value {raw!r} must NOT satisfy {not_source}",
+                    raw,
+                ))
+        checks.append(check_not)
+
+    # -- Conditional: @if / @then / @else (GAP-V7) ----------------------------
+    if "@if" in constraint:
+        if_checks = _compile_constraints(prop, constraint["@if"])
+        then_checks = (
+            _compile_constraints(prop, constraint["@then"])
+            if "@then" in constraint else None
+        )
+        else_checks = (
+            _compile_constraints(prop, constraint["@else"])
+            if "@else" in constraint else None
+        )
+
+        def check_if(raw, node, errors):
+            if not _run_checks(if_checks, raw, node):
+                if then_checks is not None:
+                    then_errors = _run_checks(then_checks, raw, node)
+                    if then_errors:
+                        errors.append(ValidationError(
+                            prop, "conditional",
+                            f"Value {raw!r} met @if condition but failed "
+                            f"@then: {then_errors[0].message}",
+                            raw,
+                        ))
+            elif else_checks is not None:
+                else_errors = _run_checks(else_checks, raw, node)
+                if else_errors:
+                    errors.append(ValidationError(
+                        prop, "conditional",
+                        f"Value {raw!r} failed @else branch: "
+                        f"{else_errors[0].message}",
+                        raw,
+                    ))
+        checks.append(check_if)
+
+    # -- Cross-property constraints -------------------------------------------
+    if "@lessThan" in constraint:
+        checks.append(_compile_ordering(prop, constraint["@lessThan"], strict=True))
+
+    if "@lessThanOrEquals" in constraint:
+        checks.append(_compile_ordering(prop, constraint["@lessThanOrEquals"], strict=False))
+
+    if "@equals" in constraint:
+        eq_prop = constraint["@equals"]
+
+        def check_equals(raw, node, errors):
+            if node is None:
+                return
+            other_raw = _extract_raw(node.get(eq_prop))
+            if other_raw is not None and raw != other_raw:
+                errors.append(ValidationError(
+                    prop, "equals",
+                    f"Value {raw!r} != {eq_prop}={other_raw!r}",
+                    raw,
+                ))
+        checks.append(check_equals)
+
+    if "@disjoint" in constraint:
+        disjoint_prop = constraint["@disjoint"]
+
+        def check_disjoint(raw, node, errors):
+            if node is None:
+                return
+            other_raw = _extract_raw(node.get(disjoint_prop))
+            if other_raw is not None and raw == other_raw:
+                errors.append(ValidationError(
+                    prop, "disjoint",
+                    f"Value {raw!r} must differ from "
+                    f"{disjoint_prop}={other_raw!r}",
+                    raw,
+                ))
+        checks.append(check_disjoint)
+
+    # -- Atomic constraints ---------------------------------------------------
+    expected_type = constraint.get("@type")
+    if expected_type:
+        if isinstance(expected_type, str):
+            type_ok, short = _resolve_type_check(expected_type)
+            if type_ok is not None:
+                def check_type(raw, node, errors):
+                    if not type_ok(raw):
+                        errors.append(ValidationError(
+                            prop, "type",
+                            f"Expected {short}, got {type(raw).__name__}: {raw}",
+                            raw,
+                        ))
+                checks.append(check_type)
+        else:
+            def check_type_raw(raw, node, errors):
+                type_err = _validate_type(raw, expected_type)
+                if type_err:
+                    errors.append(ValidationError(prop, "type", type_err, raw))
+            checks.append(check_type_raw)
+
+    if "@minimum" in constraint:
+        minimum = constraint["@minimum"]
+
+        def check_minimum(raw, node, errors):
+            if isinstance(raw, (int, float)) and not isinstance(raw, bool) and raw < minimum:
+                errors.append(ValidationError(
+                    prop, "minimum",
+                    f"Value {raw} below minimum {minimum}", raw,
+                ))
+        checks.append(check_minimum)
+
+    if "@maximum" in constraint:
+        maximum = constraint["@maximum"]
+
+        def check_maximum(raw, node, errors):
+            if isinstance(raw, (int, float)) and not isinstance(raw, bool) and raw > maximum:
+                errors.append(ValidationError(
+                    prop, "maximum",
+                    f"Value {raw} exceeds maximum {maximum}", raw,
+                ))
+        checks.append(check_maximum)
+
+    if "@minLength" in constraint:
+        min_length = constraint["@minLength"]
+
+        def check_min_length(raw, node, errors):
+            if isinstance(raw, str) and len(raw) < min_length:
+                errors.append(ValidationError(
+                    prop, "minLength",
+                    f"Length {len(raw)} below minimum {min_length}", raw,
+                ))
+        checks.append(check_min_length)
+
+    if "@maxLength" in constraint:
+        max_length = constraint["@maxLength"]
+
+        def check_max_length(raw, node, errors):
+            if isinstance(raw, str) and len(raw) > max_length:
+                errors.append(ValidationError(
+                    prop, "maxLength",
+                    f"Length {len(raw)} exceeds maximum {max_length}", raw,
+                ))
+        checks.append(check_max_length)
+
+    if "@in" in constraint:
+        allowed = constraint["@in"]
+
+        def check_in(raw, node, errors):
+            if raw not in allowed:
+                errors.append(ValidationError(
+                    prop, "in",
+                    f"Value {raw!r} not in allowed set {allowed}", raw,
+                ))
+        checks.append(check_in)
+
+    if "@pattern" in constraint:
+        checks.append(_compile_pattern(prop, constraint["@pattern"]))
+
+    return checks
+
+
+def _compile_ordering(prop: str, other_prop: Any, *, strict: bool) -> _Check:
+    """Compile ``@lessThan`` (*strict*) or ``@lessThanOrEquals``."""
+    name = "lessThan" if strict else "lessThanOrEquals"
+    relation = "less than" if strict else "<="
+
+    def check(raw, node, errors):
+        if node is None:
+            return
+        other_raw = _extract_raw(node.get(other_prop))
+        if other_raw is None:
+            return
+        try:
+            ok = raw < other_raw if strict else raw <= other_raw
+        except TypeError:
+            errors.append(ValidationError(
+                prop, name,
+                f"Cannot compare {type(raw).__name__} with "
+                f"{type(other_raw).__name__}",
+                raw,
+            ))
+            return
+        if not ok:
+            errors.append(ValidationError(
+                prop, name,
+                f"Value {raw!r} is not {relation} {other_prop}={other_raw!r}",
+                raw,
+            ))
+
+    return check
+
+
+def _compile_pattern(prop: str, pattern: Any) -> _Check:
+    """Compile ``@pattern`` once; invalid regexes report on every string value."""
+    try:
+        search = re.compile(pattern).search
+    except re.error as exc:
+        message = f'Invalid regex pattern "{pattern}": {exc}'
+
+        def check_invalid(raw, node, errors):
+            if isinstance(raw, str):
+                errors.append(ValidationError(prop, "pattern", message, raw))
+        return check_invalid
+    except TypeError:
+        # Not a pattern at all: defer to re.search so the failure surfaces
+        # exactly as it does in the interpreted path.
+        def search(raw: str) -> Any:
+            return re.search(pattern, raw)
+
+    def check_pattern(raw, node, errors):
+        if isinstance(raw, str) and not search(raw):
+            errors.append(ValidationError(
+                prop, "pattern",
+                f'"{raw}" does not match pattern "{pattern}"', raw,
+            ))
+
+    return check_pattern
+
+
 # -- Shape inheritance (@extends, GAP-OWL1) -----------------------------------
 
 
@@ -531,33 +1080,51 @@ def _extract_raw(value: Any) -> Any:
 
 
 def _extract_nodes(doc: Any) -> list[dict]:
-    if isinstance(doc, list):
-        nodes = []
-        for item in doc:
-            nodes.extend(_extract_nodes(item))
-        return nodes
-    if not isinstance(doc, dict):
-        return []
-    nodes = []
-    if "@type" in doc:
-        nodes.append(doc)
-    if "@graph" in doc:
-        nodes.extend(_extract_nodes(doc["@graph"]))
-    return nodes
+    return list(_iter_nodes(doc))
 
 
-def _validate_type(value: Any, expected: str) -> Optional[str]:
+def _iter_nodes(doc: Any) -> Iterator[dict]:
+    """Yield typed nodes of *doc* depth-first, descending into ``@graph``.
+
+    Iterative, so deeply nested graphs do not hit the recursion limit,
+    and lazy over each array, so large ``@graph`` lists are not copied.
+    """
+    stack: list[Iterator[Any]] = [iter((doc,))]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, list):
+                stack.append(iter(item))
+                break
+            if not isinstance(item, dict):
+                continue
+            if "@type" in item:
+                yield item
+            if "@graph" in item:
+                stack.append(iter((item["@graph"],)))
+                break
+        else:
+            stack.pop()
+
+
+_XSD_CHECKS: dict[str, Callable[[Any], bool]] = {
+    f"{XSD}string": lambda v: isinstance(v, str),
+    f"{XSD}integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    f"{XSD}double": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    f"{XSD}float": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    f"{XSD}decimal": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    f"{XSD}boolean": lambda v: isinstance(v, bool),
+}
+
+
+def _resolve_type_check(expected: str) -> tuple[Optional[Callable[[Any], bool]], str]:
+    """Return the value checker for *expected* and its display name."""
     xsd_type = expected.replace("xsd:", XSD) if expected.startswith("xsd:") else expected
-    checks = {
-        f"{XSD}string": lambda v: isinstance(v, str),
-        f"{XSD}integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
-        f"{XSD}double": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
-        f"{XSD}float": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
-        f"{XSD}decimal": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
-        f"{XSD}boolean": lambda v: isinstance(v, bool),
-    }
-    checker = checks.get(xsd_type)
+    short = expected if expected.startswith("xsd:") else xsd_type
+    return _XSD_CHECKS.get(xsd_type), short
+
+
+def _validate_type(value: Any, expected: str) -> Optional[str]:
+    checker, short = _resolve_type_check(expected)
     if checker and not checker(value):
-        short = expected if expected.startswith("xsd:") else xsd_type
         return f"Expected {short}, got {type(value).__name__}: {value}"
     return None
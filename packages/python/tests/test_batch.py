@@ -1,8 +1,13 @@
 """Tests for batch API (GAP-API1)."""
 
 import pytest
-from jsonld_ex.batch import annotate_batch, validate_batch, filter_by_confidence_batch
-from jsonld_ex.validation import ValidationResult
+from jsonld_ex.batch import (
+    annotate_batch,
+    validate_batch,
+    iter_validate_batch,
+    filter_by_confidence_batch,
+)
+from jsonld_ex.validation import ValidationResult, compile_shape, validate_node
 
 
 # -- annotate_batch -----------------------------------------------------------
@@ -122,6 +127,90 @@ class TestValidateBatch:
         assert len(results) == 10_000
         assert all(r.valid for r in results)
 
+    def test_matches_validate_node(self):
+        shape = {
+            "@type": "Person",
+            "name": {"@required": True, "@pattern": "^[A-Z]"},
+            "age": {"@minimum": 0, "@severity": "warning"},
+        }
+        nodes = [
+            {"@type": "Person", "name": "Alice", "age": 3},
+            {"@type": "Person", "name": "bob", "age": -1},
+            {"@type": "Robot"},
+        ]
+        assert validate_batch(nodes, shape) == [validate_node(n, shape) for n in nodes]
+
+    def test_accepts_compiled_shape(self):
+        compiled = compile_shape({"@type": "Person", "name": {"@required": True}})
+        results = validate_batch([{"@type": "Person"}], compiled)
+        assert not results[0].valid
+
+    def test_shape_registry(self):
+        registry = {"Base": {"name": {"@required": True}}}
+        shape = {"@type": "Person", "@extends": "Base"}
+        results = validate_batch([{"@type": "Person"}], shape, shape_registry=registry)
+        assert results[0].errors[0].constraint == "required"
+
+
+class TestParallelValidateBatch:
+    """Chunked and process-pool validation match the serial path."""
+
+    SHAPE = {
+        "@type": "Thing",
+        "val": {"@type": "xsd:integer", "@minimum": 0},
+        "name": {"@pattern": "^n", "@severity": "warning"},
+    }
+
+    def _nodes(self, n):
+        return [
+            {"@type": "Thing", "val": i % 5 - 1, "name": "n" if i % 3 else "x"}
+            for i in range(n)
+        ]
+
+    def test_process_pool_matches_serial(self):
+        nodes = self._nodes(250)
+        expected = validate_batch(nodes, self.SHAPE)
+        assert validate_batch(nodes, self.SHAPE, max_workers=2, chunk_size=16) == expected
+
+    def test_process_pool_with_compiled_shape_and_registry(self):
+        registry = {"Base": {"val": {"@required": True}}}
+        shape = compile_shape({"@type": "Thing", "@extends": "Base"}, registry)
+        nodes = [{"@type": "Thing"}, {"@type": "Thing", "val": 1}]
+        results = validate_batch(nodes, shape, max_workers=2, chunk_size=1)
+        assert [r.valid for r in results] == [False, True]
+
+    def test_streaming_preserves_order(self):
+        nodes = self._nodes(100)
+        expected = validate_batch(nodes, self.SHAPE)
+        stream = iter_validate_batch(
+            (n for n in nodes), self.SHAPE, max_workers=2, chunk_size=7,
+        )
+        assert list(stream) == expected
+
+    def test_streaming_serial_is_lazy(self):
+        consumed = []
+
+        def source():
+            for node in self._nodes(10):
+                consumed.append(node)
+                yield node
+
+        stream = iter_validate_batch(source(), self.SHAPE)
+        next(stream)
+        assert len(consumed) == 1
+
+    def test_streaming_early_close(self):
+        stream = iter_validate_batch(self._nodes(200), self.SHAPE, max_workers=2, chunk_size=5)
+        assert next(stream).valid is False
+        stream.close()
+
+    def test_empty_input(self):
+        assert validate_batch([], self.SHAPE, max_workers=2) == []
+
+    def test_invalid_chunk_size(self):
+        with pytest.raises(ValueError, match="chunk_size"):
+            list(iter_validate_batch([], self.SHAPE, chunk_size=0))
+
 
 # -- filter_by_confidence_batch -----------------------------------------------
 
@@ -14,6 +14,8 @@ The projected probability is: P(ω) = b + a·u
 """
 
 import math
+import sys
+
 import pytest
 
 from jsonld_ex.confidence_algebra import Opinion
@@ -419,3 +421,45 @@ class TestFloatBoundaryClamping:
         assert result.disbelief < 1e-15
         assert abs(result.uncertainty - 1.0) < 1e-15
         assert abs(result.belief + result.disbelief + result.uncertainty - 1.0) < 1e-9
+
+
+class TestOpinionRepresentation:
+    """Slots, pickling and the intern cache."""
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10")
+    def test_slotted(self):
+        o = Opinion(belief=0.5, disbelief=0.3, uncertainty=0.2)
+        assert not hasattr(o, "__dict__")
+        with pytest.raises(AttributeError):
+            o.belief = 0.1
+
+    def test_pickle_and_deepcopy_roundtrip(self):
+        import copy
+        import pickle
+
+        o = Opinion(belief=0.5, disbelief=0.3, uncertainty=0.2, base_rate=0.4)
+        assert pickle.loads(pickle.dumps(o)) == o
+        assert copy.deepcopy(o) == o
+        assert copy.copy(o) == o
+
+    def test_intern_returns_shared_instance(self):
+        from jsonld_ex.confidence_algebra import intern_opinion
+
+        a = intern_opinion(Opinion(belief=0.25, disbelief=0.25, uncertainty=0.5, base_rate=0.125))
+        b = intern_opinion(Opinion(belief=0.25, disbelief=0.25, uncertainty=0.5, base_rate=0.125))
+        assert a is b
+
+    def test_intern_rejects_non_opinion(self):
+        from jsonld_ex.confidence_algebra import intern_opinion
+
+        with pytest.raises(TypeError):
+            intern_opinion((0.5, 0.5, 0.0, 0.5))
+
+    def test_operators_intern_vacuous_results(self):
+        from jsonld_ex.confidence_algebra import trust_discount
+
+        distrust = Opinion(belief=0.0, disbelief=1.0, uncertainty=0.0)
+        x = trust_discount(distrust, Opinion(belief=0.7, disbelief=0.1, uncertainty=0.2))
+        y = trust_discount(distrust, Opinion(belief=0.1, disbelief=0.6, uncertainty=0.3))
+        assert x == Opinion(belief=0.0, disbelief=0.0, uncertainty=1.0)
+        assert x is y
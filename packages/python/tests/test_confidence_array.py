@@ -0,0 +1,290 @@
+"""Tests for columnar opinion arrays (confidence_array.py).
+
+OpinionArray must agree with the scalar operators in confidence_algebra:
+bitwise on the pure-Python ``array`` backend, within floating-point
+tolerance on the NumPy backend.  Every test runs against both backends;
+the NumPy half is skipped when NumPy is not installed.
+"""
+
+import math
+import random
+
+import pytest
+
+from jsonld_ex.confidence_algebra import (
+    Opinion,
+    averaging_fuse,
+    conflict_metric,
+    cumulative_fuse,
+    deduce,
+    pairwise_conflict,
+    trust_discount,
+)
+from jsonld_ex.confidence_array import OpinionArray
+
+
+try:
+    import numpy  # noqa: F401
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+BACKENDS = [
+    "array",
+    pytest.param(
+        "numpy", marks=pytest.mark.skipif(not _HAS_NUMPY, reason="numpy not installed"),
+    ),
+]
+
+_TOL = 1e-12
+
+
+def _random_opinions(n: int, seed: int = 42, dogmatic_every: int = 0) -> list[Opinion]:
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        if dogmatic_every and i % dogmatic_every == 0:
+            b = rng.random()
+            out.append(Opinion(b, 1.0 - b, 0.0, rng.random()))
+            continue
+        raw = [rng.random() for _ in range(3)]
+        total = sum(raw)
+        out.append(Opinion(raw[0] / total, raw[1] / total, raw[2] / total, rng.random()))
+    return out
+
+
+def _assert_same(actual: Opinion, expected: Opinion, backend: str) -> None:
+    if backend == "array":
+        assert actual == expected
+    else:
+        assert actual.belief == pytest.approx(expected.belief, abs=_TOL)
+        assert actual.disbelief == pytest.approx(expected.disbelief, abs=_TOL)
+        assert actual.uncertainty == pytest.approx(expected.uncertainty, abs=_TOL)
+        assert actual.base_rate == pytest.approx(expected.base_rate, abs=_TOL)
+
+
+def _assert_all_same(actual: list[Opinion], expected: list[Opinion], backend: str) -> None:
+    assert len(actual) == len(expected)
+    for x, y in zip(actual, expected):
+        _assert_same(x, y, backend)
+
+
+# -------------------------------------------------------------------
+# Construction, validation, conversion
+# -------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+class TestConstruction:
+
+    def test_roundtrip_is_lossless(self, backend):
+        ops = _random_opinions(50)
+        arr = OpinionArray.from_opinions(ops, backend=backend)
+        assert arr.backend == backend
+        assert len(arr) == 50
+        assert arr.to_opinions() == ops
+
+    def test_columns_constructor(self, backend):
+        arr = OpinionArray([0.7, 0.0], [0.1, 1.0], [0.2, 0.0], backend=backend)
+        assert arr[0] == Opinion(0.7, 0.1, 0.2)
+        assert arr[1] == Opinion(0.0, 1.0, 0.0)
+        assert list(arr.base_rate) == [0.5, 0.5]
+
+    def test_base_rate_column(self, backend):
+        arr = OpinionArray([1.0, 0.0], [0.0, 0.0], [0.0, 1.0], [0.2, 0.9], backend=backend)
+        assert arr[1].base_rate == 0.9
+
+    def test_accepts_generators(self, backend):
+        arr = OpinionArray(
+            (x for x in [0.5]), (x for x in [0.5]), (x for x in [0.0]), backend=backend,
+        )
+        assert arr[0] == Opinion(0.5, 0.5, 0.0)
+
+    def test_integers_accepted(self, backend):
+        arr = OpinionArray([1, 0], [0, 0], [0, 1], backend=backend)
+        assert arr.to_opinions() == [Opinion(1.0, 0.0, 0.0), Opinion(0.0, 0.0, 1.0)]
+
+    def test_boundary_overshoot_clamped(self, backend):
+        arr = OpinionArray([1.0 + 1e-13], [0.0], [-1e-13], backend=backend)
+        assert arr[0].belief == 1.0
+        assert arr[0].uncertainty == 0.0
+
+    def test_out_of_range_rejected_with_index(self, backend):
+        with pytest.raises(ValueError, match=r"disbelief\[1\]"):
+            OpinionArray([0.5, 0.5], [0.5, 1.5], [0.0, 0.0], backend=backend)
+
+    def test_nan_rejected(self, backend):
+        with pytest.raises(ValueError, match="finite"):
+            OpinionArray([math.nan], [0.5], [0.5], backend=backend)
+
+    def test_bool_rejected(self, backend):
+        with pytest.raises(TypeError, match="bool"):
+            OpinionArray([True], [0.0], [0.0], backend=backend)
+
+    def test_additivity_rejected_with_index(self, backend):
+        with pytest.raises(ValueError, match="index 2"):
+            OpinionArray([0.5, 0.5, 0.5], [0.5, 0.5, 0.4], [0.0, 0.0, 0.0], backend=backend)
+
+    def test_length_mismatch_rejected(self, backend):
+        with pytest.raises(ValueError, match="same length"):
+            OpinionArray([0.5, 0.5], [0.5], [0.0, 0.0], backend=backend)
+
+    def test_from_opinions_rejects_non_opinion(self, backend):
+        with pytest.raises(TypeError, match=r"opinions\[1\]"):
+            OpinionArray.from_opinions([Opinion(1, 0, 0), 0.5], backend=backend)
+
+    def test_empty(self, backend):
+        arr = OpinionArray.from_opinions([], backend=backend)
+        assert len(arr) == 0
+        assert arr.to_opinions() == []
+
+    def test_slice_and_negative_index(self, backend):
+        ops = _random_opinions(10)
+        arr = OpinionArray.from_opinions(ops, backend=backend)
+        assert arr[2:5].to_opinions() == ops[2:5]
+        assert arr[-1] == ops[-1]
+        assert list(arr) == ops
+
+    def test_to_backend_preserves_values(self, backend):
+        ops = _random_opinions(10)
+        arr = OpinionArray.from_opinions(ops, backend=backend)
+        assert arr.to_backend("array").to_opinions() == ops
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError, match="backend"):
+        OpinionArray([1.0], [0.0], [0.0], backend="cupy")
+
+
+@pytest.mark.skipif(not _HAS_NUMPY, reason="numpy not installed")
+def test_default_backend_is_numpy_when_installed():
+    assert OpinionArray([1.0], [0.0], [0.0]).backend == "numpy"
+
+
+# -------------------------------------------------------------------
+# Element-wise operators vs scalar algebra
+# -------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+class TestElementwise:
+
+    def _pair(self, backend, n=40):
+        xs = _random_opinions(n, seed=1, dogmatic_every=7)
+        ys = _random_opinions(n, seed=2, dogmatic_every=5)
+        return (
+            xs, ys,
+            OpinionArray.from_opinions(xs, backend=backend),
+            OpinionArray.from_opinions(ys, backend=backend),
+        )
+
+    def test_cumulative_fuse(self, backend):
+        xs, ys, ax, ay = self._pair(backend)
+        expected = [cumulative_fuse(x, y) for x, y in zip(xs, ys)]
+        _assert_all_same(ax.cumulative_fuse(ay).to_opinions(), expected, backend)
+
+    def test_averaging_fuse(self, backend):
+        xs, ys, ax, ay = self._pair(backend)
+        expected = [averaging_fuse(x, y) for x, y in zip(xs, ys)]
+        _assert_all_same(ax.averaging_fuse(ay).to_opinions(), expected, backend)
+
+    def test_trust_discount(self, backend):
+        xs, ys, ax, ay = self._pair(backend)
+        expected = [trust_discount(x, y) for x, y in zip(xs, ys)]
+        _assert_all_same(ax.trust_discount(ay).to_opinions(), expected, backend)
+
+    def test_deduce(self, backend):
+        xs, ys, ax, ay = self._pair(backend)
+        zs = _random_opinions(40, seed=3)
+        az = OpinionArray.from_opinions(zs, backend=backend)
+        expected = [deduce(x, y, z) for x, y, z in zip(xs, ys, zs)]
+        _assert_all_same(ax.deduce(ay, az).to_opinions(), expected, backend)
+
+    def test_pairwise_conflict(self, backend):
+        xs, ys, ax, ay = self._pair(backend)
+        got = list(ax.pairwise_conflict(ay))
+        for g, x, y in zip(got, xs, ys):
+            assert g == pytest.approx(pairwise_conflict(x, y), abs=_TOL)
+
+    def test_conflict_metric_and_projection(self, backend):
+        xs, _, ax, _ = self._pair(backend)
+        for g, x in zip(ax.conflict_metric(), xs):
+            assert g == pytest.approx(conflict_metric(x), abs=_TOL)
+        for g, x in zip(ax.projected_probability(), xs):
+            assert g == pytest.approx(x.projected_probability(), abs=_TOL)
+
+    def test_broadcast_single_opinion(self, backend):
+        xs = _random_opinions(20)
+        trust = Opinion(0.8, 0.1, 0.1)
+        arr = OpinionArray.from_opinions(xs, backend=backend)
+        expected = [trust_discount(x, trust) for x in xs]
+        _assert_all_same(arr.trust_discount(trust).to_opinions(), expected, backend)
+        expected = [cumulative_fuse(x, trust) for x in xs]
+        _assert_all_same(arr.cumulative_fuse(trust).to_opinions(), expected, backend)
+
+    def test_mixed_backends(self, backend):
+        xs, ys, ax, _ = self._pair(backend)
+        ay = OpinionArray.from_opinions(ys, backend="array")
+        result = ax.cumulative_fuse(ay)
+        assert result.backend == backend
+
+    def test_length_mismatch(self, backend):
+        _, _, ax, ay = self._pair(backend)
+        with pytest.raises(ValueError, match="length"):
+            ax.cumulative_fuse(ay[:3])
+
+    def test_wrong_operand_type(self, backend):
+        _, _, ax, _ = self._pair(backend)
+        with pytest.raises(TypeError, match="OpinionArray"):
+            ax.averaging_fuse([0.5])
+
+    def test_inputs_not_mutated(self, backend):
+        xs, ys, ax, ay = self._pair(backend)
+        ax.cumulative_fuse(ay)
+        ax.deduce(ay, ay)
+        assert ax.to_opinions() == xs
+        assert ay.to_opinions() == ys
+
+
+# -------------------------------------------------------------------
+# Reductions vs scalar n-ary operators
+# -------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+class TestReductions:
+
+    @pytest.mark.parametrize("n", [1, 2, 3, 10, 200])
+    def test_cumulative_reduce(self, backend, n):
+        ops = _random_opinions(n)
+        arr = OpinionArray.from_opinions(ops, backend=backend)
+        _assert_same(arr.cumulative_reduce(), cumulative_fuse(*ops), backend)
+
+    @pytest.mark.parametrize("dogmatic_count", [1, 2, 3])
+    def test_cumulative_reduce_with_dogmatic(self, backend, dogmatic_count):
+        ops = _random_opinions(8)
+        for i in range(dogmatic_count):
+            ops[2 * i] = Opinion(0.3 + 0.1 * i, 0.7 - 0.1 * i, 0.0)
+        arr = OpinionArray.from_opinions(ops, backend=backend)
+        _assert_same(arr.cumulative_reduce(), cumulative_fuse(*ops), backend)
+
+    @pytest.mark.parametrize("n", [1, 2, 3, 10, 200])
+    def test_averaging_reduce(self, backend, n):
+        ops = _random_opinions(n)
+        arr = OpinionArray.from_opinions(ops, backend=backend)
+        _assert_same(arr.averaging_reduce(), averaging_fuse(*ops), backend)
+
+    @pytest.mark.parametrize("dogmatic_count", [1, 2, 3])
+    def test_averaging_reduce_with_dogmatic(self, backend, dogmatic_count):
+        ops = _random_opinions(6)
+        for i in range(dogmatic_count):
+            ops[i] = Opinion(0.3 + 0.1 * i, 0.7 - 0.1 * i, 0.0)
+        arr = OpinionArray.from_opinions(ops, backend=backend)
+        _assert_same(arr.averaging_reduce(), averaging_fuse(*ops), backend)
+
+    def test_empty_reductions_rejected(self, backend):
+        arr = OpinionArray.from_opinions([], backend=backend)
+        with pytest.raises(ValueError):
+            arr.cumulative_reduce()
+        with pytest.raises(ValueError):
+            arr.averaging_reduce()
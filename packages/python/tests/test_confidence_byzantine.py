@@ -686,3 +686,349 @@ class TestByzantineFuseEdgeCases:
         report = byzantine_fuse(opinions)
         assert len(report.conflict_matrix) == 3  # original count
         assert len(report.conflict_matrix[0]) == 3
+
+
+# -------------------------------------------------------------------
+# Incremental discord engine: equivalence with the from-scratch loop
+# -------------------------------------------------------------------
+
+
+def _reference_byzantine_fuse(opinions, cfg):
+    """The original O(n^2)-per-removal loop, kept as an oracle."""
+    from jsonld_ex.confidence_byzantine import (
+        _STRATEGY_PICKERS,
+        _compute_discord_scores,
+    )
+
+    max_removals = cfg.max_removals
+    if max_removals is None:
+        max_removals = len(opinions) // 2
+    picker = _STRATEGY_PICKERS[cfg.strategy]
+    indexed = list(enumerate(opinions))
+    removed = []
+    for _ in range(max_removals):
+        if len(indexed) <= cfg.min_agents:
+            break
+        discord = _compute_discord_scores(indexed)
+        local_idx, score, reason = picker(indexed, discord, cfg.trust_weights)
+        if discord[local_idx] < cfg.threshold:
+            break
+        orig_idx, orig_opinion = indexed.pop(local_idx)
+        removed.append(AgentRemoval(orig_idx, orig_opinion, score, reason))
+    surviving = [op for _, op in indexed]
+    return ByzantineFusionReport(
+        fused=cumulative_fuse(*surviving),
+        removed=removed,
+        conflict_matrix=build_conflict_matrix(opinions),
+        cohesion_score=cohesion_score(surviving) if len(surviving) > 1 else 1.0,
+        surviving_indices=[idx for idx, _ in indexed],
+    )
+
+
+def _mixed_population(n, seed):
+    import random
+
+    rng = random.Random(seed)
+    ops = []
+    for i in range(n):
+        if i % 4 == 0:
+            # Rogue: mostly disbelief
+            b = rng.uniform(0.0, 0.2)
+            d = rng.uniform(0.6, 1.0 - b)
+        else:
+            b = rng.uniform(0.5, 0.9)
+            d = rng.uniform(0.0, 1.0 - b)
+        ops.append(Opinion(belief=b, disbelief=d, uncertainty=1.0 - b - d))
+    return ops
+
+
+class TestIncrementalDiscordEquivalence:
+    """byzantine_fuse must produce exactly the reference report."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    @pytest.mark.parametrize("strategy", ["most_conflicting", "least_trusted", "combined"])
+    def test_matches_reference(self, seed, strategy):
+        import random
+
+        ops = _mixed_population(40, seed)
+        rng = random.Random(seed + 100)
+        trust = [round(rng.random(), 1) for _ in ops]  # coarse -> trust ties
+        cfg = ByzantineConfig(
+            strategy=strategy,
+            trust_weights=trust if strategy != "most_conflicting" else None,
+            threshold=0.05,
+        )
+        assert byzantine_fuse(ops, cfg) == _reference_byzantine_fuse(ops, cfg)
+
+    def test_exact_ties_resolved_like_reference(self):
+        """Duplicated opinions create exact discord ties."""
+        a = Opinion(belief=0.45, disbelief=0.45, uncertainty=0.1)
+        b = Opinion(belief=0.8, disbelief=0.1, uncertainty=0.1)
+        ops = [a, b, a, b, a, a, b]
+        cfg = ByzantineConfig(threshold=0.0)
+        assert byzantine_fuse(ops, cfg) == _reference_byzantine_fuse(ops, cfg)
+
+    def test_min_agents_and_max_removals(self):
+        ops = _mixed_population(30, 7)
+        cfg = ByzantineConfig(threshold=0.0, max_removals=20, min_agents=5)
+        report = byzantine_fuse(ops, cfg)
+        assert report == _reference_byzantine_fuse(ops, cfg)
+        assert len(report.surviving_indices) == 10
+
+
+# -------------------------------------------------------------------
+# Tiled / vectorized conflict and distance matrices
+# -------------------------------------------------------------------
+
+try:
+    import numpy  # noqa: F401
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+from jsonld_ex.confidence_array import OpinionArray
+from jsonld_ex.confidence_byzantine import (
+    conflict_matrix_array,
+    distance_matrix_array,
+    euclidean_opinion_distance,
+    hellinger_opinion_distance,
+    jsd_opinion_distance,
+    manhattan_opinion_distance,
+)
+
+_BUILTIN_METRICS = [
+    euclidean_opinion_distance,
+    manhattan_opinion_distance,
+    jsd_opinion_distance,
+    hellinger_opinion_distance,
+]
+
+
+def _scalar_conflict_matrix(ops):
+    from jsonld_ex.confidence_algebra import pairwise_conflict
+
+    n = len(ops)
+    return [
+        [0.0 if i == j else pairwise_conflict(ops[i], ops[j]) for j in range(n)]
+        for i in range(n)
+    ]
+
+
+def _scalar_cohesion(ops, fn):
+    n = len(ops)
+    total = sum(fn(ops[i], ops[j]) for i in range(n) for j in range(i + 1, n))
+    return 1.0 - total / (n * (n - 1) / 2)
+
+
+def _boundary_population(n, seed):
+    """Mixed population including vertices and zero components."""
+    ops = _mixed_population(n, seed)
+    ops[1] = Opinion(belief=1.0, disbelief=0.0, uncertainty=0.0)
+    ops[2] = Opinion(belief=0.0, disbelief=0.0, uncertainty=1.0)
+    ops[3] = Opinion(belief=0.0, disbelief=0.6, uncertainty=0.4)
+    return ops
+
+
+def _manhattan_squared(a, b):
+    """Custom (non-builtin) metric; module-level so it pickles."""
+    return manhattan_opinion_distance(a, b) ** 2
+
+
+@pytest.mark.skipif(not _HAS_NUMPY, reason="numpy not installed")
+class TestTiledMatrices:
+
+    @pytest.mark.parametrize("block_size", [1, 7, 64, 512])
+    def test_conflict_matrix_is_bitwise_identical(self, block_size):
+        ops = _boundary_population(50, 3)
+        got = conflict_matrix_array(ops, block_size=block_size)
+        assert got.tolist() == _scalar_conflict_matrix(ops)
+
+    def test_build_conflict_matrix_vectorized_path(self):
+        ops = _boundary_population(80, 4)
+        assert build_conflict_matrix(ops, block_size=16) == _scalar_conflict_matrix(ops)
+
+    def test_accepts_opinion_array(self):
+        ops = _boundary_population(40, 5)
+        arr = OpinionArray.from_opinions(ops)
+        assert conflict_matrix_array(arr).tolist() == _scalar_conflict_matrix(ops)
+        assert distance_matrix_array(arr) == pytest.approx(
+            distance_matrix_array(ops), abs=1e-12,
+        )
+
+    @pytest.mark.parametrize("fn", _BUILTIN_METRICS + [_manhattan_squared])
+    def test_distance_matrix_matches_scalar(self, fn):
+        ops = _boundary_population(45, 6)
+        got = distance_matrix_array(ops, fn, block_size=10)
+        for i, a in enumerate(ops):
+            for j, b in enumerate(ops):
+                expected = 0.0 if i == j else fn(a, b)
+                assert got[i, j] == pytest.approx(expected, abs=1e-12)
+
+    @pytest.mark.parametrize("fn", _BUILTIN_METRICS + [_manhattan_squared])
+    def test_cohesion_matches_scalar(self, fn):
+        ops = _boundary_population(70, 7)
+        got = cohesion_score(ops, distance_fn=fn, block_size=16)
+        assert got == pytest.approx(_scalar_cohesion(ops, fn), abs=1e-12)
+
+    def test_process_pool(self):
+        ops = _boundary_population(60, 8)
+        assert conflict_matrix_array(ops, block_size=20, max_workers=2).tolist() == (
+            _scalar_conflict_matrix(ops)
+        )
+        serial = cohesion_score(ops, distance_fn=jsd_opinion_distance, block_size=20)
+        pooled = cohesion_score(
+            ops, distance_fn=jsd_opinion_distance, block_size=20, max_workers=2,
+        )
+        assert pooled == serial
+        custom = cohesion_score(
+            ops, distance_fn=_manhattan_squared, block_size=20, max_workers=2,
+        )
+        assert custom == pytest.approx(_scalar_cohesion(ops, _manhattan_squared), abs=1e-12)
+
+    def test_empty_rejected(self):
+        with pytest.raises(ValueError):
+            conflict_matrix_array([])
+        with pytest.raises(ValueError):
+            distance_matrix_array([])
+
+    def test_invalid_block_size(self):
+        with pytest.raises(ValueError, match="block_size"):
+            conflict_matrix_array(_mixed_population(4, 0), block_size=0)
+
+
+# -------------------------------------------------------------------
+# StreamingByzantineFuser
+# -------------------------------------------------------------------
+
+from jsonld_ex.confidence_byzantine import StreamingByzantineFuser
+
+
+def _close(a, b, tol=1e-9):
+    assert a.belief == pytest.approx(b.belief, abs=tol)
+    assert a.disbelief == pytest.approx(b.disbelief, abs=tol)
+    assert a.uncertainty == pytest.approx(b.uncertainty, abs=tol)
+
+
+class TestStreamingByzantineFuser:
+
+    def test_no_eviction_matches_batch_fusion(self):
+        ops = _mixed_population(30, 1)
+        fuser = StreamingByzantineFuser(ByzantineConfig(threshold=1.0), window=100)
+        for op in ops:
+            assert fuser.add(op) == []
+        _close(fuser.fused, cumulative_fuse(*ops))
+        assert fuser.fused.base_rate == pytest.approx(0.5)
+        assert fuser.size == 30
+
+    def test_discord_matches_pairwise_mean(self):
+        from jsonld_ex.confidence_algebra import pairwise_conflict
+
+        ops = _mixed_population(12, 2)
+        fuser = StreamingByzantineFuser(ByzantineConfig(threshold=1.0))
+        fuser.extend(ops)
+        for seq, op in fuser.agents:
+            expected = sum(
+                pairwise_conflict(op, other) for s, other in fuser.agents if s != seq
+            ) / 11
+            assert fuser.discord(seq) == pytest.approx(expected, abs=1e-12)
+
+    def test_window_bounds_memory_and_expires_oldest(self):
+        ops = _mixed_population(50, 3)
+        fuser = StreamingByzantineFuser(ByzantineConfig(threshold=1.0), window=10)
+        for op in ops:
+            fuser.add(op)
+        assert fuser.size == 10
+        assert fuser.expired_count == 40
+        assert [seq for seq, _ in fuser.agents] == list(range(40, 50))
+        _close(fuser.fused, cumulative_fuse(*ops[40:]))
+        assert len(fuser._heap) <= 2 * 10 + 16 + 10
+
+    def test_evicts_rogue_like_byzantine_fuse(self):
+        honest = [Opinion(belief=0.8, disbelief=0.05, uncertainty=0.15)] * 6
+        rogue = Opinion(belief=0.05, disbelief=0.85, uncertainty=0.1)
+        fuser = StreamingByzantineFuser(window=20)
+        fuser.extend(honest)
+        removed = fuser.add(rogue)
+        assert [r.index for r in removed] == [6]
+        assert removed[0].opinion == rogue
+        assert fuser.evicted_count == 1
+        _close(fuser.fused, cumulative_fuse(*honest))
+
+    def test_micro_batch_matches_batch_removals(self):
+        ops = _mixed_population(40, 4)
+        cfg = ByzantineConfig(threshold=0.2)
+        fuser = StreamingByzantineFuser(cfg, window=100)
+        streamed = fuser.extend(ops)
+        batch = byzantine_fuse(ops, cfg)
+        assert [r.index for r in streamed] == [r.index for r in batch.removed]
+        assert [s for s, _ in fuser.agents] == batch.surviving_indices
+        _close(fuser.fused, batch.fused)
+
+    @pytest.mark.parametrize("strategy", ["least_trusted", "combined"])
+    def test_trust_strategies_match_batch(self, strategy):
+        ops = _mixed_population(24, 5)
+        trust = [0.9 if i % 4 else 0.2 for i in range(24)]
+        batch = byzantine_fuse(
+            ops, ByzantineConfig(strategy=strategy, trust_weights=trust, threshold=0.2),
+        )
+        fuser = StreamingByzantineFuser(
+            ByzantineConfig(strategy=strategy, threshold=0.2), window=50,
+        )
+        streamed = fuser.extend(ops, trusts=trust)
+        assert [r.index for r in streamed] == [r.index for r in batch.removed]
+
+    def test_trust_required(self):
+        fuser = StreamingByzantineFuser(ByzantineConfig(strategy="combined"))
+        with pytest.raises(ValueError, match="trust"):
+            fuser.add(Opinion(0.5, 0.2, 0.3))
+        with pytest.raises(ValueError, match="trust"):
+            fuser.extend([Opinion(0.5, 0.2, 0.3)])
+
+    def test_long_stream_stays_consistent(self):
+        import random
+
+        rng = random.Random(9)
+        fuser = StreamingByzantineFuser(ByzantineConfig(threshold=0.3), window=25)
+        for i in range(2000):
+            if i % 10 == 0:
+                fuser.add(Opinion(belief=0.02, disbelief=0.9, uncertainty=0.08))
+            else:
+                b = rng.uniform(0.6, 0.9)
+                fuser.add(Opinion(belief=b, disbelief=0.0, uncertainty=1.0 - b))
+        window = [op for _, op in fuser.agents]
+        _close(fuser.fused, cumulative_fuse(*window))
+        assert all(op.disbelief == 0.0 for op in window)
+        assert fuser.evicted_count == 200
+        # Brute-force check that no survivor crosses the threshold
+        assert max(fuser.discord(s) for s, _ in fuser.agents) < 0.3
+
+    def test_cohesion_is_rms_lower_bound(self):
+        ops = _mixed_population(20, 6)
+        fuser = StreamingByzantineFuser(ByzantineConfig(threshold=1.0))
+        fuser.extend(ops)
+        exact = fuser.exact_cohesion()
+        assert exact == pytest.approx(cohesion_score(ops))
+        assert fuser.cohesion <= exact + 1e-12
+        same = StreamingByzantineFuser()
+        same.extend([Opinion(0.6, 0.1, 0.3)] * 5)
+        assert same.cohesion == pytest.approx(1.0)
+
+    def test_dogmatic_agents(self):
+        fuser = StreamingByzantineFuser(ByzantineConfig(threshold=1.0))
+        fuser.add(Opinion(0.5, 0.2, 0.3))
+        fuser.add(Opinion(0.7, 0.3, 0.0))
+        assert fuser.fused == cumulative_fuse(Opinion(0.5, 0.2, 0.3), Opinion(0.7, 0.3, 0.0))
+        fuser.add(Opinion(0.9, 0.1, 0.0))
+        assert fuser.fused.uncertainty == 0.0
+        assert fuser.fused.belief == pytest.approx(0.8)
+
+    def test_empty_and_invalid(self):
+        fuser = StreamingByzantineFuser()
+        assert fuser.fused is None
+        assert fuser.cohesion == 1.0
+        with pytest.raises(ValueError, match="window"):
+            StreamingByzantineFuser(window=1)
+        with pytest.raises(ValueError, match="trust_weights"):
+            StreamingByzantineFuser(ByzantineConfig(trust_weights=[0.5]))
+        with pytest.raises(TypeError):
+            fuser.add(0.5)
@@ -23,8 +23,10 @@ import math
 import pytest
 
 from jsonld_ex.confidence_algebra import Opinion
+from jsonld_ex.confidence_array import OpinionArray
 from jsonld_ex.confidence_decay import (
     decay_opinion,
+    decay_opinions_batch,
     exponential_decay,
     linear_decay,
     step_decay,
@@ -367,3 +369,109 @@ class TestDecayWithFusion:
 
         fused = cumulative_fuse(a_decayed, b_decayed)
         assert fused.belief + fused.disbelief + fused.uncertainty == pytest.approx(1.0)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Batch decay
+# ═══════════════════════════════════════════════════════════════════
+
+try:
+    import numpy  # noqa: F401
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+BACKENDS = [
+    "array",
+    pytest.param(
+        "numpy", marks=pytest.mark.skipif(not _HAS_NUMPY, reason="numpy not installed"),
+    ),
+]
+
+
+def _batch_inputs(n=60):
+    import random
+
+    rng = random.Random(5)
+    ops, ages = [], []
+    for i in range(n):
+        b = rng.random()
+        d = rng.uniform(0.0, 1.0 - b)
+        ops.append(Opinion(b, d, 1.0 - b - d, rng.random()))
+        ages.append(0.0 if i == 0 else rng.uniform(0.0, 50.0))
+    return ops, ages
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+class TestDecayOpinionsBatch:
+
+    @pytest.mark.parametrize("fn", [None, exponential_decay, linear_decay, step_decay])
+    def test_matches_scalar_decay(self, backend, fn):
+        ops, ages = _batch_inputs()
+        got = decay_opinions_batch(ops, ages, half_life=10.0, decay_fn=fn, backend=backend)
+        assert isinstance(got, OpinionArray)
+        assert got.backend == backend
+        expected = [decay_opinion(o, t, 10.0, decay_fn=fn) for o, t in zip(ops, ages)]
+        for g, e in zip(got.to_opinions(), expected):
+            if backend == "array":
+                assert g == e
+            else:
+                assert g.belief == pytest.approx(e.belief, abs=1e-12)
+                assert g.disbelief == pytest.approx(e.disbelief, abs=1e-12)
+                assert g.uncertainty == pytest.approx(e.uncertainty, abs=1e-12)
+                assert g.base_rate == e.base_rate
+
+    def test_custom_decay_fn(self, backend):
+        ops, ages = _batch_inputs(10)
+
+        def halve(elapsed, half_life):
+            return 0.5
+
+        got = decay_opinions_batch(ops, ages, half_life=1.0, decay_fn=halve, backend=backend)
+        for g, o in zip(got, ops):
+            assert g.belief == pytest.approx(o.belief / 2)
+
+    def test_scalar_elapsed_broadcasts(self, backend):
+        ops, _ = _batch_inputs(5)
+        got = decay_opinions_batch(ops, 10.0, half_life=10.0, backend=backend)
+        for g, o in zip(got, ops):
+            assert g.belief == pytest.approx(o.belief / 2, abs=1e-12)
+
+    def test_epoch_timestamps(self, backend):
+        ops, _ = _batch_inputs(3)
+        got = decay_opinions_batch(
+            ops, timestamps=[1000.0, 900.0, 800.0], reference_time=1000.0,
+            half_life=100.0, backend=backend,
+        )
+        factors = [g.belief / o.belief for g, o in zip(got, ops)]
+        assert factors == pytest.approx([1.0, 0.5, 0.25])
+
+    def test_accepts_opinion_array(self, backend):
+        ops, ages = _batch_inputs(8)
+        arr = OpinionArray.from_opinions(ops, backend=backend)
+        got = decay_opinions_batch(arr, ages, half_life=10.0)
+        assert got.backend == backend
+        assert len(got) == 8
+
+    def test_negative_elapsed_rejected_with_index(self, backend):
+        ops, _ = _batch_inputs(3)
+        with pytest.raises(ValueError, match="index 2"):
+            decay_opinions_batch(ops, [1.0, 2.0, -1.0], half_life=10.0, backend=backend)
+
+    def test_bad_factor_rejected(self, backend):
+        ops, ages = _batch_inputs(3)
+        with pytest.raises(ValueError, match="decay factor"):
+            decay_opinions_batch(
+                ops, ages, half_life=10.0, decay_fn=lambda t, h: 1.5, backend=backend,
+            )
+
+    def test_argument_errors(self, backend):
+        ops, ages = _batch_inputs(3)
+        with pytest.raises(ValueError, match="half_life"):
+            decay_opinions_batch(ops, ages, half_life=0.0, backend=backend)
+        with pytest.raises(ValueError, match="exactly one"):
+            decay_opinions_batch(ops, half_life=1.0, backend=backend)
+        with pytest.raises(ValueError, match="exactly one"):
+            decay_opinions_batch(ops, ages, timestamps=ages, half_life=1.0, backend=backend)
+        with pytest.raises(ValueError, match="Expected 3"):
+            decay_opinions_batch(ops, [1.0], half_life=1.0, backend=backend)
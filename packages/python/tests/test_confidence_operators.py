@@ -20,9 +20,18 @@ Algebraic properties tested:
 """
 
 import math
+import random
+
 import pytest
 
-from jsonld_ex.confidence_algebra import Opinion, cumulative_fuse, averaging_fuse, trust_discount
+from jsonld_ex.confidence_algebra import (
+    Opinion,
+    cumulative_fuse,
+    cumulative_fuse_tree,
+    averaging_fuse,
+    trust_discount,
+    _cumulative_fuse_pair,
+)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -219,6 +228,89 @@ class TestCumulativeFuseMultiple:
             cumulative_fuse()
 
 
+def _random_opinions(n, seed=7):
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        raw = [rng.random() for _ in range(3)]
+        total = sum(raw)
+        out.append(Opinion(raw[0] / total, raw[1] / total, raw[2] / total, rng.random()))
+    return out
+
+
+def _left_fold(opinions):
+    result = opinions[0]
+    for o in opinions[1:]:
+        result = _cumulative_fuse_pair(result, o)
+    return result
+
+
+def _assert_close(a, b, tol=1e-12):
+    assert a.belief == pytest.approx(b.belief, abs=tol)
+    assert a.disbelief == pytest.approx(b.disbelief, abs=tol)
+    assert a.uncertainty == pytest.approx(b.uncertainty, abs=tol)
+    assert a.base_rate == pytest.approx(b.base_rate, abs=tol)
+
+
+class TestCumulativeFuseClosedForm:
+    """The n-ary closed form must agree with the pairwise left fold."""
+
+    @pytest.mark.parametrize("n", [3, 4, 10, 100])
+    def test_matches_left_fold(self, n):
+        ops = _random_opinions(n)
+        _assert_close(cumulative_fuse(*ops), _left_fold(ops))
+
+    def test_single_dogmatic_dominates(self):
+        ops = _random_opinions(5)
+        ops[2] = Opinion(belief=0.9, disbelief=0.1, uncertainty=0.0, base_rate=0.3)
+        result = cumulative_fuse(*ops)
+        assert result.belief == 0.9
+        assert result.uncertainty == 0.0
+        _assert_close(result, _left_fold(ops))
+
+    def test_multiple_dogmatic_uses_fold(self):
+        """Two or more dogmatic inputs keep the exact fold semantics."""
+        ops = _random_opinions(5)
+        ops[0] = Opinion(belief=0.9, disbelief=0.1, uncertainty=0.0)
+        ops[3] = Opinion(belief=0.2, disbelief=0.8, uncertainty=0.0)
+        assert cumulative_fuse(*ops) == _left_fold(ops)
+
+    def test_long_input_does_not_underflow(self):
+        """∏ u_i underflows for long inputs; the evidence form must not."""
+        ops = [Opinion(belief=0.5, disbelief=0.2, uncertainty=0.3)] * 2000
+        result = cumulative_fuse(*ops)
+        # Evidence ratio b/d is preserved exactly by cumulative fusion.
+        assert result.belief / result.disbelief == pytest.approx(2.5)
+        assert 0.0 < result.uncertainty < 1e-3
+
+    def test_vacuous_inputs_are_identity(self):
+        a = Opinion(belief=0.6, disbelief=0.1, uncertainty=0.3, base_rate=0.5)
+        vacuous = Opinion(belief=0.0, disbelief=0.0, uncertainty=1.0, base_rate=0.5)
+        result = cumulative_fuse(vacuous, a, vacuous)
+        assert result.belief == pytest.approx(a.belief)
+        assert result.uncertainty == pytest.approx(a.uncertainty)
+
+
+class TestCumulativeFuseTree:
+    """Balanced pairwise reduction."""
+
+    @pytest.mark.parametrize("n", [1, 2, 3, 7, 64, 1001])
+    def test_matches_cumulative_fuse(self, n):
+        ops = _random_opinions(n)
+        _assert_close(cumulative_fuse_tree(*ops), cumulative_fuse(*ops), tol=1e-10)
+
+    def test_single_dogmatic_dominates(self):
+        ops = _random_opinions(6)
+        ops[5] = Opinion(belief=0.4, disbelief=0.6, uncertainty=0.0)
+        result = cumulative_fuse_tree(*ops)
+        assert result.belief == pytest.approx(0.4)
+        assert result.uncertainty == 0.0
+
+    def test_empty_raises(self):
+        with pytest.raises(ValueError):
+            cumulative_fuse_tree()
+
+
 # ═══════════════════════════════════════════════════════════════════
 # Averaging Fusion (⊘) — dependent/correlated sources
 # ═══════════════════════════════════════════════════════════════════
@@ -465,3 +465,138 @@ class TestTemporalByzantineFuse:
         )
         report = temporal_byzantine_fuse(opinions, t_cfg, b_cfg)
         assert isinstance(report, ByzantineFusionReport)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# TemporalFusionWindow
+# ═══════════════════════════════════════════════════════════════════
+
+from jsonld_ex.confidence_temporal_fusion import TemporalFusionWindow
+
+_T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _stream(n, seed=0, step=60.0):
+    import random
+
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        raw = [rng.random() for _ in range(3)]
+        total = sum(raw)
+        op = Opinion(raw[0] / total, raw[1] / total, raw[2] / total, rng.random())
+        out.append(TimestampedOpinion(op, _T0 + timedelta(seconds=i * step)))
+    return out
+
+
+def _assert_close(a, b, tol=1e-9):
+    assert a.belief == pytest.approx(b.belief, abs=tol)
+    assert a.disbelief == pytest.approx(b.disbelief, abs=tol)
+    assert a.uncertainty == pytest.approx(b.uncertainty, abs=tol)
+    assert a.base_rate == pytest.approx(b.base_rate, abs=tol)
+
+
+class TestTemporalFusionWindow:
+
+    @pytest.mark.parametrize("method", ["cumulative", "averaging"])
+    def test_matches_temporal_fuse(self, method):
+        entries = _stream(50)
+        win = TemporalFusionWindow(half_life=1800.0, window=1e9, fusion_method=method)
+        win.extend(entries)
+        for minutes in (49, 60, 300):
+            ref = _T0 + timedelta(minutes=minutes)
+            expected = temporal_fuse(
+                entries,
+                TemporalFusionConfig(half_life=1800.0, fusion_method=method, reference_time=ref),
+            )
+            _assert_close(win.fused(ref), expected.fused)
+
+    def test_expires_entries_outside_window(self):
+        entries = _stream(100)
+        win = TemporalFusionWindow(half_life=3600.0, window=1800.0)
+        ref = _T0 + timedelta(seconds=99 * 60)
+        for e in entries:
+            win.add(e)
+        fused = win.fused(ref)
+        live = [e for e in entries if (ref - e.timestamp).total_seconds() <= 1800.0]
+        assert len(win) == len(live) == 31
+        expected = temporal_fuse(live, TemporalFusionConfig(half_life=3600.0, reference_time=ref))
+        _assert_close(fused, expected.fused)
+
+    def test_rolling_queries_with_interleaved_adds(self):
+        entries = _stream(400, seed=1)
+        win = TemporalFusionWindow(half_life=600.0, window=3600.0)
+        for i, e in enumerate(entries):
+            win.add(e)
+            if i % 25 == 24:
+                ref = e.timestamp + timedelta(seconds=30)
+                live = [x for x in entries[: i + 1]
+                        if (ref - x.timestamp).total_seconds() <= 3600.0]
+                expected = temporal_fuse(
+                    live, TemporalFusionConfig(half_life=600.0, reference_time=ref),
+                )
+                _assert_close(win.fused(ref), expected.fused)
+
+    def test_long_horizon_repivots(self):
+        """Hundreds of half-lives later the weights must not overflow."""
+        entries = _stream(600, seed=2, step=3600.0)
+        win = TemporalFusionWindow(half_life=3600.0, window=10 * 3600.0)
+        for e in entries:
+            win.add(e)
+            win.advance(e.timestamp)
+        ref = entries[-1].timestamp
+        live = entries[-11:]
+        expected = temporal_fuse(live, TemporalFusionConfig(half_life=3600.0, reference_time=ref))
+        _assert_close(win.fused(ref), expected.fused)
+
+    def test_long_ingest_without_queries_repivots(self):
+        """More than 1024 half-lives of adds with no query must not overflow."""
+        entries = _stream(200, seed=5, step=600.0)
+        win = TemporalFusionWindow(half_life=60.0, window=3600.0)
+        win.extend(entries)
+        ref = entries[-1].timestamp
+        live = [e for e in entries if (ref - e.timestamp).total_seconds() <= 3600.0]
+        expected = temporal_fuse(live, TemporalFusionConfig(half_life=60.0, reference_time=ref))
+        _assert_close(win.fused(ref), expected.fused)
+
+    def test_out_of_order_arrival(self):
+        entries = _stream(30, seed=3)
+        win = TemporalFusionWindow(half_life=900.0, window=1e9)
+        win.extend(list(reversed(entries)))
+        ref = _T0 + timedelta(hours=1)
+        expected = temporal_fuse(
+            list(reversed(entries)), TemporalFusionConfig(half_life=900.0, reference_time=ref),
+        )
+        _assert_close(win.fused(ref), expected.fused)
+
+    def test_report_matches_batch(self):
+        entries = _stream(5, seed=4)
+        win = TemporalFusionWindow(half_life=900.0, window=1e9)
+        win.extend(entries)
+        ref = _T0 + timedelta(hours=1)
+        report = win.report(ref)
+        expected = temporal_fuse(entries, TemporalFusionConfig(half_life=900.0, reference_time=ref))
+        assert report.reference_time == ref
+        for got, exp in zip(report.decayed_opinions, expected.decayed_opinions):
+            _assert_close(got, exp)
+
+    def test_cached_repeat_query(self):
+        win = TemporalFusionWindow(half_life=60.0, window=600.0)
+        win.extend(_stream(10))
+        ref = _T0 + timedelta(minutes=10)
+        assert win.fused(ref) is win.fused(ref)
+
+    def test_errors(self):
+        with pytest.raises(ValueError, match="half_life"):
+            TemporalFusionWindow(half_life=0.0, window=10.0)
+        with pytest.raises(ValueError, match="window"):
+            TemporalFusionWindow(half_life=1.0, window=0.0)
+        win = TemporalFusionWindow(half_life=60.0, window=600.0)
+        with pytest.raises(ValueError, match="no opinions"):
+            win.fused(_T0)
+        win.extend(_stream(3))
+        with pytest.raises(ValueError, match="future"):
+            win.fused(_T0)
+        win.fused(_T0 + timedelta(minutes=5))
+        with pytest.raises(ValueError, match="earlier"):
+            win.fused(_T0 + timedelta(minutes=4))
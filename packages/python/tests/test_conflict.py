@@ -368,3 +368,38 @@ class TestRobustFuse:
         # With 5 opinions, default max_removals should be 2
         fused, removed = robust_fuse(opinions)
         assert len(removed) <= 2
+
+    def test_matches_from_scratch_discord_loop(self):
+        """Incremental discord tracking reproduces the O(n^2)-per-round loop."""
+        import random
+
+        def reference(opinions, threshold=0.15):
+            indexed = list(enumerate(opinions))
+            removed = []
+            for _ in range(len(opinions) // 2):
+                n = len(indexed)
+                if n <= 2:
+                    break
+                discord = [0.0] * n
+                for i in range(n):
+                    for j in range(i + 1, n):
+                        c = pairwise_conflict(indexed[i][1], indexed[j][1])
+                        discord[i] += c
+                        discord[j] += c
+                for i in range(n):
+                    discord[i] /= (n - 1)
+                worst = max(range(n), key=lambda k: discord[k])
+                if discord[worst] < threshold:
+                    break
+                removed.append(indexed.pop(worst)[0])
+            return cumulative_fuse(*[op for _, op in indexed]), removed
+
+        rng = random.Random(3)
+        for _ in range(5):
+            ops = []
+            for _ in range(30):
+                b = rng.random()
+                d = rng.uniform(0.0, 1.0 - b)
+                ops.append(Opinion(belief=b, disbelief=d, uncertainty=1.0 - b - d))
+            ops += ops[:5]  # exact duplicates -> exact ties
+            assert robust_fuse(ops, threshold=0.05) == reference(ops, threshold=0.05)
@@ -0,0 +1,154 @@
+"""Tests for the processed-context cache used by JsonLdEx."""
+
+import pytest
+from pyld import jsonld
+
+from jsonld_ex import JsonLdEx
+from jsonld_ex.document_loader import CachingDocumentLoader
+from jsonld_ex.processor import ProcessedContextCache
+
+
+CTX_URL = "https://example.org/ctx/v1.jsonld"
+VOCAB = {"@vocab": "http://schema.org/"}
+
+
+def _processor(**kwargs):
+    loader = CachingDocumentLoader(offline=True)
+    loader.preload(CTX_URL, {"@context": {"name": "http://schema.org/name"}})
+    return JsonLdEx(document_loader=loader, **kwargs)
+
+
+def _plain(processor, operation, *args, **options):
+    """Run *operation* through PyLD directly with the processor's loader."""
+    return getattr(jsonld, operation)(
+        *args, {"documentLoader": processor.document_loader, **options}
+    )
+
+
+DOCUMENTS = [
+    {"@context": VOCAB, "@id": "http://ex.org/a", "name": "A", "knows": {"name": "B"}},
+    {"@context": [CTX_URL, {"age": {"@id": "http://schema.org/age", "@type": "@id"}}],
+     "name": "A", "age": "http://ex.org/42"},
+    {"@context": {"@base": "http://base.org/", **VOCAB}, "@id": "rel", "p": {"@id": "x"}},
+    {"@context": {**VOCAB, "Person": {"@id": "http://schema.org/Person",
+                                      "@context": {"name": "http://other.org/name"}}},
+     "@type": "Person", "name": "A", "knows": {"name": "B"}},
+    {"@context": {**VOCAB, "@propagate": False}, "name": "A", "knows": {"name": "B"}},
+    {"@context": VOCAB, "@graph": [{"@id": "http://ex.org/a", "p": 1}]},
+    {"@context": {**VOCAB, "items": {"@container": "@list"}}, "items": [1, [2, 3]]},
+    {"@context": None, "http://schema.org/name": "A"},
+]
+
+
+class TestEquivalence:
+    @pytest.mark.parametrize("doc", DOCUMENTS)
+    def test_expand_matches_pyld(self, doc):
+        processor = _processor()
+        expected = _plain(processor, "expand", doc)
+        assert processor.expand(doc) == expected
+        assert processor.expand(doc) == expected  # served from the cache
+
+    @pytest.mark.parametrize("doc", DOCUMENTS)
+    def test_other_operations_match_pyld(self, doc):
+        processor = _processor()
+        processor.expand(doc)
+        assert processor.compact(doc, VOCAB) == _plain(processor, "compact", doc, VOCAB)
+        assert processor.flatten(doc) == _plain(processor, "flatten", doc, None)
+        assert processor.to_rdf(doc) == _plain(
+            processor, "to_rdf", doc, format="application/n-quads"
+        )
+
+    def test_base_is_part_of_the_key(self):
+        processor = _processor()
+        doc = {"@context": {"@vocab": "terms/"}, "p": 1}
+        first = processor.expand(doc, base="http://one.org/")
+        second = processor.expand(doc, base="http://two.org/")
+        assert first == [{"http://one.org/terms/p": [{"@value": 1}]}]
+        assert second == [{"http://two.org/terms/p": [{"@value": 1}]}]
+        assert processor.context_cache.misses == 2
+
+    def test_input_not_mutated(self):
+        processor = _processor()
+        doc = {"@context": VOCAB, "name": "A"}
+        processor.expand(doc)
+        processor.expand(doc)
+        assert doc == {"@context": VOCAB, "name": "A"}
+
+
+class TestCacheBehaviour:
+    def test_equal_contexts_share_an_entry(self):
+        processor = _processor()
+        for i in range(10):
+            processor.expand({"@context": {"@vocab": "http://schema.org/"}, "name": i})
+        cache = processor.context_cache
+        assert (cache.hits, cache.misses, len(cache)) == (9, 1, 1)
+
+    def test_operations_share_the_cache(self):
+        processor = _processor()
+        doc = {"@context": VOCAB, "name": "A"}
+        processor.expand(doc)
+        processor.compact(doc, VOCAB)
+        processor.to_rdf(doc)
+        assert processor.context_cache.hits == 2
+
+    def test_bounded_lru(self):
+        processor = _processor(max_contexts=2)
+        contexts = [{"@vocab": f"http://ex.org/{i}/"} for i in range(3)]
+        for ctx in (contexts[0], contexts[1], contexts[0], contexts[2], contexts[0]):
+            processor.expand({"@context": ctx, "p": 1})
+        cache = processor.context_cache
+        assert len(cache) == 2
+        assert (cache.hits, cache.misses) == (2, 3)
+
+    def test_uncacheable_inputs_bypass(self):
+        processor = _processor()
+        other = CachingDocumentLoader(offline=True)
+        processor.expand({"@context": {**VOCAB, "@propagate": False}, "p": 1})
+        processor.expand({"@context": VOCAB, "p": 1}, documentLoader=other)
+        processor.expand({"p": 1}, expandContext=VOCAB)
+        processor.expand({"@context": VOCAB, "p": 1}, expandContext=VOCAB)
+        assert len(processor.context_cache) == 0
+
+    def test_clear(self):
+        processor = _processor()
+        doc = {"@context": VOCAB, "name": "A"}
+        processor.expand(doc)
+        processor.context_cache.clear()
+        processor.expand(doc)
+        assert processor.context_cache.misses == 2
+
+    def test_remote_context_follows_loader_expiry(self):
+        clock = [0.0]
+        documents = {CTX_URL: {"@context": {"name": "http://schema.org/name"}}}
+        loader = CachingDocumentLoader(
+            ttl=10,
+            clock=lambda: clock[0],
+            fallback=lambda url, options: {"document": documents[url]},
+        )
+        processor = JsonLdEx(document_loader=loader)
+        doc = {"@context": CTX_URL, "name": "A"}
+        assert processor.expand(doc) == [{"http://schema.org/name": [{"@value": "A"}]}]
+
+        documents[CTX_URL] = {"@context": {"name": "http://other.org/name"}}
+        clock[0] = 5.0
+        processor.expand(doc)
+        assert processor.context_cache.hits == 1
+        clock[0] = 10.0
+        assert processor.expand(doc) == [{"http://other.org/name": [{"@value": "A"}]}]
+
+        documents[CTX_URL] = {"@context": {"name": "http://third.org/name"}}
+        loader.invalidate(CTX_URL)
+        assert processor.expand(doc) == [{"http://third.org/name": [{"@value": "A"}]}]
+        assert processor.context_cache.misses == 3
+
+    def test_inline_context_does_not_expire(self):
+        processor = _processor()
+        doc = {"@context": VOCAB, "name": "A"}
+        processor.expand(doc)
+        processor.document_loader.invalidate()
+        processor.expand(doc)
+        assert processor.context_cache.hits == 1
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError, match="max_size"):
+            ProcessedContextCache(0)
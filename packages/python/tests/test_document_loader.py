@@ -0,0 +1,213 @@
+"""Tests for the caching JSON-LD document loader."""
+
+import json
+
+import pytest
+from pyld.jsonld import JsonLdError
+
+from jsonld_ex import JsonLdEx
+from jsonld_ex import document_loader
+from jsonld_ex.document_loader import CachingDocumentLoader
+from jsonld_ex.security import compute_integrity
+
+
+CTX_URL = "https://example.org/ctx/v1.jsonld"
+CTX = {"@context": {"name": "http://schema.org/name"}}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingFallback:
+    """Stands in for the network loader and records every fetch."""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.calls = []
+
+    def __call__(self, url, options):
+        self.calls.append(url)
+        if url not in self.documents:
+            raise JsonLdError("not found", "jsonld.LoadDocumentError", {"url": url})
+        return {"contextUrl": None, "documentUrl": url, "document": self.documents[url]}
+
+
+def _loader(**kwargs):
+    fallback = CountingFallback({CTX_URL: CTX, **kwargs.pop("documents", {})})
+    return CachingDocumentLoader(fallback=fallback, **kwargs), fallback
+
+
+class TestCaching:
+    def test_second_load_is_a_hit(self):
+        loader, fallback = _loader()
+        first = loader(CTX_URL)
+        second = loader(CTX_URL)
+        assert first["document"] == second["document"] == CTX
+        assert first is not second  # fresh envelope per call
+        assert fallback.calls == [CTX_URL]
+        assert (loader.hits, loader.misses) == (1, 1)
+
+    def test_ttl_expiry_refetches(self):
+        clock = FakeClock()
+        loader, fallback = _loader(ttl=10, clock=clock)
+        loader(CTX_URL)
+        clock.now = 9.9
+        loader(CTX_URL)
+        clock.now = 10.0
+        loader(CTX_URL)
+        assert fallback.calls == [CTX_URL, CTX_URL]
+
+    def test_no_ttl_never_expires(self):
+        clock = FakeClock()
+        loader, fallback = _loader(ttl=None, clock=clock)
+        loader(CTX_URL)
+        clock.now = 1e12
+        loader(CTX_URL)
+        assert fallback.calls == [CTX_URL]
+
+    def test_lru_eviction(self):
+        urls = [f"https://example.org/{i}" for i in range(3)]
+        loader, fallback = _loader(max_size=2, documents={u: CTX for u in urls})
+        loader(urls[0])
+        loader(urls[1])
+        loader(urls[0])  # refresh 0; 1 is now least recently used
+        loader(urls[2])
+        assert urls[0] in loader and urls[2] in loader
+        assert urls[1] not in loader
+
+    def test_invalidate(self):
+        loader, fallback = _loader()
+        loader(CTX_URL)
+        loader.invalidate(CTX_URL)
+        loader(CTX_URL)
+        loader.invalidate()
+        loader(CTX_URL)
+        assert len(fallback.calls) == 3
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="max_size"):
+            CachingDocumentLoader(max_size=0)
+        with pytest.raises(ValueError, match="ttl"):
+            CachingDocumentLoader(ttl=0)
+
+
+BUNDLED_URL = "https://example.org/bundled/v1.jsonld"
+
+
+@pytest.fixture
+def bundled(monkeypatch):
+    monkeypatch.setattr(document_loader, "BUNDLED_CONTEXTS", {BUNDLED_URL: CTX})
+
+
+class TestPinnedDocuments:
+    def test_nothing_pinned_by_default(self, bundled):
+        loader = CachingDocumentLoader(offline=True)
+        assert len(loader) == 0
+        with pytest.raises(JsonLdError, match="offline"):
+            loader(BUNDLED_URL)
+
+    def test_bundled_contexts_served_offline(self, bundled):
+        loader = CachingDocumentLoader(offline=True, bundled=True)
+        assert loader(BUNDLED_URL)["document"] == CTX
+
+    def test_bundled_contexts_obey_allowlist(self, bundled):
+        loader = CachingDocumentLoader(
+            offline=True, bundled=True, allowlist={"allowed": [], "block_remote_contexts": True},
+        )
+        for _ in range(2):
+            with pytest.raises(JsonLdError, match="allowlist"):
+                loader(BUNDLED_URL)
+        allowed = CachingDocumentLoader(
+            offline=True, bundled=True, allowlist={"allowed": [BUNDLED_URL]},
+        )
+        assert allowed(BUNDLED_URL)["document"] == CTX
+
+    def test_preload_accepts_text_and_bypasses_policy(self):
+        loader = CachingDocumentLoader(offline=True, allowlist={"block_remote_contexts": True})
+        loader.preload(CTX_URL, json.dumps(CTX))
+        assert loader(CTX_URL)["document"] == CTX
+
+
+class TestPolicy:
+    def test_allowlist_checked_on_miss(self):
+        loader, fallback = _loader(allowlist={"allowed": ["https://other.org/ctx"]})
+        with pytest.raises(JsonLdError, match="allowlist"):
+            loader(CTX_URL)
+        assert fallback.calls == []
+
+    def test_integrity_verified_once(self):
+        declared = compute_integrity(CTX)
+        loader, fallback = _loader(integrity={CTX_URL: declared})
+        loader(CTX_URL)
+        loader(CTX_URL)
+        assert loader.hits == 1
+
+    def test_integrity_mismatch_not_cached(self):
+        loader, fallback = _loader(integrity={CTX_URL: compute_integrity({"other": 1})})
+        for _ in range(2):
+            with pytest.raises(JsonLdError, match="integrity"):
+                loader(CTX_URL)
+        assert CTX_URL not in loader
+        assert len(fallback.calls) == 2
+
+
+class TestLocalDirectory:
+    def test_mirror_layout(self, tmp_path):
+        target = tmp_path / "example.org" / "ctx" / "v1.jsonld"
+        target.parent.mkdir(parents=True)
+        target.write_text(json.dumps(CTX), encoding="utf-8")
+        loader = CachingDocumentLoader(local_dir=tmp_path, offline=True)
+        assert loader(CTX_URL)["document"] == CTX
+
+    def test_missing_file_offline_raises(self, tmp_path):
+        loader = CachingDocumentLoader(local_dir=tmp_path, offline=True)
+        with pytest.raises(JsonLdError, match="offline"):
+            loader(CTX_URL)
+
+    def test_path_traversal_ignored(self, tmp_path):
+        (tmp_path / "secret.jsonld").write_text("{}", encoding="utf-8")
+        mirror = tmp_path / "mirror"
+        mirror.mkdir()
+        loader = CachingDocumentLoader(local_dir=mirror, offline=True)
+        with pytest.raises(JsonLdError):
+            loader("https://example.org/../../secret.jsonld")
+
+    def test_invalid_json_file(self, tmp_path):
+        target = tmp_path / "example.org" / "ctx" / "v1.jsonld"
+        target.parent.mkdir(parents=True)
+        target.write_text("{not json", encoding="utf-8")
+        loader = CachingDocumentLoader(local_dir=tmp_path, offline=True)
+        with pytest.raises(JsonLdError, match="not valid JSON"):
+            loader(CTX_URL)
+
+
+class TestProcessorIntegration:
+    DOC = {"@context": CTX_URL, "name": "Alice"}
+
+    def test_expand_uses_cache(self):
+        loader, fallback = _loader()
+        processor = JsonLdEx(document_loader=loader)
+        expected = [{"http://schema.org/name": [{"@value": "Alice"}]}]
+        assert processor.expand(self.DOC) == expected
+        assert processor.expand(self.DOC) == expected
+        assert processor.compact(self.DOC, CTX_URL)["name"] == "Alice"
+        assert fallback.calls == [CTX_URL]
+
+    def test_default_loader_enforces_allowlist(self):
+        processor = JsonLdEx(context_allowlist={"block_remote_contexts": True})
+        assert isinstance(processor.document_loader, CachingDocumentLoader)
+        with pytest.raises(JsonLdError):
+            processor.expand(self.DOC)
+
+    def test_call_option_overrides_loader(self):
+        loader, fallback = _loader()
+        other, other_fallback = _loader()
+        processor = JsonLdEx(document_loader=loader)
+        processor.expand(self.DOC, documentLoader=other)
+        assert fallback.calls == []
+        assert other_fallback.calls == [CTX_URL]
@@ -8,7 +8,7 @@ authoredOn, manufactureDate).
 
 import pytest
 from jsonld_ex.confidence_algebra import Opinion
-from jsonld_ex.fhir_interop import from_fhir, fhir_temporal_decay
+from jsonld_ex.fhir_interop import from_fhir, fhir_temporal_decay, fhir_temporal_decay_batch
 
 
 REF_TIME = "2025-06-01T00:00:00Z"
@@ -282,3 +282,60 @@ class TestTemporalDecayComprehensive:
             f"(orig={orig_b:.4f}, decayed={dec_b:.4f})"
         )
         assert report.nodes_converted >= 1
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Batch variant
+# ═══════════════════════════════════════════════════════════════════
+
+
+class TestTemporalDecayBatch:
+    """fhir_temporal_decay_batch agrees with per-document decay."""
+
+    def _docs(self):
+        resources = [r for r, _ in TestTemporalDecayComprehensive.RESOURCE_WITH_TIMESTAMPS]
+        resources.append({"resourceType": "Observation", "id": "nots", "status": "final"})
+        resources.append({"resourceType": "Observation", "id": "future", "status": "final",
+                          "effectiveDateTime": "2030-01-01T00:00:00Z"})
+        return [from_fhir(r)[0] for r in resources]
+
+    def test_matches_single_document_decay(self):
+        docs = self._docs()
+        decayed, report = fhir_temporal_decay_batch(
+            docs, reference_time=REF_TIME, half_life_days=180.0,
+        )
+        assert len(decayed) == len(docs)
+        total = 0
+        for doc, got in zip(docs, decayed):
+            expected, single = fhir_temporal_decay(
+                doc, reference_time=REF_TIME, half_life_days=180.0,
+            )
+            total += single.nodes_converted if not single.warnings else 0
+            assert len(got["opinions"]) == len(expected["opinions"])
+            for g, e in zip(got["opinions"], expected["opinions"]):
+                assert g["opinion"].belief == pytest.approx(e["opinion"].belief, abs=1e-12)
+                assert g["opinion"].uncertainty == pytest.approx(
+                    e["opinion"].uncertainty, abs=1e-12,
+                )
+        assert report.nodes_converted == total
+
+    def test_warnings_name_document_index(self):
+        docs = self._docs()
+        _, report = fhir_temporal_decay_batch(docs, reference_time=REF_TIME)
+        assert len(report.warnings) == 2
+        assert report.warnings[0].startswith(f"Document {len(docs) - 2}:")
+        assert "future" in report.warnings[1]
+
+    def test_inputs_not_mutated(self):
+        docs = self._docs()
+        before = [[e["opinion"] for e in d["opinions"]] for d in docs]
+        decayed, _ = fhir_temporal_decay_batch(docs, reference_time=REF_TIME)
+        after = [[e["opinion"] for e in d["opinions"]] for d in docs]
+        assert before == after
+        assert decayed[0] is not docs[0]
+        assert decayed[0]["opinions"] is not docs[0]["opinions"]
+
+    def test_empty(self):
+        decayed, report = fhir_temporal_decay_batch([], reference_time=REF_TIME)
+        assert decayed == []
+        assert report.nodes_converted == 0
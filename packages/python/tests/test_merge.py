@@ -4,7 +4,12 @@ import pytest
 
 from jsonld_ex.merge import (
     merge_graphs,
+    merge_graph_streams,
     diff_graphs,
+    diff_graphs_hashed,
+    summarize_graph,
+    node_hash,
+    GraphSummary,
     MergeReport,
 )
 
@@ -201,6 +206,204 @@ class TestMergeEdgeCases:
         assert "email" in alice
 
 
+# ═══════════════════════════════════════════════════════════════════
+# merge_graphs — copy-on-write output
+# ═══════════════════════════════════════════════════════════════════
+
+
+class TestMergeCopyOnWrite:
+    @staticmethod
+    def _graphs():
+        address = {"@id": "ex:addr", "city": "Melbourne"}
+        g1 = _person_graph("ex:alice", "Alice", 0.8, extra={"address": address})
+        g2 = _person_graph("ex:alice", "Alice", 0.7)
+        g1["@graph"].append({"@type": "Note", "text": "anonymous"})
+        g1["@context"] = {"@vocab": "http://schema.org/"}
+        return g1, g2
+
+    def test_unchanged_values_are_shared(self):
+        g1, g2 = self._graphs()
+        merged, _ = merge_graphs([g1, g2])
+        alice = merged["@graph"][0]
+        assert alice["address"] is g1["@graph"][0]["address"]
+        assert merged["@graph"][1] is g1["@graph"][1]
+        assert merged["@context"] is g1["@context"]
+
+    def test_resolved_values_are_new_and_inputs_untouched(self):
+        g1, g2 = self._graphs()
+        merged, _ = merge_graphs([g1, g2])
+        name = merged["@graph"][0]["name"]
+        assert name["@confidence"] == pytest.approx(0.94)
+        assert name is not g1["@graph"][0]["name"]
+        assert g1["@graph"][0]["name"]["@confidence"] == 0.8
+        assert g2["@graph"][0]["name"]["@confidence"] == 0.7
+
+    def test_conflict_default_confidence_not_written_to_input(self):
+        g1 = {"@graph": [{"@id": "ex:a", "name": {"@value": "A"}}]}
+        g2 = {"@graph": [{"@id": "ex:a", "name": {"@value": "B", "@confidence": 0.3}}]}
+        merge_graphs([g1, g2])
+        assert g1["@graph"][0]["name"] == {"@value": "A"}
+
+    def test_copy_output_shares_nothing(self):
+        g1, g2 = self._graphs()
+        plain, _ = merge_graphs([g1, g2])
+        copied, _ = merge_graphs([g1, g2], copy_output=True)
+        assert copied == plain
+        assert copied["@graph"][0]["address"] is not g1["@graph"][0]["address"]
+        assert copied["@graph"][1] is not g1["@graph"][1]
+        assert copied["@context"] is not g1["@context"]
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Partitioned merge (max_workers)
+# ═══════════════════════════════════════════════════════════════════
+
+
+class TestMergePartitioned:
+    @staticmethod
+    def _graphs():
+        graphs = []
+        for source, conf in (("a", 0.9), ("b", 0.6), ("c", 0.75)):
+            nodes = [
+                {
+                    "@id": f"ex:n{i}",
+                    "name": {"@value": f"{source}{i % 3}", "@confidence": conf},
+                    "age": 30 + i,
+                }
+                for i in range(12)
+            ]
+            nodes.append({"label": f"anon-{source}"})
+            graphs.append({"@graph": nodes})
+        return graphs
+
+    @pytest.mark.parametrize("strategy", ["highest", "weighted_vote", "union", "recency"])
+    def test_matches_serial_merge(self, strategy):
+        graphs = self._graphs()
+        expected, expected_report = merge_graphs(graphs, conflict_strategy=strategy)
+        merged, report = merge_graphs(graphs, conflict_strategy=strategy, max_workers=3)
+        assert merged == expected
+        assert report == expected_report
+        assert report.properties_conflicted > 0
+
+    def test_deterministic_across_worker_counts(self):
+        graphs = self._graphs()
+        results = [merge_graphs(graphs, max_workers=n) for n in (2, 4)]
+        assert results[0] == results[1]
+
+    def test_spawn_fallback_matches_serial(self, monkeypatch):
+        import jsonld_ex.merge as merge_module
+
+        monkeypatch.setattr(merge_module.mp, "get_all_start_methods", lambda: ["spawn"])
+        graphs = self._graphs()
+        expected = merge_graphs(graphs, conflict_strategy="union")
+        assert merge_graphs(graphs, conflict_strategy="union", max_workers=2) == expected
+
+    def test_conflict_values_are_the_input_values(self):
+        graphs = self._graphs()
+        _, report = merge_graphs(graphs, max_workers=2)
+        first = report.conflicts[0]
+        assert first.node_id == "ex:n0"
+        assert first.values[0] is graphs[0]["@graph"][0][first.property_name]
+
+    def test_concurrent_calls_do_not_share_input(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        inputs = [self._graphs()]
+        other = self._graphs()
+        for graph in other:
+            for node in graph["@graph"]:
+                if "@id" in node:
+                    node["@id"] += "-other"
+        inputs.append(other)
+        expected = [merge_graphs(graphs) for graphs in inputs]
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(lambda graphs: merge_graphs(graphs, max_workers=2), inputs * 2))
+        assert results == expected * 2
+
+    def test_single_worker_is_serial(self):
+        graphs = self._graphs()
+        merged, _ = merge_graphs(graphs, max_workers=1)
+        # Serial merges share unchanged values with the inputs.
+        assert any(node is graphs[0]["@graph"][-1] for node in merged["@graph"])
+
+
+# ═══════════════════════════════════════════════════════════════════
+# merge_graph_streams
+# ═══════════════════════════════════════════════════════════════════
+
+
+class TestMergeGraphStreams:
+    @staticmethod
+    def _shards():
+        a = [
+            {"@id": "ex:a", "@type": "Person", "name": {"@value": "Alice", "@confidence": 0.8}},
+            {"@id": "ex:b", "name": {"@value": "Bob", "@confidence": 0.9}},
+            {"@id": "ex:d", "name": "Dana"},
+        ]
+        b = [
+            {"@id": "ex:a", "@type": "Agent", "name": {"@value": "Alice", "@confidence": 0.7}},
+            {"@id": "ex:b", "name": {"@value": "Robert", "@confidence": 0.6}},
+            {"@id": "ex:c", "name": "Carol"},
+        ]
+        return a, b
+
+    @pytest.mark.parametrize("strategy", ["highest", "weighted_vote", "union", "recency"])
+    def test_matches_merge_graphs(self, strategy):
+        a, b = self._shards()
+        expected, expected_report = merge_graphs(
+            [{"@graph": a}, {"@graph": b}], conflict_strategy=strategy
+        )
+        report = MergeReport()
+        merged = list(merge_graph_streams([a, b], strategy, report=report, record_conflicts=True))
+        assert merged == sorted(expected["@graph"], key=lambda n: n["@id"])
+        assert report == expected_report
+
+    def test_json_lines_input(self):
+        import json
+
+        a, b = self._shards()
+        lines_a = [json.dumps(n) + "\n" for n in a] + ["\n"]
+        lines_b = [json.dumps(n).encode("utf-8") for n in b]
+        assert list(merge_graph_streams([lines_a, lines_b])) == list(merge_graph_streams([a, b]))
+
+    def test_yields_lazily_in_id_order(self):
+        a, b = self._shards()
+        read = []
+
+        def tracked(nodes):
+            for node in nodes:
+                read.append(node["@id"])
+                yield node
+
+        stream = merge_graph_streams([tracked(a), tracked(b)])
+        assert next(stream)["@id"] == "ex:a"
+        assert "ex:d" not in read
+        assert [n["@id"] for n in stream] == ["ex:b", "ex:c", "ex:d"]
+
+    def test_running_report_without_conflict_records(self):
+        a, b = self._shards()
+        report = MergeReport()
+        list(merge_graph_streams([a, b], report=report))
+        assert report.nodes_merged == 4
+        assert report.properties_conflicted == 1
+        assert report.conflicts == []
+        assert report.source_count == 2
+
+    def test_anonymous_nodes_passed_through(self):
+        a, b = self._shards()
+        merged = list(merge_graph_streams([a + [{"label": "anon"}], b]))
+        assert {"label": "anon"} in merged
+
+    def test_unsorted_stream_raises(self):
+        a, b = self._shards()
+        with pytest.raises(ValueError, match="Stream 1 is not sorted"):
+            list(merge_graph_streams([a, list(reversed(b))]))
+
+    def test_fewer_than_two_streams_raises(self):
+        with pytest.raises(ValueError, match="at least 2"):
+            merge_graph_streams([[]])
+
+
 # ═══════════════════════════════════════════════════════════════════
 # diff_graphs
 # ═══════════════════════════════════════════════════════════════════
@@ -266,6 +469,92 @@ class TestDiffGraphs:
         assert d == {"added": [], "removed": [], "modified": [], "unchanged": []}
 
 
+# ═══════════════════════════════════════════════════════════════════
+# diff_graphs_hashed
+# ═══════════════════════════════════════════════════════════════════
+
+
+class TestDiffGraphsHashed:
+    @staticmethod
+    def _snapshots():
+        old = {"@graph": [
+            {"@id": f"ex:n{i}", "name": {"@value": f"N{i}", "@confidence": 0.8}, "age": i}
+            for i in range(50)
+        ]}
+        new = {"@graph": [dict(node) for node in old["@graph"][1:]]}
+        new["@graph"][0]["age"] = -1           # ex:n1 modified
+        new["@graph"].append({"@id": "ex:new", "name": "New"})
+        return old, new
+
+    def test_node_hash_ignores_key_order(self):
+        a = {"@id": "ex:a", "name": {"@value": "A", "@confidence": 0.9, "@source": "s"}}
+        b = {"name": {"@source": "s", "@confidence": 0.9, "@value": "A"}, "@id": "ex:a"}
+        assert node_hash(a) == node_hash(b)
+        assert node_hash(a) != node_hash({**a, "name": {"@value": "A", "@confidence": 0.8}})
+
+    def test_matches_diff_graphs_on_changes(self):
+        old, new = self._snapshots()
+        expected = diff_graphs(old, new)
+        diff, _ = diff_graphs_hashed(old, new, n_buckets=8)
+        for key in ("added", "removed", "modified"):
+            assert sorted(map(repr, diff[key])) == sorted(map(repr, expected[key]))
+        assert diff["modified"] == [
+            {"@id": "ex:n1", "property": "age", "value_a": 1, "value_b": -1}
+        ]
+        assert diff["unchanged_nodes"] == 48
+        assert {e["@id"] for e in diff["unchanged"]} == {"ex:n1"}
+
+    def test_identical_graphs(self):
+        old, _ = self._snapshots()
+        diff, summary = diff_graphs_hashed(old, old)
+        assert diff["added"] == diff["removed"] == diff["modified"] == []
+        assert diff["unchanged_nodes"] == len(summary) == 50
+
+    def test_identical_buckets_are_not_read(self):
+        old, new = self._snapshots()
+        summary_a = summarize_graph(old, n_buckets=4)
+        summary_b = summarize_graph(new, n_buckets=4)
+        same = [
+            i for i in range(4) if summary_a.bucket_hashes[i] == summary_b.bucket_hashes[i]
+        ]
+        assert same
+        summary_a.buckets[same[0]].clear()  # would surface if the bucket were visited
+        diff, _ = diff_graphs_hashed(old, new, summary_a=summary_a, summary_b=summary_b)
+        assert diff["modified"] and not any(
+            e["@id"] in summary_b.buckets[same[0]] for e in diff["added"]
+        )
+
+    def test_persisted_summary_round_trip(self, tmp_path):
+        old, new = self._snapshots()
+        first, summary_new = diff_graphs_hashed(old, new)
+        path = tmp_path / "summary.json"
+        summary_new.save(path)
+        loaded = GraphSummary.load(path)
+        assert loaded == summary_new
+        assert loaded == summarize_graph(new)
+        again, _ = diff_graphs_hashed(new, new, summary_a=loaded)
+        assert again["unchanged_nodes"] == 50 and again["modified"] == []
+
+    def test_bucket_count_mismatch_raises(self):
+        old, new = self._snapshots()
+        with pytest.raises(ValueError, match="bucket counts"):
+            diff_graphs_hashed(
+                old, new,
+                summary_a=summarize_graph(old, 4),
+                summary_b=summarize_graph(new, 8),
+            )
+
+    def test_invalid_bucket_count(self):
+        with pytest.raises(ValueError, match="n_buckets"):
+            summarize_graph({"@graph": []}, n_buckets=0)
+
+    def test_unsupported_version(self):
+        data = summarize_graph({"@graph": []}, 2).to_dict()
+        data["version"] = 99
+        with pytest.raises(ValueError, match="version"):
+            GraphSummary.from_dict(data)
+
+
 # ═══════════════════════════════════════════════════════════════════
 # MergeReport
 # ═══════════════════════════════════════════════════════════════════
@@ -9,6 +9,7 @@ Structure:
   1. TestProvOInputImmutability — proves copy.deepcopy is unnecessary
   2. TestTrustedCreateEquivalence — proves _trusted_create matches constructor
   3. TestProvOBatchEquivalence — proves batch API matches per-node calls
+  4. TestCompiledShapeEquivalence — proves compile_shape matches validate_node
 """
 
 import copy
@@ -28,6 +29,7 @@ from jsonld_ex.confidence_algebra import (
 from jsonld_ex.confidence_decay import decay_opinion, exponential_decay
 from jsonld_ex.ai_ml import annotate
 from jsonld_ex.owl_interop import to_prov_o, ConversionReport
+from jsonld_ex.validation import compile_shape, validate_node
 
 
 # ── Reusable Hypothesis strategies (same as test_property_based.py) ──
@@ -318,6 +320,38 @@ class TestTrustedCreateEquivalence:
         assert r.uncertainty == pytest.approx(0.065, abs=1e-12)
 
 
+    # ── Phase 2: _trusted_create matches the validating constructor ──
+
+    @staticmethod
+    def _bits(o):
+        return tuple(
+            (v, math.copysign(1.0, v))
+            for v in (o.belief, o.disbelief, o.uncertainty, o.base_rate)
+        )
+
+    @given(opinion=opinions())
+    def test_trusted_create_matches_constructor(self, opinion):
+        args = (opinion.belief, opinion.disbelief, opinion.uncertainty, opinion.base_rate)
+        assert self._bits(Opinion._trusted_create(*args)) == self._bits(Opinion(*args))
+
+    @pytest.mark.parametrize("overshoot", [1e-16, 5e-13])
+    def test_trusted_create_clamps_like_constructor(self, overshoot):
+        args = (-overshoot, 0.0, 1.0 + overshoot, 0.5)
+        assert self._bits(Opinion._trusted_create(*args)) == self._bits(Opinion(*args))
+
+    @given(a=opinions(), b=opinions(), c=opinions())
+    def test_operator_outputs_match_revalidated(self, a, b, c):
+        """Operators now build results via _trusted_create; rebuilding
+        each through the full constructor must not change a bit."""
+        for r in (
+            cumulative_fuse(a, b), cumulative_fuse(a, b, c), averaging_fuse(a, b, c),
+            trust_discount(a, b), deduce(a, b, c),
+            decay_opinion(a, elapsed=5.0, half_life=10.0),
+        ):
+            rebuilt = Opinion(r.belief, r.disbelief, r.uncertainty, r.base_rate)
+            assert self._bits(r) == self._bits(rebuilt)
+
+
 # ═══════════════════════════════════════════════════════════════════
 # FIX 3: Prove batch to_prov_o equivalence (test written in advance)
 # ═══════════════════════════════════════════════════════════════════
@@ -436,3 +470,103 @@ class TestProvOBatchEquivalence:
         snapshot = copy.deepcopy(doc)
         to_prov_o_graph(doc)
         assert doc == snapshot
+
+
+# ═══════════════════════════════════════════════════════════════════
+# FIX 4: Prove compiled shapes produce identical ValidationResults
+# ═══════════════════════════════════════════════════════════════════
+
+_EQUIV_SHAPES = {
+    "Person": {
+        "@type": "Person",
+        "name": {"@required": True, "@type": "xsd:string", "@minLength": 1, "@maxLength": 8},
+        "email": {"@pattern": r"^[^@]+@[^@]+$", "@severity": "warning"},
+        "age": {"@type": "xsd:integer", "@minimum": 0, "@maximum": 150},
+        "tags": {"@minCount": 1, "@maxCount": 2, "@severity": "info"},
+    },
+    "Logic": {
+        "@type": "Logic",
+        "code": {"@or": [{"@type": "xsd:string"}, {"@minimum": 10}]},
+        "level": {"@and": [{"@minimum": 0}, {"@maximum": 5}], "@not": {"@in": [3]}},
+        "kind": {"@in": ["a", "b", 1]},
+        "score": {
+            "@if": {"@type": "xsd:integer"},
+            "@then": {"@minimum": 0},
+            "@else": {"@type": "xsd:string", "@pattern": "["},
+        },
+    },
+    "Range": {
+        "@type": "Range",
+        "start": {"@lessThan": "end", "@disjoint": "other"},
+        "end": {"@lessThanOrEquals": "limit", "@equals": "mirror"},
+        "flag": {"@type": "xsd:boolean"},
+        "ratio": {"@type": "xsd:double"},
+    },
+    "Nested": {
+        "@type": "Nested",
+        "owner": {"@shape": {"@type": "Person", "name": {"@required": True}}},
+        "child": {"@shape": {"name": {"@minLength": 2}}, "@severity": "warning"},
+    },
+    "Child": {
+        "@type": "Child",
+        "@extends": ["Base", {"code": {"@maxLength": 2}}, "Missing"],
+        "extra": {"@required": True},
+    },
+}
+_EQUIV_REGISTRY = {
+    "Base": {"@type": "Base", "code": {"@required": True, "@minLength": 1}},
+}
+
+_scalar = st.one_of(
+    st.none(),
+    st.booleans(),
+    st.integers(min_value=-5, max_value=200),
+    st.floats(min_value=-5, max_value=200, allow_nan=False),
+    st.sampled_from(["", "a", "b", "ab", "x@y", "[", "long-string"]),
+)
+_value = st.one_of(
+    _scalar,
+    st.builds(lambda v: {"@value": v}, _scalar),
+    st.lists(_scalar, max_size=3),
+    st.fixed_dictionaries({}, optional={
+        "@type": st.sampled_from(["Person", "Other"]),
+        "name": _scalar,
+    }),
+)
+_props = sorted({
+    p for shape in _EQUIV_SHAPES.values() for p in shape if not p.startswith("@")
+} | {"limit", "other", "mirror", "code"})
+
+
+@st.composite
+def _nodes(draw):
+    node = draw(st.dictionaries(st.sampled_from(_props), _value, max_size=8))
+    node["@type"] = draw(st.sampled_from(list(_EQUIV_SHAPES) + ["Unknown"]))
+    return node
+
+
+class TestCompiledShapeEquivalence:
+    """compile_shape(shape).validate(node) == validate_node(node, shape)."""
+
+    @given(node=_nodes(), name=st.sampled_from(sorted(_EQUIV_SHAPES)))
+    @settings(max_examples=400, suppress_health_check=[HealthCheck.too_slow])
+    def test_random_nodes(self, node, name):
+        shape = _EQUIV_SHAPES[name]
+        expected = validate_node(node, shape, shape_registry=_EQUIV_REGISTRY)
+        compiled = compile_shape(shape, _EQUIV_REGISTRY)
+        assert compiled.validate(node) == expected
+
+    def test_non_dict_node(self):
+        shape = _EQUIV_SHAPES["Child"]
+        expected = validate_node("nope", shape, shape_registry=_EQUIV_REGISTRY)
+        assert compile_shape(shape, _EQUIV_REGISTRY).validate("nope") == expected
+
+    def test_repeated_validation_returns_fresh_results(self):
+        compiled = compile_shape(_EQUIV_SHAPES["Child"], _EQUIV_REGISTRY)
+        first = compiled.validate({"@type": "Child"})
+        first.errors[0].path = "mutated"
+        first.warnings[0].message = "mutated"
+        second = compiled.validate({"@type": "Child"})
+        assert second == validate_node(
+            {"@type": "Child"}, _EQUIV_SHAPES["Child"], shape_registry=_EQUIV_REGISTRY,
+        )
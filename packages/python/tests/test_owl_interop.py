@@ -1,5 +1,6 @@
 """Tests for owl_interop module — PROV-O, SHACL, OWL, RDF-star bidirectional mapping."""
 
+import copy
 import json
 import math
 import pytest
@@ -21,6 +22,7 @@ from jsonld_ex.owl_interop import (
     ConversionReport,
     VerbosityComparison,
     to_prov_o,
+    iter_prov_o,
     from_prov_o,
     to_ssn,
     from_ssn,
@@ -30,12 +32,52 @@ from jsonld_ex.owl_interop import (
     owl_to_shape,
     to_rdf_star_ntriples,
     from_rdf_star_ntriples,
+    from_rdf_star_ntriples_stream,
     to_rdf_star_turtle,
+    iter_rdf_star_ntriples,
+    iter_rdf_star_turtle,
+    write_rdf_star_ntriples,
+    write_rdf_star_turtle,
     compare_with_prov_o,
     compare_with_shacl,
+    ShapeTranslator,
 )
 
 
+# ── Streaming helpers ───────────────────────────────────────────
+
+
+def _annotated_nodes(n):
+    """*n* nodes, each with a confidence/source and a human-verified annotation."""
+    return [
+        {
+            "@id": f"http://example.org/n{i}",
+            "http://schema.org/name": annotate(
+                f"N{i}", confidence=0.9, source="https://models.example.org/gpt4"
+            ),
+            "http://schema.org/email": annotate(f"n{i}@example.org", human_verified=True),
+        }
+        for i in range(n)
+    ]
+
+
+def _assert_lazy(stream_fn, items, consumed_before_first):
+    """Check that the first output of *stream_fn* pulls only the items it needs.
+
+    *stream_fn* is fed a generator over *items*; its first output is returned.
+    """
+    consumed = []
+
+    def source():
+        for item in items:
+            consumed.append(item)
+            yield item
+
+    first = next(iter(stream_fn(source())))
+    assert len(consumed) == consumed_before_first
+    return first
+
+
 # ── Fixtures ────────────────────────────────────────────────────
 
 
@@ -213,6 +255,76 @@ class TestToProvO:
         assert main[0]["name"] == "plain string"
 
 
+class TestIterProvO:
+    """Tests for iter_prov_o() — streaming PROV-O conversion."""
+
+    def test_single_node_matches_to_prov_o(self, annotated_person):
+        prov_doc, expected = to_prov_o(annotated_person)
+        report = ConversionReport(success=True)
+        nodes = list(iter_prov_o([annotated_person], report))
+        assert len(nodes) == len(prov_doc["@graph"])
+        main = nodes[0]
+        assert "@context" not in main
+        entity = next(n for n in nodes if n.get("@type") == f"{PROV}Entity")
+        assert main["name"] == {"@id": entity["@id"]}
+        assert entity[f"{JSONLD_EX}confidence"] == 0.95
+        assert (report.nodes_converted, report.triples_input, report.triples_output) == (
+            expected.nodes_converted, expected.triples_input, expected.triples_output,
+        )
+
+    def test_yields_incrementally(self):
+        first = _assert_lazy(iter_prov_o, _annotated_nodes(3), 1)
+        assert first["@id"] == "http://example.org/n0"
+
+    def test_shared_agent_and_verifier_emitted_once(self):
+        nodes = list(iter_prov_o(_annotated_nodes(4)))
+        agents = [n for n in nodes if n.get("@type") == f"{PROV}SoftwareAgent"]
+        people = [n for n in nodes if n.get("@type") == f"{PROV}Person"]
+        assert len(agents) == 1
+        assert len(people) == 1
+        entities = [n for n in nodes if n.get("@type") == f"{PROV}Entity"]
+        verified = [e for e in entities if e.get(f"{PROV}wasAttributedTo") == {"@id": people[0]["@id"]}]
+        assert len(verified) == 4
+
+    def test_blank_node_ids_unique(self):
+        nodes = list(iter_prov_o(_annotated_nodes(200)))
+        ids = [n["@id"] for n in nodes if n["@id"].startswith("_:")]
+        assert len(ids) == len(set(ids))
+
+    def test_aggregated_report(self):
+        report = ConversionReport(success=True)
+        list(iter_prov_o(_annotated_nodes(5), report))
+        assert report.nodes_converted == 10
+        assert report.triples_input == 10
+
+    def test_different_delegation_emits_new_agent(self):
+        src = "https://models.example.org/gpt4"
+        nodes = [
+            {"@id": "http://example.org/a", "p": annotate("x", source=src)},
+            {"@id": "http://example.org/b", "p": annotate("y", source=src, delegated_by="https://org.example/")},
+        ]
+        agents = [n for n in iter_prov_o(nodes) if n.get("@type") == f"{PROV}SoftwareAgent"]
+        assert len(agents) == 2
+        assert agents[1][f"{PROV}actedOnBehalfOf"] == {"@id": "https://org.example/"}
+
+    @pytest.mark.parametrize("delegated_by", [{"@id": "http://o"}, [{"@id": "http://o"}]])
+    def test_node_ref_delegation_matches_to_prov_o(self, delegated_by):
+        value = {"@value": "v", "@source": "http://s", "@delegatedBy": delegated_by}
+        node = {"@id": "http://example.org/a", "p": value}
+        prov_doc, _ = to_prov_o(node)
+        nodes = list(iter_prov_o([node, node]))
+        agents = [n for n in nodes if n.get("@type") == f"{PROV}SoftwareAgent"]
+        expected = [n for n in prov_doc["@graph"] if n.get("@type") == f"{PROV}SoftwareAgent"]
+        assert agents == expected * 2  # not deduplicated, but not an error
+
+    def test_round_trip_per_node(self, multi_annotated):
+        nodes = list(iter_prov_o([multi_annotated]))
+        restored, _ = from_prov_o({"@context": "http://schema.org/", "@graph": nodes})
+        assert restored["name"]["@confidence"] == 0.92
+        assert restored["email"]["@method"] == "regex-extraction"
+        assert restored["email"]["@humanVerified"] is True
+
+
 class TestFromProvO:
     """Tests for PROV-O → jsonld-ex round-trip."""
 
@@ -3102,6 +3214,116 @@ class TestExtendsShacl:
         assert restored["http://example.org/dept"]["@required"] is True
 
 
+# ═══════════════════════════════════════════════════════════════════
+# SHAPE TRANSLATION CACHE
+# ═══════════════════════════════════════════════════════════════════
+
+
+class TestShapeTranslator:
+    """Memoized and bulk shape ↔ SHACL/OWL translation."""
+
+    MIXIN = {"@type": "http://example.org/Audited", "http://example.org/rev": {"@minimum": 0}}
+
+    @pytest.fixture
+    def registry(self, person_shape):
+        return {
+            "Person": person_shape,
+            "Employee": {
+                "@type": "http://example.org/Employee",
+                "@extends": ["Person", dict(self.MIXIN)],
+                "http://example.org/dept": {"@required": True},
+            },
+            "Contractor": {
+                "@type": "http://example.org/Contractor",
+                "@extends": dict(self.MIXIN),
+            },
+        }
+
+    def test_matches_module_functions(self, person_shape):
+        translator = ShapeTranslator()
+        shacl = translator.shape_to_shacl(person_shape, shape_iri="http://example.org/PersonShape")
+        assert shacl == shape_to_shacl(person_shape, shape_iri="http://example.org/PersonShape")
+        owl = translator.shape_to_owl_restrictions(person_shape)
+        assert owl == shape_to_owl_restrictions(person_shape)
+        assert translator.shacl_to_shape(shacl) == shacl_to_shape(shacl)
+        assert translator.owl_to_shape(owl) == owl_to_shape(owl)
+
+    def test_memoized_by_content(self, person_shape):
+        translator = ShapeTranslator()
+        first = translator.shape_to_owl_restrictions(person_shape)
+        second = translator.shape_to_owl_restrictions(copy.deepcopy(person_shape))
+        assert first == second
+        assert first is not second  # callers get their own copy
+        assert (translator.hits, translator.misses) == (1, 1)
+
+    def test_result_mutation_does_not_leak(self, person_shape):
+        translator = ShapeTranslator()
+        translator.shape_to_owl_restrictions(person_shape)["@graph"].clear()
+        assert translator.shape_to_owl_restrictions(person_shape)["@graph"]
+
+    def test_disk_cache_survives_restart(self, tmp_path, registry):
+        first = ShapeTranslator(cache_dir=tmp_path).translate_registry(registry)
+        restarted = ShapeTranslator(cache_dir=tmp_path)
+        assert restarted.translate_registry(registry) == first
+        assert restarted.misses == 0
+        assert restarted.disk_hits > 0
+
+    def test_corrupt_cache_file_recomputed(self, tmp_path, person_shape):
+        ShapeTranslator(cache_dir=tmp_path).shape_to_owl_restrictions(person_shape)
+        for path in tmp_path.glob("*.json"):
+            path.write_text("{truncated", encoding="utf-8")
+        translator = ShapeTranslator(cache_dir=tmp_path)
+        assert translator.shape_to_owl_restrictions(person_shape) == shape_to_owl_restrictions(person_shape)
+        assert translator.misses == 1
+
+    def test_registry_links_named_parents(self, registry):
+        result = ShapeTranslator().translate_registry(registry)
+        shapes = {n["@id"]: n for n in result.shacl["@graph"]}
+        employee = shapes[result.shape_iris["Employee"]]
+        links = [ref["@id"] for ref in employee[f"{SHACL}node"]]
+        assert links[0] == result.shape_iris["Person"]
+        # The shared inline parent is emitted once
+        assert links[1] in shapes
+        contractor = shapes[result.shape_iris["Contractor"]]
+        assert contractor[f"{SHACL}node"] == {"@id": links[1]}
+        assert len(shapes) == 4
+
+    def test_inline_parent_iri_uses_base(self, registry):
+        result = ShapeTranslator().translate_registry(registry, shape_iri_base="http://ex.org/shapes/")
+        iris = [n["@id"] for n in result.shacl["@graph"]]
+        assert all(iri.startswith("http://ex.org/shapes/") for iri in iris)
+        assert sum(iri.startswith("http://ex.org/shapes/inline-") for iri in iris) == 1
+
+    def test_registry_owl_subclass_uses_parent_class(self, registry):
+        result = ShapeTranslator().translate_registry(registry, shacl=False)
+        assert result.shacl is None
+        classes = {n["@id"]: n for n in result.owl["@graph"]}
+        supers = classes["http://example.org/Employee"][f"{RDFS}subClassOf"]
+        ids = [s.get("@id") for s in supers if "@id" in s]
+        assert "http://schema.org/Person" in ids
+        assert "http://example.org/Audited" in ids
+        assert "http://example.org/Audited" in classes
+
+    def test_registry_circular_extends(self):
+        registry = {
+            "A": {"@type": "http://example.org/A", "@extends": "B"},
+            "B": {"@type": "http://example.org/B", "@extends": "A"},
+        }
+        with pytest.raises(ValueError, match="Circular"):
+            ShapeTranslator().translate_registry(registry)
+
+    def test_registry_shape_without_type(self):
+        with pytest.raises(ValueError, match="'Abstract' has no @type"):
+            ShapeTranslator().translate_registry({"Abstract": {"http://example.org/p": {}}})
+
+    def test_clear(self, tmp_path, person_shape):
+        translator = ShapeTranslator(cache_dir=tmp_path)
+        translator.shape_to_owl_restrictions(person_shape)
+        translator.clear(disk=True)
+        assert len(translator) == 0
+        assert not list(tmp_path.glob("*.json"))
+
+
 # ═══════════════════════════════════════════════════════════════════
 # SSN/SOSA INTEROP TESTS
 # ═══════════════════════════════════════════════════════════════════
@@ -4141,6 +4363,126 @@ class TestFromRdfStarNtriples:
         assert report.nodes_converted == 1  # 1 annotated value
 
 
+def _ntriples(n):
+    return "\n".join(to_rdf_star_ntriples(d)[0] for d in _annotated_nodes(n))
+
+
+class TestFromRdfStarNtriplesStream:
+    """Tests for from_rdf_star_ntriples_stream() — the incremental parser."""
+
+    def test_matches_batch_parser(self):
+        text = _ntriples(5)
+        nodes = list(from_rdf_star_ntriples_stream(text))
+        doc, _ = from_rdf_star_ntriples(text)
+        assert nodes == doc["@graph"]
+
+    def test_report_matches_batch_parser(self):
+        text = _ntriples(3) + f"\n<< <http://example.org/n2> <http://p> \"x\" >> <{JSONLD_EX}bogus> \"y\" ."
+        report = ConversionReport(success=True)
+        list(from_rdf_star_ntriples_stream(text, report))
+        _, expected = from_rdf_star_ntriples(text)
+        assert report == expected
+
+    def test_yields_node_when_block_ends(self):
+        lines = _ntriples(10).split("\n")
+        # the five lines of n0, then the first line of n1
+        first = _assert_lazy(from_rdf_star_ntriples_stream, lines, 6)
+        assert first["@id"] == "http://example.org/n0"
+
+    def test_file_and_mmap_sources(self, tmp_path):
+        import io
+        import mmap
+
+        text = _ntriples(4)
+        expected = list(from_rdf_star_ntriples_stream(text))
+        assert list(from_rdf_star_ntriples_stream(io.StringIO(text))) == expected
+        path = tmp_path / "dump.nt"
+        path.write_bytes(text.encode("utf-8"))
+        with open(path, "rb") as fh:
+            assert list(from_rdf_star_ntriples_stream(fh)) == expected
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                assert list(from_rdf_star_ntriples_stream(mm)) == expected
+
+    def test_non_contiguous_subject_yields_two_nodes(self):
+        text = (
+            '<http://example.org/a> <http://p/1> "x" .\n'
+            '<http://example.org/b> <http://p/1> "y" .\n'
+            '<http://example.org/a> <http://p/2> "z" .'
+        )
+        ids = [node["@id"] for node in from_rdf_star_ntriples_stream(text)]
+        assert ids == ["http://example.org/a", "http://example.org/b", "http://example.org/a"]
+
+    def test_invalid_line_reports_line_number(self):
+        text = '<http://example.org/a> <http://p/1> "x" .\nnot a triple'
+        with pytest.raises(ValueError, match="line 2"):
+            list(from_rdf_star_ntriples_stream(text))
+
+
+class TestRdfStarWriters:
+    """Tests for the streaming RDF-star N-Triples and Turtle writers."""
+
+    def test_ntriples_lines_match_batch(self):
+        doc = _annotated_nodes(1)[0]
+        expected, expected_report = to_rdf_star_ntriples(doc)
+        report = ConversionReport(success=True)
+        assert "\n".join(iter_rdf_star_ntriples(doc, report=report)) == expected
+        assert report == expected_report
+
+    def test_turtle_matches_batch(self):
+        doc = _annotated_nodes(1)[0]
+        expected, expected_report = to_rdf_star_turtle(doc)
+        report = ConversionReport(success=True)
+        assert "\n".join(iter_rdf_star_turtle(doc, report=report)) == expected
+        assert report == expected_report
+
+    def test_write_ntriples_many_documents(self):
+        import io
+
+        docs = _annotated_nodes(3)
+        buf = io.StringIO()
+        report = write_rdf_star_ntriples(iter(docs), buf, buffer_size=16)
+        expected = "".join(to_rdf_star_ntriples(d)[0] + "\n" for d in docs)
+        assert buf.getvalue() == expected
+        assert report.nodes_converted == 3 * 2  # two annotated values per node
+        assert report.triples_output == 3 * 5
+
+    def test_turtle_prefixes_from_first_pass(self):
+        docs = [{"@id": "http://example.org/a", "http://p": "x"}, {"@id": "http://example.org/b", "http://p": 3}]
+        lines = list(iter_rdf_star_turtle(docs))
+        assert lines[0] == f"@prefix xsd: <{XSD}> ."
+        assert lines[1] == ""
+        assert not any("jex:" in line for line in lines)
+
+    def test_turtle_one_shot_iterator_declares_all_prefixes(self):
+        lines = list(iter_rdf_star_turtle(iter(_annotated_nodes(2))))
+        assert lines[:3] == [f"@prefix jex: <{JSONLD_EX}> .", f"@prefix xsd: <{XSD}> .", ""]
+
+    def test_turtle_declared_prefixes(self):
+        import io
+
+        docs = [
+            {"@id": f"http://example.org/n{i}", "http://p": annotate("x", source="https://m.example.org")}
+            for i in range(2)
+        ]
+        buf = io.StringIO()
+        write_rdf_star_turtle(iter(docs), buf, prefixes=["jex"])
+        text = buf.getvalue()
+        assert text.startswith(f"@prefix jex: <{JSONLD_EX}> .\n\n")
+        assert "xsd:" not in text
+        assert to_rdf_star_turtle(docs[1])[0].split("\n\n", 1)[1] in text
+
+    def test_turtle_undeclared_prefix_raises(self):
+        with pytest.raises(ValueError, match="not declared"):
+            list(iter_rdf_star_turtle(_annotated_nodes(1), prefixes=[]))
+
+    def test_turtle_unknown_prefix_raises(self):
+        with pytest.raises(ValueError, match="Unknown"):
+            list(iter_rdf_star_turtle(_annotated_nodes(1), prefixes=["foaf"]))
+
+    def test_lazy_consumption(self):
+        _assert_lazy(iter_rdf_star_ntriples, _annotated_nodes(5), 1)
+
+
 # ═══════════════════════════════════════════════════════════════════
 # RDF-STAR ROUND-TRIP TESTS
 # ═══════════════════════════════════════════════════════════════════
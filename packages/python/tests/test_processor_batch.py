@@ -0,0 +1,139 @@
+"""Tests for the JsonLdEx batch operations (expand_many and friends)."""
+
+import pickle
+
+import pytest
+from pyld import jsonld
+from pyld.jsonld import JsonLdError
+
+from jsonld_ex import DocumentResult, JsonLdEx
+from jsonld_ex.document_loader import CachingDocumentLoader
+
+
+VOCAB = {"@vocab": "http://schema.org/"}
+
+
+def _docs(n):
+    return [{"@context": VOCAB, "@id": f"http://ex.org/{i}", "name": f"N{i}"} for i in range(n)]
+
+
+def _processor(**kwargs):
+    return JsonLdEx(document_loader=CachingDocumentLoader(offline=True), **kwargs)
+
+
+def _bad_doc():
+    return {"@context": "https://example.org/unavailable", "name": "x"}
+
+
+class TestSerial:
+    def test_expand_many_matches_expand(self):
+        processor = _processor()
+        docs = _docs(5)
+        results = list(processor.expand_many(docs))
+        assert [r.index for r in results] == list(range(5))
+        assert all(r.ok for r in results)
+        assert [r.result for r in results] == [processor.expand(d) for d in docs]
+
+    def test_compact_and_to_rdf_many(self):
+        processor = _processor()
+        docs = _docs(3)
+        compacted = [r.result for r in processor.compact_many(docs, VOCAB)]
+        assert compacted == [processor.compact(d, VOCAB) for d in docs]
+        nquads = [r.result for r in processor.to_rdf_many(docs)]
+        assert nquads == [processor.to_rdf(d) for d in docs]
+
+    def test_errors_are_gathered(self):
+        processor = _processor()
+        docs = _docs(2) + [_bad_doc()] + _docs(1)
+        results = list(processor.expand_many(docs))
+        assert [r.ok for r in results] == [True, True, False, True]
+        assert isinstance(results[2].error, JsonLdError)
+        assert results[2].result is None
+
+    def test_resource_limits_per_document(self):
+        processor = _processor(resource_limits={"max_document_size": 200})
+        docs = _docs(1) + [{"@context": VOCAB, "name": "x" * 500}]
+        results = list(processor.expand_many(docs))
+        assert results[0].ok
+        assert isinstance(results[1].error, ValueError)
+
+    def test_lazy_over_generators(self):
+        processor = _processor()
+        consumed = []
+
+        def source():
+            for doc in _docs(100):
+                consumed.append(doc)
+                yield doc
+
+        results = processor.expand_many(source())
+        next(results)
+        assert len(consumed) == 1
+
+    def test_shares_context_cache(self):
+        processor = _processor()
+        list(processor.expand_many(_docs(10)))
+        assert processor.context_cache.misses == 1
+        assert processor.context_cache.hits == 9
+
+    def test_options_passed_through(self):
+        processor = _processor()
+        doc = {"@context": {"@vocab": "terms/"}, "p": 1}
+        (result,) = processor.expand_many([doc], base="http://ex.org/")
+        assert result.result == [{"http://ex.org/terms/p": [{"@value": 1}]}]
+
+    def test_invalid_arguments(self):
+        processor = _processor()
+        with pytest.raises(ValueError, match="chunk_size"):
+            processor.expand_many([], chunk_size=0)
+        with pytest.raises(ValueError, match="executor"):
+            processor.expand_many([], executor="fiber")
+
+
+class TestPools:
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_ordered_results(self, executor):
+        processor = _processor()
+        docs = _docs(20)
+        docs[7] = _bad_doc()
+        results = list(processor.expand_many(
+            docs, max_workers=2, executor=executor, chunk_size=3,
+        ))
+        assert [r.index for r in results] == list(range(20))
+        expected = jsonld.expand(docs[0])
+        assert results[0].result == expected
+        assert not results[7].ok
+        assert isinstance(results[7].error, JsonLdError)
+        assert all(r.ok for i, r in enumerate(results) if i != 7)
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_unordered_results_cover_input(self, executor):
+        processor = _processor()
+        docs = _docs(20)
+        results = list(processor.to_rdf_many(
+            docs, max_workers=2, executor=executor, ordered=False, chunk_size=4,
+        ))
+        assert sorted(r.index for r in results) == list(range(20))
+        for r in results:
+            assert r.result == processor.to_rdf(docs[r.index])
+
+    def test_thread_pool_shares_context_cache(self):
+        processor = _processor()
+        list(processor.expand_many(_docs(50), max_workers=4, chunk_size=5))
+        cache = processor.context_cache
+        assert cache.hits + cache.misses == 50
+        assert len(cache) == 1
+
+    def test_processor_pickles_with_empty_caches(self):
+        processor = _processor(max_contexts=7)
+        processor.expand(_docs(1)[0])
+        clone = pickle.loads(pickle.dumps(processor))
+        assert len(clone.context_cache) == 0
+        assert clone.context_cache.max_size == 7
+        assert clone.expand(_docs(1)[0]) == processor.expand(_docs(1)[0])
+
+
+class TestDocumentResult:
+    def test_ok(self):
+        assert DocumentResult(0, result=[]).ok
+        assert not DocumentResult(0, error=ValueError("x")).ok
@@ -0,0 +1,128 @@
+"""Tests for JsonLdEx streaming N-Quads output (iter_rdf / write_rdf) and input."""
+
+import io
+
+import pytest
+from pyld import jsonld
+
+from jsonld_ex import JsonLdEx
+
+
+VOCAB = {"@vocab": "http://ex.org/"}
+
+DOCUMENTS = [
+    {"@context": VOCAB, "@id": "http://ex.org/a", "name": "A",
+     "knows": {"name": "B", "age": 3},
+     "tags": {"@list": [1, "x", {"@id": "http://ex.org/z"}]}},
+    {"@context": VOCAB, "@graph": [
+        {"@id": "http://ex.org/g1", "@graph": [{"@id": "http://ex.org/s", "p": "v"}, {"p": "w"}]},
+        {"@id": "http://ex.org/t", "q": True, "r": 1.5},
+    ]},
+    {"@context": {**VOCAB, "@language": "en"}, "@id": "http://ex.org/l", "label": "hi",
+     "@type": ["T1", "T2"],
+     "year": {"@value": "2020", "@type": "http://www.w3.org/2001/XMLSchema#gYear"}},
+    {"@context": VOCAB, "@id": "_:x", "p": {"@id": "rel/iri"}, "s": 'line\nbreak "q" \\'},
+]
+
+
+def _canonical(data):
+    return jsonld.normalize(data, {"algorithm": "URDNA2015", "format": "application/n-quads"})
+
+
+class TestIterRdf:
+    @pytest.mark.parametrize("doc", DOCUMENTS)
+    def test_lines_match_to_rdf(self, doc):
+        processor = JsonLdEx()
+        lines = list(processor.iter_rdf(doc))
+        assert all(line.endswith("\n") for line in lines)
+        assert "".join(sorted(lines)) == processor.to_rdf(doc)
+
+    def test_grouped_by_subject(self):
+        doc = {"@context": VOCAB, "@graph": [
+            {"@id": f"http://ex.org/n{i}", "a": i, "b": str(i)} for i in range(5)
+        ]}
+        subjects = [line.split(" ", 1)[0] for line in JsonLdEx().iter_rdf(doc)]
+        runs = [s for i, s in enumerate(subjects) if i == 0 or subjects[i - 1] != s]
+        assert len(runs) == len(set(runs)) == 5
+
+    def test_resource_limits_enforced(self):
+        processor = JsonLdEx(resource_limits={"max_document_size": 50})
+        with pytest.raises(ValueError):
+            processor.iter_rdf({"@context": VOCAB, "p": "x" * 100})
+
+    @pytest.mark.parametrize("buffer_size", [1, 40, 1 << 16])
+    def test_write_rdf(self, buffer_size):
+        processor = JsonLdEx()
+        doc = DOCUMENTS[0]
+        out = io.StringIO()
+        count = processor.write_rdf(doc, out, buffer_size=buffer_size)
+        lines = list(processor.iter_rdf(doc))
+        assert out.getvalue() == "".join(lines)
+        assert count == len(lines)
+
+    def test_write_rdf_batches_writes(self):
+        class Recorder(io.StringIO):
+            writes = 0
+
+            def write(self, s):
+                Recorder.writes += 1
+                return super().write(s)
+
+        doc = {"@context": VOCAB, "@graph": [{"@id": f"http://ex.org/n{i}", "a": i} for i in range(100)]}
+        JsonLdEx().write_rdf(doc, Recorder(), buffer_size=1 << 16)
+        assert Recorder.writes == 1
+
+
+class TestFromRdfStream:
+    @pytest.mark.parametrize("doc", DOCUMENTS)
+    def test_round_trip_is_isomorphic(self, doc):
+        processor = JsonLdEx()
+        nquads = processor.to_rdf(doc)
+        # Native types: PyLD 2.x cannot re-serialize a string xsd:double.
+        nodes = list(processor.from_rdf_stream(io.StringIO(nquads), useNativeTypes=True))
+        expected = jsonld.from_rdf(nquads, {"useNativeTypes": True})
+        assert _canonical(nodes) == _canonical(expected)
+
+    def test_one_node_per_subject(self):
+        processor = JsonLdEx()
+        doc = {"@context": VOCAB, "@graph": [
+            {"@id": f"http://ex.org/n{i}", "a": i, "b": str(i)} for i in range(5)
+        ]}
+        nodes = list(processor.from_rdf_stream(processor.iter_rdf(doc)))
+        assert [n["@id"] for n in nodes] == [f"http://ex.org/n{i}" for i in range(5)]
+        assert nodes[2]["http://ex.org/b"] == [{"@value": "2"}]
+
+    def test_named_graph_wrapping(self):
+        lines = ['<http://ex.org/s> <http://ex.org/p> "v" <http://ex.org/g> .\n']
+        (node,) = JsonLdEx().from_rdf_stream(lines)
+        assert node == {
+            "@id": "http://ex.org/g",
+            "@graph": [{"@id": "http://ex.org/s", "http://ex.org/p": [{"@value": "v"}]}],
+        }
+
+    def test_binary_input_and_options(self):
+        data = b'<http://ex.org/s> <http://ex.org/p> "1"^^<http://www.w3.org/2001/XMLSchema#integer> .\n'
+        (node,) = JsonLdEx().from_rdf_stream(io.BytesIO(data), useNativeTypes=True)
+        assert node["http://ex.org/p"] == [{"@value": 1}]
+
+    def test_lazy(self):
+        consumed = []
+
+        def lines():
+            for i in range(100):
+                consumed.append(i)
+                yield f"<http://ex.org/s{i}> <http://ex.org/p> \"{i}\" .\n"
+
+        stream = JsonLdEx().from_rdf_stream(lines())
+        next(stream)
+        assert len(consumed) == 2  # the second subject closes the first run
+
+    def test_skips_comments_and_blank_lines(self):
+        lines = ["# header\n", "\n", '<http://ex.org/s> <http://ex.org/p> "v" .\n']
+        assert len(list(JsonLdEx().from_rdf_stream(lines))) == 1
+
+    def test_error_reports_line_number(self):
+        lines = ['<http://ex.org/s> <http://ex.org/p> "v" .\n', "not a quad\n"]
+        with pytest.raises(jsonld.JsonLdError, match="line 2") as info:
+            list(JsonLdEx().from_rdf_stream(lines))
+        assert info.value.details == {"line": 2}
@@ -5,6 +5,7 @@ import pytest
 from jsonld_ex.security import (
     compute_integrity, verify_integrity, integrity_context,
     is_context_allowed, enforce_resource_limits, DEFAULT_RESOURCE_LIMITS,
+    measure_resources, ResourceUsage,
 )
 
 
@@ -143,3 +144,116 @@ class TestEnforceResourceLimits:
         # Should not crash — depth capped at 500
         with pytest.raises(ValueError, match="depth"):
             enforce_resource_limits(doc, {"max_graph_depth": 50})
+
+
+class TestMeasureResources:
+    """Single-pass measurement shared by enforce_resource_limits."""
+
+    DOCS = [
+        {"@context": {"ex": "http://example.org/"}, "@graph": [
+            {"@id": "ex:a", "name": "Ünïcode \u2603 \"quoted\"\n", "n": -12, "f": 0.1},
+            {"@id": "ex:b", "tags": [True, False, None, [], {}], "big": 10 ** 30},
+        ]},
+        [1.5e300, float("nan"), float("inf"), -float("inf"), "\ud83d\ude00"],
+        {1: "int key", 2.5: "float key", True: "bool", None: "none"},
+        {"t": (1, 2, (3,))},
+    ]
+
+    def test_size_matches_json_dumps(self):
+        for doc in self.DOCS:
+            assert measure_resources(doc).size == len(json.dumps(doc))
+
+    def test_counts(self):
+        usage = measure_resources({"a": {"bb": "ccc"}, "d": [{}, "e"]})
+        assert usage == ResourceUsage(
+            size=len(json.dumps({"a": {"bb": "ccc"}, "d": [{}, "e"]})),
+            depth=2, node_count=3, string_length=8,
+        )
+
+    def test_text_matches_parsed(self):
+        for doc in self.DOCS[:3]:
+            text = json.dumps(doc, indent=2)
+            parsed = measure_resources(doc)
+            scanned = measure_resources(text)
+            assert scanned.size == len(text)
+            assert scanned.depth == parsed.depth
+            assert scanned.node_count == parsed.node_count
+            assert scanned.string_length is None
+
+    def test_stops_at_first_exceeded_limit(self):
+        doc = {"items": ["x" * 100 for _ in range(10_000)]}
+        usage = measure_resources(doc, {"max_document_size": 1000})
+        assert usage.exceeded == "size"
+        assert usage.string_length < 1000  # stopped before reading the items
+
+    def test_depth_reported_at_limit(self):
+        doc: list = []
+        for _ in range(20):
+            doc = [doc, 1]
+        usage = measure_resources(doc, {"max_graph_depth": 5})
+        assert (usage.exceeded, usage.depth) == ("depth", 6)
+
+    def test_optional_limits(self):
+        doc = {"@graph": [{"name": "abcdef"} for _ in range(10)]}
+        with pytest.raises(ValueError, match="node count of at least 6 exceeds limit 5"):
+            enforce_resource_limits(doc, {"max_node_count": 5})
+        with pytest.raises(ValueError, match=r"string length of at least \d+ exceeds limit 20"):
+            enforce_resource_limits(doc, {"max_string_length": 20})
+        with pytest.raises(ValueError, match="node count"):
+            enforce_resource_limits(json.dumps(doc), {"max_node_count": 5})
+        enforce_resource_limits(doc, {"max_node_count": 11, "max_string_length": 200})
+
+    def test_error_reports_measured_figures(self):
+        with pytest.raises(ValueError, match="Document size 8 exceeds limit 2"):
+            enforce_resource_limits('{"a": 1}', {"max_document_size": 2})
+        with pytest.raises(ValueError, match="size of at least 8 exceeds limit 2"):
+            enforce_resource_limits({"a": 1}, {"max_document_size": 2})
+        nested = {"a": {"b": {"c": {"d": "deep"}}}}
+        with pytest.raises(ValueError, match="depth of at least 3 exceeds limit 2"):
+            enforce_resource_limits(nested, {"max_graph_depth": 2})
+        with pytest.raises(ValueError, match="depth of at least 3 exceeds limit 2"):
+            enforce_resource_limits(json.dumps(nested), {"max_graph_depth": 2})
+
+    def test_invalid_json_reports_line_and_column(self):
+        with pytest.raises(ValueError, match=r"line 2 column 3 \(char 8\)"):
+            enforce_resource_limits('{"a":\n  }')
+
+    def test_circular_reference(self):
+        doc: dict = {"a": []}
+        doc["a"].append(doc)
+        with pytest.raises(TypeError, match="Circular reference"):
+            enforce_resource_limits(doc)
+
+    def test_shared_subtree_is_not_circular(self):
+        shared = {"x": 1}
+        doc = {"a": shared, "b": [shared, shared]}
+        assert measure_resources(doc).size == len(json.dumps(doc))
+
+    def test_invalid_key_type(self):
+        with pytest.raises(TypeError, match="not JSON-serializable: keys must be"):
+            enforce_resource_limits({(1, 2): "tuple key"})
+
+    @pytest.mark.parametrize("text", [
+        "", "   ", "{", "[1,]", '{"a":1,}', '{"a" 1}', "[1 2]", '{"a":1]', "[}",
+        "[1]]", '{"a":1} x', "{'a': 1}", '["\t"]', '["\\x"]', "01", "[.5]", "nul",
+    ])
+    def test_text_rejects_invalid_json(self, text):
+        with pytest.raises(ValueError):
+            json.loads(text)
+        with pytest.raises(ValueError, match="not valid JSON"):
+            enforce_resource_limits(text)
+
+    @pytest.mark.parametrize("text", [
+        "1", ' "s" ', "[]", "{}", '[[], {}, [[]], {"a": {}}]', "[NaN, -Infinity, 1e5, -0.5E-3]",
+        '{"k": "\\u00e9\\n", "l": [true, false, null]}\n',
+    ])
+    def test_text_accepts_valid_json(self, text):
+        parsed = json.loads(text)
+        expected = measure_resources(parsed).depth if isinstance(parsed, (dict, list)) else 0
+        assert measure_resources(text).depth == expected
+
+    def test_text_deep_nesting_without_recursion(self):
+        text = "[" * 5000 + "]" * 5000
+        with pytest.raises(ValueError, match="depth"):
+            enforce_resource_limits(text)
+        assert measure_resources(text, {"max_graph_depth": 10_000}).depth == 4999
@@ -7,6 +7,7 @@ from jsonld_ex.temporal import (
     query_at_time,
     temporal_diff,
     TemporalDiffResult,
+    TemporalIndex,
 )
 
 
@@ -194,6 +195,96 @@ class TestQueryAtTimeMultiValue:
         assert "old-tag" not in vals
 
 
+# ═══════════════════════════════════════════════════════════════════
+# TemporalIndex
+# ═══════════════════════════════════════════════════════════════════
+
+
+_VERSIONED = [
+    {
+        "@id": f"ex:p{i}",
+        "@type": "Person",
+        "jobTitle": [
+            {"@value": f"T{i}-{y}", "@validFrom": f"{y}-01-01T00:00:00Z",
+             "@validUntil": f"{y}-12-31T23:59:59Z"}
+            for y in range(2020, 2024)
+        ],
+        "name": {"@value": f"P{i}", "@validFrom": f"{2018 + i % 6}-06-01T00:00:00Z"},
+    }
+    for i in range(30)
+]
+
+
+class TestTemporalIndex:
+    @pytest.mark.parametrize("ts", [
+        "2019-01-01T00:00:00Z", "2020-01-01T00:00:00Z", "2021-06-15T00:00:00Z",
+        "2023-12-31T23:59:59Z", "2030-01-01T00:00:00Z",
+    ])
+    @pytest.mark.parametrize("property_name", [None, "jobTitle", "missing"])
+    def test_matches_query_at_time(self, ts, property_name):
+        for graph in (_GRAPH, _VERSIONED):
+            index = TemporalIndex(graph)
+            assert index.query_at_time(ts, property_name) == query_at_time(
+                graph, ts, property_name
+            )
+
+    def test_list_values_reduced_like_query_at_time(self):
+        graph = [{
+            "@id": "ex:x",
+            "tags": [
+                {"@value": "old", "@validFrom": "2020-01-01", "@validUntil": "2022-12-31"},
+                {"@value": "new", "@validFrom": "2023-01-01"},
+                "always",
+            ],
+        }]
+        index = TemporalIndex(graph)
+        assert index.query_at_time("2024-06-01")[0]["tags"] == [
+            {"@value": "new", "@validFrom": "2023-01-01"}, "always",
+        ]
+        assert index.query_at_time("2019-06-01")[0]["tags"] == "always"
+
+    def test_query_range(self):
+        index = TemporalIndex(_VERSIONED)
+        results = index.query_range(
+            "2021-12-01T00:00:00Z", "2022-02-01T00:00:00Z", property_name="jobTitle",
+        )
+        assert len(results) == 30
+        assert [t["@value"] for t in results[0]["jobTitle"]] == ["T0-2021", "T0-2022"]
+        assert index.query_range("2018-01-01", "2018-02-01") == []
+
+    def test_query_range_rejects_reversed_bounds(self):
+        with pytest.raises(ValueError, match="must not be after"):
+            TemporalIndex(_GRAPH).query_range("2025-01-01", "2020-01-01")
+
+    def test_incremental_inserts(self):
+        index = TemporalIndex(_VERSIONED[:5])
+        graph = list(_VERSIONED[:5])
+        for node in _VERSIONED[5:] + _GRAPH:
+            index.add(node)
+            graph.append(node)
+            ts = "2022-03-01T00:00:00Z"
+            assert index.query_at_time(ts) == query_at_time(graph, ts)
+        assert len(index) == len(graph)
+
+    def test_inverted_interval_never_valid(self):
+        graph = [{"@id": "ex:x", "p": {"@value": 1, "@validFrom": "2024-01-01",
+                                       "@validUntil": "2020-01-01"}}]
+        index = TemporalIndex(graph)
+        assert index.query_at_time("2022-01-01") == []
+        assert index.query_range("2019-01-01", "2025-01-01") == []
+
+    def test_naive_timestamps_taken_as_utc(self):
+        index = TemporalIndex([{"@id": "ex:x", "p": {"@value": 1, "@validFrom": "2024-01-01"}}])
+        assert index.query_at_time("2024-01-01T00:00:00Z") != []
+        assert index.query_at_time("2023-12-31T23:59:59+00:00") == []
+
+    def test_bad_timestamp_rejected_on_add(self):
+        index = TemporalIndex()
+        with pytest.raises(ValueError, match="Cannot parse"):
+            index.add({"@id": "ex:x", "p": {"@value": 1, "@validFrom": "not a date"}})
+        assert len(index) == 0
+
+
 # ═══════════════════════════════════════════════════════════════════
 # temporal_diff
 # ═══════════════════════════════════════════════════════════════════
@@ -1,7 +1,18 @@
 """Tests for validation extensions."""
 
+import pickle
+
 import pytest
-from jsonld_ex.validation import validate_node, validate_document
+from jsonld_ex.validation import (
+    CompiledShape,
+    ShapeIndex,
+    ValidationResult,
+    _get_types,
+    _iter_nodes,
+    compile_shape,
+    validate_node,
+    validate_document,
+)
 
 
 PERSON_SHAPE = {
@@ -1340,3 +1351,144 @@ class TestShapeInheritance:
         }
         assert not validate_node({"@type": "Thing"}, child).valid
         assert validate_node({"@type": "Thing", "value": "x"}, child).valid
+
+
+class TestCompiledShape:
+    """compile_shape() builds a reusable plan equivalent to validate_node."""
+
+    def test_matches_validate_node(self):
+        compiled = compile_shape(PERSON_SHAPE)
+        for node in (
+            {"@type": "Person", "name": "John", "email": "j@x.com", "age": 30},
+            {"@type": "Person", "email": "bad", "age": -1},
+            {"@type": "Other", "name": ""},
+        ):
+            assert compiled.validate(node) == validate_node(node, PERSON_SHAPE)
+
+    def test_validate_node_accepts_compiled(self):
+        compiled = compile_shape(PERSON_SHAPE)
+        node = {"@type": "Person", "age": 200}
+        assert validate_node(node, compiled) == validate_node(node, PERSON_SHAPE)
+
+    def test_registry_resolved_at_compile_time(self):
+        registry = {"Named": {"@type": "Thing", "id": {"@required": True}}}
+        compiled = compile_shape({"@type": "Thing", "@extends": "Named"}, registry)
+        registry.clear()
+        result = compiled.validate({"@type": "Thing"})
+        assert not result.valid
+        assert result.errors[0].constraint == "required"
+
+    def test_unresolved_extends_warning_per_result(self):
+        compiled = compile_shape({"@type": "Thing", "@extends": "Missing"})
+        first = compiled.validate({"@type": "Thing"})
+        second = compiled.validate({"@type": "Thing"})
+        assert [w.code for w in first.warnings] == ["unresolved"]
+        assert first.warnings[0] is not second.warnings[0]
+
+    def test_snapshot_of_source_shape(self):
+        shape = {"@type": "Thing", "v": {"@minimum": 0}}
+        compiled = compile_shape(shape)
+        shape["v"]["@minimum"] = 100
+        assert compiled.validate({"@type": "Thing", "v": 5}).valid
+
+    def test_invalid_pattern_reported_per_value(self):
+        shape = {"@type": "Thing", "v": {"@pattern": "["}}
+        node = {"@type": "Thing", "v": "x"}
+        result = compile_shape(shape).validate(node)
+        assert result == validate_node(node, shape)
+        assert result.errors[0].message.startswith('Invalid regex pattern "["')
+
+    def test_self_referencing_nested_shape(self):
+        shape = {"@type": "Node", "next": {}}
+        shape["next"]["@shape"] = shape
+        node = {"@type": "Node", "next": {"@type": "Node", "next": {"@type": "Other"}}}
+        assert compile_shape(shape).validate(node) == validate_node(node, shape)
+
+    def test_pickle_roundtrip(self):
+        compiled = compile_shape(PERSON_SHAPE)
+        restored = pickle.loads(pickle.dumps(compiled))
+        assert isinstance(restored, CompiledShape)
+        node = {"@type": "Person", "email": "bad"}
+        assert restored.validate(node) == compiled.validate(node)
+
+    def test_validate_document_accepts_compiled(self):
+        doc = {"@graph": [
+            {"@type": "Person", "@id": "ex:a", "name": "A"},
+            {"@type": "Person", "@id": "ex:b"},
+        ]}
+        compiled = validate_document(doc, [compile_shape(PERSON_SHAPE)])
+        assert compiled == validate_document(doc, [PERSON_SHAPE])
+        assert compiled.errors[0].path == "ex:b/name"
+
+
+def _scan_validate_document(doc, shapes):
+    """Reference: every node against every shape, as before indexing."""
+    errors, warnings = [], []
+    for node in _iter_nodes(doc):
+        node_types = _get_types(node)
+        for shape in shapes:
+            if shape.get("@type") in node_types:
+                result = validate_node(node, shape)
+                for e in result.errors:
+                    e.path = f"{node.get('@id', 'anonymous')}/{e.path}"
+                errors.extend(result.errors)
+                warnings.extend(result.warnings)
+    return ValidationResult(len(errors) == 0, errors, warnings)
+
+
+class TestShapeIndex:
+    """validate_document dispatches nodes through a @type index."""
+
+    SHAPES = [
+        {"@type": "Person", "name": {"@required": True}},
+        {"@type": "Agent", "name": {"@minLength": 3, "@severity": "warning"}},
+        {"@type": "Person", "age": {"@minimum": 0}},
+        {"name": {"@required": True}},  # no @type: never matches
+        {"@type": "Org", "@extends": "Missing"},
+    ]
+
+    def test_matches_full_scan(self):
+        doc = {"@graph": [
+            {"@id": "ex:a", "@type": "Person", "age": -1},
+            {"@id": "ex:b", "@type": ["Agent", "Person"], "name": "Al"},
+            {"@id": "ex:c", "@type": ["Person", "Person"]},
+            {"@type": "Org"},
+            {"@type": "Unknown"},
+            {"@graph": [{"@id": "ex:d", "@type": "Agent", "name": "X"}]},
+        ]}
+        assert validate_document(doc, self.SHAPES) == _scan_validate_document(doc, self.SHAPES)
+
+    def test_match_preserves_shape_order(self):
+        index = ShapeIndex(self.SHAPES)
+        matched = index.match(["Person", "Agent"])
+        assert [s.shape for s in matched] == [self.SHAPES[0], self.SHAPES[1], self.SHAPES[2]]
+        assert index.match(["Nothing"]) == []
+        assert len(index) == len(self.SHAPES)
+
+    def test_unhashable_types(self):
+        shapes = [{"@type": ["A", "B"], "v": {"@required": True}}, {"@type": "A"}]
+        index = ShapeIndex(shapes)
+        assert [s.shape for s in index.match([["A", "B"]])] == [shapes[0]]
+        assert index.match([{"x": 1}]) == []
+
+    def test_reusable_index(self):
+        index = ShapeIndex(self.SHAPES)
+        doc = {"@type": "Person", "age": -5}
+        assert validate_document(doc, index) == validate_document(doc, self.SHAPES)
+        assert not validate_document(doc, index).valid
+
+    def test_iter_nodes_order(self):
+        doc = [
+            {"@type": "A", "@graph": [{"@type": "B"}, [{"@type": "C"}]]},
+            "skip",
+            {"@graph": {"@type": "D"}},
+            {"@type": "E"},
+        ]
+        assert [n["@type"] for n in _iter_nodes(doc)] == ["A", "B", "C", "D", "E"]
+
+    def test_deeply_nested_graph(self):
+        doc = {"@type": "Person"}
+        for _ in range(5000):
+            doc = {"@graph": [doc]}
+        result = validate_document(doc, self.SHAPES)
+        assert [e.path for e in result.errors] == ["anonymous/name"]